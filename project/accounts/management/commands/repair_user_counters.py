@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from accounts.services.counters import COUNTER_FIELDS, repair_counters
+
+
+class Command(BaseCommand):
+    """
+    유저 찜/추천 수 카운터를 실제 Like/Recommendation 행 수와 맞춤
+    - 시그널을 거치지 않은 변경(bulk_create, update(), 직접 SQL, 데이터 이관) 뒤에 실행
+    - pk 순 배치로 비교해 어긋난 유저만 UPDATE (--dry-run이면 개수만 출력)
+    사용 예)
+      python manage.py repair_user_counters
+      python manage.py repair_user_counters --dry-run --batch-size 5000
+    """
+    help = "유저의 찜/추천 수 카운터를 실제 행 수로 다시 맞춥니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--dry-run", action="store_true", help="고치지 않고 어긋난 개수만 출력")
+
+    def handle(self, *args, **options):
+        stats = repair_counters(batch_size=max(1, options["batch_size"]), dry_run=options["dry_run"])
+        detail = ", ".join(f"{field} {stats[field]}" for field in COUNTER_FIELDS)
+        verb = "어긋남" if options["dry_run"] else "수정"
+        self.stdout.write(self.style.SUCCESS(f"유저 {stats['users']}명 중 {stats['fixed']}명 {verb} ({detail})"))
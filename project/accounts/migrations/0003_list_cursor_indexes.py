@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_recommendation_user_recommended_targets_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='생성일'),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='liked_targets',
+            field=models.ManyToManyField(blank=True, related_name='liked_by', through='accounts.Like', through_fields=('user', 'target'), to=settings.AUTH_USER_MODEL, verbose_name='찜한 대상 목록'),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='recommended_targets',
+            field=models.ManyToManyField(blank=True, related_name='recommended_by', through='accounts.Recommendation', through_fields=('from_user', 'to_user'), to=settings.AUTH_USER_MODEL, verbose_name='추천 대상(사장님)'),
+        ),
+        migrations.AddIndex(
+            model_name='like',
+            index=models.Index(fields=['user', 'created_at'], name='accounts_li_user_id_827ece_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='like',
+            index=models.Index(fields=['target', 'created_at'], name='accounts_li_target__de3b77_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='recommendation',
+            index=models.Index(fields=['from_user', 'created_at'], name='accounts_re_from_us_ed12b1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='recommendation',
+            index=models.Index(fields=['to_user', 'created_at'], name='accounts_re_to_user_c52ca7_idx'),
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-17 08:07
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def fill_counters(apps, schema_editor):
+    # 기존 유저의 찜/추천 수 채우기 (이후에는 생성/삭제 시 accounts.signals에서 갱신)
+    User = apps.get_model('accounts', 'User')
+    Like = apps.get_model('accounts', 'Like')
+    Recommendation = apps.get_model('accounts', 'Recommendation')
+
+    def count(model, fk_name):
+        rows = (
+            model.objects.filter(**{fk_name: OuterRef('pk')})
+            .order_by().values(fk_name).annotate(n=Count('*')).values('n')
+        )
+        return Coalesce(Subquery(rows, output_field=IntegerField()), Value(0))
+
+    User.objects.update(
+        likes_given_count=count(Like, 'user'),
+        likes_received_count=count(Like, 'target'),
+        recommendations_given_count=count(Recommendation, 'from_user'),
+        recommendations_received_count=count(Recommendation, 'to_user'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_list_cursor_indexes'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='likes_given_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='누른 찜 수'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='likes_received_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='받은 찜 수'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='recommendations_given_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='한 추천 수'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='recommendations_received_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='받은 추천 수'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['likes_received_count', 'id'], name='user_likes_received_idx'),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
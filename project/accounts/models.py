@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import AbstractUser, Group
 from django.db.models import Q, F
 from django.utils import timezone
@@ -45,9 +45,40 @@ class User(AbstractUser):
         verbose_name='추천 대상(사장님)',
     )
 
-    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
+    # 목록 커서 페이지네이션 정렬 키 (created_at, id)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='생성일')
     modified_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
 
+    # 찜/추천 수 (비정규화 카운터)
+    # - Like/Recommendation 생성·삭제 시 같은 트랜잭션에서 F() += 1 / -= 1 (accounts/signals.py)
+    # - bulk_create/update()/직접 SQL로 어긋난 값은 `python manage.py repair_user_counters`
+    # - User.save()는 기존 유저를 저장할 때 이 컬럼들을 쓰지 않음 (UPDATE ... F()와 repair만 씀)
+    likes_given_count = models.PositiveIntegerField(default=0, editable=False, verbose_name='누른 찜 수')
+    likes_received_count = models.PositiveIntegerField(default=0, editable=False, verbose_name='받은 찜 수')
+    recommendations_given_count = models.PositiveIntegerField(default=0, editable=False, verbose_name='한 추천 수')
+    recommendations_received_count = models.PositiveIntegerField(default=0, editable=False, verbose_name='받은 추천 수')
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # 받은 찜 수 순 목록 (likes_received_count, id) 커서 조회
+            models.Index(fields=['likes_received_count', 'id'], name='user_likes_received_idx'),
+        ]
+
+    COUNTER_FIELDS = (
+        'likes_given_count', 'likes_received_count',
+        'recommendations_given_count', 'recommendations_received_count',
+    )
+
+    def save(self, *args, **kwargs):
+        # 기존 유저의 전체 save()(관리자 수정, set_password() 후 save() 등)는 카운터를 빼고 UPDATE
+        # (먼저 읽어 둔 옛 카운터 값으로 그 사이 늘어난 찜/추천 수를 덮어쓰지 않도록)
+        if not self._state.adding and kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            kwargs['update_fields'] = [
+                f.name for f in self._meta.concrete_fields
+                if not f.primary_key and f.name not in self.COUNTER_FIELDS
+            ]
+        return super().save(*args, **kwargs)
+
     # ---- 헬퍼 프로퍼티 ----
     @property
     def is_owner(self) -> bool:
@@ -95,6 +126,9 @@ class Like(models.Model):
         indexes = [
             models.Index(fields=['target']),
             models.Index(fields=['user', 'target']),
+            # 내가 누른/받은 찜 목록 (created_at, id) 커서 조회
+            models.Index(fields=['user', 'created_at']),
+            models.Index(fields=['target', 'created_at']),
         ]
 
     ''' 
@@ -118,11 +152,15 @@ class Like(models.Model):
     User.objects.filter(liked_by=a).order_by('-like__created_at')  # through의 created_at 경유
     # (ORM이 through 모델 이름을 경로에 노출합니다. 안 되면 annotate/values로 우회)
 
-    # 받은 찜 수 랭킹 정렬
-    from django.db.models import Count
-    User.objects.annotate(cnt=Count('likes_received')).order_by('-cnt')
+    # 받은 찜 수 랭킹 정렬 (카운터 컬럼 + 인덱스)
+    User.objects.order_by('-likes_received_count', '-id')
     '''
 
+    def save(self, *args, **kwargs):
+        # 생성과 카운터 증가(post_save)를 한 트랜잭션으로
+        with transaction.atomic():
+            return super().save(*args, **kwargs)
+
     def __str__(self):
         return f'{self.user} → {self.target}' 
     
@@ -160,6 +198,8 @@ class Recommendation(models.Model):
         indexes = [
             models.Index(fields=['to_user']),                # 사장님별 추천 수/목록 조회 최적화
             models.Index(fields=['from_user', 'to_user']),   # 존재 여부 검사, 토글 체크 최적화
+            models.Index(fields=['from_user', 'created_at']),  # 내가 한 추천 목록 커서 조회
+            models.Index(fields=['to_user', 'created_at']),    # 내가 받은 추천 목록 커서 조회
         ]
         verbose_name = '추천'
         verbose_name_plural = '추천들'
@@ -179,7 +219,9 @@ class Recommendation(models.Model):
     def save(self, *args, **kwargs):
         # DRF/ORM에서 full_clean()이 자동 호출되지 않으므로, 보수적으로 한 번 호출
         self.full_clean()
-        return super().save(*args, **kwargs)
+        # 생성과 카운터 증가(post_save)를 한 트랜잭션으로
+        with transaction.atomic():
+            return super().save(*args, **kwargs)
 
     def __str__(self):
         return f'{self.from_user} → {self.to_user} (추천)'
\ No newline at end of file
@@ -5,6 +5,9 @@ from .models import User, Like, Recommendation
 from django.contrib.auth import get_user_model, password_validation
 from django.db.models import Q
 
+from config.sparse_fields import SparseFieldsetMixin
+from .services import relation_state, toggles
+
 # 사용자 정의 토큰 발급 시리얼라이저
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -153,19 +156,32 @@ class MiniUserSerializer(serializers.ModelSerializer):
         ref_name = "AccountMiniUser"
 
 
-# --- 유저 상세/목록 공용 ---
-class UserSerializer(serializers.ModelSerializer):
-    # 읽기 전용 헬퍼/카운트
+# --- 유저 목록용 (관계 배열 없이 id/역할/카운터만) ---
+class UserListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     is_owner = serializers.ReadOnlyField()
     is_student = serializers.ReadOnlyField()
-    likes_given_count = serializers.SerializerMethodField()
-    likes_received_count = serializers.SerializerMethodField()
 
-    # 추천 카운트
-    recommendations_given_count = serializers.SerializerMethodField()
-    recommendations_received_count = serializers.SerializerMethodField()
+    class Meta:
+        model = User
+        fields = (
+            "id", "username", "user_role",
+            "is_owner", "is_student",
+            "created_at",
+            "likes_given_count", "likes_received_count",
+            "recommendations_given_count", "recommendations_received_count",
+        )
+        read_only_fields = fields
+
+
+# --- 유저 상세 ---
+class UserSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    # 읽기 전용 헬퍼
+    is_owner = serializers.ReadOnlyField()
+    is_student = serializers.ReadOnlyField()
+    # 찜/추천 수는 User의 카운터 컬럼을 그대로 읽음 (editable=False → 읽기 전용)
 
     # N:N 읽기 (중첩/경량 표현) — write는 LikeSerializer로만 허용
+    # 관계가 많은 유저는 /users/{id}/liked-by/ 같은 페이지 단위 하위 리소스나 ?fields=로 배열 제외
     liked_targets = MiniUserSerializer(many=True, read_only=True)
     liked_by = MiniUserSerializer(many=True, read_only=True)
 
@@ -188,20 +204,44 @@ class UserSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ("created_at", "modified_at")
 
-    def get_likes_given_count(self, obj):
-        return obj.likes_given.count()
 
-    def get_likes_received_count(self, obj):
-        return obj.likes_received.count()
-    
-    # 추천 카운트 구현 (through FK의 related_name 활용)
-    def get_recommendations_given_count(self, obj):
-        # obj.recommendations_given -> Recommendation(from_user=obj)
-        return obj.recommendations_given.count()
+# --- 유저 관계 하위 리소스 한 행 (/users/{id}/liked-targets/ 등) ---
+class RelatedUserSerializer(serializers.Serializer):
+    """
+    Like/Recommendation 한 행을 상대 유저 기준으로 표현
+    context["counterpart"]: 상대 유저를 가리키는 FK 이름 (예: liked-by면 "user")
+    """
+    id = serializers.IntegerField(read_only=True)  # Like/Recommendation id
+    user = serializers.SerializerMethodField()
+    created_at = serializers.DateTimeField(read_only=True)
+
+    def get_user(self, obj):
+        return MiniUserSerializer(getattr(obj, self.context["counterpart"])).data
 
-    def get_recommendations_received_count(self, obj):
-        # obj.recommendations_received -> Recommendation(to_user=obj)
-        return obj.recommendations_received.count()
+
+# --- 목록 화면용 찜/추천 상태 일괄 조회 ---
+class RelationStateQuerySerializer(serializers.Serializer):
+    ids = serializers.CharField(help_text="대상 유저 id (쉼표 구분, 최대 settings.RELATION_STATE['MAX_IDS']개)")
+
+    def validate_ids(self, value):
+        try:
+            ids = [int(part) for part in value.split(",") if part.strip()]
+        except ValueError:
+            raise serializers.ValidationError(_("id는 정수여야 합니다."))
+        if not ids:
+            raise serializers.ValidationError(_("id를 하나 이상 보내야 합니다."))
+        limit = relation_state.max_ids()
+        if len(set(ids)) > limit:
+            raise serializers.ValidationError(_("한 번에 최대 %(limit)d개까지 조회할 수 있습니다.") % {"limit": limit})
+        return ids
+
+
+class RelationStateSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    liked = serializers.BooleanField()
+    recommended = serializers.BooleanField()
+    likes_received_count = serializers.IntegerField()
+    recommendations_received_count = serializers.IntegerField()
 
 
 # --- 찜(Like) 읽기용 ---
@@ -265,31 +305,23 @@ class LikeWriteSerializer(serializers.ModelSerializer):
 # --- 한 줄짜리 엔드포인트용 시리얼라이저 (타겟만 받기) ---
 class LikeToggleSerializer(serializers.Serializer):
     """
-    /users/{id}/like/ 같은 커스텀 액션에 붙이기 좋음.
-    - POST: like 생성
-    - DELETE: like 제거 (뷰에서 처리)
+    /users/{id}/like-toggle/ 같은 커스텀 액션에 붙이기 좋음.
+    - 대상은 뷰가 get_object()로 읽어 context["target"]으로 전달 (PK 재조회 없음)
+    - save(): 있으면 삭제, 없으면 생성 — services.toggles.ToggleResult 반환
     """
-    target = serializers.PrimaryKeyRelatedField(queryset=User.objects.all())
-
-    def save(self, **kwargs):
-        # 토글 기능: 있으면 삭제하고 None 반환, 없으면 생성해서 반환
+    def validate(self, attrs):
         request = self.context.get("request")
         if not request or not request.user.is_authenticated:
             raise serializers.ValidationError(_("인증이 필요합니다."))
         user = request.user
-        target = self.validated_data["target"]
+        target = self.context["target"]
         if user == target:
             raise serializers.ValidationError(_("자기 자신을 찜할 수 없습니다."))
-        
-        # 기존 찜이 있는지 확인
-        try:
-            existing_like = Like.objects.get(user=user, target=target)
-            # 있으면 삭제하고 None 반환
-            existing_like.delete()
-            return None
-        except Like.DoesNotExist:
-            # 없으면 생성해서 반환
-            return Like.objects.create(user=user, target=target)
+        return {"user": user, "target": target}
+
+    def save(self, **kwargs):
+        # 조건부 DELETE → 없었으면 INSERT IGNORE (동시 요청에도 중복/IntegrityError 없음)
+        return toggles.toggle(Like, self.validated_data["user"], self.validated_data["target"])
 
 
 class RecommendationReadSerializer(serializers.ModelSerializer):
@@ -348,15 +380,14 @@ class RecommendationWriteSerializer(serializers.ModelSerializer):
         
 # 추천 토글 용 시리얼라이저: 있으면 삭제, 없으면 생성
 class RecommendationToggleSerializer(serializers.Serializer):
-    to_user = serializers.PrimaryKeyRelatedField(queryset=User.objects.all())
-
-    def save(self, **kwargs):
+    """대상은 context["target"] (뷰의 get_object()), save()는 ToggleResult 반환"""
+    def validate(self, attrs):
         request = self.context.get("request")
         if not request or not request.user.is_authenticated:
             raise serializers.ValidationError(_("인증이 필요합니다."))
 
         from_user = request.user
-        to_user = self.validated_data["to_user"]
+        to_user = self.context["target"]
 
         if from_user == to_user:
             raise serializers.ValidationError(_("자기 자신을 추천할 수 없습니다."))
@@ -364,10 +395,7 @@ class RecommendationToggleSerializer(serializers.Serializer):
             raise serializers.ValidationError(_("추천은 '학생'만 할 수 있습니다."))
         if to_user.user_role != User.Role.OWNER:
             raise serializers.ValidationError(_("추천 대상은 '사장님'만 가능합니다."))
+        return {"from_user": from_user, "to_user": to_user}
 
-        try:
-            existing = Recommendation.objects.get(from_user=from_user, to_user=to_user)
-            existing.delete()
-            return None  # 언라이크와 동일하게 None이면 해제
-        except Recommendation.DoesNotExist:
-            return Recommendation.objects.create(from_user=from_user, to_user=to_user)
\ No newline at end of file
+    def save(self, **kwargs):
+        return toggles.toggle(Recommendation, self.validated_data["from_user"], self.validated_data["to_user"])
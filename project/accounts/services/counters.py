@@ -0,0 +1,80 @@
+from django.db.models import Case, Count, F, IntegerField, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce
+
+from accounts.models import Like, Recommendation, User
+
+# 유저별 찜/추천 수 카운터 (User.*_count 컬럼)
+# - Like/Recommendation 한 행이 생성되면 양쪽 유저의 카운터를 F() + 1, 삭제되면 F() - 1
+#   (accounts.signals — 행 저장/삭제와 같은 트랜잭션, 유저 행 UPDATE라 동시 요청도 누락 없음)
+# - bulk_create/update()/직접 SQL처럼 시그널이 없는 경로는 repair_counters()로 다시 맞춤
+#   `python manage.py repair_user_counters`
+# - 목록/상세는 카운터를 그대로 읽고 받은 찜 수 정렬은 (likes_received_count, id) 인덱스 사용
+
+# 모델 → [(유저 FK 컬럼, 카운터 필드)]
+COUNTERS = {
+    Like: [("user_id", "likes_given_count"), ("target_id", "likes_received_count")],
+    Recommendation: [("from_user_id", "recommendations_given_count"), ("to_user_id", "recommendations_received_count")],
+}
+COUNTER_FIELDS = [field for pairs in COUNTERS.values() for _, field in pairs]
+
+
+def bump(instance, delta):
+    """instance(Like/Recommendation) 양쪽 유저의 카운터를 delta만큼"""
+    (source_column, _), (target_column, _) = COUNTERS[type(instance)]
+    bump_pair(type(instance), getattr(instance, source_column), getattr(instance, target_column), delta)
+
+
+def bump_pair(model, source_id, target_id, delta):
+    """관계 한 건의 양쪽 유저 카운터를 UPDATE 한 번으로 delta만큼 (0 아래로는 내려가지 않음)"""
+    updates = {}
+    for pk, (_, field) in zip((source_id, target_id), COUNTERS[model]):
+        condition = Q(pk=pk) if delta > 0 else Q(pk=pk, **{f"{field}__gte": -delta})
+        updates[field] = Case(When(condition, then=F(field) + delta), default=F(field), output_field=IntegerField())
+    User.objects.filter(pk__in=[source_id, target_id]).update(**updates)
+
+
+def actual_counts():
+    """User 쿼리셋용: 카운터 필드 이름 → 실제 행 수 서브쿼리"""
+    expressions = {}
+    for model, pairs in COUNTERS.items():
+        for column, field in pairs:
+            fk_name = column.removesuffix("_id")
+            rows = (
+                model.objects.filter(**{fk_name: OuterRef("pk")})
+                .order_by().values(fk_name).annotate(n=Count("*")).values("n")
+            )
+            expressions[field] = Coalesce(Subquery(rows, output_field=IntegerField()), Value(0))
+    return expressions
+
+
+def repair_counters(batch_size=1000, dry_run=False) -> dict:
+    """
+    pk 순 배치로 저장된 카운터와 실제 행 수를 비교해 다른 유저만 다시 계산
+    반환: {"users": 검사한 수, "fixed": 고친 유저 수, "<카운터 필드>": 그 필드가 틀렸던 유저 수}
+    """
+    stats = {"users": 0, "fixed": 0, **{field: 0 for field in COUNTER_FIELDS}}
+    actual = {f"actual_{field}": expression for field, expression in actual_counts().items()}
+    last_pk = 0
+    while True:
+        batch = list(
+            User.objects.filter(pk__gt=last_pk).order_by("pk")
+            .only("pk", *COUNTER_FIELDS).annotate(**actual)[:batch_size]
+        )
+        if not batch:
+            break
+        drifted = []
+        for user in batch:
+            changed = False
+            for field in COUNTER_FIELDS:
+                if getattr(user, field) != getattr(user, f"actual_{field}"):
+                    stats[field] += 1
+                    changed = True
+            if changed:
+                drifted.append(user)
+        if drifted and not dry_run:
+            # 읽은 값이 아니라 UPDATE 시점의 행 수로 다시 계산 (그 사이 생긴 찜/추천도 반영)
+            User.objects.filter(pk__in=[user.pk for user in drifted]).update(**actual_counts())
+        stats["users"] += len(batch)
+        stats["fixed"] += len(drifted)
+        last_pk = batch[-1].pk
+    return stats
@@ -0,0 +1,121 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+
+from accounts.models import Like, Recommendation, User
+
+# 목록 화면용 찜/추천 상태 일괄 조회 (GET /users/relation-state/?ids=1,2,3)
+# - 대상 id 여러 개에 대해 "내가 찜/추천했는지 + 받은 찜/추천 수"를 쿼리 한 번으로
+#   User pk IN (...) + EXISTS 서브쿼리 2개 — (user, target) / (from_user, to_user) 인덱스 조회
+# - 찜/추천을 많이 한 유저(HEAVY_USER_THRESHOLD 이상)는 누른 대상 id를 비트셋으로 캐시
+#   → EXISTS 없이 카운터만 읽음, 캐시는 찜/추천이 바뀌면 지금 한 번 + 커밋 후 한 번 삭제
+#   (ORM 저장/삭제는 accounts.signals, 토글/해제는 services.toggles에서 invalidate 호출)
+# - settings.RELATION_STATE = {"MAX_IDS", "CACHE_ENABLED", "ALIAS", "TTL", "HEAVY_USER_THRESHOLD"}
+
+DEFAULTS = {
+    "MAX_IDS": 100,
+    "CACHE_ENABLED": True,
+    "ALIAS": "default",
+    "TTL": 10 * 60,
+    "HEAVY_USER_THRESHOLD": 200,
+}
+
+# 상태 이름 → (관계 모델, 주체 FK, 대상 FK, 주체 쪽 카운터)
+STATES = {
+    "liked": (Like, "user", "target", "likes_given_count"),
+    "recommended": (Recommendation, "from_user", "to_user", "recommendations_given_count"),
+}
+COUNT_FIELDS = ("likes_received_count", "recommendations_received_count")
+
+
+def _config(name):
+    return getattr(settings, "RELATION_STATE", {}).get(name, DEFAULTS[name])
+
+
+def _cache():
+    return caches[_config("ALIAS")]
+
+
+def _key(user_id) -> str:
+    return f"accounts:relation-state:{user_id}"
+
+
+# ---- 비트셋 ----
+def to_bitset(ids) -> tuple:
+    """id 모음 → (시작 id, bytes) — 가장 작은 id부터 한 비트씩 (비어 있으면 (0, b""))"""
+    ids = sorted(set(ids))
+    if not ids:
+        return 0, b""
+    offset = ids[0]
+    data = bytearray((ids[-1] - offset) // 8 + 1)
+    for pk in ids:
+        index = pk - offset
+        data[index // 8] |= 1 << (index % 8)
+    return offset, bytes(data)
+
+
+def in_bitset(bitset, pk) -> bool:
+    offset, data = bitset
+    index = pk - offset
+    if index < 0 or index >= len(data) * 8:
+        return False
+    return bool(data[index // 8] >> (index % 8) & 1)
+
+
+def _bitsets(user) -> dict:
+    """{상태 이름: 비트셋} — 캐시에 없으면 관계 테이블에서 대상 id만 읽어 만듦"""
+    cache = _cache()
+    bitsets = cache.get(_key(user.pk))
+    if bitsets is None:
+        bitsets = {
+            name: to_bitset(model.objects.filter(**{source: user}).values_list(f"{target}_id", flat=True))
+            for name, (model, source, target, _) in STATES.items()
+        }
+        cache.set(_key(user.pk), bitsets, _config("TTL"))
+    return bitsets
+
+
+def invalidate(*user_ids):
+    """user_ids가 누른 찜/추천이 바뀜 → 비트셋 캐시 삭제 (지금 + 커밋 후)"""
+    if not _config("CACHE_ENABLED"):
+        return
+    keys = [_key(pk) for pk in user_ids]
+    _cache().delete_many(keys)
+    transaction.on_commit(lambda: _cache().delete_many(keys))
+
+
+def max_ids() -> int:
+    return _config("MAX_IDS")
+
+
+def is_heavy(user) -> bool:
+    return sum(getattr(user, field) for *_, field in STATES.values()) >= _config("HEAVY_USER_THRESHOLD")
+
+
+def relation_states(user, ids) -> list:
+    """
+    ids(요청 순서, 중복 제거) 중 존재하는 유저마다
+    {"id", "liked", "recommended", "likes_received_count", "recommendations_received_count"}
+    """
+    ids = list(dict.fromkeys(ids))
+    targets = User.objects.filter(pk__in=ids)
+
+    if _config("CACHE_ENABLED") and is_heavy(user):
+        bitsets = _bitsets(user)
+        rows = {row["id"]: row for row in targets.values("id", *COUNT_FIELDS)}
+        for pk, row in rows.items():
+            for name in STATES:
+                row[name] = in_bitset(bitsets[name], pk)
+    else:
+        states = {
+            name: Exists(model.objects.filter(**{source: user, target: OuterRef("pk")}))
+            for name, (model, source, target, _) in STATES.items()
+        }
+        rows = {row["id"]: row for row in targets.annotate(**states).values("id", *STATES, *COUNT_FIELDS)}
+
+    return [
+        {"id": pk, **{name: rows[pk][name] for name in STATES}, **{field: rows[pk][field] for field in COUNT_FIELDS}}
+        for pk in ids
+        if pk in rows
+    ]
@@ -0,0 +1,103 @@
+from dataclasses import dataclass
+
+from django.db import connections, router, transaction
+from django.db.models.constants import OnConflict
+from django.utils import timezone
+
+from accounts.models import Like, Recommendation, User
+from accounts.services import relation_state
+from accounts.services.counters import COUNTERS, bump_pair
+
+# 찜/추천 토글·해제 (요청 1건 = 조건부 DELETE 1 + 필요 시 INSERT 1 + 카운터 UPDATE 1 + 카운터 SELECT 1, 한 트랜잭션)
+# - 먼저 DELETE ... WHERE (주체, 대상) 를 실행해 지운 행 수로 "있었음"을 판단 (조회 후 삭제 경합 없음)
+# - 지운 게 없으면 INSERT ... ON CONFLICT DO NOTHING (MySQL: INSERT IGNORE, SQLite: INSERT OR IGNORE)
+#   → 같은 요청이 동시에 두 번 와도(더블탭) 한 건만 들어가고 나머지는 0행 — IntegrityError 없음
+# - 실제로 바뀐 행이 있을 때만 양쪽 유저 카운터를 UPDATE 한 번으로 ±1, 응답에 대상의 최신 카운터 포함
+# - 행을 직접 지우고 넣으므로 post_save/post_delete 시그널(accounts.signals)은 거치지 않음
+#   (카운터와 상태 조회 비트셋 캐시는 여기서 직접 갱신)
+#   역할/자기 자신 검증은 호출 측(serializers)에서
+
+# 모델 → (주체 FK, 대상 FK)
+RELATIONS = {
+    Like: ("user", "target"),
+    Recommendation: ("from_user", "to_user"),
+}
+
+
+@dataclass(frozen=True)
+class ToggleResult:
+    active: bool    # 호출 후 관계가 있는지
+    changed: bool   # 이번 호출이 실제로 행을 넣거나 지웠는지
+    id: int | None  # 관계 행 id (해제 상태면 None)
+    count: int      # 대상 유저의 받은 찜/추천 수
+
+
+def toggle(model, source, target) -> ToggleResult:
+    """있으면 지우고 없으면 넣음 — 동시에 같은 토글이 와도 관계 행은 최대 1개, 카운터는 실제 변경만 반영"""
+    with transaction.atomic(using=router.db_for_write(model)):
+        if _delete(model, source, target):
+            _changed(model, source, target, -1)
+            return ToggleResult(False, True, None, _target_count(model, target))
+
+        pk = _insert_ignore(model, source, target)
+        if pk is not None:
+            _changed(model, source, target, 1)
+            return ToggleResult(True, True, pk, _target_count(model, target))
+
+        # DELETE와 INSERT 사이에 다른 요청이 먼저 넣음 → 이미 켜진 상태
+        source_fk, target_fk = RELATIONS[model]
+        pk = model.objects.filter(**{source_fk: source, target_fk: target}).values_list("pk", flat=True).first()
+        return ToggleResult(True, False, pk, _target_count(model, target))
+
+
+def remove(model, source, target) -> ToggleResult:
+    """관계 해제 (멱등) — DELETE 한 번, 지운 행이 있을 때만 카운터 감소"""
+    with transaction.atomic(using=router.db_for_write(model)):
+        changed = bool(_delete(model, source, target))
+        if changed:
+            _changed(model, source, target, -1)
+        return ToggleResult(False, changed, None, _target_count(model, target))
+
+
+def _changed(model, source, target, delta):
+    bump_pair(model, source.pk, target.pk, delta)
+    relation_state.invalidate(source.pk)
+
+
+def _delete(model, source, target) -> int:
+    """조건부 DELETE 한 문장, 지운 행 수 반환 (Collector/시그널 없이)"""
+    source_fk, target_fk = RELATIONS[model]
+    rows = model.objects.filter(**{source_fk: source, target_fk: target})
+    return rows._raw_delete(rows.db)
+
+
+def _insert_ignore(model, source, target):
+    """유니크 충돌이면 아무것도 하지 않는 INSERT 한 문장 — 넣었으면 새 id, 충돌이면 None"""
+    connection = connections[router.db_for_write(model)]
+    ops, qn = connection.ops, connection.ops.quote_name
+    source_fk, target_fk = RELATIONS[model]
+    fields = [model._meta.get_field(name) for name in (source_fk, target_fk, "created_at")]
+    values = [source.pk, target.pk, fields[2].get_db_prep_save(timezone.now(), connection)]
+
+    sql = "%s %s (%s) VALUES (%s) %s" % (
+        ops.insert_statement(on_conflict=OnConflict.IGNORE),
+        qn(model._meta.db_table),
+        ", ".join(qn(field.column) for field in fields),
+        ", ".join(["%s"] * len(fields)),
+        ops.on_conflict_suffix_sql(fields, OnConflict.IGNORE, None, None),
+    )
+    returning = connection.features.can_return_columns_from_insert
+    if returning:
+        sql += " RETURNING %s" % qn(model._meta.pk.column)
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, values)
+        if returning:
+            row = cursor.fetchone()
+            return row[0] if row else None
+        return cursor.lastrowid if cursor.rowcount == 1 else None
+
+
+def _target_count(model, target) -> int:
+    _, (_, field) = COUNTERS[model]
+    return User.objects.filter(pk=target.pk).values_list(field, flat=True).first() or 0
@@ -0,0 +1,28 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Like, Recommendation
+from .services import relation_state
+from .services.counters import bump
+
+
+# 찜/추천 수 카운터 갱신
+# - 생성: Like/Recommendation.save()의 atomic 안에서 호출 / 삭제: Collector의 트랜잭션 안에서 호출
+# - 유저 삭제로 CASCADE 삭제될 때도 건마다 호출되어 상대 유저의 카운터가 줄어듦
+@receiver(post_save, sender=Like)
+@receiver(post_save, sender=Recommendation)
+def increment_user_counters(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        bump(instance, 1)
+        relation_state.invalidate(_source_id(instance))
+
+
+@receiver(post_delete, sender=Like)
+@receiver(post_delete, sender=Recommendation)
+def decrement_user_counters(sender, instance, **kwargs):
+    bump(instance, -1)
+    relation_state.invalidate(_source_id(instance))
+
+
+def _source_id(instance):
+    return instance.user_id if isinstance(instance, Like) else instance.from_user_id
@@ -1,9 +1,21 @@
+import threading
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import close_old_connections, connection
+from django.db.models import F
 from django.urls import reverse
-from django.test import TestCase
+from django.test import TestCase, TransactionTestCase, override_settings
 from rest_framework.test import APIClient
 from rest_framework import status
 
-from .models import User, Like
+from config import query_budget
+from config.pagination import KeysetCursorPagination
+from config.testing import QueryBudgetMixin
+from .models import User, Like, Recommendation
+from .services import relation_state, toggles
 
 
 class AccountsAPITests(TestCase):
@@ -32,14 +44,15 @@ class AccountsAPITests(TestCase):
         # 검색
         resp = self.client.get(url, {"search": "ali"})
         self.assertEqual(resp.status_code, status.HTTP_200_OK)
-        usernames = [u["username"] for u in resp.data]
+        usernames = [u["username"] for u in resp.data["results"]]
         self.assertIn("alice", usernames)
 
         # 정렬 (받은 찜 수 내림차순)
         resp2 = self.client.get(url, {"ordering": "-likes_received_count"})
         self.assertEqual(resp2.status_code, status.HTTP_200_OK)
         # bob은 cara에게서 1개 받은 상태 → bob이 상위에 있어야 함(간단 확인)
-        self.assertGreaterEqual(resp2.data[0]["likes_received_count"], resp2.data[-1]["likes_received_count"])
+        rows = resp2.data["results"]
+        self.assertGreaterEqual(rows[0]["likes_received_count"], rows[-1]["likes_received_count"])
 
     def test_user_retrieve(self):
         url = reverse("user-detail", args=[self.alice.id])
@@ -125,7 +138,7 @@ class AccountsAPITests(TestCase):
         resp_given = self.client.get(url)  # 기본: given
         self.assertEqual(resp_given.status_code, status.HTTP_200_OK)
         # alice가 누른 대상들만
-        for row in resp_given.data:
+        for row in resp_given.data["results"]:
             self.assertEqual(row["user"]["id"], self.alice.id)
 
         # (2) 내가 받은 목록 (bob으로 인증)
@@ -133,7 +146,455 @@ class AccountsAPITests(TestCase):
         resp_recv = self.client.get(url, {"mode": "received"})
         self.assertEqual(resp_recv.status_code, status.HTTP_200_OK)
         # bob을 타겟으로 한 레코드들만
-        for row in resp_recv.data:
+        for row in resp_recv.data["results"]:
             self.assertEqual(row["target"]["id"], self.bob.id)
         # 최소 1개 이상(cara -> bob)
-        self.assertGreaterEqual(len(resp_recv.data), 1)
+        self.assertGreaterEqual(len(resp_recv.data["results"]), 1)
+
+    # ---------- 커서 페이지네이션 ----------
+    def test_user_list_cursor_pagination(self):
+        for i in range(5):
+            User.objects.create_user(username=f"extra{i}", password="pass1234", email=f"extra{i}@example.com")
+        url = reverse("user-list")
+
+        # 2개씩 끝까지 넘기면 중복/누락 없이 전체를 한 번씩 본다 (동률이 많은 정렬 키 포함)
+        for ordering in ("-created_at", "-likes_received_count"):
+            seen, next_url = [], f"{url}?page_size=2&ordering={ordering}"
+            while next_url:
+                resp = self.client.get(next_url)
+                self.assertEqual(resp.status_code, status.HTTP_200_OK)
+                self.assertLessEqual(len(resp.data["results"]), 2)
+                seen += [u["id"] for u in resp.data["results"]]
+                next_url = resp.data["next"]
+            self.assertEqual(len(seen), len(set(seen)))
+            self.assertEqual(set(seen), set(User.objects.values_list("id", flat=True)))
+
+        # 이전 페이지로 돌아가면 첫 페이지와 같다
+        first = self.client.get(url, {"page_size": 2})
+        second = self.client.get(first.data["next"])
+        back = self.client.get(second.data["previous"])
+        self.assertEqual(
+            [u["id"] for u in back.data["results"]],
+            [u["id"] for u in first.data["results"]],
+        )
+
+    def test_user_list_page_size_cap_and_bad_cursor(self):
+        url = reverse("user-list")
+        with self.settings(API_MAX_PAGE_SIZE=1):
+            resp = self.client.get(url, {"page_size": 50})
+        self.assertEqual(len(resp.data["results"]), 1)
+
+        resp_bad = self.client.get(url, {"cursor": "not-a-cursor"})
+        self.assertEqual(resp_bad.status_code, status.HTTP_404_NOT_FOUND)
+
+        # 형식은 맞지만 값의 타입이 정렬 키와 다른 커서도 500이 아니라 404
+        pagination = KeysetCursorPagination()
+        for values in (["abc", 1], [None, None], [{"a": 1}, 1], ["2025-01-01T00:00:00", "x"]):
+            resp_bad = self.client.get(url, {"cursor": pagination.encode_cursor(values, False)})
+            self.assertEqual(resp_bad.status_code, status.HTTP_404_NOT_FOUND, values)
+
+
+class UserCounterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(username="owner", password="pass1234", user_role=User.Role.OWNER)
+        cls.group = User.objects.create_user(username="group", password="pass1234", user_role=User.Role.STUDENT_GROUP)
+        cls.student = User.objects.create_user(username="student", password="pass1234", user_role=User.Role.STUDENT)
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def counters(self, user):
+        return User.objects.values_list(
+            "likes_given_count", "likes_received_count",
+            "recommendations_given_count", "recommendations_received_count",
+        ).get(pk=user.pk)
+
+    # ---------- 생성/삭제 시 양쪽 카운터 갱신 ----------
+    def test_like_and_recommend_update_counters(self):
+        self.client.force_authenticate(user=self.group)
+        self.assertEqual(self.client.post(reverse("user-like", args=[self.owner.id])).status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.counters(self.group), (1, 0, 0, 0))
+        self.assertEqual(self.counters(self.owner), (0, 1, 0, 0))
+
+        # 중복 요청(400)은 카운터를 바꾸지 않음
+        self.client.post(reverse("user-like", args=[self.owner.id]))
+        self.assertEqual(self.counters(self.owner), (0, 1, 0, 0))
+
+        self.client.force_authenticate(user=self.student)
+        self.client.post(reverse("user-recommend", args=[self.owner.id]))
+        self.client.post(reverse("user-like-toggle", args=[self.owner.id]))
+        self.assertEqual(self.counters(self.owner), (0, 2, 0, 1))
+        self.assertEqual(self.counters(self.student), (1, 0, 1, 0))
+
+        resp = self.client.get(reverse("user-detail", args=[self.owner.id]))
+        self.assertEqual(resp.data["likes_received_count"], 2)
+        self.assertEqual(resp.data["recommendations_received_count"], 1)
+        resp = self.client.get(reverse("user-likes-received-count", args=[self.owner.id]))
+        self.assertEqual(resp.data["likes_received_count"], 2)
+
+        # 해제: 토글/DELETE 모두 감소, 이미 없으면 그대로
+        self.client.post(reverse("user-like-toggle", args=[self.owner.id]))
+        self.client.delete(reverse("user-recommend", args=[self.owner.id]))
+        self.client.delete(reverse("user-recommend", args=[self.owner.id]))
+        self.assertEqual(self.counters(self.owner), (0, 1, 0, 0))
+        self.assertEqual(self.counters(self.student), (0, 0, 0, 0))
+
+    def test_cascade_delete_decrements_other_side(self):
+        Like.objects.create(user=self.group, target=self.owner)
+        Like.objects.create(user=self.student, target=self.owner)
+        Recommendation.objects.create(from_user=self.student, to_user=self.owner)
+
+        self.student.delete()
+        self.assertEqual(self.counters(self.owner), (0, 1, 0, 0))
+        self.assertEqual(self.counters(self.group), (1, 0, 0, 0))
+
+    # ---------- 유저 전체 save()는 그 사이 바뀐 카운터를 되돌리지 않음 ----------
+    def test_stale_user_save_keeps_counters(self):
+        stale = User.objects.get(pk=self.owner.pk)
+        Like.objects.create(user=self.group, target=self.owner)
+
+        stale.set_password("new-pass1234")
+        stale.first_name = "사장"
+        stale.save()
+
+        self.assertEqual(self.counters(self.owner), (0, 1, 0, 0))
+        stale.refresh_from_db()
+        self.assertEqual(stale.first_name, "사장")
+        self.assertTrue(stale.check_password("new-pass1234"))
+
+    # ---------- 목록은 집계 없이 카운터로 정렬 ----------
+    def test_list_orders_by_counter_without_aggregation(self):
+        Like.objects.create(user=self.group, target=self.owner)
+        Like.objects.create(user=self.student, target=self.owner)
+        Like.objects.create(user=self.owner, target=self.group)
+
+        with self.assertNumQueries(1):  # 목록은 관계 prefetch 없이 한 쿼리
+            resp = self.client.get(reverse("user-list"), {"ordering": "-likes_received_count"})
+        rows = [(u["username"], u["likes_received_count"]) for u in resp.data["results"]]
+        self.assertEqual(rows, [("owner", 2), ("group", 1), ("student", 0)])
+
+    # ---------- 어긋난 카운터 복구 ----------
+    def test_repair_command_fixes_drift(self):
+        Like.objects.create(user=self.group, target=self.owner)
+        # 시그널을 거치지 않는 경로
+        Like.objects.bulk_create([Like(user=self.student, target=self.owner)])
+        User.objects.filter(pk=self.group.pk).update(recommendations_received_count=F("recommendations_received_count") + 3)
+
+        out = StringIO()
+        call_command("repair_user_counters", "--dry-run", stdout=out)
+        self.assertIn("3명 중 3명 어긋남", out.getvalue())
+        self.assertEqual(self.counters(self.owner), (0, 1, 0, 0))
+
+        call_command("repair_user_counters", "--batch-size", "2", stdout=StringIO())
+        self.assertEqual(self.counters(self.owner), (0, 2, 0, 0))
+        self.assertEqual(self.counters(self.student), (1, 0, 0, 0))
+        self.assertEqual(self.counters(self.group), (1, 0, 0, 0))
+
+
+class UserListModeTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(username="owner", password="pass1234", user_role=User.Role.OWNER)
+        cls.fans = [
+            User.objects.create_user(username=f"fan{i}", password="pass1234", user_role=User.Role.STUDENT)
+            for i in range(5)
+        ]
+        for fan in cls.fans:
+            Like.objects.create(user=fan, target=cls.owner)
+        Recommendation.objects.create(from_user=cls.fans[0], to_user=cls.owner)
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_list_is_compact_and_detail_keeps_relations(self):
+        resp = self.client.get(reverse("user-list"))
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        row = next(u for u in resp.data["results"] if u["id"] == self.owner.id)
+        self.assertEqual(row["likes_received_count"], 5)
+        self.assertNotIn("liked_by", row)
+        self.assertNotIn("email", row)
+
+        resp = self.client.get(reverse("user-detail", args=[self.owner.id]))
+        self.assertEqual(len(resp.data["liked_by"]), 5)
+
+    def test_sparse_fieldsets(self):
+        resp = self.client.get(reverse("user-list"), {"fields": "id,likes_received_count"})
+        self.assertEqual(set(resp.data["results"][0]), {"id", "likes_received_count"})
+
+        # 상세에서 관계 배열을 빼면 prefetch 쿼리도 없음
+        url = reverse("user-detail", args=[self.owner.id])
+        with self.assertNumQueries(1):
+            resp = self.client.get(url, {"fields": "id,username"})
+        self.assertEqual(resp.data, {"id": self.owner.id, "username": "owner"})
+        with self.assertNumQueries(2):
+            resp = self.client.get(url, {"fields": ["id", "liked_by"]})
+        self.assertEqual(set(resp.data), {"id", "liked_by"})
+
+        resp = self.client.get(url, {"fields": "id,nope"})
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("nope", str(resp.data["fields"]))
+
+    def test_relation_subresources_paginate(self):
+        url = reverse("user-liked-by", args=[self.owner.id])
+        seen, next_url = [], f"{url}?page_size=2"
+        while next_url:
+            with self.assertNumQueries(2):  # 대상 유저 1 + 관계 페이지 1
+                resp = self.client.get(next_url)
+            self.assertEqual(resp.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(resp.data["results"]), 2)
+            seen += [row["user"]["username"] for row in resp.data["results"]]
+            next_url = resp.data["next"]
+        # 찜한 시각 최신순
+        self.assertEqual(seen, [fan.username for fan in reversed(self.fans)])
+
+        resp = self.client.get(reverse("user-liked-targets", args=[self.fans[0].id]))
+        self.assertEqual([row["user"]["id"] for row in resp.data["results"]], [self.owner.id])
+        resp = self.client.get(reverse("user-recommended-by", args=[self.owner.id]))
+        self.assertEqual(resp.data["results"][0]["user"]["username"], "fan0")
+        resp = self.client.get(reverse("user-recommended-targets", args=[self.owner.id]))
+        self.assertEqual(resp.data["results"], [])
+
+
+class ToggleTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(username="owner", password="pass1234", user_role=User.Role.OWNER)
+        cls.student = User.objects.create_user(username="student", password="pass1234", user_role=User.Role.STUDENT)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.student)
+
+    def test_toggle_returns_state_and_counter(self):
+        url = reverse("user-like-toggle", args=[self.owner.id])
+        # 대상 조회 1 + 조건부 DELETE 1 + INSERT 1 + 카운터 UPDATE 1 + 카운터 SELECT 1 (+ 트랜잭션 세이브포인트)
+        with self.assertNumQueries(7):
+            resp = self.client.post(url)
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        like = Like.objects.get(user=self.student, target=self.owner)
+        self.assertEqual(resp.data, {"status": "liked", "like_id": like.id, "likes_received_count": 1})
+
+        resp = self.client.post(url)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data, {"status": "unliked", "likes_received_count": 0})
+        self.assertFalse(Like.objects.exists())
+
+        resp = self.client.post(reverse("user-recommend-toggle", args=[self.owner.id]))
+        self.assertEqual(resp.data["recommendations_received_count"], 1)
+        self.assertEqual(resp.data["recommendation_id"], Recommendation.objects.get().id)
+        resp = self.client.post(reverse("user-recommend-toggle", args=[self.student.id]))
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_insert_race_is_idempotent(self):
+        # DELETE(0행)와 INSERT 사이에 같은 토글 요청이 먼저 끝난 상황
+        original = toggles._insert_ignore
+        raced = []
+
+        def racing_insert(model, source, target):
+            if raced:
+                return original(model, source, target)
+            raced.append(None)
+            raced[0] = toggles.toggle(model, source, target)  # 경쟁 요청이 먼저 끝남
+            return original(model, source, target)
+
+        with mock.patch.object(toggles, "_insert_ignore", racing_insert):
+            result = toggles.toggle(Like, self.student, self.owner)
+        like = Like.objects.get()
+        self.assertEqual(raced, [toggles.ToggleResult(True, True, like.id, 1)])
+        self.assertEqual(result, toggles.ToggleResult(True, False, like.id, 1))
+
+        # 해제는 멱등: 두 번째는 지운 행이 없어 카운터도 그대로
+        self.assertEqual(toggles.remove(Like, self.student, self.owner), toggles.ToggleResult(False, True, None, 0))
+        self.assertEqual(toggles.remove(Like, self.student, self.owner), toggles.ToggleResult(False, False, None, 0))
+        self.assertEqual(User.objects.get(pk=self.student.pk).likes_given_count, 0)
+
+
+class ConcurrentToggleTests(TransactionTestCase):
+    def setUp(self):
+        # 테스트 DB가 만들어진 뒤에 확인 (import 시점의 connection은 설정 파일의 DB를 가리킴)
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            self.skipTest("메모리 SQLite는 동시 쓰기를 테이블 잠금 오류로 돌려줌 (파일 SQLite/MySQL/PostgreSQL에서 실행)")
+
+    def test_double_tap_keeps_single_row_and_exact_counter(self):
+        owner = User.objects.create_user(username="owner", password="pass1234", user_role=User.Role.OWNER)
+        students = [
+            User.objects.create_user(username=f"s{i}", password="pass1234", user_role=User.Role.STUDENT)
+            for i in range(4)
+        ]
+        taps = 5  # 학생마다 홀수 번 → 최종 상태는 찜
+        barrier = threading.Barrier(len(students) * taps)
+        errors = []
+
+        def tap(student):
+            try:
+                barrier.wait()
+                toggles.toggle(Like, student, owner)
+            except Exception as exc:  # noqa: BLE001 — 스레드 예외를 본 스레드에서 확인
+                errors.append(exc)
+            finally:
+                close_old_connections()
+
+        threads = [threading.Thread(target=tap, args=(s,)) for s in students for _ in range(taps)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])  # IntegrityError/교착 없음
+        rows = Like.objects.filter(target=owner).count()
+        self.assertLessEqual(rows, len(students))
+        owner.refresh_from_db()
+        self.assertEqual(owner.likes_received_count, rows)
+        for student in students:
+            student.refresh_from_db()
+            self.assertEqual(student.likes_given_count, Like.objects.filter(user=student).count())
+
+
+class RelationStateTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = User.objects.create_user(username="student", password="pass1234", user_role=User.Role.STUDENT)
+        cls.owners = [
+            User.objects.create_user(username=f"owner{i}", password="pass1234", user_role=User.Role.OWNER)
+            for i in range(4)
+        ]
+        Like.objects.create(user=cls.student, target=cls.owners[0])
+        Like.objects.create(user=cls.student, target=cls.owners[2])
+        Recommendation.objects.create(from_user=cls.student, to_user=cls.owners[2])
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse("user-relation-states")
+
+    def states(self, ids):
+        resp = self.client.get(self.url, {"ids": ids})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        return [(r["id"], r["liked"], r["recommended"], r["likes_received_count"]) for r in resp.data["results"]]
+
+    def test_batch_state_in_one_query(self):
+        self.assertEqual(self.client.get(self.url, {"ids": "1"}).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.client.force_authenticate(user=self.student)
+        o0, o1, o2, o3 = (o.id for o in self.owners)
+        with self.assertNumQueries(1):
+            rows = self.states(f"{o2},{o1},999999,{o0},{o2}")
+        # 요청 순서 유지, 중복/없는 id 제외
+        self.assertEqual(rows, [(o2, True, True, 1), (o1, False, False, 0), (o0, True, False, 1)])
+        # 반복 키도 허용
+        self.assertEqual(len(self.client.get(self.url, {"ids": [o0, o3]}).data["results"]), 2)
+
+    def test_validation(self):
+        self.client.force_authenticate(user=self.student)
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(self.url, {"ids": "1,a"}).status_code, status.HTTP_400_BAD_REQUEST)
+        with self.settings(RELATION_STATE={"MAX_IDS": 2}):
+            resp = self.client.get(self.url, {"ids": "1,2,3"})
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("ids", resp.data)
+
+    @override_settings(RELATION_STATE={"HEAVY_USER_THRESHOLD": 1})
+    def test_heavy_user_bitset_cache(self):
+        self.student.refresh_from_db()  # 인증 시 읽히는 유저처럼 최신 카운터
+        self.client.force_authenticate(user=self.student)
+        o0, o1, o2, o3 = (o.id for o in self.owners)
+        ids = f"{o0},{o1},{o2},{o3}"
+        with self.assertNumQueries(3):  # 비트셋 생성 (찜/추천 대상 id 2) + 카운터 1
+            first = self.states(ids)
+        with self.assertNumQueries(1):  # 캐시 적중: 카운터만
+            self.assertEqual(self.states(ids), first)
+        self.assertEqual(first, [(o0, True, False, 1), (o1, False, False, 0), (o2, True, True, 1), (o3, False, False, 0)])
+
+        # 토글하면 캐시가 지워져 바로 반영
+        self.client.post(reverse("user-like-toggle", args=[o3]))
+        Like.objects.filter(user=self.student, target_id=o0).delete()
+        self.assertEqual(self.states(f"{o0},{o3}"), [(o0, False, False, 0), (o3, True, False, 1)])
+
+    def test_bitset_helpers(self):
+        bitset = relation_state.to_bitset([1005, 1000, 1017, 1000])
+        self.assertEqual(bitset[0], 1000)
+        self.assertEqual([pk for pk in range(990, 1030) if relation_state.in_bitset(bitset, pk)], [1000, 1005, 1017])
+        self.assertFalse(relation_state.in_bitset(relation_state.to_bitset([]), 0))
+
+
+class QueryBudgetTests(QueryBudgetMixin, TestCase):
+    """엔드포인트별 쿼리 예산 — 행 수가 늘어도 쿼리 수는 그대로여야 함 (N+1 방지)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(username="admin", password="pass1234", is_staff=True)
+        cls.student = User.objects.create_user(username="student", password="pass1234", user_role=User.Role.STUDENT)
+        cls.owners = [
+            User.objects.create_user(username=f"owner{i}", password="pass1234", user_role=User.Role.OWNER)
+            for i in range(8)
+        ]
+        for owner in cls.owners:
+            Like.objects.create(user=cls.student, target=owner)
+            Recommendation.objects.create(from_user=cls.student, to_user=owner)
+
+    def setUp(self):
+        cache.clear()
+        query_budget.reset_query_budget_stats()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.student)
+
+    def test_endpoint_budgets(self):
+        owner, student = self.owners[0].id, self.student.id
+        ids = ",".join(str(o.id) for o in self.owners)
+        # (URL 이름, args, 쿼리 파라미터, 예산)
+        budgets = [
+            ("user-list", [], {}, 1),
+            ("user-list", [], {"ordering": "-likes_received_count"}, 1),
+            ("user-detail", [owner], {}, 5),  # 유저 + 관계 4종 prefetch
+            ("user-detail", [student], {"fields": "id,liked_targets"}, 2),
+            ("user-liked-targets", [student], {}, 2),
+            ("user-recommended-by", [owner], {}, 2),
+            ("user-relation-states", [], {"ids": ids}, 1),
+            ("like-list", [], {}, 1),
+            ("like-list", [], {"mode": "received"}, 1),
+            ("recommendations-list", [], {}, 1),
+        ]
+        for name, args, params, budget in budgets:
+            with self.subTest(name, **params), self.assertQueryBudget(budget, max_duplicates=1):
+                resp = self.client.get(reverse(name, args=args), params)
+            self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
+    def test_toggle_budget(self):
+        with self.assertQueryBudget(6, max_duplicates=1):
+            resp = self.client.post(reverse("user-like-toggle", args=[self.owners[0].id]))
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
+    def test_budget_failure_lists_repeated_queries(self):
+        with self.assertRaises(AssertionError) as ctx:
+            with self.assertQueryBudget(10, max_duplicates=2):
+                for owner in self.owners[:3]:
+                    owner.likes_received.count()
+        self.assertIn("3회 반복", str(ctx.exception))
+        self.assertIn("3x SELECT COUNT(*)", str(ctx.exception))
+
+    def test_fingerprint_ignores_literals(self):
+        self.assertEqual(
+            query_budget.fingerprint("SELECT * FROM t WHERE id IN (%s, %s, %s) AND name = 'a''b' LIMIT 21"),
+            "SELECT * FROM t WHERE id IN (...) AND name = ? LIMIT ?",
+        )
+
+    def test_middleware_logs_offenders_and_aggregates(self):
+        url = reverse("user-list")
+        with self.settings(QUERY_BUDGET={"MAX_QUERIES": 0, "HEADERS": True}):
+            with self.assertLogs("config.query_budget", level="WARNING") as logs:
+                resp = self.client.get(url)
+        self.assertEqual(resp["X-Query-Count"], "1")
+        self.assertIn("GET user-list", logs.output[0])
+        self.assertIn("쿼리 1개 > 0", logs.output[0])
+        self.client.get(url)
+
+        stats = query_budget.query_budget_stats()["GET user-list"]
+        self.assertEqual((stats["requests"], stats["max_queries"], stats["over_budget"]), (2, 1, 1))
+        self.assertGreater(stats["avg_serializer_time_ms"], 0)
+
+        stats_url = reverse("query-stats")
+        self.assertEqual(self.client.get(stats_url).status_code, status.HTTP_403_FORBIDDEN)
+        self.client.force_authenticate(user=self.admin)
+        self.assertIn("GET user-list", self.client.get(stats_url).data)
+
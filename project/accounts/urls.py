@@ -17,9 +17,16 @@ urlpatterns = [
 # 유저 목록(검색/정렬)
 GET /api/users/?search=alice&ordering=-likes_received_count
 
-# 특정 유저 상세
+# 특정 유저 상세 (필요한 필드만: ?fields=id,username,liked_by)
 GET /api/users/5/
 
+# 여러 유저에 대한 내 찜/추천 상태 + 받은 수 (목록 카드용, 최대 100개)
+GET /api/users/relation-state/?ids=3,5,8   Authorization: Bearer <token>
+
+# 특정 유저의 찜/추천 관계 (커서 페이지)
+GET /api/users/5/liked-targets/     GET /api/users/5/liked-by/
+GET /api/users/5/recommended-targets/     GET /api/users/5/recommended-by/
+
 # 특정 유저 찜 생성(정석)
 POST /api/users/5/like/             Authorization: Bearer <token>
 
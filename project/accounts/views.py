@@ -1,5 +1,5 @@
 # accounts/views.py
-from django.db.models import Count, Prefetch
+from django.db.models import Prefetch
 from rest_framework import viewsets, mixins, status, permissions, filters, generics
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -7,13 +7,20 @@ from rest_framework.response import Response
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
+from config.sparse_fields import FIELDS_PARAM, requested_fields
+
 # 토큰 발급용
 from rest_framework_simplejwt.views import TokenObtainPairView
 from .serializers import UsernameTokenObtainPairSerializer, RegisterSerializer, LikeWriteSerializer, RecommendationWriteSerializer
 
 from .models import User, Like, Recommendation
+from .services import relation_state, toggles
 from .serializers import (
     UserSerializer,
+    UserListSerializer,
+    RelatedUserSerializer,
+    RelationStateQuerySerializer,
+    RelationStateSerializer,
     MiniUserSerializer,
     LikeReadSerializer,
     LikeWriteSerializer,
@@ -64,6 +71,12 @@ class LoginView(TokenObtainPairView):
     def post(self, request, *args, **kwargs):
         return super().post(request, *args, **kwargs)  # 문서 목적으로만 오버라이드
 
+FIELDS_PARAMETER = openapi.Parameter(
+    FIELDS_PARAM, openapi.IN_QUERY, type=openapi.TYPE_STRING,
+    description="응답에 포함할 필드 (콤마 구분, 예: id,username,likes_received_count)",
+)
+
+
 class IsAuthenticatedOrReadOnly(permissions.BasePermission):
     def has_permission(self, request, view):
         if request.method in permissions.SAFE_METHODS:
@@ -75,40 +88,69 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
     """
     사용자 목록/상세 조회
     - 필터링/검색/정렬 지원
+    - 목록은 관계 배열 없는 경량 표현(id/역할/카운터), 상세만 찜/추천 관계 배열 포함
+    - 관계는 /users/{id}/liked-targets|liked-by|recommended-targets|recommended-by/ 에서 커서 페이지 단위로 조회
+    - ?fields=id,username,... 로 필요한 필드만 (상세에서 관계 배열을 빼면 prefetch도 생략)
     - 찜(좋아요) 토글/생성/삭제 커스텀 액션 제공
     """
-    queryset = (
-        User.objects
-        .select_related()  # 확장 필드가 없으면 영향은 적지만 명시해 둠
-        .prefetch_related(
-            Prefetch('liked_targets', queryset=User.objects.only('id', 'username', 'user_role')),
-            Prefetch('liked_by', queryset=User.objects.only('id', 'username', 'user_role')),
-            Prefetch('recommended_targets', queryset=User.objects.only('id', 'username', 'user_role')),
-            Prefetch('recommended_by', queryset=User.objects.only('id', 'username', 'user_role')),
-        )
-        .annotate(
-            likes_given_count=Count('likes_given', distinct=True),
-            likes_received_count=Count('likes_received', distinct=True),
-            recommendations_given_count=Count('recommendations_given', distinct=True),
-            recommendations_received_count=Count('recommendations_received', distinct=True),
-        )
-    )
+    # 찜/추천 수는 User 카운터 컬럼 (집계 JOIN 없음, 받은 찜 수 정렬은 인덱스 사용)
+    queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['username', 'email']
-    ordering_fields = ['date_joined', 'likes_received_count']
-    ordering = ['-date_joined']
+    ordering_fields = ['created_at', 'date_joined', 'likes_received_count']
+    ordering = ['-created_at']
+
+    # 하위 리소스 이름 → (관계 모델, 이 유저를 가리키는 FK, 상대 유저 FK)
+    RELATIONS = {
+        'liked-targets': (Like, 'user', 'target'),
+        'liked-by': (Like, 'target', 'user'),
+        'recommended-targets': (Recommendation, 'from_user', 'to_user'),
+        'recommended-by': (Recommendation, 'to_user', 'from_user'),
+    }
+    RELATION_FIELDS = ('liked_targets', 'liked_by', 'recommended_targets', 'recommended_by')
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'retrieve':
+            # 상세에서 요청한 관계 배열만 prefetch
+            fields = requested_fields(self.request)
+            queryset = queryset.prefetch_related(*(
+                Prefetch(name, queryset=User.objects.only('id', 'username', 'user_role'))
+                for name in self.RELATION_FIELDS
+                if fields is None or name in fields
+            ))
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return UserListSerializer
+        return UserSerializer
+
+    def relation_page(self, request, name):
+        """관계 행(Like/Recommendation)을 (created_at, id) 커서로 페이지 조회 — 상대 유저만 JOIN"""
+        model, own, counterpart = self.RELATIONS[name]
+        user = self.get_object()
+        rows = model.objects.filter(**{own: user}).select_related(counterpart).only(
+            'id', 'created_at', f'{counterpart}__id', f'{counterpart}__username', f'{counterpart}__user_role',
+        )
+        paginator = self.paginator
+        # 유저 목록의 ?ordering=은 관계 행에 쓰지 않음 (view=None → 기본 (-created_at, -id))
+        page = paginator.paginate_queryset(rows, request, view=None)
+        serializer = RelatedUserSerializer(page, many=True, context={'counterpart': counterpart})
+        return paginator.get_paginated_response(serializer.data)
 
     # --- 목록/상세 문서화 ---
     @swagger_auto_schema(
         operation_summary="유저 목록 조회",
-        operation_description="검색/정렬이 가능한 유저 목록을 반환합니다.",
+        operation_description="검색/정렬이 가능한 유저 목록을 커서 페이지 단위로 반환합니다.",
         manual_parameters=[
             openapi.Parameter('search', openapi.IN_QUERY, description="username/email 검색", type=openapi.TYPE_STRING),
-            openapi.Parameter('ordering', openapi.IN_QUERY, description="정렬 필드: date_joined, likes_received_count (예: -likes_received_count)", type=openapi.TYPE_STRING),
+            openapi.Parameter('ordering', openapi.IN_QUERY, description="정렬 필드: created_at, date_joined, likes_received_count (예: -likes_received_count)", type=openapi.TYPE_STRING),
+            FIELDS_PARAMETER,
         ],
-        responses={200: UserSerializer(many=True)},
+        responses={200: UserListSerializer(many=True)},
         tags=["Users"],
         operation_id="listUsers",
     )
@@ -118,13 +160,86 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
     @swagger_auto_schema(
         operation_summary="유저 상세 조회",
         security=[{"Bearer": []}],
-        responses={200: UserSerializer()},
+        manual_parameters=[FIELDS_PARAMETER],
+        responses={200: UserSerializer(), 400: "알 수 없는 필드"},
         tags=["Users"],
         operation_id="retrieveUser",
     )
     def retrieve(self, request, *args, **kwargs):
         return super().retrieve(request, *args, **kwargs)
 
+    # --- 목록 화면용 찜/추천 상태 일괄 조회 ---
+    @swagger_auto_schema(
+        method='get',
+        security=[{"Bearer": []}],
+        operation_summary="여러 유저에 대한 내 찜/추천 상태 일괄 조회",
+        operation_description=(
+            "ids로 받은 유저마다 내가 찜/추천했는지와 받은 찜/추천 수를 한 번에 반환합니다. "
+            "(?ids=1,2,3 또는 ?ids=1&ids=2, 요청 순서 유지, 없는 id는 제외)"
+        ),
+        query_serializer=RelationStateQuerySerializer,
+        responses={200: RelationStateSerializer(many=True), 400: "잘못된 id 목록", 401: "인증 필요"},
+        tags=["Likes"],
+        operation_id="getRelationStates",
+    )
+    @action(detail=False, methods=['get'], url_path='relation-state', permission_classes=[permissions.IsAuthenticated])
+    def relation_states(self, request):
+        # 같은 키가 여러 번 오면 쉼표로 합침 (?ids=1&ids=2 == ?ids=1,2)
+        query = RelationStateQuerySerializer(data={'ids': ",".join(request.query_params.getlist('ids'))})
+        if not query.is_valid():
+            return Response(query.errors, status=status.HTTP_400_BAD_REQUEST)
+        states = relation_state.relation_states(request.user, query.validated_data['ids'])
+        return Response({'results': RelationStateSerializer(states, many=True).data})
+
+    # --- 관계 하위 리소스 (커서 페이지) ---
+    @swagger_auto_schema(
+        method='get',
+        operation_summary="유저가 찜한 대상 목록",
+        operation_description="찜한 시각 최신순, 커서 페이지 단위. (?cursor=, ?page_size=)",
+        responses={200: RelatedUserSerializer(many=True)},
+        tags=["Likes"],
+        operation_id="listUserLikedTargets",
+    )
+    @action(detail=True, methods=['get'], url_path='liked-targets', permission_classes=[permissions.AllowAny])
+    def liked_targets(self, request, pk=None):
+        return self.relation_page(request, 'liked-targets')
+
+    @swagger_auto_schema(
+        method='get',
+        operation_summary="유저를 찜한 사용자 목록",
+        operation_description="찜한 시각 최신순, 커서 페이지 단위. (?cursor=, ?page_size=)",
+        responses={200: RelatedUserSerializer(many=True)},
+        tags=["Likes"],
+        operation_id="listUserLikedBy",
+    )
+    @action(detail=True, methods=['get'], url_path='liked-by', permission_classes=[permissions.AllowAny])
+    def liked_by(self, request, pk=None):
+        return self.relation_page(request, 'liked-by')
+
+    @swagger_auto_schema(
+        method='get',
+        operation_summary="유저가 추천한 사장님 목록",
+        operation_description="추천한 시각 최신순, 커서 페이지 단위. (?cursor=, ?page_size=)",
+        responses={200: RelatedUserSerializer(many=True)},
+        tags=["Recommendations"],
+        operation_id="listUserRecommendedTargets",
+    )
+    @action(detail=True, methods=['get'], url_path='recommended-targets', permission_classes=[permissions.AllowAny])
+    def recommended_targets(self, request, pk=None):
+        return self.relation_page(request, 'recommended-targets')
+
+    @swagger_auto_schema(
+        method='get',
+        operation_summary="유저를 추천한 학생 목록",
+        operation_description="추천한 시각 최신순, 커서 페이지 단위. (?cursor=, ?page_size=)",
+        responses={200: RelatedUserSerializer(many=True)},
+        tags=["Recommendations"],
+        operation_id="listUserRecommendedBy",
+    )
+    @action(detail=True, methods=['get'], url_path='recommended-by', permission_classes=[permissions.AllowAny])
+    def recommended_by(self, request, pk=None):
+        return self.relation_page(request, 'recommended-by')
+
     # --- 찜 생성/삭제(REST 정석) ---
     @swagger_auto_schema(
         method='post',
@@ -168,16 +283,17 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
             like = ser.save()
             return Response({'status': 'liked', 'like_id': like.id}, status=status.HTTP_201_CREATED)
 
-        obj = Like.objects.filter(user=request.user, target=target).first()
-        if obj:
-            obj.delete()
+        toggles.remove(Like, request.user, target)  # 조건부 DELETE 한 번 (없으면 0행)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     # --- 찜 토글(단일 엔드포인트 UX용) ---
     @swagger_auto_schema(
         method='post',
         operation_summary="특정 유저 찜 토글",
-        operation_description="대상 유저에 대해 찜이 없으면 생성, 있으면 삭제합니다.",
+        operation_description=(
+            "대상 유저에 대해 찜이 없으면 생성, 있으면 삭제합니다. 응답에 대상의 받은 찜 수 포함.\n"
+            "동시에 여러 번 호출해도 찜은 최대 하나만 생기고 중복 오류가 나지 않습니다."
+        ),
         request_body=openapi.Schema(type=openapi.TYPE_OBJECT),
         responses={
             201: openapi.Response("liked", schema=openapi.Schema(
@@ -185,11 +301,15 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
                 properties={
                     "status": openapi.Schema(type=openapi.TYPE_STRING, example="liked"),
                     "like_id": openapi.Schema(type=openapi.TYPE_INTEGER, example=123),
+                    "likes_received_count": openapi.Schema(type=openapi.TYPE_INTEGER, example=42),
                 }
             )),
             200: openapi.Response("unliked", schema=openapi.Schema(
                 type=openapi.TYPE_OBJECT,
-                properties={"status": openapi.Schema(type=openapi.TYPE_STRING, example="unliked")}
+                properties={
+                    "status": openapi.Schema(type=openapi.TYPE_STRING, example="unliked"),
+                    "likes_received_count": openapi.Schema(type=openapi.TYPE_INTEGER, example=41),
+                }
             )),
             401: "인증 필요",
         },
@@ -202,12 +322,15 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
             return Response({'detail': '인증 필요'}, status=status.HTTP_401_UNAUTHORIZED)
 
         target = self.get_object()
-        ser = LikeToggleSerializer(data={'target': target.id}, context={'request': request})
+        ser = LikeToggleSerializer(data={}, context={'request': request, 'target': target})
         ser.is_valid(raise_exception=True)
-        obj = ser.save()
-        if obj is None:
-            return Response({'status': 'unliked'}, status=status.HTTP_200_OK)
-        return Response({'status': 'liked', 'like_id': obj.id}, status=status.HTTP_201_CREATED)
+        result = ser.save()
+        if not result.active:
+            return Response({'status': 'unliked', 'likes_received_count': result.count}, status=status.HTTP_200_OK)
+        return Response(
+            {'status': 'liked', 'like_id': result.id, 'likes_received_count': result.count},
+            status=status.HTTP_201_CREATED,
+        )
     
     # ---------------------- 추천 생성/삭제 ----------------------
     @swagger_auto_schema(
@@ -238,9 +361,7 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
             rec = ser.save()
             return Response({'status': 'recommended', 'recommendation_id': rec.id}, status=status.HTTP_201_CREATED)
 
-        obj = Recommendation.objects.filter(from_user=request.user, to_user=target).first()
-        if obj:
-            obj.delete()
+        toggles.remove(Recommendation, request.user, target)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     # ---------------------- 추천 토글 ----------------------
@@ -248,6 +369,7 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
         method='post',
         security=[{"Bearer": []}],
         operation_summary="특정 유저 추천 토글 (있으면 삭제, 없으면 생성)",
+        operation_description="응답에 대상의 받은 추천 수(recommendations_received_count) 포함. 동시 호출에도 추천은 최대 하나.",
         tags=["Recommendations"],
         operation_id="toggleRecommendUser",
     )
@@ -257,12 +379,18 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
             return Response({'detail': '인증 필요'}, status=status.HTTP_401_UNAUTHORIZED)
 
         target = self.get_object()
-        ser = RecommendationToggleSerializer(data={'to_user': target.id}, context={'request': request})
+        ser = RecommendationToggleSerializer(data={}, context={'request': request, 'target': target})
         ser.is_valid(raise_exception=True)
-        obj = ser.save()
-        if obj is None:
-            return Response({'status': 'unrecommended'}, status=status.HTTP_200_OK)
-        return Response({'status': 'recommended', 'recommendation_id': obj.id}, status=status.HTTP_201_CREATED)
+        result = ser.save()
+        if not result.active:
+            return Response(
+                {'status': 'unrecommended', 'recommendations_received_count': result.count},
+                status=status.HTTP_200_OK,
+            )
+        return Response(
+            {'status': 'recommended', 'recommendation_id': result.id, 'recommendations_received_count': result.count},
+            status=status.HTTP_201_CREATED,
+        )
     
     @swagger_auto_schema(
         method='get',
@@ -289,11 +417,7 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
     )
     def likes_received_count(self, request, pk=None):
         user = self.get_object()
-        # annotate가 이미 있으면 그대로 사용, 없으면 쿼리로 계산
-        cnt = getattr(user, "likes_received_count", None)
-        if cnt is None:
-            cnt = Like.objects.filter(target=user).count()
-        return Response({"user_id": user.id, "likes_received_count": cnt})
+        return Response({"user_id": user.id, "likes_received_count": user.likes_received_count})
     
     @swagger_auto_schema(
         method='get',
@@ -320,11 +444,7 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
     )
     def recommendations_received_count(self, request, pk=None):
         user = self.get_object()
-        # queryset에서 annotate 된 값이 있으면 사용, 없으면 직접 count
-        cnt = getattr(user, "recommendations_received_count", None)
-        if cnt is None:
-            cnt = Recommendation.objects.filter(to_user=user).count()
-        return Response({"user_id": user.id, "recommendations_received_count": cnt})
+        return Response({"user_id": user.id, "recommendations_received_count": user.recommendations_received_count})
 
 
 class LikeViewSet(mixins.CreateModelMixin,
@@ -0,0 +1,326 @@
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from importlib import import_module
+from statistics import mean
+from typing import Callable
+
+from django.db.models import Count
+from django.urls import URLPattern, URLResolver, reverse
+from rest_framework.test import APIClient
+
+from accounts.models import Like, Recommendation, User
+from config.query_budget import record
+from profiles.models import OwnerProfile, StudentGroupProfile, StudentProfile
+from proposals.models import Proposal, ProposalDraftJob
+
+# 엔드포인트 벤치마크 (benchmark_endpoints 명령)
+# - accounts/profiles/proposals URL마다 시나리오(메서드, 경로, 본문, 요청 유저)를 APIClient로 반복 호출
+#   (미들웨어/인증/직렬화까지 실제 요청과 같은 경로, 네트워크와 WSGI 서버만 제외)
+# - 시나리오별: 지연 p50/p95/p99/최대(ms), 쿼리 수, DB 시간, 직렬화 시간(config.query_budget 계측),
+#   할당 메모리 최대치(tracemalloc — 지연에 섞이지 않도록 별도 1회 호출)
+# - 상태를 바꾸는 시나리오는 prepare()로 매 호출 전(측정 밖) 초기 상태를 다시 만듦
+# - 결과 JSON을 --baseline으로 넘기면 compare()로 비교: 지연/메모리가 threshold 비율 이상
+#   (그리고 최소 절대값 이상) 늘었거나 쿼리 수가 늘면 regression
+# - 시나리오가 없는 URL 이름은 uncovered_url_names()로 드러남 (새 엔드포인트 누락 방지)
+
+URLCONFS = ("accounts.urls", "profiles.urls", "proposals.urls")
+IGNORED_URL_NAMES = {"api-root"}
+
+MIN_LATENCY_DELTA_MS = 2.0   # 이보다 작은 지연 증가는 잡음으로 봄
+MIN_MEMORY_DELTA_KIB = 64
+
+
+@dataclass
+class Scenario:
+    name: str                   # 결과 키 (예: "GET accounts:user-list ?ordering")
+    url_name: str               # 커버리지 확인용 URL 이름
+    method: str
+    path: str
+    user: User | None = None
+    data: dict | None = None
+    format: str = "json"        # 본문 형식 (GET 제외)
+    prepare: Callable[[], dict] | None = None  # 매 호출 전 실행, {"path", "data"} 덮어쓰기
+
+
+@dataclass
+class Fixtures:
+    """시나리오에 쓰는 대표 행 — 찜/추천/제안서가 많은 쪽을 골라 목록이 비지 않게"""
+    student: User
+    owner: User
+    group: User
+    admin: User
+    owner_profile: OwnerProfile
+    group_profile: StudentGroupProfile
+    student_profile: StudentProfile
+    proposal: Proposal
+    job: ProposalDraftJob
+    owners: list = field(default_factory=list)   # 다른 사장님 유저 id (찜/추천/일괄 초안 대상)
+    groups: list = field(default_factory=list)   # 다른 학생단체 유저 id
+
+
+def load_fixtures(size=5) -> Fixtures:
+    """현재 DB에서 대표 행을 고름 (없으면 ValueError — 먼저 generate_synthetic_data로 데이터 생성)"""
+    owner_profile = OwnerProfile.objects.select_related("user").order_by("-user__likes_received_count", "id").first()
+    student_profile = (
+        StudentProfile.objects.select_related("user")
+        .filter(user__user_role=User.Role.STUDENT).order_by("-user__likes_given_count", "id").first()
+    )
+    # 제안서를 가장 많이 보낸 학생단체 (프로필 있음)
+    group_id = (
+        Proposal.objects.filter(author__user_role=User.Role.STUDENT_GROUP, author__student_group_profile__isnull=False)
+        .values("author").annotate(n=Count("id")).order_by("-n", "author").values_list("author", flat=True).first()
+    )
+    proposal = Proposal.objects.select_related("author").filter(author_id=group_id).order_by("-id").first()
+    if owner_profile is None or student_profile is None or proposal is None:
+        raise ValueError("벤치마크에 쓸 사장님/학생 프로필 또는 학생단체 제안서가 없습니다.")
+
+    owner, group = owner_profile.user, proposal.author
+    admin = User.objects.filter(is_staff=True).order_by("id").first() or User.objects.create(
+        username="benchmark-admin", password="!", is_staff=True,
+    )
+    job = ProposalDraftJob.objects.create(
+        author=group, recipient=owner, direction=ProposalDraftJob.Direction.TO_OWNER,
+        status=ProposalDraftJob.Status.DONE, proposal=proposal,
+    )
+    owners = list(
+        OwnerProfile.objects.exclude(user=owner).order_by("-user__likes_received_count", "id")
+        .values_list("user_id", flat=True)[:size]
+    )
+    groups = list(
+        StudentGroupProfile.objects.exclude(user=group).order_by("id").values_list("user_id", flat=True)[:size]
+    )
+    return Fixtures(
+        student=student_profile.user, owner=owner, group=group, admin=admin,
+        owner_profile=owner_profile,
+        group_profile=StudentGroupProfile.objects.filter(user=group).first(),
+        student_profile=student_profile, proposal=proposal, job=job,
+        owners=owners or [owner.pk], groups=groups or [group.pk],
+    )
+
+
+def build_scenarios(fx: Fixtures) -> list:
+    student, owner, group = fx.student, fx.owner, fx.group
+    target = fx.owners[0]
+
+    def scenario(method, url_name, args=(), *, label="", user=None, data=None, format="json", prepare=None):
+        name = f"{method.upper()} {url_name}" + (f" {label}" if label else "")
+        path = reverse(url_name, args=args)
+        return Scenario(name, url_name, method, path, user=user, data=data, format=format, prepare=prepare)
+
+    def draft():
+        return Proposal.objects.create(author=group, recipient=owner, contact_info="010-0000-0000")
+
+    def reset(model, **lookup):
+        # 다음 호출이 "없음" 상태에서 시작 (시그널로 카운터도 되돌림)
+        for row in model.objects.filter(**lookup):
+            row.delete()
+        return {}
+
+    def ensure(model, **lookup):
+        model.objects.get_or_create(**lookup)
+        return {}
+
+    def fresh(model, url_name, **lookup):
+        reset(model, **lookup)
+        return {"path": reverse(url_name, args=[model.objects.create(**lookup).pk])}
+
+    owner_ids = ",".join(str(pk) for pk in [owner.pk, *fx.owners])
+    ai_body = {"recipient": owner.pk, "contact_info": "010-0000-0000"}
+    ai_student_body = {"recipient": group.pk, "contact_info": "010-0000-0000"}
+    return [
+        # ---- accounts ----
+        scenario("get", "user-list", user=student),
+        scenario("get", "user-list", label="?ordering", user=student, data={"ordering": "-likes_received_count"}),
+        scenario("get", "user-list", label="?search", user=student, data={"search": owner.username[:6]}),
+        scenario("get", "user-detail", [owner.pk], user=student),
+        scenario("get", "user-detail", [owner.pk], label="?fields", user=student, data={"fields": "id,username,liked_by"}),
+        scenario("get", "user-relation-states", user=student, data={"ids": owner_ids}),
+        scenario("get", "user-liked-by", [owner.pk], user=student),
+        scenario("get", "user-liked-targets", [student.pk], user=student),
+        scenario("get", "user-recommended-by", [owner.pk], user=student),
+        scenario("get", "user-recommended-targets", [student.pk], user=student),
+        scenario("get", "user-likes-received-count", [owner.pk], user=student),
+        scenario("get", "user-recommendations-received-count", [owner.pk], user=student),
+        scenario("post", "user-like-toggle", [target], user=student),
+        scenario("post", "user-recommend-toggle", [target], user=student),
+        scenario("post", "user-like", [target], user=student,
+                 prepare=lambda: reset(Like, user=student, target_id=target)),
+        scenario("delete", "user-like", [target], user=student,
+                 prepare=lambda: ensure(Like, user=student, target_id=target)),
+        scenario("post", "user-recommend", [target], user=student,
+                 prepare=lambda: reset(Recommendation, from_user=student, to_user_id=target)),
+        scenario("delete", "user-recommend", [target], user=student,
+                 prepare=lambda: ensure(Recommendation, from_user=student, to_user_id=target)),
+        scenario("get", "like-list", user=student),
+        scenario("get", "like-list", label="?mode=received", user=owner, data={"mode": "received"}),
+        scenario("post", "like-list", user=student, data={"target": target},
+                 prepare=lambda: reset(Like, user=student, target_id=target)),
+        scenario("delete", "like-detail", [0], user=student,
+                 prepare=lambda: fresh(Like, "like-detail", user=student, target_id=target)),
+        scenario("get", "recommendations-list", user=student),
+        scenario("post", "recommendations-list", user=student, data={"to_user": target},
+                 prepare=lambda: reset(Recommendation, from_user=student, to_user_id=target)),
+        scenario("delete", "recommendations-detail", [0], user=student,
+                 prepare=lambda: fresh(Recommendation, "recommendations-detail", from_user=student, to_user_id=target)),
+
+        # ---- profiles ----
+        scenario("get", "profiles:owner-list", user=student),
+        scenario("get", "profiles:owner-list", label="?business_type", user=student,
+                 data={"business_type": fx.owner_profile.business_type}),
+        scenario("get", "profiles:owner-detail", [fx.owner_profile.pk], user=student),
+        scenario("patch", "profiles:owner-detail", [fx.owner_profile.pk], user=owner, data={"comment": "벤치마크"},
+                 format="multipart"),
+        scenario("get", "profiles:owner-search", user=student, data={"campus_name": fx.owner_profile.campus_name}),
+        scenario("get", "profiles:owner-search", label="?open_now", user=student, data={"open_now": "true"}),
+        scenario("get", "profiles:student-group-list", user=student),
+        scenario("get", "profiles:student-group-detail", [fx.group_profile.pk], user=student),
+        scenario("get", "profiles:student-list", user=student),
+        scenario("get", "profiles:student-detail", [fx.student_profile.pk], user=student),
+        scenario("get", "profiles:partner-matches", user=owner),
+        scenario("get", "profiles:cache-stats", user=fx.admin),
+
+        # ---- proposals ----
+        scenario("get", "proposal-list", user=group),
+        scenario("get", "proposal-list", label="?box=inbox", user=owner, data={"box": "inbox"}),
+        scenario("get", "proposal-detail", [fx.proposal.pk], user=group),
+        scenario("post", "proposal-list", user=group, data={
+            "recipient": owner.pk, "contact_info": "010-0000-0000", "partnership_type": ["할인형"],
+            "benefit_description": "전 메뉴 10% 할인",
+        }),
+        scenario("patch", "proposal-detail", [0], user=group, data={"benefit_description": "음료 1잔 무료"},
+                 prepare=lambda: {"path": reverse("proposal-detail", args=[draft().pk])}),
+        scenario("delete", "proposal-detail", [0], user=group,
+                 prepare=lambda: {"path": reverse("proposal-detail", args=[draft().pk])}),
+        scenario("post", "proposal-change-status", [0], user=group, data={"status": "UNREAD"},
+                 prepare=lambda: {"path": reverse("proposal-change-status", args=[draft().pk])}),
+        scenario("get", "proposal-sent-by-user", [group.pk], user=group),
+        scenario("get", "proposal-received-by-user", [owner.pk], user=owner),
+        scenario("post", "proposal-ai-draft", user=group, data=ai_body),
+        scenario("post", "proposal-ai-draft-to-student", user=owner, data=ai_student_body),
+        scenario("post", "proposal-ai-draft-batch", user=group, data={"recipients": fx.owners}),
+        scenario("post", "proposal-ai-draft-to-student-batch", user=owner, data={"recipients": fx.groups}),
+        scenario("post", "proposal-ai-draft-stream", user=group, data=ai_body),
+        scenario("post", "proposal-ai-draft-to-student-stream", user=owner, data=ai_student_body),
+        scenario("get", "proposal-ai-draft-job", [fx.job.pk], user=group),
+    ]
+
+
+def url_names() -> set:
+    """URLCONFS에 등록된 URL 이름 (app_name이 있으면 "앱:이름")"""
+    names = set()
+
+    def walk(patterns, namespace):
+        for pattern in patterns:
+            if isinstance(pattern, URLResolver):
+                walk(pattern.url_patterns, pattern.namespace or namespace)
+            elif isinstance(pattern, URLPattern) and pattern.name and pattern.name not in IGNORED_URL_NAMES:
+                names.add(f"{namespace}:{pattern.name}" if namespace else pattern.name)
+
+    for module_name in URLCONFS:
+        module = import_module(module_name)
+        walk(module.urlpatterns, getattr(module, "app_name", None))
+    return names
+
+
+def uncovered_url_names(scenarios) -> list:
+    return sorted(url_names() - {s.url_name for s in scenarios})
+
+
+# ---- 측정 ----
+def percentile(sorted_values, q) -> float:
+    index = min(len(sorted_values) - 1, max(0, int(round(q * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def _send(client, scenario, overrides):
+    path, data = overrides.get("path", scenario.path), overrides.get("data", scenario.data)
+    if scenario.method == "get":
+        response = client.get(path, data)
+    else:
+        response = getattr(client, scenario.method)(path, data, format=scenario.format)
+    if response.streaming:
+        b"".join(response.streaming_content)  # 스트리밍 본문 생성까지 측정
+    return response
+
+
+def run_scenario(client, scenario, repeat=30, warmup=3) -> dict:
+    client.force_authenticate(user=scenario.user)
+    timings, queries, db_times, serializer_times, statuses = [], [], [], [], {}
+    for i in range(warmup + repeat):
+        overrides = scenario.prepare() if scenario.prepare else {}
+        with record() as recorder:
+            started = time.perf_counter()
+            response = _send(client, scenario, overrides)
+            elapsed = time.perf_counter() - started
+        if i < warmup:
+            continue
+        timings.append(elapsed * 1000)
+        queries.append(recorder.queries)
+        db_times.append(recorder.db_time * 1000)
+        serializer_times.append(recorder.serializer_time * 1000)
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    # 할당 메모리는 추적 오버헤드가 지연에 섞이지 않도록 별도 1회
+    overrides = scenario.prepare() if scenario.prepare else {}
+    tracemalloc.start()
+    try:
+        _send(client, scenario, overrides)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    timings.sort()
+    return {
+        "method": scenario.method.upper(),
+        "url_name": scenario.url_name,
+        "status": {str(code): count for code, count in sorted(statuses.items())},
+        "latency_ms": {
+            "p50": round(percentile(timings, 0.5), 2),
+            "p95": round(percentile(timings, 0.95), 2),
+            "p99": round(percentile(timings, 0.99), 2),
+            "max": round(timings[-1], 2),
+            "mean": round(mean(timings), 2),
+        },
+        "queries": max(queries),
+        "db_time_ms": round(percentile(sorted(db_times), 0.5), 2),
+        "serializer_time_ms": round(percentile(sorted(serializer_times), 0.5), 2),
+        "peak_memory_kib": round(peak / 1024, 1),
+    }
+
+
+def run(scenarios, repeat=30, warmup=3, on_result=None) -> dict:
+    """시나리오 이름 → 결과 (on_result(name, result)는 시나리오마다 끝날 때 호출)"""
+    client = APIClient()
+    client.raise_request_exception = False  # 500도 상태 코드로 기록
+    results = {}
+    for scenario in scenarios:
+        results[scenario.name] = run_scenario(client, scenario, repeat=max(1, repeat), warmup=max(0, warmup))
+        if on_result is not None:
+            on_result(scenario.name, results[scenario.name])
+    return results
+
+
+def compare(results, baseline, threshold=0.2) -> list:
+    """
+    baseline 결과와 비교해 나빠진 지표 목록 [{"scenario", "metric", "baseline", "current"}]
+    - latency_ms.p50/p95, peak_memory_kib: (1 + threshold)배 초과 그리고 최소 절대 증가량 초과
+    - queries: 하나라도 늘면
+    (한쪽에만 있는 시나리오는 비교하지 않음)
+    """
+    regressions = []
+
+    def check(name, metric, old, new, min_delta):
+        if new > old * (1 + threshold) and new - old > min_delta:
+            regressions.append({"scenario": name, "metric": metric, "baseline": old, "current": new})
+
+    for name, current in results.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        for q in ("p50", "p95"):
+            check(name, f"latency_ms.{q}", old["latency_ms"][q], current["latency_ms"][q], MIN_LATENCY_DELTA_MS)
+        check(name, "peak_memory_kib", old["peak_memory_kib"], current["peak_memory_kib"], MIN_MEMORY_DELTA_KIB)
+        if current["queries"] > old["queries"]:
+            regressions.append({"scenario": name, "metric": "queries", "baseline": old["queries"], "current": current["queries"]})
+    return regressions
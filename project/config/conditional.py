@@ -0,0 +1,36 @@
+import hashlib
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+# 상세 조회 API 공용 조건부 GET (ETag / Last-Modified)
+# - 뷰는 본문 대신 가벼운 검증값 쿼리(수정 시각, 하위 행 개수/최대 수정 시각 등)만 먼저 실행
+# - If-None-Match / If-Modified-Since가 현재 검증값과 맞으면 직렬화 없이 304
+#   (둘 다 오면 If-None-Match 우선 — Last-Modified는 초 단위라 같은 초 안의 변경은 ETag로 구분)
+# - 200 응답에도 같은 검증값을 실어 보내 다음 요청에서 재검증할 수 있게 함
+
+
+def make_etag(*parts) -> str:
+    """검증값 조각들로 만든 강한 ETag (따옴표 포함)"""
+    raw = DjangoJSONEncoder().encode([str(part) for part in parts])
+    return f'"{hashlib.md5(raw.encode()).hexdigest()}"'
+
+
+def conditional_get(request, etag, last_modified, build):
+    """
+    etag/last_modified(datetime 또는 None)가 클라이언트 캐시와 같으면 304, 아니면 build()로 만든 응답
+    두 응답 모두 ETag, Last-Modified, Cache-Control(private, no-cache) 헤더 포함
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is None:
+        response = build()
+        if response.status_code != 200:
+            return response
+    response["ETag"] = etag
+    if timestamp is not None:
+        response["Last-Modified"] = http_date(timestamp)
+    response["Cache-Control"] = "private, no-cache"
+    return response
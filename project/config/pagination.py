@@ -0,0 +1,154 @@
+import base64
+import datetime
+import decimal
+import json
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    전 목록 API 공용 커서(keyset) 페이지네이션
+    - 기본 정렬: (-created_at, -id) — 정렬 키 전체를 커서에 담아 동률 없이 안정적으로 이어서 조회
+    - 뷰에 OrderingFilter가 있으면 그 정렬을 따르고, 마지막에 id를 보조 키로 붙임
+    - 커서는 정렬 키 값을 base64로 감싼 불투명 문자열 (?cursor=...)
+    - 페이지 크기: ?page_size=N (settings.API_MAX_PAGE_SIZE로 상한)
+    응답 형식: {"next": url|null, "previous": url|null, "results": [...]}
+    """
+    ordering = ("-created_at", "-id")
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "잘못된 커서입니다."
+
+    @property
+    def max_page_size(self):
+        return getattr(settings, "API_MAX_PAGE_SIZE", 100)
+
+    def get_ordering(self, request, queryset, view):
+        ordering = list(super().get_ordering(request, queryset, view))
+        # pk 보조 키로 정렬을 유일하게 만듦 (마지막 키와 같은 방향)
+        if not any(field.lstrip("-") in ("id", "pk") for field in ordering):
+            ordering.append("-id" if ordering[-1].startswith("-") else "id")
+        return tuple(ordering)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.keys = [(field.lstrip("-"), field.startswith("-")) for field in self.ordering]
+
+        values, reverse = self.decode_cursor(request)
+        order = [self._flip(field) for field in self.ordering] if reverse else list(self.ordering)
+        queryset = queryset.order_by(*order)
+        if values is not None:
+            try:
+                queryset = queryset.filter(self._after(self._to_python(queryset.model, values), reverse))
+            except (TypeError, ValueError, ValidationError):
+                raise NotFound(self.invalid_cursor_message)
+
+        # 한 건 더 읽어 다음 페이지 존재 여부 판단
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+
+        self.page = results
+        self.next_cursor = None
+        self.previous_cursor = None
+        if results:
+            if has_more or reverse:
+                self.next_cursor = self._key_of(results[-1])
+            if (has_more and reverse) or (values is not None and not reverse):
+                self.previous_cursor = self._key_of(results[0])
+        elif values is not None:
+            # 빈 페이지라도 반대 방향으로는 돌아갈 수 있게 커서 유지
+            if reverse:
+                self.next_cursor = values
+            else:
+                self.previous_cursor = values
+
+        self.has_next = self.next_cursor is not None
+        self.has_previous = self.previous_cursor is not None
+        return self.page
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        return self._link(self.next_cursor, reverse=False)
+
+    def get_previous_link(self):
+        if self.previous_cursor is None:
+            return None
+        return self._link(self.previous_cursor, reverse=True)
+
+    # ---- 커서 인코딩/디코딩 ----
+    def encode_cursor(self, values, reverse):
+        payload = json.dumps({"v": values, "r": int(reverse)}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+            values, reverse = payload["v"], bool(payload.get("r", 0))
+        except (TypeError, ValueError, KeyError, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.keys):
+            raise NotFound(self.invalid_cursor_message)
+        return values, reverse
+
+    # ---- 내부 유틸 ----
+    @staticmethod
+    def _flip(field):
+        return field[1:] if field.startswith("-") else "-" + field
+
+    def _key_of(self, instance):
+        values = []
+        for name, _ in self.keys:
+            value = getattr(instance, name)
+            # datetime은 마이크로초까지 보존해야 동일 키 비교가 정확함
+            if isinstance(value, (datetime.date, datetime.time)):
+                value = value.isoformat()
+            elif isinstance(value, decimal.Decimal):
+                value = str(value)
+            values.append(value)
+        return values
+
+    def _to_python(self, model, values):
+        """커서 값을 정렬 키 필드의 파이썬 값으로 변환 (annotate 값처럼 모델 필드가 아니면 그대로, null/객체는 거부)"""
+        converted = []
+        for (name, _), value in zip(self.keys, values):
+            if value is None or isinstance(value, (dict, list)):
+                raise ValueError(name)
+            try:
+                field = model._meta.pk if name == "pk" else model._meta.get_field(name)
+            except FieldDoesNotExist:
+                field = None
+            converted.append(field.to_python(value) if field is not None else value)
+        return converted
+
+    def _link(self, values, reverse):
+        url = remove_query_param(self.base_url, self.cursor_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(values, reverse))
+
+    def _after(self, values, reverse):
+        """정렬 키 튜플 기준으로 커서 '다음'(reverse면 '이전') 행만 남기는 조건"""
+        condition = Q()
+        for i, (name, descending) in enumerate(self.keys):
+            lookup = "lt" if descending != reverse else "gt"
+            term = Q(**{f"{name}__{lookup}": values[i]})
+            for j, (prev_name, _) in enumerate(self.keys[:i]):
+                term &= Q(**{prev_name: values[j]})
+            condition |= term
+        return condition
@@ -0,0 +1,238 @@
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from rest_framework.serializers import ListSerializer, Serializer
+
+logger = logging.getLogger(__name__)
+
+# 요청별 쿼리 예산 계측 + N+1 탐지
+# - 요청 하나 동안 실행된 쿼리 수, DB 시간, SQL 지문(리터럴/IN 목록을 ?로 바꾼 문장)별 횟수,
+#   시리얼라이저 .data 시간(과 그 안에서 나간 쿼리 수)을 기록
+#   → 같은 지문이 여러 번 = 행마다 쿼리를 날리는 N+1 신호
+# - QueryBudgetMiddleware: 예산(MAX_QUERIES / MAX_DUPLICATES / MAX_DB_TIME_MS)을 넘은 요청을
+#   뷰 이름과 함께 경고 로그로 남기고, 엔드포인트별 누적 지표를 프로세스 메모리에 모음
+#   → query_budget_stats() (GET /api/query-stats/, 관리자 전용)
+# - 테스트는 config.testing.QueryBudgetMixin.assertQueryBudget()으로 엔드포인트별 예산을 검증
+# - 요청 스레드의 DB 연결만 계측 (백그라운드 스레드 풀, 스트리밍 응답 본문 생성 중 쿼리는 제외)
+# - settings.QUERY_BUDGET = {"ENABLED", "MAX_QUERIES", "MAX_DUPLICATES", "MAX_DB_TIME_MS", "HEADERS"}
+
+DEFAULTS = {
+    "ENABLED": True,
+    "MAX_QUERIES": 30,
+    "MAX_DUPLICATES": 5,
+    "MAX_DB_TIME_MS": 500,
+    "HEADERS": False,
+}
+
+# 트랜잭션 제어 문장은 지문 집계에서 제외 (세이브포인트 이름만 달라 중복으로 잡히지 않도록)
+_IGNORED = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT", "BEGIN", "COMMIT", "ROLLBACK")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_SPACE = re.compile(r"\s+")
+
+_current = ContextVar("query_budget_recorder", default=None)
+
+
+def _config(name):
+    return getattr(settings, "QUERY_BUDGET", {}).get(name, DEFAULTS[name])
+
+
+def fingerprint(sql) -> str:
+    """SQL → 값만 다른 문장끼리 같아지는 지문 (문자열/숫자/플레이스홀더 → ?, IN/VALUES 목록 → (...))"""
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql.replace("%s", "?"))
+    sql = _VALUE_LIST.sub("(...)", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+class QueryRecorder:
+    """connection.execute_wrapper로 끼워 넣는 쿼리 기록기 (요청/테스트 블록 하나당 하나)"""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0  # 초
+        self.fingerprints = Counter()
+        self.serializer_time = 0.0  # 초
+        self.serializer_queries = 0
+        self._serializing = False
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.queries += 1
+            if self._serializing:
+                self.serializer_queries += 1
+            statement = sql.lstrip().upper()
+            if not statement.startswith(_IGNORED):
+                self.fingerprints[fingerprint(sql)] += 1
+
+    def duplicates(self) -> dict:
+        """두 번 이상 실행된 지문 → 횟수 (많은 순)"""
+        return {sql: count for sql, count in self.fingerprints.most_common() if count > 1}
+
+    def max_duplicates(self) -> int:
+        return max(self.fingerprints.values(), default=0)
+
+    def as_dict(self) -> dict:
+        return {
+            "queries": self.queries,
+            "db_time_ms": round(self.db_time * 1000, 2),
+            "serializer_time_ms": round(self.serializer_time * 1000, 2),
+            "serializer_queries": self.serializer_queries,
+            "duplicates": self.duplicates(),
+        }
+
+
+@contextmanager
+def record():
+    """블록 안에서 이 스레드의 모든 DB 연결이 실행한 쿼리를 기록하는 QueryRecorder"""
+    recorder = QueryRecorder()
+    token = _current.set(recorder)
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            yield recorder
+    finally:
+        _current.reset(token)
+
+
+# ---- 시리얼라이저 시간 ----
+_serializer_timing_installed = False
+_install_lock = threading.Lock()
+
+
+def _timed(prop):
+    def data(self):
+        recorder = _current.get()
+        # 기록 중이 아니거나 바깥 .data 안에서 다시 불린 경우(중첩)는 그대로
+        if recorder is None or recorder._serializing:
+            return prop.fget(self)
+        recorder._serializing = True
+        start = time.perf_counter()
+        try:
+            return prop.fget(self)
+        finally:
+            recorder.serializer_time += time.perf_counter() - start
+            recorder._serializing = False
+    return property(data, doc=prop.__doc__)
+
+
+def install_serializer_timing():
+    """Serializer.data / ListSerializer.data를 시간 재는 프로퍼티로 한 번만 감쌈 (기록 중이 아니면 비용 없음)"""
+    global _serializer_timing_installed
+    with _install_lock:
+        if _serializer_timing_installed:
+            return
+        for cls in (Serializer, ListSerializer):
+            cls.data = _timed(cls.data)
+        _serializer_timing_installed = True
+
+
+# ---- 엔드포인트별 누적 지표 ----
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+def endpoint_name(request) -> str:
+    """"GET accounts:user-detail" 형태 (URL이 풀리지 않은 요청은 경로 그대로)"""
+    match = getattr(request, "resolver_match", None)
+    return f"{request.method} {match.view_name if match else request.path}"
+
+
+def over_budget(recorder) -> list:
+    """예산을 넘은 항목 설명 목록 (없으면 빈 목록)"""
+    problems = []
+    if recorder.queries > _config("MAX_QUERIES"):
+        problems.append(f"쿼리 {recorder.queries}개 > {_config('MAX_QUERIES')}")
+    if recorder.max_duplicates() > _config("MAX_DUPLICATES"):
+        sql, count = recorder.fingerprints.most_common(1)[0]
+        problems.append(f"같은 쿼리 {count}회 > {_config('MAX_DUPLICATES')}: {sql[:200]}")
+    if recorder.db_time * 1000 > _config("MAX_DB_TIME_MS"):
+        problems.append(f"DB 시간 {recorder.db_time * 1000:.1f}ms > {_config('MAX_DB_TIME_MS')}ms")
+    return problems
+
+
+def _aggregate(endpoint, recorder, exceeded):
+    with _stats_lock:
+        row = _stats.setdefault(endpoint, {
+            "requests": 0, "queries": 0, "max_queries": 0,
+            "db_time": 0.0, "max_db_time": 0.0, "serializer_time": 0.0,
+            "over_budget": 0, "max_duplicates": 0, "worst_duplicate": None,
+        })
+        row["requests"] += 1
+        row["queries"] += recorder.queries
+        row["max_queries"] = max(row["max_queries"], recorder.queries)
+        row["db_time"] += recorder.db_time
+        row["max_db_time"] = max(row["max_db_time"], recorder.db_time)
+        row["serializer_time"] += recorder.serializer_time
+        row["over_budget"] += bool(exceeded)
+        duplicates = recorder.max_duplicates()
+        if duplicates > 1 and duplicates > row["max_duplicates"]:
+            row["max_duplicates"] = duplicates
+            row["worst_duplicate"] = recorder.fingerprints.most_common(1)[0][0]
+
+
+def query_budget_stats() -> dict:
+    """엔드포인트 → 요청 수, 평균/최대 쿼리 수, 평균/최대 DB 시간(ms), 평균 직렬화 시간(ms), 예산 초과 수, 가장 많이 반복된 쿼리"""
+    with _stats_lock:
+        rows = sorted(_stats.items(), key=lambda item: item[1]["db_time"], reverse=True)
+        return {
+            endpoint: {
+                "requests": row["requests"],
+                "avg_queries": round(row["queries"] / row["requests"], 2),
+                "max_queries": row["max_queries"],
+                "avg_db_time_ms": round(row["db_time"] * 1000 / row["requests"], 2),
+                "max_db_time_ms": round(row["max_db_time"] * 1000, 2),
+                "avg_serializer_time_ms": round(row["serializer_time"] * 1000 / row["requests"], 2),
+                "over_budget": row["over_budget"],
+                "max_duplicates": row["max_duplicates"],
+                "worst_duplicate": row["worst_duplicate"],
+            }
+            for endpoint, row in rows
+        }
+
+
+def reset_query_budget_stats():
+    with _stats_lock:
+        _stats.clear()
+
+
+class QueryBudgetMiddleware:
+    """요청마다 QueryRecorder로 계측 → 예산 초과 경고 로그 + 엔드포인트별 누적 (+ 선택적으로 응답 헤더)"""
+
+    def __init__(self, get_response):
+        if not _config("ENABLED"):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        install_serializer_timing()
+
+    def __call__(self, request):
+        with record() as recorder:
+            response = self.get_response(request)
+
+        endpoint = endpoint_name(request)
+        exceeded = over_budget(recorder)
+        _aggregate(endpoint, recorder, exceeded)
+        if exceeded:
+            logger.warning(
+                "쿼리 예산 초과 %s (%s): %s",
+                endpoint, request.get_full_path(), "; ".join(exceeded),
+            )
+        if _config("HEADERS"):
+            response["X-Query-Count"] = str(recorder.queries)
+            response["X-DB-Time-Ms"] = f"{recorder.db_time * 1000:.1f}"
+            response["X-Serializer-Time-Ms"] = f"{recorder.serializer_time * 1000:.1f}"
+        return response
@@ -21,13 +21,24 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 
 secret_file = os.path.join(BASE_DIR, 'secrets.json') 
 
-with open(secret_file) as f:
-    secrets = json.loads(f.read())
+# secrets.json이 없으면(CI, 로컬 관리 명령 등) 환경 변수에서 읽음
+try:
+    with open(secret_file) as f:
+        secrets = json.loads(f.read())
+except FileNotFoundError:
+    secrets = {}
 
-def get_secret(setting, secrets=secrets): 
+_REQUIRED = object()
+
+def get_secret(setting, default=_REQUIRED, secrets=secrets): 
+    """secrets.json → 환경 변수 → default 순으로 조회 (default가 없으면 필수 값)"""
     try:
         return secrets[setting]
     except KeyError:
+        if setting in os.environ:
+            return os.environ[setting]
+        if default is not _REQUIRED:
+            return default
         error_msg = "Set the {} environment variable".format(setting)
         raise ImproperlyConfigured(error_msg)
 
@@ -75,6 +86,7 @@ INSTALLED_APPS = DJANGO_APPS + PROJECT_APPS + THIRD_PARTY_APPS
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
+    'config.query_budget.QueryBudgetMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -174,8 +186,9 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 
 ###AWS###
-AWS_ACCESS_KEY_ID = get_secret("AWS_ACCESS_KEY_ID") # .csv 파일에 있는 내용을 입력 Access key ID. IAM 계정 관련
-AWS_SECRET_ACCESS_KEY = get_secret("AWS_SECRET_ACCESS_KEY") # .csv 파일에 있는 내용을 입력 Secret access key. IAM 계정 관련
+# 없으면 boto3 기본 자격 증명 체인(환경 변수, 인스턴스 역할 등)을 사용 → 자격 증명 없이도 관리 명령/테스트 실행 가능
+AWS_ACCESS_KEY_ID = get_secret("AWS_ACCESS_KEY_ID", None) # .csv 파일에 있는 내용을 입력 Access key ID. IAM 계정 관련
+AWS_SECRET_ACCESS_KEY = get_secret("AWS_SECRET_ACCESS_KEY", None) # .csv 파일에 있는 내용을 입력 Secret access key. IAM 계정 관련
 AWS_REGION = 'ap-northeast-2'
 
 ###S3###
@@ -200,6 +213,56 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
+    # 목록 API는 (created_at, id) 기준 커서 페이지네이션
+    'DEFAULT_PAGINATION_CLASS': 'config.pagination.KeysetCursorPagination',
+    'PAGE_SIZE': 20,
+}
+
+# 목록 API의 ?page_size= 상한
+API_MAX_PAGE_SIZE = 100
+
+# OpenAI API 키 (없으면 AI 초안 호출 시점에 ImproperlyConfigured)
+OPENAI_API_KEY = get_secret("OPEN_API_SECRET_KEY", None)
+
+# AI 초안 LLM 호출 (proposals/services/llm.py)
+# - PROVIDER: "openai" / "stub"(API 키 없이 고정 응답 + 인위적 지연, 부하 테스트/벤치마크용)
+# - 호출마다 TIMEOUT 적용, 일시 오류는 지터 백오프로 MAX_RETRIES번 재시도
+# - 연속 BREAKER_THRESHOLD번 실패하면 BREAKER_RESET_TIMEOUT초 동안 호출 차단(503)
+AI_LLM = {
+    "PROVIDER": os.getenv("AI_LLM_PROVIDER", "openai"),
+    "MODEL": "gpt-4o",
+    "TIMEOUT": float(os.getenv("AI_LLM_TIMEOUT", "60")),  # 초
+    "MAX_RETRIES": 2,
+    "BACKOFF_BASE": 0.5,  # 초
+    "BACKOFF_MAX": 8,  # 초
+    "BREAKER_THRESHOLD": 5,
+    "BREAKER_RESET_TIMEOUT": 30,  # 초
+    "STUB_LATENCY": float(os.getenv("AI_LLM_STUB_LATENCY", "0.5")),  # 초
+    "STUB_JITTER": float(os.getenv("AI_LLM_STUB_JITTER", "0")),  # 초
+}
+
+# AI 제안서 초안 비동기 작업 (?mode=async)
+# - "thread": 웹 프로세스 내 스레드 풀에서 처리 / "db": run_draft_jobs 워커가 처리 / "sync": 즉시 처리(테스트용)
+AI_DRAFT_QUEUE_BACKEND = os.getenv("AI_DRAFT_QUEUE_BACKEND", "thread")
+AI_DRAFT_WORKERS = int(os.getenv("AI_DRAFT_WORKERS", "4"))
+# RUNNING으로 이만큼(초) 지난 작업은 워커가 죽은 것으로 보고 run_draft_jobs가 회수 (LLM 타임아웃 × 재시도보다 길게)
+AI_DRAFT_JOB_TIMEOUT = int(os.getenv("AI_DRAFT_JOB_TIMEOUT", "600"))
+AI_DRAFT_JOB_MAX_ATTEMPTS = 3
+
+# AI 제안서 초안 응답 캐시 (같은 입력이면 OpenAI 재호출 없이 반환)
+# - BACKEND: "memory"(프로세스 로컬) / "db"(AIDraftCacheEntry 테이블, 프로세스 간 공유) / "none"
+AI_DRAFT_CACHE = {
+    "BACKEND": os.getenv("AI_DRAFT_CACHE_BACKEND", "memory"),
+    "TTL": 60 * 60 * 24,  # 초
+    "MAX_ENTRIES": 1000,
+}
+
+# AI 제안서 초안 일괄 생성 (ai-draft/batch)
+AI_DRAFT_BATCH = {
+    "MAX_RECIPIENTS": 50,       # 요청당 최대 수신자 수
+    "WORKERS": 4,               # GPT 동시 호출 수
+    "OWNER_RATE_LIMIT": 20,     # 사장님 한 명의 프로필로 만드는 초안 수 상한 (윈도우당)
+    "OWNER_RATE_WINDOW": 60 * 60,  # 초
 }
 
 SIMPLE_JWT = {
@@ -253,8 +316,93 @@ CORS_ALLOWED_ORIGINS = [
 ]
 
 # S3 파일 스토리지 설정
-DEFAULT_FILE_STORAGE = 'storages.backends.s3boto3.S3Boto3Storage'
+# default_storage는 지연 객체라 첫 파일 접근 시점에 S3Boto3Storage(boto3)를 import/생성함
+# MEDIA_STORAGE=local 이면 S3 대신 로컬 파일 시스템(MEDIA_ROOT)에 저장 (로컬 개발/테스트용)
+MEDIA_STORAGE = os.getenv("MEDIA_STORAGE", "s3")
+STORAGES = {
+    "default": {"BACKEND": "storages.backends.s3boto3.S3Boto3Storage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
+if MEDIA_STORAGE == "local":
+    STORAGES["default"] = {"BACKEND": "django.core.files.storage.FileSystemStorage"}
+    MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+    MEDIA_URL = '/media/'
+
+# 업로드 이미지 파생본 (profiles/services/images.py): 이름 → 긴 변 최대 픽셀, WebP로 저장
+IMAGE_VARIANTS = {
+    "thumb": 320,   # 목록/카드
+    "medium": 960,  # 상세
+}
+IMAGE_VARIANT_QUALITY = 80
+
+# 프로필 사진/메뉴 이미지 백그라운드 업로드 (profiles/services/uploads.py)
+# - BACKEND: "thread"(웹 프로세스 스레드 풀) / "sync"(커밋 직후 즉시 처리, 테스트용)
+# - STAGING_DIR: 업로드 전 파일을 임시 저장할 로컬 디렉터리 (BASE_DIR 기준)
+PROFILE_UPLOADS = {
+    "BACKEND": os.getenv("PROFILE_UPLOAD_BACKEND", "thread"),
+    "WORKERS": 4,
+    "STAGING_DIR": "upload_staging",
+    "STALE_AFTER": 10 * 60,  # 초
+}
 
-from storages.backends.s3boto3 import S3Boto3Storage
-from django.core.files.storage import default_storage
-default_storage._wrapped = S3Boto3Storage()
+# 삭제된 프로필 이미지의 스토리지 파일 정리 (profiles/services/deletions.py)
+# - BACKEND: "thread"(웹 프로세스에서 커밋 후 처리) / "db"(flush_storage_deletions 워커만 처리) / "sync"(테스트용)
+# - BATCH_SIZE: 한 번에 선점할 키 수 (S3 DeleteObjects는 요청당 최대 1000키)
+STORAGE_DELETIONS = {
+    "BACKEND": os.getenv("STORAGE_DELETION_BACKEND", "thread"),
+    "BATCH_SIZE": 1000,
+    "LEASE": 5 * 60,        # 초
+    "RETRY_BASE": 30,       # 초
+    "RETRY_MAX": 6 * 60 * 60,
+}
+
+# 프로필 목록 응답 캐시 (profiles/services/listing_cache.py)
+# - ALIAS: 사용할 Django 캐시, Redis/Memcached/DB 캐시처럼 워커 간 공유되는 백엔드여야 동작
+#   (CACHES 미설정 시 기본값은 프로세스 로컬 메모리 → 목록 캐시는 꺼진 것과 같음)
+# - ALLOW_LOCAL: 로컬 메모리 캐시로도 사용 (runserver 같은 단일 프로세스에서만)
+# - TTL: 초, 무효화는 저장/삭제 시그널로 즉시 이뤄지므로 TTL은 이전 버전 항목의 정리 주기
+PROFILE_LIST_CACHE = {
+    "ENABLED": os.getenv("PROFILE_LIST_CACHE_ENABLED", "1") == "1",
+    "ALIAS": "default",
+    "TTL": 5 * 60,
+    "ALLOW_LOCAL": os.getenv("PROFILE_LIST_CACHE_ALLOW_LOCAL", "0") == "1",
+}
+
+# 사장님 프로필 검색 (profiles/services/search.py)
+# - TIME_ZONE: business_day 시간대의 기준 시간대 ("지금 영업 중" 판단)
+# - 점수 = 받은 찜 수 * LIKE_WEIGHT + 받은 추천 수 * RECOMMEND_WEIGHT
+OWNER_SEARCH = {
+    "TIME_ZONE": "Asia/Seoul",
+    "LIKE_WEIGHT": 1,
+    "RECOMMEND_WEIGHT": 2,
+}
+
+# 목록 화면용 찜/추천 상태 일괄 조회 (accounts/services/relation_state.py, GET /users/relation-state/)
+# - MAX_IDS: 한 요청의 최대 대상 수
+# - 누른 찜/추천이 HEAVY_USER_THRESHOLD개 이상인 유저는 대상 id 비트셋을 ALIAS 캐시에 TTL초 동안 보관
+RELATION_STATE = {
+    "MAX_IDS": 100,
+    "CACHE_ENABLED": os.getenv("RELATION_STATE_CACHE_ENABLED", "1") == "1",
+    "ALIAS": "default",
+    "TTL": 10 * 60,
+    "HEAVY_USER_THRESHOLD": 200,
+}
+
+# 사장님 × 학생단체 매칭 후보 배치 (profiles/services/matching.py, refresh_partner_matches 명령)
+# - TOP_K: 유저별 저장 후보 수 / CHUNK_SIZE: 한 번에 점수 행렬을 만들 사장님 유저 수
+# - WEIGHTS: 항목별 가중치 (campus, business_type, goals, off_peak, student_size)
+PARTNER_MATCHING = {
+    "TOP_K": 20,
+    "CHUNK_SIZE": 2000,
+}
+
+# 요청별 쿼리 예산 계측 (config/query_budget.py, 누적 지표: GET /api/query-stats/)
+# - 쿼리 MAX_QUERIES개, 같은 쿼리 MAX_DUPLICATES회, DB 시간 MAX_DB_TIME_MS를 넘은 요청은 뷰 이름과 함께 경고 로그
+# - HEADERS: 응답에 X-Query-Count / X-DB-Time-Ms / X-Serializer-Time-Ms 헤더 추가
+QUERY_BUDGET = {
+    "ENABLED": os.getenv("QUERY_BUDGET_ENABLED", "1") == "1",
+    "MAX_QUERIES": 30,
+    "MAX_DUPLICATES": 5,
+    "MAX_DB_TIME_MS": 500,
+    "HEADERS": os.getenv("QUERY_BUDGET_HEADERS", "0") == "1",
+}
@@ -0,0 +1,39 @@
+from rest_framework.exceptions import ValidationError
+
+
+# 목록/상세 API 공용 희소 필드셋 (?fields=id,username,likes_received_count)
+# - 요청한 필드만 직렬화해 응답 크기와 직렬화 시간을 줄임 (콤마 구분, 반복 키도 허용)
+# - 없는 필드를 요청하면 400 — 오타로 빈 응답을 받는 일이 없도록
+# - 뷰는 requested_fields()로 어떤 관계를 prefetch할지 정할 수 있음
+
+FIELDS_PARAM = "fields"
+
+
+def requested_fields(request):
+    """?fields= 값 → 필드 이름 집합 (파라미터가 없거나 비어 있으면 None = 전체)"""
+    if request is None:
+        return None
+    names = {
+        name.strip()
+        for value in request.query_params.getlist(FIELDS_PARAM)
+        for name in value.split(",")
+        if name.strip()
+    }
+    return names or None
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer 믹스인: context["request"]의 ?fields=에 없는 필드를 제거
+    (최상위 응답 시리얼라이저에만 섞을 것 — 중첩용 시리얼라이저는 그대로 둠)
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        names = requested_fields(self.context.get("request"))
+        if names is None:
+            return
+        unknown = names - set(self.fields)
+        if unknown:
+            raise ValidationError({FIELDS_PARAM: [f"알 수 없는 필드: {', '.join(sorted(unknown))}"]})
+        for name in set(self.fields) - names:
+            self.fields.pop(name)
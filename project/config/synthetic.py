@@ -0,0 +1,282 @@
+import random
+import time
+from datetime import date, timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.models import Like, Recommendation, User
+from accounts.services.counters import repair_counters
+from profiles.models import (
+    BusinessType, Menu, OwnerPhoto, OwnerProfile, OwnerTimeRange,
+    StudentGroupProfile, StudentPhoto, StudentProfile,
+)
+from profiles.services.assets import MAX_OWNER_MENUS, MAX_OWNER_PHOTOS
+from profiles.services.hours import build_rows
+from profiles.services.search import GOAL_FIELDS, SERVICE_FIELDS
+from proposals.models import Proposal, ProposalStatus, StatusChoices
+
+# 벤치마크/부하 테스트용 합성 데이터 (generate_synthetic_data, benchmark_endpoints 명령)
+# - 규모 1 = BASE_COUNTS, scale배로 늘리거나 항목별 개수를 직접 지정
+#   (프로필당 사진/메뉴 수는 평균, 규모와 무관 — 프로필 수정 API의 상한 MAX_OWNER_PHOTOS/MENUS 이내)
+# - 역할별 유저 → 사장님 프로필(+영업/한산 시간 구간, 사진, 메뉴) → 학생단체 프로필(+사진) → 학생 프로필
+#   → 찜/추천(파레토 분포로 소수 사장님에게 몰림) → 제안서(+상태 이력) 순으로 bulk_create 배치 INSERT
+# - save()/시그널을 거치지 않는 값은 여기서 직접 맞춤: feature_mask, OwnerTimeRange, 유저 찜/추천 카운터
+#   (repair_counters), 제안서 current_status/status_changed_at
+# - 같은 seed면 같은 분포 (유저명 접두사만 실행마다 다름), 이미지는 기본 사진 경로만 채움 (스토리지 업로드 없음)
+
+BASE_COUNTS = {
+    "owners": 200,
+    "student_groups": 50,
+    "students": 500,
+    "likes": 5_000,
+    "recommendations": 1_000,
+    "proposals": 1_000,
+}
+PHOTOS_PER_OWNER = 3
+MENUS_PER_OWNER = 5
+PHOTOS_PER_GROUP = 2
+PLACEHOLDER_IMAGE = "defaults/owner_profile.png"
+
+CAMPUSES = [f"합성대학교 {i}캠퍼스" for i in range(20)]
+SCHEDULES = [
+    {"평일": ["09:00-21:00"], "토": ["10:00-17:00"]},
+    {"월": ["11:00-15:00", "17:00-22:00"], "화": ["11:00-15:00", "17:00-22:00"], "수": ["11:00-22:00"],
+     "목": ["11:00-22:00"], "금": ["11:00-23:00"], "토": ["12:00-23:00"]},
+    {"매일": ["18:00-02:00"]},
+    {"주말": ["10:00-20:00"]},
+    {"평일": ["07:30-19:00"]},
+]
+MENU_NAMES = ["아메리카노", "라떼", "떡볶이", "김밥", "치킨", "맥주", "파스타", "샐러드", "버거", "케이크"]
+PARTNERSHIP_TYPES = ["할인형", "리뷰형", "서비스제공형", "타임형"]
+
+# 제안서 상태 경로 (마지막이 현재 상태)와 비율
+STATUS_PATHS = [
+    ([StatusChoices.DRAFT], 0.2),
+    ([StatusChoices.DRAFT, StatusChoices.UNREAD], 0.25),
+    ([StatusChoices.DRAFT, StatusChoices.UNREAD, StatusChoices.READ], 0.2),
+    ([StatusChoices.DRAFT, StatusChoices.UNREAD, StatusChoices.READ, StatusChoices.PARTNERSHIP], 0.15),
+    ([StatusChoices.DRAFT, StatusChoices.UNREAD, StatusChoices.READ, StatusChoices.REJECTED], 0.15),
+    ([StatusChoices.DRAFT, StatusChoices.UNREAD, StatusChoices.READ, StatusChoices.REJECTED, StatusChoices.UNREAD], 0.05),
+]
+RECIPIENT_STATUSES = {StatusChoices.READ, StatusChoices.PARTNERSHIP, StatusChoices.REJECTED}
+
+
+def scaled_counts(scale=1.0, **overrides) -> dict:
+    """BASE_COUNTS × scale (최소 1), overrides에 값이 있는 항목은 그 값"""
+    counts = {name: max(1, int(round(base * scale))) for name, base in BASE_COUNTS.items()}
+    counts.update({name: value for name, value in overrides.items() if value is not None})
+    return counts
+
+
+class SyntheticDataGenerator:
+    """
+    generate(counts)로 한 번에 생성, 반환값은 실제로 만든 행 수
+    (찜/추천/제안서는 중복 쌍을 뺀 수라 요청한 개수보다 적을 수 있음)
+    """
+
+    def __init__(self, seed=42, batch_size=2_000, prefix=None, stdout=None):
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.prefix = prefix or f"syn{int(time.time())}"
+        self.stdout = stdout
+
+    def log(self, message):
+        if self.stdout is not None:
+            self.stdout.write(message)
+
+    @transaction.atomic
+    def generate(self, counts) -> dict:
+        started = time.perf_counter()
+        owners = self.create_users("o", counts["owners"], User.Role.OWNER)
+        groups = self.create_users("g", counts["student_groups"], User.Role.STUDENT_GROUP)
+        students = self.create_users("s", counts["students"], User.Role.STUDENT)
+        stats = {"users": len(owners) + len(groups) + len(students)}
+
+        stats.update(self.create_owner_profiles(owners))
+        stats.update(self.create_student_groups(groups))
+        stats["student_profiles"] = self.create_student_profiles(students)
+        self.log(f"유저/프로필: {time.perf_counter() - started:.1f}s")
+
+        # 찜/추천은 학생·학생단체 → 사장님, 인기는 소수 사장님에게 몰리도록
+        fans = students + groups
+        stats["likes"] = self.create_pairs(Like, "user_id", "target_id", fans, owners, counts["likes"])
+        stats["recommendations"] = self.create_pairs(
+            Recommendation, "from_user_id", "to_user_id", fans, owners, counts["recommendations"],
+        )
+        repair_counters(batch_size=self.batch_size)  # bulk_create는 카운터 시그널을 거치지 않음
+
+        stats.update(self.create_proposals(owners, groups, counts["proposals"]))
+        self.log(f"전체: {time.perf_counter() - started:.1f}s")
+        return stats
+
+    # ---- 유저 ----
+    def create_users(self, role_code, count, role) -> list:
+        usernames = [f"{self.prefix}{role_code}{i}" for i in range(count)]
+        for start in range(0, count, self.batch_size):
+            User.objects.bulk_create([
+                User(username=name, email=f"{name}@example.com", user_role=role, password="!")
+                for name in usernames[start:start + self.batch_size]
+            ])
+        return list(
+            User.objects.filter(username__startswith=f"{self.prefix}{role_code}", user_role=role)
+            .order_by("id").values_list("id", flat=True)
+        )
+
+    # ---- 사장님 프로필 ----
+    def create_owner_profiles(self, owners) -> dict:
+        stats = {"owner_profiles": 0, "owner_photos": 0, "menus": 0}
+        for start in range(0, len(owners), self.batch_size):
+            profiles = [self.build_owner_profile(user_id) for user_id in owners[start:start + self.batch_size]]
+            OwnerProfile.objects.bulk_create(profiles)
+            ids = dict(OwnerProfile.objects.filter(user_id__in=[p.user_id for p in profiles]).values_list("user_id", "id"))
+            ranges, photos, menus = [], [], []
+            for profile in profiles:
+                profile.pk = ids[profile.user_id]
+                ranges += build_rows(profile)
+                photos += [
+                    OwnerPhoto(owner_profile_id=profile.pk, image=PLACEHOLDER_IMAGE, order=order)
+                    for order in range(min(MAX_OWNER_PHOTOS, self.around(PHOTOS_PER_OWNER)))
+                ]
+                menus += [
+                    Menu(owner_profile_id=profile.pk, name=name, price=self.rng.randrange(3_000, 30_000, 500), order=order)
+                    for order, name in enumerate(self.rng.sample(MENU_NAMES, min(MAX_OWNER_MENUS, self.around(MENUS_PER_OWNER))))
+                ]
+            OwnerTimeRange.objects.bulk_create(ranges, batch_size=self.batch_size)
+            OwnerPhoto.objects.bulk_create(photos, batch_size=self.batch_size)
+            Menu.objects.bulk_create(menus, batch_size=self.batch_size)
+            stats["owner_profiles"] += len(profiles)
+            stats["owner_photos"] += len(photos)
+            stats["menus"] += len(menus)
+        return stats
+
+    def build_owner_profile(self, user_id) -> OwnerProfile:
+        rng = self.rng
+        profile = OwnerProfile(
+            user_id=user_id,
+            campus_name=rng.choice(CAMPUSES),
+            business_type=rng.choice(BusinessType.values),
+            profile_name=f"가게{user_id}"[:30],
+            business_day=rng.choice(SCHEDULES),
+            off_peak_time={"평일": [rng.choice(["14:00-17:00", "15:00-18:00", "10:00-12:00"])]},
+            average_sales=rng.randrange(5_000, 40_000, 500),
+            margin_rate=rng.randint(5, 60),
+            comment=rng.choice(["학생 환영", "단체석 있음", "", None]),
+            contact=f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}",
+            **{field: rng.random() < 0.3 for field in [*GOAL_FIELDS.values(), *SERVICE_FIELDS.values()]},
+        )
+        profile.feature_mask = profile.compute_feature_mask()  # bulk_create는 save()를 거치지 않음
+        return profile
+
+    # ---- 학생단체 / 학생 프로필 ----
+    def create_student_groups(self, groups) -> dict:
+        stats = {"student_group_profiles": 0, "student_photos": 0}
+        today = date.today()
+        for start in range(0, len(groups), self.batch_size):
+            profiles = []
+            for user_id in groups[start:start + self.batch_size]:
+                term_start = today - timedelta(days=self.rng.randint(0, 300))
+                profiles.append(StudentGroupProfile(
+                    user_id=user_id,
+                    university_name=self.rng.choice(CAMPUSES),
+                    council_name=f"학생회{user_id}",
+                    department=self.rng.choice(["경영학부", "공과대학", "인문대학", "총학생회"]),
+                    position=self.rng.choice(["회장", "부회장", "제휴국장"]),
+                    student_size=self.rng.randint(50, 5_000),
+                    term_start=term_start,
+                    term_end=term_start + timedelta(days=365),
+                    partnership_start=term_start + timedelta(days=30),
+                    partnership_end=term_start + timedelta(days=180),
+                    partnership_count=self.rng.randint(0, 10),
+                ))
+            StudentGroupProfile.objects.bulk_create(profiles)
+            ids = list(
+                StudentGroupProfile.objects.filter(user_id__in=[p.user_id for p in profiles]).values_list("id", flat=True)
+            )
+            photos = [
+                StudentPhoto(student_group_profile_id=pk, image=PLACEHOLDER_IMAGE, order=order)
+                for pk in ids
+                for order in range(self.around(PHOTOS_PER_GROUP))
+            ]
+            StudentPhoto.objects.bulk_create(photos, batch_size=self.batch_size)
+            stats["student_group_profiles"] += len(profiles)
+            stats["student_photos"] += len(photos)
+        return stats
+
+    def create_student_profiles(self, students) -> int:
+        rows = [
+            StudentProfile(user_id=user_id, name=f"학생{user_id}"[:10], university_name=self.rng.choice(CAMPUSES))
+            for user_id in students
+        ]
+        StudentProfile.objects.bulk_create(rows, batch_size=self.batch_size)
+        return len(rows)
+
+    # ---- 찜/추천 ----
+    def create_pairs(self, model, source_field, target_field, sources, targets, count) -> int:
+        pairs = set()
+        for _ in range(count):
+            pairs.add((self.rng.choice(sources), self.popular(targets)))
+        rows = [model(**{source_field: s, target_field: t}) for s, t in pairs]
+        model.objects.bulk_create(rows, batch_size=self.batch_size, ignore_conflicts=True)
+        return len(rows)
+
+    # ---- 제안서 ----
+    def create_proposals(self, owners, groups, count) -> dict:
+        """학생단체 → 사장님 70%, 사장님 → 학생단체 30% (한 배치 안에서 (작성자, 수신자) 쌍은 유일)"""
+        users = User.objects.in_bulk(owners + groups)
+        pairs = set()
+        for _ in range(count):
+            owner, group = users[self.popular(owners)], users[self.rng.choice(groups)]
+            pairs.add((group, owner) if self.rng.random() < 0.7 else (owner, group))
+        pairs = sorted(pairs, key=lambda pair: (pair[0].pk, pair[1].pk))
+        self.rng.shuffle(pairs)
+
+        paths, weights = zip(*STATUS_PATHS)
+        stats = {"proposals": 0, "status_history": 0}
+        for start in range(0, len(pairs), self.batch_size):
+            proposals = [self.build_proposal(author, recipient) for author, recipient in pairs[start:start + self.batch_size]]
+            Proposal.bulk_create_drafts(proposals)  # 제안서 + DRAFT 이력 (pk 채움)
+
+            by_status, history = {}, []
+            for proposal in proposals:
+                path = self.rng.choices(paths, weights)[0]
+                for status in path[1:]:
+                    changed_by = proposal.recipient_id if status in RECIPIENT_STATUSES else proposal.author_id
+                    history.append(ProposalStatus(proposal=proposal, status=status, changed_by_id=changed_by))
+                by_status.setdefault(path[-1], []).append(proposal.pk)
+            ProposalStatus.objects.bulk_create(history, batch_size=self.batch_size)
+            now = timezone.now()
+            for status, ids in by_status.items():
+                if status != StatusChoices.DRAFT:
+                    Proposal.objects.filter(pk__in=ids).update(current_status=status, status_changed_at=now)
+            stats["proposals"] += len(proposals)
+            stats["status_history"] += len(proposals) + len(history)
+        return stats
+
+    def build_proposal(self, author, recipient) -> Proposal:
+        rng = self.rng
+        starts = date.today() + timedelta(days=rng.randint(-60, 60))
+        return Proposal(
+            author=author,
+            recipient=recipient,
+            sender_name=author.username,
+            recipient_display_name=recipient.username,
+            expected_effects="신규 고객 유입과 재방문 증가",
+            partnership_type=rng.sample(PARTNERSHIP_TYPES, rng.randint(1, 2)),
+            contact_info=f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}",
+            apply_target=rng.choice(["대학생 전체", "학생회 구성원", "모든 손님"]),
+            time_windows=[{"days": ["Mon", "Tue", "Wed"], "start": "14:00", "end": "17:00"}],
+            benefit_description=rng.choice(["전 메뉴 10% 할인", "음료 1잔 무료", "리뷰 작성 시 사이드 제공"]),
+            period_start=starts,
+            period_end=starts + timedelta(days=rng.choice([30, 90, 180])),
+        )
+
+    # ---- 분포 ----
+    def around(self, mean) -> int:
+        """0 ~ 2 × mean 사이 정수 (평균 mean)"""
+        return self.rng.randint(0, 2 * mean)
+
+    def popular(self, ids):
+        """파레토 분포 — 앞쪽 몇 개(섞인 순서)에 선택이 몰림"""
+        index = min(int(self.rng.paretovariate(1.2)) - 1, len(ids) - 1)
+        return ids[(index * 7919) % len(ids)]
@@ -0,0 +1,38 @@
+from concurrent.futures import Future
+from contextlib import contextmanager
+
+from config.query_budget import _config, record
+
+
+# 앱 테스트 공용 헬퍼
+# - QueryBudgetMixin: 쿼리 예산 검증 (config.query_budget 계측 재사용)
+#   with self.assertQueryBudget(5): self.client.get(...)
+#   쿼리 수가 max_queries를 넘거나 같은 지문의 쿼리가 max_duplicates번을 넘으면 실패
+#   (실패 메시지에 반복된 쿼리 지문과 횟수 포함 → 어디서 N+1이 생겼는지 바로 보임)
+# - InlineExecutor: 스레드 풀을 쓰는 코드(업로드 후처리, AI 초안 워커)를 테스트에서 동기로 실행
+
+
+class QueryBudgetMixin:
+    """TestCase 믹스인: 블록 안의 쿼리 수 / 같은 쿼리 반복 횟수 상한 검증"""
+
+    @contextmanager
+    def assertQueryBudget(self, max_queries, max_duplicates=None):
+        if max_duplicates is None:
+            max_duplicates = _config("MAX_DUPLICATES")
+        with record() as recorder:
+            yield recorder
+
+        duplicates = "\n".join(f"  {count}x {sql}" for sql, count in recorder.duplicates().items())
+        if recorder.queries > max_queries:
+            self.fail(f"쿼리 {recorder.queries}개 (예산 {max_queries}개)\n{duplicates}")
+        if recorder.max_duplicates() > max_duplicates:
+            self.fail(f"같은 쿼리가 {recorder.max_duplicates()}회 반복 (허용 {max_duplicates}회)\n{duplicates}")
+
+
+class InlineExecutor:
+    """ThreadPoolExecutor 대용: submit()한 함수를 현재 스레드에서 바로 실행 (테스트 트랜잭션 안의 데이터가 보이도록)"""
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
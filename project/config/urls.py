@@ -1,3 +1,5 @@
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, re_path, include
 from rest_framework import permissions
@@ -5,6 +7,7 @@ from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 from rest_framework_simplejwt.views import TokenRefreshView, TokenVerifyView
 from accounts.views import LoginView, RegisterView
+from config.views import QueryBudgetStatsView
 
 schema_view = get_schema_view(
     openapi.Info(
@@ -30,7 +33,14 @@ urlpatterns = [
     path('auth/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('auth/verify/', TokenVerifyView.as_view(), name='token_verify'),
 
+    # 엔드포인트별 쿼리 예산 지표 (관리자 전용)
+    path('api/query-stats/', QueryBudgetStatsView.as_view(), name='query-stats'),
+
     # Swagger, Open API UI
     path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
     path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
 ]
+
+# 로컬 미디어 스토리지(MEDIA_STORAGE=local)일 때 업로드 파일 서빙 (DEBUG에서만 동작)
+if settings.MEDIA_STORAGE == "local":
+    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -0,0 +1,23 @@
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from config.query_budget import query_budget_stats
+
+
+class QueryBudgetStatsView(APIView):
+    """엔드포인트별 쿼리 수/DB 시간 누적 지표 (관리자 전용, 응답한 워커 프로세스 기준)"""
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        operation_summary="엔드포인트별 쿼리 예산 지표",
+        operation_description=(
+            "뷰 이름별 요청 수, 평균/최대 쿼리 수, 평균/최대 DB 시간(ms), 평균 직렬화 시간(ms), "
+            "예산 초과 횟수, 가장 많이 반복된 쿼리 지문을 DB 시간 합계가 큰 순으로 반환합니다."
+        ),
+        responses={200: "엔드포인트별 지표"}
+    )
+    def get(self, request):
+        return Response(query_budget_stats(), status=status.HTTP_200_OK)
@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from profiles.models import OwnerPhoto, Menu, StudentPhoto, StudentProfile, UploadStatus
+from profiles.services import listing_cache
+from profiles.services.images import generate_variants
+
+VARIANT_MODELS = (OwnerPhoto, Menu, StudentPhoto, StudentProfile)
+
+
+class Command(BaseCommand):
+    """
+    파생본 도입 이전에 올라간 이미지의 크기/썸네일/중간 크기 WebP 생성
+    - 원본을 스토리지(S3)에서 내려받아 처리하므로 --limit으로 나눠 실행 가능
+    사용 예)
+      python manage.py backfill_image_variants
+      python manage.py backfill_image_variants --limit 200
+    """
+    help = "크기 정보가 없는 기존 이미지의 파생본을 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=None, help="모델별 최대 처리 수")
+
+    def handle(self, *args, **options):
+        done = failed = 0
+        for model in VARIANT_MODELS:
+            qs = model.objects.filter(image_width__isnull=True).exclude(image="").exclude(image__isnull=True)
+            staged = any(f.name == "upload_status" for f in model._meta.fields)
+            if staged:
+                qs = qs.filter(upload_status=UploadStatus.READY)
+            for obj in qs.order_by("pk")[:options["limit"]].iterator():
+                try:
+                    with obj.image.open("rb") as f:
+                        fields = generate_variants(obj, f)
+                except OSError:
+                    fields = {}
+                if not fields:
+                    failed += 1
+                    continue
+                if staged:
+                    fields["modified_at"] = timezone.now()
+                model.objects.filter(pk=obj.pk).update(**fields)
+                done += 1
+            listing_cache.invalidate_model(model)
+        self.stdout.write(self.style.SUCCESS(f"{done}건 생성, 실패 {failed}건"))
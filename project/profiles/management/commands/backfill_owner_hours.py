@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from profiles.models import OwnerProfile, OwnerTimeRange, TimeRangeKind
+from profiles.services.hours import SOURCE_FIELDS, build_rows
+
+
+class Command(BaseCommand):
+    """
+    사장님 프로필의 영업/피크/한산 시간대 JSON을 다시 파싱해 OwnerTimeRange 재구성
+    - 저장 시그널을 거치지 않은 변경(update(), 직접 SQL, 파서 변경 후)을 맞출 때 사용
+    - pk 순 배치마다 삭제 1회 + bulk_create 1회를 한 트랜잭션으로 처리
+    사용 예)
+      python manage.py backfill_owner_hours
+      python manage.py backfill_owner_hours --kind OFF_PEAK --batch-size 1000
+    """
+    help = "시간대 JSON으로 사장님 프로필의 시간대 구간 테이블을 다시 채웁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--kind", action="append", choices=TimeRangeKind.values,
+            help="다시 계산할 종류 (여러 번 지정 가능, 기본: 전체)",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        kinds = options["kind"] or list(SOURCE_FIELDS)
+        fields = [SOURCE_FIELDS[kind] for kind in kinds]
+        batch_size = max(1, options["batch_size"])
+
+        profiles = rows = 0
+        last_pk = 0
+        while True:
+            batch = list(OwnerProfile.objects.filter(pk__gt=last_pk).order_by("pk").only("pk", *fields)[:batch_size])
+            if not batch:
+                break
+            new_rows = [row for profile in batch for row in build_rows(profile, kinds)]
+            with transaction.atomic():
+                OwnerTimeRange.objects.filter(owner_profile__in=[p.pk for p in batch], kind__in=kinds).delete()
+                OwnerTimeRange.objects.bulk_create(new_rows)
+            profiles += len(batch)
+            rows += len(new_rows)
+            last_pk = batch[-1].pk
+
+        self.stdout.write(self.style.SUCCESS(f"프로필 {profiles}개, 구간 {rows}개 ({', '.join(kinds)})"))
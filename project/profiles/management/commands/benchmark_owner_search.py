@@ -0,0 +1,161 @@
+import random
+import statistics
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import Like, Recommendation, User
+from accounts.services.counters import repair_counters
+from profiles.models import BusinessType, OwnerProfile, OwnerTimeRange, PartnershipGoal, Service
+from profiles.services.hours import build_rows
+from profiles.services.search import GOAL_FIELDS, SERVICE_FIELDS, local_now, search_owners
+
+CAMPUSES = [f"벤치대학교 {i}캠퍼스" for i in range(40)]
+SCHEDULES = [
+    {"평일": ["09:00-21:00"], "토": ["10:00-17:00"]},
+    {"월": ["11:00-15:00", "17:00-22:00"], "화": ["11:00-15:00", "17:00-22:00"], "수": ["11:00-22:00"],
+     "목": ["11:00-22:00"], "금": ["11:00-23:00"], "토": ["12:00-23:00"]},
+    {"매일": ["18:00-02:00"]},
+    {"주말": ["10:00-20:00"]},
+    {"평일": ["07:30-19:00"]},
+]
+
+
+class Command(BaseCommand):
+    """
+    사장님 프로필 검색 벤치마크 (합성 데이터)
+    - --profiles개 사장님 프로필(+영업/한산 시간 구간), 학생 --students명의 찜/추천을 bulk_create로 생성
+    - 대표 검색 조합마다 첫 페이지 조회를 --repeat번 실행해 p50/p95/최대 지연과 쿼리 수 출력
+    - 기본은 끝나면 롤백 (--keep이면 데이터 유지), --explain이면 조합별 실행 계획 출력
+    사용 예)
+      python manage.py benchmark_owner_search --profiles 100000
+      python manage.py benchmark_owner_search --profiles 20000 --repeat 5 --explain
+    """
+    help = "합성 데이터로 사장님 프로필 검색 성능을 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--profiles", type=int, default=100_000)
+        parser.add_argument("--students", type=int, default=2_000)
+        parser.add_argument("--likes", type=int, default=200_000)
+        parser.add_argument("--recommendations", type=int, default=50_000)
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--page-size", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--batch-size", type=int, default=2_000)
+        parser.add_argument("--keep", action="store_true", help="생성한 데이터를 롤백하지 않음")
+        parser.add_argument("--explain", action="store_true", help="조합별 실행 계획 출력")
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options["seed"])
+        self.batch_size = options["batch_size"]
+        with transaction.atomic():
+            started = time.perf_counter()
+            self.generate(options)
+            self.stdout.write(f"데이터 생성: {time.perf_counter() - started:.1f}s")
+            for name, params in self.scenarios():
+                self.run_scenario(name, params, options)
+            if not options["keep"]:
+                transaction.set_rollback(True)
+
+    # ---- 합성 데이터 ----
+    def generate(self, options):
+        prefix = f"bench{int(time.time())}"
+        owners = self.create_users(prefix, "o", options["profiles"], User.Role.OWNER)
+        students = self.create_users(prefix, "s", options["students"], User.Role.STUDENT)
+
+        for start in range(0, len(owners), self.batch_size):
+            profiles = [self.build_profile(user_id) for user_id in owners[start:start + self.batch_size]]
+            OwnerProfile.objects.bulk_create(profiles)
+            ids = dict(OwnerProfile.objects.filter(user_id__in=[p.user_id for p in profiles]).values_list("user_id", "id"))
+            ranges = []
+            for profile in profiles:
+                profile.pk = ids[profile.user_id]
+                ranges += build_rows(profile)
+            OwnerTimeRange.objects.bulk_create(ranges, batch_size=self.batch_size)
+
+        # 인기도는 소수 프로필에 몰리도록 (파레토 분포)
+        self.create_pairs(Like, "user_id", "target_id", students, owners, options["likes"])
+        self.create_pairs(Recommendation, "from_user_id", "to_user_id", students, owners, options["recommendations"])
+        repair_counters(batch_size=self.batch_size)  # bulk_create는 카운터 시그널을 거치지 않음
+        self.stdout.write(
+            f"생성: 사장님 {len(owners)}, 학생 {len(students)}, "
+            f"찜 {options['likes']}, 추천 {options['recommendations']} (요청 수, 중복 제외)"
+        )
+
+    def create_users(self, prefix, role_code, count, role) -> list:
+        usernames = [f"{prefix}{role_code}{i}" for i in range(count)]
+        for start in range(0, count, self.batch_size):
+            User.objects.bulk_create(
+                [User(username=name, user_role=role, password="!") for name in usernames[start:start + self.batch_size]]
+            )
+        return list(User.objects.filter(username__startswith=f"{prefix}{role_code}").values_list("id", flat=True))
+
+    def build_profile(self, user_id) -> OwnerProfile:
+        rng = self.rng
+        profile = OwnerProfile(
+            user_id=user_id,
+            campus_name=rng.choice(CAMPUSES),
+            business_type=rng.choice(BusinessType.values),
+            profile_name=f"가게{user_id}"[:30],
+            business_day=rng.choice(SCHEDULES),
+            off_peak_time={"평일": [rng.choice(["14:00-17:00", "15:00-18:00", "10:00-12:00"])]},
+            average_sales=rng.randrange(5_000, 40_000, 500),
+            margin_rate=rng.randint(5, 60),
+            **{field: rng.random() < 0.3 for field in [*GOAL_FIELDS.values(), *SERVICE_FIELDS.values()]},
+        )
+        profile.feature_mask = profile.compute_feature_mask()  # bulk_create는 save()를 거치지 않음
+        return profile
+
+    def create_pairs(self, model, source_field, target_field, sources, targets, count):
+        pairs = set()
+        for _ in range(count):
+            index = min(int(self.rng.paretovariate(1.2)) - 1, len(targets) - 1)
+            pairs.add((self.rng.choice(sources), targets[(index * 7919) % len(targets)]))
+        rows = [model(**{source_field: s, target_field: t}) for s, t in pairs]
+        model.objects.bulk_create(rows, batch_size=self.batch_size, ignore_conflicts=True)
+
+    # ---- 측정 ----
+    def scenarios(self):
+        # 월요일 19:00 (TIME_ZONE 기준) — 대부분의 영업 시간표가 걸치는 시각
+        now = local_now()
+        evening = (now - timedelta(days=now.weekday())).replace(hour=19, minute=0, second=0, microsecond=0)
+        campus = CAMPUSES[0]
+        return [
+            ("전체 (점수 순)", {}),
+            ("캠퍼스", {"campus_name": campus}),
+            ("캠퍼스 + 업종 + 객단가", {
+                "campus_name": campus, "business_type": BusinessType.CAFE, "min_sales": 10_000, "max_sales": 20_000,
+            }),
+            ("업종 + 객단가", {"business_type": BusinessType.BAR, "min_sales": 15_000}),
+            ("캠퍼스 + 목표 2개 + 서비스", {
+                "campus_name": campus,
+                "goals": [PartnershipGoal.NEW_CUSTOMERS, PartnershipGoal.REVISIT],
+                "services": [Service.DRINK],
+            }),
+            ("영업 중", {"open_at": evening}),
+            ("캠퍼스 + 영업 중 + 목표", {
+                "campus_name": campus, "open_at": evening, "goals": [PartnershipGoal.SPREAD_PEAK],
+            }),
+        ]
+
+    def run_scenario(self, name, params, options):
+        timings, queries, found = [], 0, 0
+        for _ in range(options["repeat"]):
+            queryset = search_owners(**params).order_by("-score", "-id")
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                found = len(list(queryset[:options["page_size"]]))
+                timings.append((time.perf_counter() - started) * 1000)
+            queries = len(captured)
+
+        timings.sort()
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        self.stdout.write(
+            f"{name:<24} p50 {statistics.median(timings):8.2f}ms  p95 {p95:8.2f}ms  "
+            f"max {timings[-1]:8.2f}ms  queries {queries}  rows {found}"
+        )
+        if options["explain"]:
+            self.stdout.write(search_owners(**params).order_by("-score", "-id")[:options["page_size"]].explain())
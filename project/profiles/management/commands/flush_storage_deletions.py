@@ -0,0 +1,35 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from profiles.models import StorageDeletion
+from profiles.services.deletions import flush_all
+
+
+class Command(BaseCommand):
+    """
+    스토리지 파일 삭제 대기열 워커 (STORAGE_DELETIONS["BACKEND"]="db"일 때 사용, 그 외에는 밀린 키 정리용)
+    - 대기 키를 BATCH_SIZE개씩 선점해서 S3 DeleteObjects로 일괄 삭제
+    - 선점은 조건부 UPDATE로 하므로 웹 프로세스/워커 여러 개가 겹쳐도 같은 키를 중복 처리하지 않음
+    사용 예)
+      python manage.py flush_storage_deletions
+      python manage.py flush_storage_deletions --once
+    """
+    help = "대기 중인 스토리지 파일 삭제를 일괄 처리합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="지금 처리 가능한 키만 처리하고 종료")
+        parser.add_argument("--interval", type=float, default=5.0, help="대기 키가 없을 때 폴링 간격(초)")
+
+    def handle(self, *args, **options):
+        processed = 0
+        while True:
+            claimed = flush_all()
+            processed += claimed
+            if options["once"]:
+                break
+            if not claimed:
+                time.sleep(options["interval"])
+
+        remaining = StorageDeletion.objects.count()
+        self.stdout.write(self.style.SUCCESS(f"{processed}건 처리, 대기/재시도 {remaining}건"))
@@ -0,0 +1,60 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from profiles.models import OwnerPhoto, Menu, StudentPhoto, StudentProfile, StorageDeletion
+from profiles.services.deletions import flush_all, list_files, queue_deletions
+
+FILE_MODELS = (OwnerPhoto, Menu, StudentPhoto, StudentProfile)
+
+
+class Command(BaseCommand):
+    """
+    DB에서 참조하지 않는 고아 이미지 파일 정리 (삭제 대기열 도입 전 누락분, 중단된 업로드 등)
+    - 모델별 upload_to 경로 아래 파일을 나열하고 원본/파생본/삭제 대기 키 어디에도 없는 파일을 삭제 대기열에 추가
+    - 업로드 직후(아직 DB에 키가 기록되기 전) 파일을 지우지 않도록 --older-than보다 오래된 파일만 대상
+    사용 예)
+      python manage.py reconcile_profile_files --dry-run
+      python manage.py reconcile_profile_files --older-than 86400
+    """
+    help = "DB에서 참조하지 않는 프로필 이미지 파일을 찾아 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--older-than", type=int, default=24 * 60 * 60, help="이 시간(초)보다 오래된 파일만 대상")
+        parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상만 출력")
+
+    def handle(self, *args, **options):
+        referenced = self.referenced_keys()
+        cutoff = timezone.now() - timedelta(seconds=options["older_than"])
+
+        orphans, scanned = [], 0
+        for model in FILE_MODELS:
+            field = model._meta.get_field("image")
+            for name, modified in list_files(field.storage, field.upload_to):
+                scanned += 1
+                if name not in referenced and modified < cutoff:
+                    orphans.append(name)
+
+        if options["dry_run"]:
+            for name in orphans:
+                self.stdout.write(name)
+            self.stdout.write(self.style.SUCCESS(f"{scanned}개 중 고아 파일 {len(orphans)}개 (dry-run)"))
+            return
+
+        queue_deletions(orphans)
+        flush_all()
+        self.stdout.write(self.style.SUCCESS(f"{scanned}개 중 고아 파일 {len(orphans)}개를 삭제 대기열에 추가했습니다."))
+
+    @staticmethod
+    def referenced_keys() -> set:
+        """DB에 기록된 원본/파생본 키 + 이미 삭제 대기 중인 키 + 공용 기본 이미지"""
+        keys = set(StorageDeletion.objects.values_list("name", flat=True))
+        keys.add(getattr(settings, "DEFAULT_OWNER_PHOTO_PATH", ""))
+        for model in FILE_MODELS:
+            for image, variants in model.objects.exclude(image="").values_list("image", "image_variants").iterator():
+                if image:
+                    keys.add(image)
+                keys.update(v["name"] for v in (variants or {}).values())
+        return keys
@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from profiles.services.matching import refresh_partner_matches
+
+
+class Command(BaseCommand):
+    """
+    사장님 × 학생단체 매칭 후보 재계산 (NumPy 행렬 점수 → 유저별 상위 K를 PartnerMatch에 교체 저장)
+    - cron 등으로 주기 실행하거나 --interval로 상주 실행
+    사용 예)
+      python manage.py refresh_partner_matches
+      python manage.py refresh_partner_matches --interval 3600 --top-k 30
+    """
+    help = "사장님과 학생단체의 매칭 후보를 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top-k", type=int, default=None, help="유저별 후보 수 (기본: PARTNER_MATCHING['TOP_K'])")
+        parser.add_argument("--chunk-size", type=int, default=None, help="한 번에 계산할 사장님 유저 수")
+        parser.add_argument("--interval", type=float, default=None, help="지정하면 이 간격(초)으로 계속 실행")
+
+    def handle(self, *args, **options):
+        while True:
+            stats = refresh_partner_matches(top_k=options["top_k"], chunk_size=options["chunk_size"])
+            self.stdout.write(self.style.SUCCESS(
+                f"사장님 프로필 {stats['owner_profiles']}개 × 학생단체 프로필 {stats['student_group_profiles']}개 → "
+                f"후보 {stats['matches']}건 (계산 {stats['compute_seconds']}s, 전체 {stats['total_seconds']}s)"
+            ))
+            if options["interval"] is None:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from profiles.models import OwnerPhoto, Menu, StudentPhoto
+from profiles.services.uploads import get_executor, retryable_uploads, upload_staged_image_in_worker
+
+UPLOAD_MODELS = (OwnerPhoto, Menu, StudentPhoto)
+
+
+class Command(BaseCommand):
+    """
+    업로드되지 못한 프로필 이미지 재시도 (서버 재시작/S3 장애 등으로 PENDING·FAILED에 남은 행)
+    - 스테이징 파일은 요청을 받은 서버의 로컬 디스크에 있으므로 같은 서버에서 실행
+    - 선점은 조건부 UPDATE로 하므로 웹 프로세스의 업로드와 겹쳐도 중복 업로드되지 않음
+    사용 예)
+      python manage.py retry_profile_uploads
+      python manage.py retry_profile_uploads --limit 100
+    """
+    help = "대기/실패 상태의 프로필 사진·메뉴 이미지 업로드를 재시도합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=500, help="모델별 최대 재시도 수")
+
+    def handle(self, *args, **options):
+        executor = get_executor()
+        futures = []
+        for model in UPLOAD_MODELS:
+            pks = retryable_uploads(model).order_by("pk").values_list("pk", flat=True)[:options["limit"]]
+            futures += [executor.submit(upload_staged_image_in_worker, model, pk) for pk in pks]
+        for future in futures:
+            future.result()
+
+        remaining = sum(retryable_uploads(model).count() for model in UPLOAD_MODELS)
+        self.stdout.write(self.style.SUCCESS(f"{len(futures)}건 재시도, 미완료 {remaining}건"))
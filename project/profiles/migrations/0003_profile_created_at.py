@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:12
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0002_alter_ownerprofile_off_peak_time_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studentgroupprofile',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True, default=django.utils.timezone.now, verbose_name='생성일'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='studentprofile',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True, default=django.utils.timezone.now, verbose_name='생성일'),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name='ownerprofile',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='생성일'),
+        ),
+    ]
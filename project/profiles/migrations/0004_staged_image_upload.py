@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0003_profile_created_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='menu',
+            name='staged_path',
+            field=models.CharField(blank=True, default='', help_text='업로드 전 스테이징 파일 경로 (완료 후 비움)', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='menu',
+            name='upload_started_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='업로드 시작'),
+        ),
+        migrations.AddField(
+            model_name='menu',
+            name='upload_status',
+            field=models.CharField(choices=[('PENDING', '업로드 대기'), ('UPLOADING', '업로드 중'), ('READY', '완료'), ('FAILED', '실패')], db_index=True, default='READY', max_length=10, verbose_name='업로드 상태'),
+        ),
+        migrations.AddField(
+            model_name='ownerphoto',
+            name='staged_path',
+            field=models.CharField(blank=True, default='', help_text='업로드 전 스테이징 파일 경로 (완료 후 비움)', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='ownerphoto',
+            name='upload_started_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='업로드 시작'),
+        ),
+        migrations.AddField(
+            model_name='ownerphoto',
+            name='upload_status',
+            field=models.CharField(choices=[('PENDING', '업로드 대기'), ('UPLOADING', '업로드 중'), ('READY', '완료'), ('FAILED', '실패')], db_index=True, default='READY', max_length=10, verbose_name='업로드 상태'),
+        ),
+        migrations.AddField(
+            model_name='studentphoto',
+            name='staged_path',
+            field=models.CharField(blank=True, default='', help_text='업로드 전 스테이징 파일 경로 (완료 후 비움)', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='studentphoto',
+            name='upload_started_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='업로드 시작'),
+        ),
+        migrations.AddField(
+            model_name='studentphoto',
+            name='upload_status',
+            field=models.CharField(choices=[('PENDING', '업로드 대기'), ('UPLOADING', '업로드 중'), ('READY', '완료'), ('FAILED', '실패')], db_index=True, default='READY', max_length=10, verbose_name='업로드 상태'),
+        ),
+    ]
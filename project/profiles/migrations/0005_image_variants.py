@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0004_staged_image_upload'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='menu',
+            name='image_height',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='원본 높이'),
+        ),
+        migrations.AddField(
+            model_name='menu',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, verbose_name='파생 이미지'),
+        ),
+        migrations.AddField(
+            model_name='menu',
+            name='image_width',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='원본 너비'),
+        ),
+        migrations.AddField(
+            model_name='ownerphoto',
+            name='image_height',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='원본 높이'),
+        ),
+        migrations.AddField(
+            model_name='ownerphoto',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, verbose_name='파생 이미지'),
+        ),
+        migrations.AddField(
+            model_name='ownerphoto',
+            name='image_width',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='원본 너비'),
+        ),
+        migrations.AddField(
+            model_name='studentphoto',
+            name='image_height',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='원본 높이'),
+        ),
+        migrations.AddField(
+            model_name='studentphoto',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, verbose_name='파생 이미지'),
+        ),
+        migrations.AddField(
+            model_name='studentphoto',
+            name='image_width',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='원본 너비'),
+        ),
+        migrations.AddField(
+            model_name='studentprofile',
+            name='image_height',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='원본 높이'),
+        ),
+        migrations.AddField(
+            model_name='studentprofile',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, verbose_name='파생 이미지'),
+        ),
+        migrations.AddField(
+            model_name='studentprofile',
+            name='image_width',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='원본 너비'),
+        ),
+    ]
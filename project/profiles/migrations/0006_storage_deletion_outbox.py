@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0005_image_variants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StorageDeletion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, verbose_name='스토리지 키')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='요청일시')),
+                ('available_at', models.DateTimeField(db_index=True, verbose_name='처리 가능 시각')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')),
+                ('last_error', models.TextField(blank=True, verbose_name='마지막 실패 사유')),
+            ],
+            options={
+                'verbose_name': '스토리지 파일 삭제 대기',
+                'verbose_name_plural': '스토리지 파일 삭제 대기',
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-17 09:12
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0006_storage_deletion_outbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='menu',
+            name='modified_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='수정일'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='ownerphoto',
+            name='modified_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='수정일'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='studentgroupprofile',
+            name='modified_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='수정일'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='studentphoto',
+            name='modified_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='수정일'),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:53
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fill_search_columns(apps, schema_editor):
+    # 기존 프로필의 feature_mask와 영업 시간 구간 채우기 (이후에는 저장 시 자동 갱신)
+    from profiles.models import FEATURE_BITS
+    from profiles.services.hours import week_intervals
+
+    OwnerProfile = apps.get_model('profiles', 'OwnerProfile')
+    OwnerTimeRange = apps.get_model('profiles', 'OwnerTimeRange')
+    for profile in OwnerProfile.objects.iterator(chunk_size=1000):
+        mask = sum(bit for name, bit in FEATURE_BITS.items() if getattr(profile, name))
+        if mask:
+            OwnerProfile.objects.filter(pk=profile.pk).update(feature_mask=mask)
+        OwnerTimeRange.objects.bulk_create([
+            OwnerTimeRange(owner_profile_id=profile.pk, kind='BUSINESS', start=start, end=end)
+            for start, end in week_intervals(profile.business_day)
+        ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0007_modified_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OwnerTimeRange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('BUSINESS', '영업 시간')], default='BUSINESS', max_length=10)),
+                ('start', models.PositiveIntegerField(help_text='시작 (주 단위 분, 포함)')),
+                ('end', models.PositiveIntegerField(help_text='끝 (주 단위 분, 미포함)')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='ownerprofile',
+            name='feature_mask',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='목표/서비스 비트마스크'),
+        ),
+        migrations.AddIndex(
+            model_name='ownerprofile',
+            index=models.Index(fields=['campus_name', 'business_type', 'average_sales'], name='owner_campus_type_sales_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ownerprofile',
+            index=models.Index(fields=['business_type', 'average_sales'], name='owner_type_sales_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ownerprofile',
+            index=models.Index(fields=['campus_name', 'feature_mask'], name='owner_campus_features_idx'),
+        ),
+        migrations.AddField(
+            model_name='ownertimerange',
+            name='owner_profile',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='time_ranges', to='profiles.ownerprofile'),
+        ),
+        migrations.AddIndex(
+            model_name='ownertimerange',
+            index=models.Index(fields=['kind', 'start', 'end'], name='owner_time_kind_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ownertimerange',
+            index=models.Index(fields=['owner_profile', 'kind', 'start'], name='owner_time_profile_idx'),
+        ),
+        migrations.RunPython(fill_search_columns, migrations.RunPython.noop),
+    ]
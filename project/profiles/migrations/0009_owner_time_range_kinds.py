@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:58
+
+from django.db import migrations, models
+
+
+def rebuild_time_ranges(apps, schema_editor):
+    # 요일 단위로 나눈 영업 시간 + 피크/한산 시간대로 다시 채움 (이후 수동 재계산은 backfill_owner_hours)
+    from profiles.services.hours import MINUTES_PER_DAY, SOURCE_FIELDS, week_intervals
+
+    OwnerProfile = apps.get_model('profiles', 'OwnerProfile')
+    OwnerTimeRange = apps.get_model('profiles', 'OwnerTimeRange')
+    OwnerTimeRange.objects.all().delete()
+    fields = list(SOURCE_FIELDS.values())
+    for row in OwnerProfile.objects.values('pk', *fields).iterator(chunk_size=1000):
+        OwnerTimeRange.objects.bulk_create([
+            OwnerTimeRange(
+                owner_profile_id=row['pk'], kind=str(kind), weekday=start // MINUTES_PER_DAY, start=start, end=end,
+            )
+            for kind, field in SOURCE_FIELDS.items()
+            for start, end in week_intervals(row[field])
+        ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0008_owner_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ownertimerange',
+            name='weekday',
+            field=models.PositiveSmallIntegerField(default=0, help_text='요일 (월=0 ~ 일=6)'),
+        ),
+        migrations.AlterField(
+            model_name='ownertimerange',
+            name='kind',
+            field=models.CharField(choices=[('BUSINESS', '영업 시간'), ('PEAK', '바쁜 시간대'), ('OFF_PEAK', '한산 시간대')], default='BUSINESS', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='ownertimerange',
+            index=models.Index(fields=['kind', 'weekday', 'start'], name='owner_time_kind_day_idx'),
+        ),
+        migrations.RunPython(rebuild_time_ranges, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 08:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0009_owner_time_range_kinds'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PartnerMatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField(verbose_name='순위')),
+                ('score', models.FloatField(verbose_name='점수')),
+                ('components', models.JSONField(blank=True, default=dict, verbose_name='항목별 점수')),
+                ('computed_at', models.DateTimeField(verbose_name='계산일시')),
+                ('owner_profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='profiles.ownerprofile')),
+                ('student_group_profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='profiles.studentgroupprofile')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='partner_matches', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '매칭 후보',
+                'verbose_name_plural': '매칭 후보',
+                'constraints': [models.UniqueConstraint(fields=('user', 'rank'), name='uq_partner_match_user_rank')],
+            },
+        ),
+    ]
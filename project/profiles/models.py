@@ -26,8 +26,69 @@ class PartnershipRecord(models.TextChoices):
         TRUE = 'TRUE', '있음'
         FALSE = 'FALSE', '없음'
 
+class TimeRangeKind(models.TextChoices):
+        BUSINESS = 'BUSINESS', '영업 시간'
+        PEAK = 'PEAK', '바쁜 시간대'
+        OFF_PEAK = 'OFF_PEAK', '한산 시간대'
+
+class UploadStatus(models.TextChoices):
+        PENDING = 'PENDING', '업로드 대기'
+        UPLOADING = 'UPLOADING', '업로드 중'
+        READY = 'READY', '완료'
+        FAILED = 'FAILED', '실패'
+
+
+# ------ 이미지 파생본(썸네일/중간 크기 WebP) 공통 필드 ------
+class ImageVariantFields(models.Model):
+    """
+    원본 크기와 파생본 정보 (profiles/services/images.py에서 업로드 시 생성)
+    image_variants 예: {"thumb": {"name": "owner_profile/photos/a__thumb.webp", "width": 320, "height": 240}, ...}
+    """
+    image_width = models.PositiveIntegerField(null=True, blank=True, verbose_name='원본 너비')
+    image_height = models.PositiveIntegerField(null=True, blank=True, verbose_name='원본 높이')
+    image_variants = models.JSONField(default=dict, blank=True, verbose_name='파생 이미지')
+
+    class Meta:
+        abstract = True
+
+
+# ------ 백그라운드 업로드 이미지 공통 필드 ------
+class StagedImageFields(ImageVariantFields):
+    """
+    요청 안에서는 파일을 로컬 스테이징 디렉터리에 저장하고 PENDING으로 응답,
+    커밋 후 워커가 스토리지(S3)에 올리고 image에 최종 키를 기록 (profiles/services/uploads.py)
+    """
+    upload_status = models.CharField(
+        max_length=10, choices=UploadStatus.choices, default=UploadStatus.READY,
+        db_index=True, verbose_name='업로드 상태',
+    )
+    staged_path = models.CharField(
+        max_length=255, blank=True, default="",
+        help_text='업로드 전 스테이징 파일 경로 (완료 후 비움)'
+    )
+    upload_started_at = models.DateTimeField(null=True, blank=True, verbose_name='업로드 시작')
+    # 조건부 GET 검증값에 사용 (update()로 상태/키를 바꾸는 곳에서도 함께 갱신)
+    modified_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
+
+    class Meta:
+        abstract = True
+
 
 # ------ 사장님 프로필 ------
+# 검색용 목표/서비스 비트마스크 (OwnerProfile.feature_mask) — 필드 → 비트
+FEATURE_BITS = {
+    "goal_new_customers": 1 << 0,
+    "goal_revisit": 1 << 1,
+    "goal_clear_stock": 1 << 2,
+    "goal_spread_peak": 1 << 3,
+    "goal_sns_marketing": 1 << 4,
+    "goal_collect_reviews": 1 << 5,
+    "goal_other": 1 << 6,
+    "service_drink": 1 << 8,
+    "service_side_menu": 1 << 9,
+    "service_other": 1 << 10,
+}
+
 class OwnerProfile(models.Model):
 
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='owner_profile')
@@ -123,14 +184,56 @@ class OwnerProfile(models.Model):
     # 연락처 
     contact = models.CharField(max_length=25, blank=True, null=True)
 
-    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
+    # goal_*/service_* 불리언을 합친 값 (저장 시 자동 계산, 검색에서 요청한 비트를 모두 가진 행만 필터)
+    feature_mask = models.PositiveIntegerField(default=0, editable=False, verbose_name='목표/서비스 비트마스크')
+
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='생성일')
     modified_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
 
+    class Meta:
+        # 검색 필터 조합 (profiles/services/search.py): 캠퍼스·업종 일치 + 객단가 범위, 캠퍼스 + 목표/서비스
+        indexes = [
+            models.Index(fields=['campus_name', 'business_type', 'average_sales'], name='owner_campus_type_sales_idx'),
+            models.Index(fields=['business_type', 'average_sales'], name='owner_type_sales_idx'),
+            models.Index(fields=['campus_name', 'feature_mask'], name='owner_campus_features_idx'),
+        ]
+
     def __str__(self):
         return self.profile_name
+
+    def compute_feature_mask(self) -> int:
+        return sum(bit for name, bit in FEATURE_BITS.items() if getattr(self, name))
+
+    def save(self, *args, **kwargs):
+        self.feature_mask = self.compute_feature_mask()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'feature_mask' not in update_fields:
+            kwargs['update_fields'] = [*update_fields, 'feature_mask']
+        super().save(*args, **kwargs)
     
+# 시간대 구간 : business_day/peak_time/off_peak_time JSON을 주 단위 분(월 00:00 = 0)으로 파싱한 결과
+# 한 행은 한 요일 안의 구간, JSON이 원본 (profiles/services/hours.py)
+class OwnerTimeRange(models.Model):
+    owner_profile = models.ForeignKey(
+        OwnerProfile, on_delete=models.CASCADE, related_name="time_ranges"
+    )
+    kind = models.CharField(max_length=10, choices=TimeRangeKind.choices, default=TimeRangeKind.BUSINESS)
+    weekday = models.PositiveSmallIntegerField(default=0, help_text="요일 (월=0 ~ 일=6)")
+    start = models.PositiveIntegerField(help_text="시작 (주 단위 분, 포함)")
+    end = models.PositiveIntegerField(help_text="끝 (주 단위 분, 미포함)")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['kind', 'start', 'end'], name='owner_time_kind_start_idx'),      # 특정 시각/시간 창과 겹치는 구간
+            models.Index(fields=['kind', 'weekday', 'start'], name='owner_time_kind_day_idx'),    # 특정 요일의 구간
+            models.Index(fields=['owner_profile', 'kind', 'start'], name='owner_time_profile_idx'),  # 프로필별 EXISTS 조회
+        ]
+
+    def __str__(self):
+        return f"{self.owner_profile_id} {self.kind} {self.start}-{self.end}"
+
 # 대표 사진 : 여러개 저장을 위해 별도 테이블 생성
-class OwnerPhoto(models.Model):
+class OwnerPhoto(StagedImageFields):
     owner_profile = models.ForeignKey(
         OwnerProfile, on_delete=models.CASCADE, related_name="photos"
     )
@@ -147,7 +250,7 @@ class OwnerPhoto(models.Model):
         return f"{self.owner_profile.profile_name} - photo#{self.pk}"
 
 # 대표 메뉴 : 여러개 저장을 위해 별도 테이블 생성
-class Menu(models.Model):
+class Menu(StagedImageFields):
     owner_profile = models.ForeignKey(
         OwnerProfile, on_delete=models.CASCADE, related_name="menus"
     )
@@ -219,8 +322,11 @@ class StudentGroupProfile(models.Model):
     # 제휴 이력
     partnership_count = models.PositiveIntegerField(default=0, db_index=True)
 
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='생성일')
+    modified_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
+
 # 학생 단체 대표 사진 : 여러개 저장을 위해 별도 테이블 생성
-class StudentPhoto(models.Model):
+class StudentPhoto(StagedImageFields):
     student_group_profile = models.ForeignKey(
         StudentGroupProfile, on_delete=models.CASCADE, related_name="photos"
     )
@@ -239,7 +345,7 @@ class StudentPhoto(models.Model):
 
 
 # ------ 학생 프로필 ------
-class StudentProfile(models.Model):
+class StudentProfile(ImageVariantFields):
 
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='student_profile')
     
@@ -260,7 +366,55 @@ class StudentProfile(models.Model):
         help_text="검색으로 선택한 캠퍼스명"
     )
 
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='생성일')
+
     def __str__(self):
         return f"{self.user.username}의 프로필"
 
 
+# ------ 스토리지 파일 삭제 대기열 (outbox) ------
+class StorageDeletion(models.Model):
+    """
+    삭제된 사진/메뉴/프로필 이미지의 스토리지 키 (profiles/services/deletions.py)
+    - 행 삭제와 같은 트랜잭션에서 기록 → 롤백되면 함께 사라지고, 커밋되면 워커가 S3에서 일괄 삭제 후 행 제거
+    - available_at: 처리 가능 시각 (선점 시 임대 만료 시각, 실패 시 재시도 시각으로 미룸)
+    """
+    name = models.CharField(max_length=255, verbose_name='스토리지 키')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='요청일시')
+    available_at = models.DateTimeField(db_index=True, verbose_name='처리 가능 시각')
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')
+    last_error = models.TextField(blank=True, verbose_name='마지막 실패 사유')
+
+    class Meta:
+        verbose_name = '스토리지 파일 삭제 대기'
+        verbose_name_plural = '스토리지 파일 삭제 대기'
+
+    def __str__(self):
+        return self.name
+
+
+# ------ 사장님 × 학생단체 매칭 후보 (배치로 미리 계산) ------
+class PartnerMatch(models.Model):
+    """
+    사용자별 상위 K개 매칭 후보 (profiles/services/matching.py, `refresh_partner_matches` 배치가 전체 교체)
+    - 사장님 유저: 후보는 학생단체 프로필 / 학생단체 유저: 후보는 사장님 프로필
+    - 유저가 프로필을 여러 개 가지면 가장 점수가 높은 자기 프로필 기준 (owner_profile/student_group_profile에 기록)
+    - /profiles/matches/는 (user, rank) 인덱스로 K행만 읽음
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='partner_matches')
+    rank = models.PositiveSmallIntegerField(verbose_name='순위')
+    owner_profile = models.ForeignKey(OwnerProfile, on_delete=models.CASCADE, related_name='+')
+    student_group_profile = models.ForeignKey(StudentGroupProfile, on_delete=models.CASCADE, related_name='+')
+    score = models.FloatField(verbose_name='점수')
+    components = models.JSONField(default=dict, blank=True, verbose_name='항목별 점수')
+    computed_at = models.DateTimeField(verbose_name='계산일시')
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'rank'], name='uq_partner_match_user_rank'),
+        ]
+        verbose_name = '매칭 후보'
+        verbose_name_plural = '매칭 후보'
+
+    def __str__(self):
+        return f"{self.user_id} #{self.rank} ({self.score:.3f})"
@@ -2,23 +2,44 @@ from rest_framework import serializers
 from .models import (
     OwnerProfile, OwnerPhoto, Menu,
     StudentGroupProfile, StudentPhoto,
-    PartnershipGoal, Service,
-    StudentProfile
+    PartnershipGoal, Service, BusinessType,
+    StudentProfile, PartnerMatch
 )
+from .services.images import build_srcset
+
+
+# ---- 공용: 원본 + 파생본 URL/크기 맵 ----
+class ImageSrcsetField(serializers.Field):
+    """
+    {"thumb": {"url", "width", "height"}, "medium": {...}, "original": {...}} (작은 것부터)
+    클라이언트는 표시 크기 이상인 가장 작은 항목을 고르면 됨 / 이미지가 없거나 업로드 전이면 null
+    """
+    def __init__(self, **kwargs):
+        kwargs.update(source="*", read_only=True)
+        super().__init__(**kwargs)
+
+    def to_representation(self, instance):
+        return build_srcset(instance.image, instance.image_width, instance.image_height, instance.image_variants)
 
 # ------ 업체 프로필 관련 Serializers ------
+# 사진/메뉴 이미지는 커밋 후 백그라운드로 업로드됨
+# → 업로드가 끝나기 전(upload_status: PENDING/UPLOADING/FAILED)에는 image가 null
 
 class OwnerPhotoSerializer(serializers.ModelSerializer):
+    srcset = ImageSrcsetField()
+
     class Meta:
         model = OwnerPhoto
-        fields = ["id", "image", "order", "uploaded_at"]
-        read_only_fields = ["id", "uploaded_at"]
+        fields = ["id", "image", "srcset", "upload_status", "order", "uploaded_at"]
+        read_only_fields = ["id", "upload_status", "uploaded_at"]
 
 class MenuSerializer(serializers.ModelSerializer):
+    srcset = ImageSrcsetField()
+
     class Meta:
         model = Menu
-        fields = ["id", "name", "price", "image", "order"]
-        read_only_fields = ["id"]
+        fields = ["id", "name", "price", "image", "srcset", "upload_status", "order"]
+        read_only_fields = ["id", "upload_status"]
 
 # --- 업체 프로필 조회용 --- 
 class OwnerProfileSerializer(serializers.ModelSerializer):
@@ -83,13 +104,55 @@ class OwnerProfileCreateSerializer(serializers.ModelSerializer):
         return instance
 
 
+# --- 업체 탐색 검색용 ---
+class CommaSeparatedChoiceField(serializers.Field):
+    """"NEW_CUSTOMERS,REVISIT" 또는 같은 키 반복 → 선택지 값 리스트"""
+    def __init__(self, choices, **kwargs):
+        self.choices = {str(value) for value, _ in choices}
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        values = [v.strip() for v in str(data).split(",") if v.strip()]
+        invalid = [v for v in values if v not in self.choices]
+        if invalid:
+            raise serializers.ValidationError(f"허용되지 않는 값: {', '.join(invalid)}")
+        return values
+
+
+class OwnerSearchQuerySerializer(serializers.Serializer):
+    campus_name = serializers.CharField(required=False, max_length=100)
+    business_type = serializers.ChoiceField(choices=BusinessType.choices, required=False)
+    goals = CommaSeparatedChoiceField(PartnershipGoal.choices, required=False, help_text="쉼표 구분, 모두 만족")
+    services = CommaSeparatedChoiceField(Service.choices, required=False, help_text="쉼표 구분, 모두 만족")
+    min_sales = serializers.IntegerField(required=False, min_value=0)
+    max_sales = serializers.IntegerField(required=False, min_value=0)
+    open_now = serializers.BooleanField(required=False, default=False)
+    open_at = serializers.DateTimeField(required=False, help_text="이 시각에 영업 중 (open_now보다 우선)")
+
+    def validate(self, attrs):
+        if attrs.get("min_sales") is not None and attrs.get("max_sales") is not None \
+                and attrs["min_sales"] > attrs["max_sales"]:
+            raise serializers.ValidationError({"max_sales": "max_sales는 min_sales보다 크거나 같아야 합니다."})
+        return attrs
+
+
+class OwnerSearchResultSerializer(OwnerProfileSerializer):
+    likes_count = serializers.IntegerField(read_only=True)
+    recommendations_count = serializers.IntegerField(read_only=True)
+    score = serializers.IntegerField(read_only=True)
+
+    class Meta(OwnerProfileSerializer.Meta):
+        fields = OwnerProfileSerializer.Meta.fields + ["likes_count", "recommendations_count", "score"]
+
 # ------ 학생단체 프로필 관련 Serializers ------
 
 class StudentPhotoSerializer(serializers.ModelSerializer):
+    srcset = ImageSrcsetField()
+
     class Meta:
         model = StudentPhoto
-        fields = ['id', 'image', 'order', 'uploaded_at']
-        read_only_fields = ['id', 'uploaded_at']
+        fields = ['id', 'image', 'srcset', 'upload_status', 'order', 'uploaded_at']
+        read_only_fields = ['id', 'upload_status', 'uploaded_at']
 
 # --- 학생단체 프로필 조회용 ---
 class StudentGroupProfileSerializer(serializers.ModelSerializer):
@@ -154,11 +217,13 @@ class StudentGroupProfileCreateSerializer(serializers.ModelSerializer):
 # --- 학생 프로필 조회용 ---
 class StudentProfileSerializer(serializers.ModelSerializer):
     
+    srcset = ImageSrcsetField()
+
     class Meta:
         model = StudentProfile
         fields = [
             'id', 'user', 'name',
-            'university_name', 'image'
+            'university_name', 'image', 'srcset'
         ]
         read_only_fields = ['id', 'user']
 
@@ -181,6 +246,46 @@ class StudentProfileCreateSerializer(serializers.ModelSerializer):
         
         return value
 
+# ------ 매칭 후보 ------
+class MatchOwnerSummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = OwnerProfile
+        fields = ["id", "user", "profile_name", "campus_name", "business_type", "average_sales", "comment"]
+        read_only_fields = fields
+
+
+class MatchStudentGroupSummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = StudentGroupProfile
+        fields = [
+            "id", "user", "university_name", "council_name", "department", "student_size",
+            "partnership_start", "partnership_end",
+        ]
+        read_only_fields = fields
+
+
+class PartnerMatchSerializer(serializers.ModelSerializer):
+    """candidate: 상대 프로필 요약 / my_profile_id: 점수 계산에 쓰인 내 프로필"""
+    candidate = serializers.SerializerMethodField()
+    my_profile_id = serializers.SerializerMethodField()
+
+    class Meta:
+        model = PartnerMatch
+        fields = ["rank", "score", "components", "candidate", "my_profile_id", "computed_at"]
+        read_only_fields = fields
+
+    def _viewer_is_owner(self, obj):
+        return obj.owner_profile.user_id == obj.user_id
+
+    def get_candidate(self, obj):
+        if self._viewer_is_owner(obj):
+            return MatchStudentGroupSummarySerializer(obj.student_group_profile).data
+        return MatchOwnerSummarySerializer(obj.owner_profile).data
+
+    def get_my_profile_id(self, obj):
+        return obj.owner_profile_id if self._viewer_is_owner(obj) else obj.student_group_profile_id
+
+
 # prompt에 넘길 메뉴 Serializer
 class MenuForAISerializer(serializers.ModelSerializer):
     class Meta:
@@ -0,0 +1,136 @@
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import connections, router
+
+from profiles.models import OwnerPhoto, Menu, StudentPhoto, UploadStatus
+from profiles.services import listing_cache
+from profiles.services.uploads import discard_staged_file, schedule_upload, stage_image
+
+# 프로필 사진/메뉴 일괄 등록·삭제
+# - 파일 수와 무관하게 고정된 쿼리 수: 관계별 삭제 1회 + bulk_create 1회
+#   (개수/최대 order는 프리페치된 목록에서 계산, MySQL처럼 bulk_create가 pk를 돌려주지 않으면 행마다 INSERT)
+# - 처리 후 프로필의 photos/menus 프리페치 캐시를 갱신 → 뷰는 다시 조회하지 않고 바로 직렬화
+# - 검증(개수 제한, 메뉴 이름/가격, 메뉴명 중복)은 파일을 스테이징하기 전에 끝냄
+
+MAX_OWNER_PHOTOS = 10
+MAX_OWNER_MENUS = 8
+
+
+class ProfileAssetError(Exception):
+    """사진/메뉴 요청 검증 실패 (뷰에서 body 그대로 400 응답)"""
+    def __init__(self, body):
+        super().__init__(body)
+        self.body = body
+
+
+def apply_owner_assets(
+    profile, *, created=False,
+    new_photos=(), delete_photo_ids=(),
+    new_menus=(), menu_images=(), delete_menu_ids=(),
+):
+    """
+    사장님 프로필의 대표 사진/메뉴 반영
+    - created=True: 방금 만든 프로필 (기존 사진/메뉴 없음, 조회 생략)
+    - new_menus: [{"name", "price"}], menu_images[i]는 new_menus[i]의 이미지 (없으면 이미지 없음)
+    - 사진이 하나도 남지 않으면 기본 대표 사진 추가
+    """
+    photos = _existing(profile, "photos", created)
+    menus = _existing(profile, "menus", created)
+    photos = _delete(OwnerPhoto, profile, "owner_profile", photos, delete_photo_ids)
+    menus = _delete(Menu, profile, "owner_profile", menus, delete_menu_ids)
+
+    if len(photos) + len(new_photos) > MAX_OWNER_PHOTOS:
+        raise ProfileAssetError({"message": f"대표 사진은 최대 {MAX_OWNER_PHOTOS}장까지 업로드할 수 있습니다."})
+    if len(menus) + len(new_menus) > MAX_OWNER_MENUS:
+        raise ProfileAssetError({"detail": f"대표 메뉴는 최대 {MAX_OWNER_MENUS}개까지 등록할 수 있습니다."})
+
+    # 메뉴 검증 (필드 값, 같은 프로필 내 메뉴명 중복) — DB 조회 없이
+    start = _next_order(menus)
+    menu_rows = [
+        Menu(owner_profile=profile, name=data.get("name"), price=data.get("price"), order=start + i)
+        for i, data in enumerate(new_menus)
+    ]
+    names = [m.name for m in menus]
+    for menu in menu_rows:
+        try:
+            menu.clean_fields(exclude=["owner_profile", "image"])
+        except ValidationError as e:
+            raise ProfileAssetError({"detail": "잘못된 메뉴 데이터입니다.", "errors": e.message_dict})
+        if menu.name in names:
+            raise ProfileAssetError({"detail": f"이미 등록된 메뉴명입니다: {menu.name}"})
+        names.append(menu.name)
+
+    start = _next_order(photos)
+    photo_rows = [OwnerPhoto(owner_profile=profile, order=start + i) for i in range(len(new_photos))]
+    if not photos and not photo_rows:
+        # ---- 기본 대표 사진 자동 생성 ----
+        photo_rows.append(OwnerPhoto(owner_profile=profile, image=settings.DEFAULT_OWNER_PHOTO_PATH, order=0))
+
+    photos += _insert(OwnerPhoto, photo_rows, new_photos)
+    menus += _insert(Menu, menu_rows, menu_images)
+    _set_prefetched(profile, photos=photos, menus=menus)
+    return profile
+
+
+def apply_student_group_assets(profile, *, created=False, new_photos=(), delete_photo_ids=()):
+    """학생단체 프로필의 대표 사진 반영 (개수 제한 없음)"""
+    photos = _existing(profile, "photos", created)
+    photos = _delete(StudentPhoto, profile, "student_group_profile", photos, delete_photo_ids)
+    start = _next_order(photos)
+    rows = [StudentPhoto(student_group_profile=profile, order=start + i) for i in range(len(new_photos))]
+    photos += _insert(StudentPhoto, rows, new_photos)
+    _set_prefetched(profile, photos=photos)
+    return profile
+
+
+# ---- 내부 ----
+def _existing(profile, name, created) -> list:
+    """기존 행 (뷰에서 prefetch_related 했다면 추가 쿼리 없음)"""
+    return [] if created else list(getattr(profile, name).all())
+
+
+def _delete(model, profile, fk_name, rows, ids) -> list:
+    ids = {int(i) for i in ids if str(i).isdigit()}
+    if not ids:
+        return rows
+    model.objects.filter(**{fk_name: profile}, id__in=ids).delete()
+    return [row for row in rows if row.pk not in ids]
+
+
+def _next_order(rows) -> int:
+    return max((row.order for row in rows), default=-1) + 1
+
+
+def _insert(model, rows, files) -> list:
+    """파일 스테이징 → bulk_create 1회 (pk를 돌려주지 않는 DB는 행마다 INSERT) → 커밋 후 업로드 예약"""
+    if not rows:
+        return []
+    for row, file in zip(rows, files):
+        if file is not None:
+            stage_image(row, file)
+    try:
+        if connections[router.db_for_write(model)].features.can_return_rows_from_bulk_insert:
+            model.objects.bulk_create(rows)
+        else:
+            # order는 유일하지 않아 동시 요청의 행과 섞일 수 있으므로 pk를 재조회하지 않고 한 행씩 INSERT
+            for row in rows:
+                row.save(force_insert=True)
+    except Exception:
+        for row in rows:
+            discard_staged_file(row)
+        raise
+
+    for row in rows:
+        if row.upload_status == UploadStatus.PENDING:
+            schedule_upload(row)
+    listing_cache.invalidate_model(model)  # bulk_create는 post_save 시그널이 없음
+    return rows
+
+
+def _set_prefetched(profile, **relations):
+    """직렬화 시 profile.<관계>.all()이 쿼리 없이 최신 목록을 반환하도록 프리페치 캐시 교체"""
+    cache = getattr(profile, "_prefetched_objects_cache", None)
+    if cache is None:
+        cache = profile._prefetched_objects_cache = {}
+    for name, rows in relations.items():
+        cache[name] = sorted(rows, key=lambda r: (r.order, r.pk or 0))
@@ -0,0 +1,208 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from profiles.models import StorageDeletion
+
+logger = logging.getLogger(__name__)
+
+# 스토리지(S3) 파일 삭제 대기열
+# - post_delete 시그널은 S3를 직접 호출하지 않고 삭제할 키를 StorageDeletion(outbox)에 기록
+#   → 행 삭제와 같은 트랜잭션이므로 롤백되면 기록도 사라짐 (파일은 그대로)
+# - 커밋 후 워커가 대기 키를 최대 BATCH_SIZE개씩 선점해서 S3 DeleteObjects(요청당 최대 1000키)로 일괄 삭제
+#   (S3가 아닌 스토리지는 키마다 storage.delete)
+# - settings.STORAGE_DELETIONS["BACKEND"]
+#   - "thread"(기본): 웹 프로세스의 스레드 풀에서 처리 (여러 커밋의 요청은 한 번의 flush로 합쳐짐)
+#   - "db": 별도 프로세스의 `python manage.py flush_storage_deletions` 워커만 처리
+#   - "sync": 커밋 직후 같은 스레드에서 처리 (테스트/로컬 디버깅용)
+# - 실패한 키는 지수 백오프로 재시도, DB에 참조가 없는 고아 파일은 `reconcile_profile_files`로 정리
+
+DEFAULTS = {
+    "BACKEND": "thread",
+    "BATCH_SIZE": 1000,
+    "LEASE": 5 * 60,          # 초, 선점 후 이 시간 안에 끝나지 않으면 다른 워커가 다시 가져감
+    "RETRY_BASE": 30,         # 초, 실패 시 RETRY_BASE * 2^(시도 횟수-1) 후 재시도
+    "RETRY_MAX": 6 * 60 * 60,
+}
+S3_MAX_KEYS = 1000  # DeleteObjects 요청 한 번의 최대 키 수
+
+
+def _config(name):
+    return getattr(settings, "STORAGE_DELETIONS", {}).get(name, DEFAULTS[name])
+
+
+_executor = None
+_executor_lock = threading.Lock()
+_flush_queued = False
+_flush_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """프로세스 당 하나의 삭제 워커 스레드 (처음 사용할 때 생성)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="storage-delete")
+    return _executor
+
+
+def image_keys(instance, field_name="image") -> list:
+    """instance가 가진 원본/파생본 스토리지 키 (공용 기본 이미지는 제외)"""
+    field_file = getattr(instance, field_name)
+    keys = [field_file.name] if field_file and field_file.name != getattr(settings, "DEFAULT_OWNER_PHOTO_PATH", None) else []
+    keys += [v["name"] for v in (getattr(instance, "image_variants", None) or {}).values()]
+    return keys
+
+
+def queue_deletions(names):
+    """삭제할 키를 현재 트랜잭션에 기록하고 커밋 후 flush 예약"""
+    names = [n for n in dict.fromkeys(names) if n]
+    if not names:
+        return
+    now = timezone.now()
+    StorageDeletion.objects.bulk_create([StorageDeletion(name=n, available_at=now) for n in names])
+    transaction.on_commit(request_flush)
+
+
+def request_flush():
+    backend = _config("BACKEND")
+    if backend == "sync":
+        flush_all()
+    elif backend == "thread":
+        global _flush_queued
+        with _flush_lock:
+            if _flush_queued:
+                return  # 이미 대기 중인 flush가 이번 키까지 처리
+            _flush_queued = True
+        get_executor().submit(_flush_in_worker)
+
+
+def _flush_in_worker():
+    global _flush_queued
+    with _flush_lock:
+        _flush_queued = False
+    close_old_connections()
+    try:
+        flush_all()
+    except Exception:
+        logger.exception("스토리지 파일 삭제 실패")
+    finally:
+        close_old_connections()
+
+
+def flush_all() -> int:
+    """지금 처리 가능한 키를 배치 단위로 모두 처리, 처리(선점)한 키 수 반환"""
+    total = 0
+    while True:
+        claimed = flush_deletions()
+        total += claimed
+        if claimed < _batch_size():
+            return total
+
+
+def _batch_size() -> int:
+    return max(1, _config("BATCH_SIZE"))
+
+
+def claim_deletions(limit) -> list:
+    """available_at이 지난 키를 조건부 UPDATE로 선점 (여러 워커가 같은 키를 중복 처리하지 않도록)"""
+    now = timezone.now()
+    ids = list(
+        StorageDeletion.objects.filter(available_at__lte=now)
+        .order_by("available_at", "id").values_list("id", flat=True)[:limit]
+    )
+    if not ids:
+        return []
+    lease_until = now + timedelta(seconds=_config("LEASE"))
+    StorageDeletion.objects.filter(id__in=ids, available_at__lte=now).update(available_at=lease_until)
+    return list(
+        StorageDeletion.objects.filter(id__in=ids, available_at=lease_until).values_list("id", "name", "attempts")
+    )
+
+
+def flush_deletions(storage=None) -> int:
+    """한 배치 선점 → 일괄 삭제 → 성공한 행 제거, 실패한 행은 재시도 시각을 미룸. 선점한 키 수 반환"""
+    rows = claim_deletions(_batch_size())
+    if not rows:
+        return 0
+    errors = delete_files(storage or default_storage, [name for _, name, _ in rows])
+
+    StorageDeletion.objects.filter(id__in=[pk for pk, name, _ in rows if name not in errors]).delete()
+    # 실패한 키: (시도 횟수, 사유)가 같은 행끼리 한 번에 갱신 (S3 장애 시 배치 전체가 같은 그룹)
+    failed = {}
+    for pk, name, attempts in rows:
+        if name in errors:
+            failed.setdefault((attempts, errors[name][:1000]), []).append(pk)
+    now = timezone.now()
+    for (attempts, error), pks in failed.items():
+        delay = min(_config("RETRY_BASE") * 2 ** attempts, _config("RETRY_MAX"))
+        StorageDeletion.objects.filter(id__in=pks).update(
+            attempts=F("attempts") + 1, last_error=error, available_at=now + timedelta(seconds=delay),
+        )
+    if errors:
+        logger.warning("스토리지 파일 %d건 삭제 실패 (재시도 예정)", len(errors))
+    return len(rows)
+
+
+def delete_files(storage, names) -> dict:
+    """
+    names 일괄 삭제, 실패한 키만 {키: 사유}로 반환 (없는 파일은 성공으로 취급)
+    S3 스토리지는 DeleteObjects로 최대 1000키씩, 그 외 스토리지는 키마다 delete
+    """
+    if not _is_s3(storage):
+        errors = {}
+        for name in names:
+            try:
+                storage.delete(name)
+            except Exception as exc:
+                errors[name] = f"{type(exc).__name__}: {exc}"
+        return errors
+
+    from storages.utils import clean_name
+
+    errors = {}
+    for i in range(0, len(names), S3_MAX_KEYS):
+        chunk = names[i:i + S3_MAX_KEYS]
+        keys = {storage._normalize_name(clean_name(name)): name for name in chunk}
+        try:
+            response = storage.bucket.delete_objects(
+                Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+            )
+        except Exception as exc:
+            errors.update({name: f"{type(exc).__name__}: {exc}" for name in chunk})
+            continue
+        for error in response.get("Errors", []):
+            name = keys.get(error.get("Key"), error.get("Key"))
+            errors[name] = f"{error.get('Code')}: {error.get('Message')}"
+    return errors
+
+
+def list_files(storage, prefix):
+    """prefix 아래 파일의 (키, 수정 시각) (S3는 ListObjectsV2 페이지 단위, 그 외는 디렉터리 순회)"""
+    if _is_s3(storage):
+        root = storage._normalize_name(prefix)
+        location = storage._normalize_name("")
+        for obj in storage.bucket.objects.filter(Prefix=root):
+            yield obj.key[len(location):].lstrip("/"), obj.last_modified
+        return
+    try:
+        dirs, files = storage.listdir(prefix)
+    except FileNotFoundError:
+        return
+    for name in files:
+        path = f"{prefix.rstrip('/')}/{name}"
+        yield path, storage.get_modified_time(path)
+    for directory in dirs:
+        yield from list_files(storage, f"{prefix.rstrip('/')}/{directory}")
+
+
+def _is_s3(storage) -> bool:
+    # S3Boto3Storage만 bucket/_normalize_name을 가짐 (django-storages는 필요할 때만 import)
+    return hasattr(storage, "_normalize_name") and hasattr(storage, "bucket")
@@ -0,0 +1,182 @@
+import re
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+
+from profiles.models import OwnerTimeRange, TimeRangeKind
+
+# 영업/피크/한산 시간대 JSON → 요일별 주 단위 분(minute-of-week) 구간 테이블
+# - 입력 예: {"월": ["09:00-15:00"], "수": ["18:00-24:00"]}, {"평일": [...], "주말": [...]}
+#   (요일 키는 한글/영문/평일/주말/매일, 값이 배열만 있으면 매일로 취급, 같은 형식의 dict 배열도 허용)
+# - 월요일 00:00 = 0, 일요일 24:00 = 10080 / 한 행은 한 요일 안의 구간 (weekday = start // 1440)
+#   자정을 넘는 구간(22:00-02:00)은 다음 요일 행으로 이어지고 일요일 밤은 월요일 새벽으로 넘어감
+# - JSON 필드가 원본, 프로필 저장 시 signals에서 바뀐 필드의 종류만 다시 계산
+#   기존 데이터/수동 수정분은 `python manage.py backfill_owner_hours`
+# - 조회 헬퍼: open_at_filter (특정 시각 포함), overlaps_filter (시간 창과 겹침), overlap_minutes (두 구간 목록의 겹침)
+#   → JSON을 파이썬으로 읽지 않고 (kind, start, end) / (kind, weekday, start) 인덱스로 조회
+
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+# 구간 종류 → 원본 JSON 필드
+SOURCE_FIELDS = {
+    TimeRangeKind.BUSINESS: "business_day",
+    TimeRangeKind.PEAK: "peak_time",
+    TimeRangeKind.OFF_PEAK: "off_peak_time",
+}
+
+WEEKDAYS = {
+    "월": [0], "화": [1], "수": [2], "목": [3], "금": [4], "토": [5], "일": [6],
+    "mon": [0], "tue": [1], "wed": [2], "thu": [3], "fri": [4], "sat": [5], "sun": [6],
+    "평일": [0, 1, 2, 3, 4], "주중": [0, 1, 2, 3, 4], "weekday": [0, 1, 2, 3, 4], "weekdays": [0, 1, 2, 3, 4],
+    "주말": [5, 6], "weekend": [5, 6], "weekends": [5, 6],
+    "매일": list(range(7)), "everyday": list(range(7)), "daily": list(range(7)),
+}
+_RANGE = re.compile(r"^\s*(\d{1,2}):(\d{2})\s*[-~]\s*(\d{1,2}):(\d{2})\s*$")
+
+
+def _days(key) -> list:
+    key = str(key).strip().lower()
+    if key in WEEKDAYS:
+        return WEEKDAYS[key]
+    # "월요일", "monday" 처럼 긴 이름
+    for prefix in (key.removesuffix("요일"), key[:3]):
+        if prefix in WEEKDAYS and len(WEEKDAYS[prefix]) == 1:
+            return WEEKDAYS[prefix]
+    return []
+
+
+def parse_range(text):
+    """"09:00-15:00" → (540, 900) / 끝이 시작보다 이르거나 같으면 자정을 넘는 구간, 형식이 틀리면 None"""
+    match = _RANGE.match(str(text))
+    if not match:
+        return None
+    sh, sm, eh, em = map(int, match.groups())
+    if sh > 24 or eh > 24 or sm > 59 or em > 59:
+        return None
+    start, end = min(sh * 60 + sm, MINUTES_PER_DAY), min(eh * 60 + em, MINUTES_PER_DAY)
+    if end <= start:
+        end += MINUTES_PER_DAY
+    return start, end
+
+
+def week_intervals(schedule) -> list:
+    """요일별 시간대 JSON → 요일 경계에서 나누고 겹치는 구간을 합친 [(start, end)] (주 단위 분, 정렬됨)"""
+    pieces = []
+    for day_map in _day_maps(schedule):
+        for key, ranges in day_map.items():
+            if isinstance(ranges, str):
+                ranges = [ranges]
+            for day in _days(key):
+                for text in ranges or ():
+                    parsed = parse_range(text)
+                    if parsed:
+                        pieces += _split_by_day(day * MINUTES_PER_DAY + parsed[0], day * MINUTES_PER_DAY + parsed[1])
+
+    merged = []
+    for start, end in sorted(pieces):
+        # 같은 요일 안에서만 합침 (행마다 weekday가 하나)
+        if merged and start <= merged[-1][1] and start // MINUTES_PER_DAY == merged[-1][0] // MINUTES_PER_DAY:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _split_by_day(start, end) -> list:
+    pieces = []
+    while start < end:
+        boundary = (start // MINUTES_PER_DAY + 1) * MINUTES_PER_DAY
+        piece_end = min(end, boundary)
+        pieces.append((start % MINUTES_PER_WEEK, (piece_end - 1) % MINUTES_PER_WEEK + 1))
+        start = piece_end
+    return pieces
+
+
+def _day_maps(schedule):
+    if isinstance(schedule, dict):
+        yield schedule
+    elif isinstance(schedule, (list, tuple)):
+        plain = [item for item in schedule if isinstance(item, str)]
+        if plain:
+            yield {"매일": plain}
+        for item in schedule:
+            if isinstance(item, dict):
+                yield item
+
+
+def minute_of_week(moment: datetime) -> int:
+    return moment.weekday() * MINUTES_PER_DAY + moment.hour * 60 + moment.minute
+
+
+def local_tz() -> ZoneInfo:
+    """시간대 JSON이 기록된 시간대 (settings.OWNER_SEARCH["TIME_ZONE"])"""
+    return ZoneInfo(getattr(settings, "OWNER_SEARCH", {}).get("TIME_ZONE", "Asia/Seoul"))
+
+
+def local_minute(moment: datetime) -> int:
+    """aware datetime → local_tz() 기준 주 단위 분"""
+    return minute_of_week(moment.astimezone(local_tz()))
+
+
+# ---- 조회 헬퍼 ----
+def open_at_filter(moment, kind=TimeRangeKind.BUSINESS, outer="pk"):
+    """OwnerProfile(또는 outer로 프로필 id를 가리키는) 쿼리셋용: moment 시각이 kind 구간에 포함되면 True"""
+    minute = local_minute(moment) if isinstance(moment, datetime) else moment
+    return Exists(OwnerTimeRange.objects.filter(
+        owner_profile=OuterRef(outer), kind=kind, start__lte=minute, end__gt=minute,
+    ))
+
+
+def overlaps_filter(windows, kind=TimeRangeKind.OFF_PEAK, outer="pk"):
+    """windows [(start, end)] (주 단위 분) 중 하나라도 kind 구간과 겹치면 True — 창이 없으면 항상 False"""
+    condition = Q()
+    for start, end in windows:
+        condition |= Q(start__lt=end, end__gt=start)
+    if not condition:
+        return Q(pk__in=[])
+    return Exists(OwnerTimeRange.objects.filter(condition, owner_profile=OuterRef(outer), kind=kind))
+
+
+def weekday_filter(weekday, kind=TimeRangeKind.BUSINESS, outer="pk"):
+    """weekday(월=0) 중 kind 구간이 하나라도 있으면 True"""
+    return Exists(OwnerTimeRange.objects.filter(owner_profile=OuterRef(outer), kind=kind, weekday=weekday))
+
+
+def overlap_minutes(a, b) -> int:
+    """정렬된 두 구간 목록이 겹치는 총 분 (week_intervals 결과끼리, 파이썬에서 계산)"""
+    total = i = j = 0
+    while i < len(a) and j < len(b):
+        total += max(0, min(a[i][1], b[j][1]) - max(a[i][0], b[j][0]))
+        if a[i][1] < b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return total
+
+
+# ---- 동기화 ----
+def build_rows(profile, kinds=SOURCE_FIELDS) -> list:
+    return [
+        OwnerTimeRange(
+            owner_profile_id=profile.pk, kind=kind, weekday=start // MINUTES_PER_DAY, start=start, end=end,
+        )
+        for kind in kinds
+        for start, end in week_intervals(getattr(profile, SOURCE_FIELDS[kind]))
+    ]
+
+
+def sync_owner_hours(profile, fields=None):
+    """
+    프로필의 시간대 JSON을 다시 파싱해 OwnerTimeRange 교체 (삭제 1회 + bulk_create 1회)
+    fields: 바뀐 필드 이름들 (save(update_fields=...)) — 주면 해당 종류만 다시 계산
+    """
+    kinds = [kind for kind, field in SOURCE_FIELDS.items() if fields is None or field in fields]
+    if not kinds:
+        return
+    with transaction.atomic():
+        OwnerTimeRange.objects.filter(owner_profile=profile, kind__in=kinds).delete()
+        OwnerTimeRange.objects.bulk_create(build_rows(profile, kinds))
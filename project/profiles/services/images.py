@@ -0,0 +1,86 @@
+import io
+import logging
+import os
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+
+logger = logging.getLogger(__name__)
+
+# 업로드 이미지 파생본 생성
+# - 원본을 한 번 디코딩해서 크기를 기록하고, settings.IMAGE_VARIANTS 의 긴 변 기준으로 축소한 WebP를 저장
+# - 원본보다 크게 늘리지 않음 (원본이 더 작으면 해당 파생본은 만들지 않고 클라이언트는 원본 사용)
+# - 파생본 키: <원본 키(확장자 제외)>__<이름>.webp  (원본과 같은 디렉터리)
+# - 목록 화면은 srcset(가장 작은 적당한 이미지)으로 원본 대신 썸네일을 받음
+
+DEFAULT_VARIANTS = {
+    "thumb": 320,    # 목록/카드
+    "medium": 960,   # 상세
+}
+DEFAULT_QUALITY = 80
+
+
+def _variant_sizes() -> dict:
+    return getattr(settings, "IMAGE_VARIANTS", DEFAULT_VARIANTS)
+
+
+def _variant_name(original_name, variant) -> str:
+    base, _ = os.path.splitext(original_name)
+    return f"{base}__{variant}.webp"
+
+
+def generate_variants(instance, fileobj, field_name="image"):
+    """
+    fileobj(원본 바이트)로 instance의 크기/파생본 필드를 채우고 파생본 파일을 스토리지에 저장 (행 저장은 호출 측에서)
+    반환: 갱신할 필드 dict {"image_width", "image_height", "image_variants"}
+    이미지로 열 수 없으면 빈 dict (원본만 사용)
+    """
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    field_file = getattr(instance, field_name)
+    try:
+        fileobj.seek(0)
+        with Image.open(fileobj) as img:
+            img = ImageOps.exif_transpose(img)  # 휴대폰 사진 회전 정보 반영
+            width, height = img.size
+            if img.mode not in ("RGB", "RGBA"):
+                img = img.convert("RGBA" if "transparency" in img.info or img.mode in ("LA", "P") else "RGB")
+
+            variants = {}
+            for variant, max_edge in _variant_sizes().items():
+                if max(width, height) <= max_edge:
+                    continue
+                resized = img.copy()
+                resized.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+                buf = io.BytesIO()
+                resized.save(buf, format="WEBP", quality=getattr(settings, "IMAGE_VARIANT_QUALITY", DEFAULT_QUALITY))
+                name = field_file.storage.save(
+                    _variant_name(field_file.name, variant), ContentFile(buf.getvalue()),
+                )
+                variants[variant] = {"name": name, "width": resized.width, "height": resized.height}
+    except (UnidentifiedImageError, OSError):
+        logger.warning("이미지 파생본 생성 실패: %s", field_file.name, exc_info=True)
+        return {}
+    finally:
+        fileobj.seek(0)
+
+    fields = {"image_width": width, "image_height": height, "image_variants": variants}
+    for name, value in fields.items():
+        setattr(instance, name, value)
+    return fields
+
+
+def build_srcset(field_file, width, height, variants) -> dict | None:
+    """
+    {"thumb": {"url", "width", "height"}, "medium": {...}, "original": {...}} (작은 것부터)
+    원본이 없으면 None
+    """
+    if not field_file:
+        return None
+    storage = field_file.storage
+    srcset = {
+        name: {"url": storage.url(v["name"]), "width": v["width"], "height": v["height"]}
+        for name, v in sorted((variants or {}).items(), key=lambda kv: kv[1]["width"])
+    }
+    srcset["original"] = {"url": field_file.url, "width": width, "height": height}
+    return srcset
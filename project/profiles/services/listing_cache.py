@@ -0,0 +1,163 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+from profiles.models import OwnerProfile, OwnerPhoto, Menu, StudentGroupProfile, StudentPhoto, StudentProfile
+
+# 프로필 목록 응답 캐시 (사장님/학생단체/학생)
+# - 목록 종류별 버전 번호 + 요청 파라미터(필터, 커서, page_size, 호스트) 해시로 키를 만들고 직렬화된 페이지를 저장
+# - 프로필/사진/메뉴가 저장·삭제되면 profiles.signals에서 해당 종류의 버전을 올림
+#   → 이전 버전 항목은 더 이상 조회되지 않고 TTL로 사라짐 (키 목록을 찾아 지울 필요 없음)
+#   bulk_create/update()처럼 시그널이 없는 경로는 호출 측에서 invalidate() 호출
+# - 응답 본문 해시를 ETag로 내려주고 If-None-Match가 같으면 304 (본문 없음)
+# - settings.PROFILE_LIST_CACHE = {"ENABLED", "ALIAS": Django 캐시 별칭, "TTL": 초, "ALLOW_LOCAL"}
+#   버전 번호는 모든 워커가 공유해야 하므로 ALIAS가 Redis/Memcached/DB 같은 공용 캐시일 때만 동작
+#   (LocMemCache처럼 프로세스 로컬이면 저장을 처리한 워커의 버전만 올라가 다른 워커가 옛 페이지를 내주므로 끔,
+#    ALLOW_LOCAL=True는 단일 프로세스 개발 서버/테스트용)
+# - 적중률: listing_cache_stats() (GET /profiles/cache-stats/, 관리자 전용)
+
+DEFAULTS = {
+    "ENABLED": True,
+    "ALIAS": "default",
+    "TTL": 5 * 60,
+    "ALLOW_LOCAL": False,
+}
+# 프로세스마다 따로 저장되는 캐시 백엔드
+LOCAL_BACKENDS = (LocMemCache, DummyCache)
+KINDS = ("owner", "student_group", "student")
+# 모델 → 그 모델이 포함되는 목록 종류
+MODEL_KINDS = {
+    OwnerProfile: "owner",
+    OwnerPhoto: "owner",
+    Menu: "owner",
+    StudentGroupProfile: "student_group",
+    StudentPhoto: "student_group",
+    StudentProfile: "student",
+}
+EVENTS = ("hit", "miss", "not_modified")
+
+
+def _config(name):
+    return getattr(settings, "PROFILE_LIST_CACHE", {}).get(name, DEFAULTS[name])
+
+
+def _cache():
+    return caches[_config("ALIAS")]
+
+
+def is_enabled() -> bool:
+    """ENABLED이고 ALIAS가 프로세스 간 공유되는 캐시일 때만 True (ALLOW_LOCAL이면 로컬 캐시도 허용)"""
+    if not _config("ENABLED"):
+        return False
+    return _config("ALLOW_LOCAL") or not isinstance(_cache(), LOCAL_BACKENDS)
+
+
+def _version_key(kind) -> str:
+    return f"profiles:list:{kind}:version"
+
+
+def get_version(kind) -> int:
+    cache = _cache()
+    version = cache.get(_version_key(kind))
+    if version is None:
+        # 처음이거나 캐시가 비워짐 → 이전에 쓰인 번호와 겹치지 않도록 현재 시각으로 시작
+        cache.add(_version_key(kind), time.time_ns(), timeout=None)
+        version = cache.get(_version_key(kind))
+    return version
+
+
+def bump_version(kind):
+    cache = _cache()
+    try:
+        cache.incr(_version_key(kind))
+    except ValueError:
+        cache.add(_version_key(kind), time.time_ns(), timeout=None)
+
+
+def invalidate(*kinds):
+    """
+    목록 캐시 무효화: 지금 한 번, 커밋 후 한 번 더
+    (커밋 전에 다른 요청이 이전 데이터를 새 버전으로 다시 캐시하는 경우까지 정리)
+    """
+    for kind in kinds:
+        bump_version(kind)
+        transaction.on_commit(lambda kind=kind: bump_version(kind))
+
+
+def invalidate_model(model):
+    invalidate(MODEL_KINDS[model])
+
+
+def _record(kind, event):
+    cache = _cache()
+    key = f"profiles:list:stats:{kind}:{event}"
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def listing_cache_stats() -> dict:
+    """{kind: {"hit", "miss", "not_modified", "hit_rate"}} (hit_rate = hit / (hit + miss))"""
+    cache = _cache()
+    stats = {}
+    for kind in KINDS:
+        counts = {event: cache.get(f"profiles:list:stats:{kind}:{event}", 0) for event in EVENTS}
+        lookups = counts["hit"] + counts["miss"]
+        counts["hit_rate"] = round(counts["hit"] / lookups, 4) if lookups else None
+        stats[kind] = counts
+    return stats
+
+
+def reset_listing_cache_stats():
+    _cache().delete_many([f"profiles:list:stats:{kind}:{event}" for kind in KINDS for event in EVENTS])
+
+
+def _entry_key(kind, version, request) -> str:
+    params = sorted((k, sorted(v)) for k, v in request.query_params.lists())
+    raw = json.dumps([request.get_host(), request.is_secure(), request.path, params], ensure_ascii=False)
+    return f"profiles:list:{kind}:v{version}:{hashlib.sha1(raw.encode()).hexdigest()}"
+
+
+def cached_list_response(request, kind, build) -> Response:
+    """
+    build(): 목록 Response를 만드는 함수 (캐시 미스일 때만 호출)
+    응답에 ETag, X-Cache(HIT/MISS) 헤더를 붙이고 If-None-Match가 일치하면 304
+    """
+    if not is_enabled():
+        return build()
+
+    cache = _cache()
+    key = _entry_key(kind, get_version(kind), request)
+    entry = cache.get(key)
+    if entry is None:
+        response = build()
+        if response.status_code != status.HTTP_200_OK:
+            return response
+        body = json.dumps(response.data, cls=DjangoJSONEncoder, sort_keys=True, ensure_ascii=False)
+        entry = (f'"{hashlib.md5(body.encode()).hexdigest()}"', response.data)
+        cache.set(key, entry, _config("TTL"))
+        _record(kind, "miss")
+        cache_status = "MISS"
+    else:
+        _record(kind, "hit")
+        cache_status = "HIT"
+
+    etag, data = entry
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache", "X-Cache": cache_status}
+    client_etags = [tag.removeprefix("W/") for tag in parse_etags(request.headers.get("If-None-Match", ""))]
+    if etag in client_etags or "*" in client_etags:
+        _record(kind, "not_modified")
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(data, headers=headers)
@@ -0,0 +1,306 @@
+import time
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from accounts.models import Like, User
+from profiles.models import (
+    BusinessType, OwnerProfile, OwnerTimeRange, PartnerMatch, PartnershipGoal, StudentGroupProfile, TimeRangeKind,
+)
+from profiles.services.hours import overlap_minutes, week_intervals
+from profiles.services.search import GOAL_FIELDS
+
+try:
+    import numpy as np
+except ImportError:  # pyproject 의존성이지만 조회 API는 저장된 결과만 읽으므로 import 실패로 앱 로딩을 막지 않음
+    np = None
+
+# 사장님 × 학생단체 매칭 후보 배치
+# - 모든 (사장님 프로필, 학생단체 프로필) 쌍의 점수를 NumPy로 사장님 CHUNK_SIZE명씩 행렬 계산
+#   (메모리: CHUNK_SIZE × 학생단체 수 float32 하나), 파이썬 반복은 특징 추출(프로필 수)과 결과 행 생성(유저 × K)에서만
+# - 점수 = Σ WEIGHTS[항목] × 항목 점수(0~1)
+#   campus: 사장님 campus_name과 학생단체 university_name이 같은 학교 (공백/캠퍼스명 무시)
+#   business_type: 학생단체 유저의 업종 선호 — BUSINESS_TYPE_WEIGHTS에 찜 이력 비율을 섞음 (이력이 많을수록 이력 비중↑)
+#   goals: 사장님이 고른 제휴 목표의 GOAL_WEIGHTS 합 (학생단체 제휴로 이루기 쉬운 목표일수록 높게)
+#   off_peak: 사장님 한산 시간대(OwnerTimeRange)와 학생 활동 시간대(STUDENT_WINDOWS)가 겹치는 비율
+#   student_size: 학생 수 (로그 스케일, 최대값 기준 정규화)
+# - 유저별 상위 TOP_K를 PartnerMatch에 전체 교체로 저장 (한 트랜잭션, 교체 중에도 이전 결과 조회 가능)
+#   사장님 유저 → 학생단체 프로필 후보, 학생단체 유저 → 사장님 프로필 후보
+#   프로필이 여러 개인 유저는 자기 프로필 중 가장 높은 점수로 후보를 고름
+# - 주기 실행: `python manage.py refresh_partner_matches [--interval 초]`
+
+DEFAULTS = {
+    "TOP_K": 20,
+    "CHUNK_SIZE": 2000,
+    "WEIGHTS": {"campus": 0.35, "business_type": 0.2, "goals": 0.15, "off_peak": 0.15, "student_size": 0.15},
+    "BUSINESS_TYPE_WEIGHTS": {
+        BusinessType.RESTAURANT: 1.0, BusinessType.CAFE: 0.9, BusinessType.BAR: 0.8, BusinessType.OTHER: 0.6,
+    },
+    "HISTORY_PRIOR": 5,  # 찜이 이만큼 쌓이면 업종 선호의 절반을 이력 비율로
+    "GOAL_WEIGHTS": {
+        PartnershipGoal.NEW_CUSTOMERS: 1.0,
+        PartnershipGoal.REVISIT: 0.8,
+        PartnershipGoal.SPREAD_PEAK: 0.8,
+        PartnershipGoal.SNS_MARKETING: 0.6,
+        PartnershipGoal.COLLECT_REVIEWS: 0.6,
+        PartnershipGoal.CLEAR_STOCK: 0.4,
+        PartnershipGoal.OTHER: 0.2,
+    },
+    "STUDENT_WINDOWS": {"평일": ["11:30-13:30", "17:00-23:00"], "주말": ["12:00-22:00"]},
+}
+COMPONENTS = ("campus", "business_type", "goals", "off_peak", "student_size")
+BUSINESS_TYPES = list(BusinessType.values)
+
+
+def _config(name):
+    return getattr(settings, "PARTNER_MATCHING", {}).get(name, DEFAULTS[name])
+
+
+def campus_key(name):
+    """"서울대학교 관악캠퍼스" → "서울대학교" (캠퍼스/괄호 토큰 제거, 소문자) / 없으면 None"""
+    tokens = [
+        t for t in str(name or "").lower().split()
+        if not t.endswith("캠퍼스") and not t.startswith("(")
+    ]
+    return "".join(tokens) or None
+
+
+# ---- 특징 추출 (프로필 수에 비례, DB 조회는 종류별 1회) ----
+def _campus_codes(names, codes):
+    """학교 이름 → 정수 코드 (사장님/학생단체가 같은 codes를 공유, 이름이 없으면 -1)"""
+    keys = [campus_key(name) for name in names]
+    return np.array([codes.setdefault(key, len(codes)) if key else -1 for key in keys], dtype=np.int64)
+
+
+def _owner_features(codes):
+    profiles = list(
+        OwnerProfile.objects.filter(user__user_role=User.Role.OWNER)
+        .order_by("user_id", "id")
+        .values("id", "user_id", "campus_name", "business_type", *GOAL_FIELDS.values())
+    )
+    goal_weights = _config("GOAL_WEIGHTS")
+    goal_total = sum(goal_weights.values()) or 1
+
+    windows = week_intervals(_config("STUDENT_WINDOWS"))
+    window_total = sum(end - start for start, end in windows) or 1
+    off_peak = {}
+    for profile_id, start, end in (
+        OwnerTimeRange.objects.filter(kind=TimeRangeKind.OFF_PEAK).order_by("owner_profile_id", "start")
+        .values_list("owner_profile_id", "start", "end").iterator(chunk_size=5000)
+    ):
+        off_peak.setdefault(profile_id, []).append((start, end))
+
+    type_index = {t: i for i, t in enumerate(BUSINESS_TYPES)}
+    return {
+        "id": np.array([p["id"] for p in profiles], dtype=np.int64),
+        "user": np.array([p["user_id"] for p in profiles], dtype=np.int64),
+        "campus": _campus_codes([p["campus_name"] for p in profiles], codes),
+        "type": np.array([type_index.get(p["business_type"], type_index[BusinessType.OTHER]) for p in profiles],
+                         dtype=np.int64),
+        "goals": np.array([
+            sum(goal_weights.get(goal, 0) for goal, field in GOAL_FIELDS.items() if p[field]) / goal_total
+            for p in profiles
+        ], dtype=np.float32),
+        "off_peak": np.array([
+            min(1.0, overlap_minutes(off_peak.get(p["id"], []), windows) / window_total) for p in profiles
+        ], dtype=np.float32),
+    }
+
+
+def _group_features(codes):
+    profiles = list(
+        StudentGroupProfile.objects.filter(
+            user__user_role=User.Role.STUDENT_GROUP, partnership_end__gte=timezone.localdate(),
+        )
+        .order_by("user_id", "id")
+        .values("id", "user_id", "university_name", "student_size")
+    )
+    sizes = np.log1p(np.array([p["student_size"] for p in profiles], dtype=np.float32))
+
+    # 업종 선호: 기본 가중치 + 유저의 찜 이력 (업종별 찜 수 비율)
+    base = np.array([_config("BUSINESS_TYPE_WEIGHTS").get(t, 0) for t in BUSINESS_TYPES], dtype=np.float32)
+    user_ids = sorted({p["user_id"] for p in profiles})
+    user_index = {u: i for i, u in enumerate(user_ids)}
+    history = np.zeros((len(user_ids), len(BUSINESS_TYPES)), dtype=np.float32)
+    for user_id, business_type, n in (
+        Like.objects.filter(user_id__in=user_ids, target__owner_profile__isnull=False)
+        .values_list("user_id", "target__owner_profile__business_type").annotate(n=Count("id"))
+    ):
+        if business_type in BUSINESS_TYPES:
+            history[user_index[user_id], BUSINESS_TYPES.index(business_type)] += n
+    total = history.sum(axis=1, keepdims=True)
+    alpha = total / (total + _config("HISTORY_PRIOR"))
+    share = np.divide(history, total, out=np.zeros_like(history), where=total > 0)
+    preference = (1 - alpha) * base + alpha * share * max(base.max(), 1e-6)
+
+    return {
+        "id": np.array([p["id"] for p in profiles], dtype=np.int64),
+        "user": np.array([p["user_id"] for p in profiles], dtype=np.int64),
+        "campus": _campus_codes([p["university_name"] for p in profiles], codes),
+        "size": sizes / sizes.max() if len(profiles) and sizes.max() > 0 else sizes,
+        "preference": preference[[user_index[p["user_id"]] for p in profiles]] if profiles
+        else np.zeros((0, len(BUSINESS_TYPES)), dtype=np.float32),
+    }
+
+
+# ---- 점수 ----
+def _components(owners, groups, oi, gi) -> dict:
+    """oi/gi: 브로드캐스트 가능한 인덱스 배열 ((R,1)×(1,G) → 행렬, 같은 길이 1차원 → 쌍별)"""
+    owner_campus = owners["campus"][oi]
+    return {
+        "campus": ((owner_campus == groups["campus"][gi]) & (owner_campus >= 0)).astype(np.float32),
+        "business_type": groups["preference"][gi, owners["type"][oi]],
+        "goals": owners["goals"][oi],
+        "off_peak": owners["off_peak"][oi],
+        "student_size": groups["size"][gi],
+    }
+
+
+def _score(owners, groups, oi, gi):
+    weights = _config("WEIGHTS")
+    total = np.zeros(np.broadcast_shapes(np.shape(oi), np.shape(gi)), dtype=np.float32)
+    for name, value in _components(owners, groups, oi, gi).items():
+        total += np.float32(weights.get(name, 0)) * value
+    # 같은 유저가 양쪽 프로필을 모두 가진 경우는 후보에서 제외
+    return np.where(owners["user"][oi] == groups["user"][gi], np.float32(-np.inf), total)
+
+
+def _top_k(values, k):
+    """행마다 상위 k개 열 (점수 내림차순) — argpartition 후 k개만 정렬"""
+    k = min(k, values.shape[1])
+    if k == 0:
+        return np.zeros((values.shape[0], 0), dtype=np.int64)
+    part = np.argpartition(-values, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(values, part, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(part, order, axis=1)
+
+
+def _segments(users):
+    """user 기준 정렬된 배열 → (고유 유저, 각 유저의 시작 위치)"""
+    return np.unique(users, return_index=True)
+
+
+def compute_matches(top_k=None, chunk_size=None):
+    """
+    유저별 상위 후보 계산: [(user_id, owner_index, group_index, score)] (순위 순) 과 특징 배열 반환
+    사장님 유저는 CHUNK 단위로 바로 상위 K, 학생단체 유저는 CHUNK마다 기존 상위 K와 합쳐 갱신
+    """
+    if np is None:
+        raise ImproperlyConfigured("매칭 배치에는 numpy가 필요합니다. (poetry install)")
+    top_k = top_k or _config("TOP_K")
+    chunk_size = max(1, chunk_size or _config("CHUNK_SIZE"))
+    codes = {}
+    owners, groups = _owner_features(codes), _group_features(codes)
+    n_owners, n_groups = len(owners["id"]), len(groups["id"])
+    results = []
+    if not n_owners or not n_groups:
+        return results, owners, groups
+
+    owner_users, owner_starts = _segments(owners["user"])
+    group_users, group_starts = _segments(groups["user"])
+    group_all = np.arange(n_groups)[None, :]
+    best_vals = np.full((len(group_users), top_k), -np.inf, dtype=np.float32)
+    best_idx = np.full((len(group_users), top_k), -1, dtype=np.int64)
+
+    for u0 in range(0, len(owner_users), chunk_size):
+        u1 = min(u0 + chunk_size, len(owner_users))
+        r0 = owner_starts[u0]
+        r1 = owner_starts[u1] if u1 < len(owner_users) else n_owners
+        rows = np.arange(r0, r1)
+        scores = _score(owners, groups, rows[:, None], group_all)  # (사장님 프로필, 학생단체 프로필)
+
+        # 사장님 유저별: 자기 프로필 중 최고 점수 → 학생단체 프로필 상위 K
+        per_user = np.maximum.reduceat(scores, owner_starts[u0:u1] - r0, axis=0)
+        for i, columns in enumerate(_top_k(per_user, top_k)):
+            for g in columns:
+                if np.isfinite(per_user[i, g]):
+                    results.append((int(owner_users[u0 + i]), None, int(g), float(per_user[i, g])))
+
+        # 학생단체 유저별: 이번 CHUNK의 사장님 프로필 점수를 기존 상위 K와 합침
+        per_group_user = np.maximum.reduceat(scores.T, group_starts, axis=0)
+        merged_vals = np.concatenate([best_vals, per_group_user], axis=1)
+        merged_idx = np.concatenate([best_idx, np.broadcast_to(rows, per_group_user.shape)], axis=1)
+        keep = _top_k(merged_vals, top_k)
+        best_vals = np.take_along_axis(merged_vals, keep, axis=1)
+        best_idx = np.take_along_axis(merged_idx, keep, axis=1)
+
+    for i, user_id in enumerate(group_users):
+        for value, o in zip(best_vals[i], best_idx[i]):
+            if o >= 0 and np.isfinite(value):
+                results.append((int(user_id), int(o), None, float(value)))
+
+    _fill_own_profiles(results, owners, groups, owner_users, owner_starts, group_users, group_starts)
+    return results, owners, groups
+
+
+def _fill_own_profiles(results, owners, groups, owner_users, owner_starts, group_users, group_starts):
+    """후보마다 유저 자신의 프로필 중 점수가 가장 높은 것을 채움 (프로필이 하나면 그대로)"""
+    def ranges(users, starts, total):
+        ends = np.append(starts[1:], total)
+        return {int(u): (int(s), int(e)) for u, s, e in zip(users, starts, ends)}
+
+    owner_rows = ranges(owner_users, owner_starts, len(owners["id"]))
+    group_rows = ranges(group_users, group_starts, len(groups["id"]))
+    for n, (user_id, o, g, value) in enumerate(results):
+        if o is None:
+            start, end = owner_rows[user_id]
+            if end - start > 1:
+                candidates = np.arange(start, end)
+                o = int(candidates[np.argmax(_score(owners, groups, candidates, np.full(end - start, g)))])
+            else:
+                o = start
+        else:
+            start, end = group_rows[user_id]
+            if end - start > 1:
+                candidates = np.arange(start, end)
+                g = int(candidates[np.argmax(_score(owners, groups, np.full(end - start, o), candidates))])
+            else:
+                g = start
+        results[n] = (user_id, o, g, value)
+
+
+def refresh_partner_matches(top_k=None, chunk_size=None) -> dict:
+    """매칭 후보 전체 재계산 후 PartnerMatch 교체, 처리 통계 반환"""
+    started = time.perf_counter()
+    results, owners, groups = compute_matches(top_k, chunk_size)
+    computed = time.perf_counter() - started
+
+    now = timezone.now()
+    if results:
+        oi = np.array([o for _, o, _, _ in results])
+        gi = np.array([g for _, _, g, _ in results])
+        parts = {name: np.broadcast_to(v, oi.shape) for name, v in _components(owners, groups, oi, gi).items()}
+    rows, rank, previous_user = [], 0, None
+    for n, (user_id, o, g, value) in enumerate(results):
+        rank = rank + 1 if user_id == previous_user else 1
+        previous_user = user_id
+        rows.append(PartnerMatch(
+            user_id=user_id, rank=rank,
+            owner_profile_id=int(owners["id"][o]), student_group_profile_id=int(groups["id"][g]),
+            score=round(value, 6),
+            components={name: round(float(parts[name][n]), 4) for name in COMPONENTS},
+            computed_at=now,
+        ))
+    with transaction.atomic():
+        PartnerMatch.objects.all().delete()
+        PartnerMatch.objects.bulk_create(rows, batch_size=1000)
+
+    return {
+        "owner_profiles": len(owners["id"]),
+        "student_group_profiles": len(groups["id"]),
+        "matches": len(rows),
+        "compute_seconds": round(computed, 3),
+        "total_seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def get_matches(user, limit=None):
+    """저장된 상위 후보 (user, rank) 인덱스 조회 — 후보/자기 프로필은 select_related"""
+    limit = min(limit or _config("TOP_K"), _config("TOP_K"))
+    return list(
+        PartnerMatch.objects.filter(user=user).order_by("rank")
+        .select_related("owner_profile", "student_group_profile")[:limit]
+    )
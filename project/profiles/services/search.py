@@ -0,0 +1,85 @@
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from profiles.models import FEATURE_BITS, OwnerProfile, PartnershipGoal, Service
+from profiles.services.hours import local_tz, open_at_filter
+
+# 사장님 프로필 탐색 검색
+# - 필터는 모두 인덱스가 있는 컬럼으로만 처리
+#   campus_name/business_type 일치 + average_sales 범위: (campus_name, business_type, average_sales) 등 복합 인덱스
+#   목표/서비스: feature_mask에 요청 비트가 모두 있는지 (feature_mask & mask = mask)
+#   지금 영업 중: OwnerTimeRange (kind, start, end) 구간에 현재 주 단위 분이 포함되는지 EXISTS (services/hours.py)
+# - 정렬: score = 받은 찜 수 * LIKE_WEIGHT + 받은 추천 수 * RECOMMEND_WEIGHT 내림차순, 동점은 id 내림차순
+#   (찜/추천 수는 User 카운터 컬럼 — 프로필마다 Like/Recommendation을 세지 않음)
+#   (KeysetCursorPagination이 (score, id)를 커서로 사용)
+# - settings.OWNER_SEARCH = {"TIME_ZONE": 영업 시간 기준 시간대, "LIKE_WEIGHT", "RECOMMEND_WEIGHT"}
+# - 벤치마크: `python manage.py benchmark_owner_search --profiles 100000`
+
+DEFAULTS = {
+    "LIKE_WEIGHT": 1,
+    "RECOMMEND_WEIGHT": 2,
+}
+
+# 쿼리 파라미터 값 → 모델 필드
+GOAL_FIELDS = {
+    PartnershipGoal.NEW_CUSTOMERS: "goal_new_customers",
+    PartnershipGoal.REVISIT: "goal_revisit",
+    PartnershipGoal.CLEAR_STOCK: "goal_clear_stock",
+    PartnershipGoal.SPREAD_PEAK: "goal_spread_peak",
+    PartnershipGoal.SNS_MARKETING: "goal_sns_marketing",
+    PartnershipGoal.COLLECT_REVIEWS: "goal_collect_reviews",
+    PartnershipGoal.OTHER: "goal_other",
+}
+SERVICE_FIELDS = {
+    Service.DRINK: "service_drink",
+    Service.SIDE_MENU: "service_side_menu",
+    Service.OTHER: "service_other",
+}
+
+
+def _config(name):
+    return getattr(settings, "OWNER_SEARCH", {}).get(name, DEFAULTS[name])
+
+
+def feature_mask(goals=(), services=()) -> int:
+    fields = [GOAL_FIELDS[g] for g in goals] + [SERVICE_FIELDS[s] for s in services]
+    return sum({FEATURE_BITS[name] for name in fields})
+
+
+def local_now():
+    """영업 시간 JSON이 기록된 시간대의 현재 시각"""
+    return timezone.now().astimezone(local_tz())
+
+
+def search_owners(
+    *, campus_name=None, business_type=None, goals=(), services=(),
+    min_sales=None, max_sales=None, open_at=None,
+):
+    """
+    조건에 맞는 사장님 프로필 (likes_count, recommendations_count, score 주석 포함, 정렬은 페이지네이션에서)
+    open_at: 이 시각(aware datetime)에 영업 중인 프로필만 — 시간대는 OWNER_SEARCH["TIME_ZONE"]로 변환
+    """
+    profiles = OwnerProfile.objects.all()
+    if campus_name:
+        profiles = profiles.filter(campus_name=campus_name)
+    if business_type:
+        profiles = profiles.filter(business_type=business_type)
+    if min_sales is not None:
+        profiles = profiles.filter(average_sales__gte=min_sales)
+    if max_sales is not None:
+        profiles = profiles.filter(average_sales__lte=max_sales)
+
+    mask = feature_mask(goals, services)
+    if mask:
+        profiles = profiles.alias(matched_features=F("feature_mask").bitand(mask)).filter(matched_features=mask)
+
+    if open_at is not None:
+        profiles = profiles.filter(open_at_filter(open_at))
+
+    return profiles.annotate(
+        likes_count=F("user__likes_received_count"),
+        recommendations_count=F("user__recommendations_received_count"),
+    ).annotate(
+        score=F("likes_count") * _config("LIKE_WEIGHT") + F("recommendations_count") * _config("RECOMMEND_WEIGHT"),
+    )
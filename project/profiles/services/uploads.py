@@ -0,0 +1,156 @@
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from profiles.models import UploadStatus
+from profiles.services import listing_cache
+from profiles.services.deletions import image_keys, queue_deletions
+from profiles.services.images import generate_variants
+
+logger = logging.getLogger(__name__)
+
+# 프로필 사진/메뉴 이미지 백그라운드 업로드
+# - 요청 안에서는 파일을 로컬 스테이징 디렉터리에 저장하고 행을 PENDING(image 비어 있음)으로 만듦
+#   → 트랜잭션 안에서 S3 업로드를 기다리지 않고 바로 응답
+# - 커밋 후 워커 스레드 풀이 스테이징 파일을 병렬로 스토리지(default_storage)에 올리고
+#   조건부 UPDATE로 최종 키를 기록 (READY), 이때 썸네일/중간 크기 파생본도 함께 생성 (services/images.py)
+# - settings.PROFILE_UPLOADS["BACKEND"]
+#   - "thread"(기본): 웹 프로세스의 스레드 풀에서 처리
+#   - "sync": 커밋 직후 같은 스레드에서 처리 (테스트/로컬 디버깅용)
+# - 실패/중단된 업로드는 `python manage.py retry_profile_uploads`로 재시도
+#   (스테이징 파일은 로컬 디스크에 있으므로 같은 서버에서 실행)
+
+DEFAULTS = {
+    "BACKEND": "thread",
+    "WORKERS": 4,
+    "STAGING_DIR": "upload_staging",
+    "STALE_AFTER": 10 * 60,  # 초, UPLOADING 상태로 이보다 오래 멈춘 행은 재시도 대상
+}
+
+
+def _config(name):
+    return getattr(settings, "PROFILE_UPLOADS", {}).get(name, DEFAULTS[name])
+
+
+def get_staging_storage() -> FileSystemStorage:
+    return FileSystemStorage(location=os.path.join(settings.BASE_DIR, _config("STAGING_DIR")))
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """프로세스 당 하나의 업로드 스레드 풀 (처음 사용할 때 생성)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_config("WORKERS"), thread_name_prefix="profile-upload")
+    return _executor
+
+
+def stage_image(instance, uploaded_file):
+    """
+    업로드 파일을 스테이징 디렉터리에 저장하고 instance를 PENDING으로 표시 (저장은 호출 측에서)
+    스테이징 경로: <uuid>/<원본 파일명> → 업로드 시 원본 파일명으로 upload_to 아래에 저장
+    """
+    uploaded_file.seek(0)
+    name = os.path.basename(uploaded_file.name or "image")
+    instance.staged_path = get_staging_storage().save(f"{uuid.uuid4().hex}/{name}", uploaded_file)
+    instance.image = ""
+    instance.upload_status = UploadStatus.PENDING
+    return instance
+
+
+def schedule_upload(instance):
+    model, pk = type(instance), instance.pk
+    backend = _config("BACKEND")
+    if backend == "thread":
+        transaction.on_commit(lambda: get_executor().submit(upload_staged_image_in_worker, model, pk))
+    else:
+        transaction.on_commit(lambda: upload_staged_image(model, pk))
+
+
+def claim_upload(model, pk) -> bool:
+    """PENDING/FAILED → UPLOADING 조건부 갱신으로 선점 (스레드 풀과 재시도 명령이 중복 업로드하지 않도록)"""
+    return model.objects.filter(
+        pk=pk, upload_status__in=[UploadStatus.PENDING, UploadStatus.FAILED],
+    ).update(upload_status=UploadStatus.UPLOADING, upload_started_at=timezone.now(), modified_at=timezone.now()) == 1
+
+
+def upload_staged_image(model, pk) -> bool:
+    """스테이징 파일 하나를 스토리지에 올리고 최종 키 기록, 성공하면 True"""
+    if not claim_upload(model, pk):
+        return False
+    obj = model.objects.only("pk", "staged_path", "image").filter(pk=pk).first()
+    if obj is None:
+        return False
+    staging = get_staging_storage()
+    try:
+        with staging.open(obj.staged_path, "rb") as f:
+            # upload_to 규칙/중복 이름 처리는 필드 스토리지에 맡김 (S3 업로드는 여기서만 발생)
+            obj.image.save(os.path.basename(obj.staged_path), File(f), save=False)
+            # 같은 스테이징 파일로 크기 기록 + 썸네일/중간 크기 WebP 생성
+            variant_fields = generate_variants(obj, f)
+    except Exception:
+        logger.exception("프로필 이미지 업로드 실패: %s#%s", model.__name__, pk)
+        model.objects.filter(pk=pk, upload_status=UploadStatus.UPLOADING).update(
+            upload_status=UploadStatus.FAILED, modified_at=timezone.now(),
+        )
+        listing_cache.invalidate_model(model)
+        return False
+
+    updated = model.objects.filter(pk=pk, upload_status=UploadStatus.UPLOADING).update(
+        image=obj.image.name, upload_status=UploadStatus.READY, staged_path="", modified_at=timezone.now(),
+        **variant_fields,
+    )
+    if updated:
+        listing_cache.invalidate_model(model)  # update()는 시그널이 없으므로 목록 캐시를 직접 무효화
+    else:
+        # 업로드 중에 행이 삭제됨 → 올린 원본/파생본도 삭제 대기열로 정리 (실패해도 재시도됨)
+        obj.image_variants = variant_fields.get("image_variants") or {}
+        queue_deletions(image_keys(obj))
+    _remove_staged(staging, obj.staged_path)
+    return bool(updated)
+
+
+def upload_staged_image_in_worker(model, pk):
+    """워커 스레드용 래퍼: 스레드마다 열린 DB 커넥션을 정리"""
+    close_old_connections()
+    try:
+        upload_staged_image(model, pk)
+    finally:
+        close_old_connections()
+
+
+def retryable_uploads(model):
+    """재시도 대상: PENDING/FAILED, 그리고 STALE_AFTER보다 오래 UPLOADING으로 멈춘 행"""
+    stale_before = timezone.now() - timedelta(seconds=_config("STALE_AFTER"))
+    model.objects.filter(
+        upload_status=UploadStatus.UPLOADING, upload_started_at__lt=stale_before,
+    ).update(upload_status=UploadStatus.FAILED, modified_at=timezone.now())
+    return model.objects.filter(upload_status__in=[UploadStatus.PENDING, UploadStatus.FAILED])
+
+
+def discard_staged_file(instance):
+    """업로드 전에 삭제된 행의 스테이징 파일 정리"""
+    if instance.staged_path:
+        _remove_staged(get_staging_storage(), instance.staged_path)
+
+
+def _remove_staged(staging, path):
+    """스테이징 파일과 <uuid> 디렉터리 삭제"""
+    staging.delete(path)
+    try:
+        os.rmdir(os.path.dirname(staging.path(path)))
+    except OSError:
+        pass
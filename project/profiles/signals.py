@@ -1,23 +1,50 @@
-from django.db.models.signals import post_delete
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from .models import StudentProfile, StudentPhoto, OwnerPhoto, Menu
+from .models import OwnerProfile, StudentGroupProfile, StudentProfile, StudentPhoto, OwnerPhoto, Menu
+from .services import listing_cache
+from .services.deletions import image_keys, queue_deletions
+from .services.hours import sync_owner_hours
+from .services.uploads import discard_staged_file
 
-@receiver(post_delete, sender=StudentProfile)
-def delete_image_file(sender, instance, **kwargs):
-    if instance.image:
-        instance.image.delete(save=False)
 
+# 원본과 썸네일/중간 크기 파생본 파일 삭제
+# S3는 요청 안에서 호출하지 않고 같은 트랜잭션의 삭제 대기열에 기록 → 커밋 후 워커가 일괄 삭제
+@receiver(post_delete, sender=StudentProfile)
 @receiver(post_delete, sender=StudentPhoto)
-def delete_image_file(sender, instance, **kwargs):
-    if instance.image:
-        instance.image.delete(save=False)
+@receiver(post_delete, sender=OwnerPhoto)
+@receiver(post_delete, sender=Menu)
+def queue_image_file_deletion(sender, instance, **kwargs):
+    queue_deletions(image_keys(instance))
 
+
+# 업로드 전에 삭제된 사진/메뉴의 스테이징 파일 정리 (롤백되면 업로드가 이어져야 하므로 커밋 후)
+@receiver(post_delete, sender=StudentPhoto)
 @receiver(post_delete, sender=OwnerPhoto)
-def delete_image_file(sender, instance, **kwargs):
-    if instance.image:
-        instance.image.delete(save=False)
+@receiver(post_delete, sender=Menu)
+def discard_staged_image(sender, instance, **kwargs):
+    if instance.staged_path:
+        transaction.on_commit(lambda: discard_staged_file(instance))
 
+
+# 영업/피크/한산 시간대 구간 테이블 갱신 (JSON 필드가 원본, update_fields가 있으면 바뀐 종류만)
+@receiver(post_save, sender=OwnerProfile)
+def sync_owner_time_ranges(sender, instance, update_fields=None, **kwargs):
+    sync_owner_hours(instance, fields=update_fields)
+
+
+# 목록 응답 캐시 무효화 (종류별 버전 증가)
+@receiver(post_save, sender=OwnerProfile)
+@receiver(post_delete, sender=OwnerProfile)
+@receiver(post_save, sender=OwnerPhoto)
+@receiver(post_delete, sender=OwnerPhoto)
+@receiver(post_save, sender=Menu)
 @receiver(post_delete, sender=Menu)
-def delete_image_file(sender, instance, **kwargs):
-    if instance.image:
-        instance.image.delete(save=False)
\ No newline at end of file
+@receiver(post_save, sender=StudentGroupProfile)
+@receiver(post_delete, sender=StudentGroupProfile)
+@receiver(post_save, sender=StudentPhoto)
+@receiver(post_delete, sender=StudentPhoto)
+@receiver(post_save, sender=StudentProfile)
+@receiver(post_delete, sender=StudentProfile)
+def invalidate_profile_listing(sender, **kwargs):
+    listing_cache.invalidate_model(sender)
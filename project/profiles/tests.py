@@ -1,19 +1,38 @@
+import json
+import os
+import shutil
+import tempfile
+import time
 from datetime import date, timedelta
+from io import StringIO
+from unittest import mock
 
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.conf import settings as dj_settings
+from django.utils import timezone as dj_timezone
 
 from rest_framework.test import APIClient
 from rest_framework import status
 
-from accounts.models import User
+from accounts.models import Like, Recommendation, User
+from config.testing import InlineExecutor, QueryBudgetMixin
 from .models import (
     OwnerProfile, OwnerPhoto, Menu,
     StudentGroupProfile, StudentPhoto, StudentProfile,
-    BusinessType, PartnershipGoal, Service,
+    BusinessType, PartnershipGoal, Service, UploadStatus, StorageDeletion, OwnerTimeRange, TimeRangeKind,
+    PartnerMatch,
 )
+from .services import deletions, listing_cache, uploads
+from .services import hours, matching
+from .services.hours import week_intervals
+from .services.assets import apply_owner_assets
+from .services.images import generate_variants
 
 
 def valid_image(name="img.png"):
@@ -38,6 +57,15 @@ def valid_image(name="img.png"):
         return SimpleUploadedFile("img.gif", data, content_type="image/gif")
 
 
+def sized_image(width, height, name="big.jpg"):
+    """파생본 생성 확인용 큰 JPEG"""
+    from PIL import Image
+    import io
+    buf = io.BytesIO()
+    Image.new("RGB", (width, height), (0, 128, 255)).save(buf, format="JPEG")
+    return SimpleUploadedFile(name, buf.getvalue(), content_type="image/jpeg")
+
+
 class ProfilesAPITests(TestCase):
     @classmethod
     def setUpTestData(cls):
@@ -136,14 +164,14 @@ class ProfilesAPITests(TestCase):
         # 전체
         resp = self.client.get(url)
         self.assertEqual(resp.status_code, status.HTTP_200_OK)
-        names = [row["profile_name"] for row in resp.data]
+        names = [row["profile_name"] for row in resp.data["results"]]
         self.assertIn("맛집1", names)
         self.assertIn("카페2", names)
 
         # 업종 필터
         resp2 = self.client.get(url, {"business_type": BusinessType.RESTAURANT})
         self.assertEqual(resp2.status_code, status.HTTP_200_OK)
-        self.assertTrue(all(r["business_type"] == BusinessType.RESTAURANT for r in resp2.data))
+        self.assertTrue(all(r["business_type"] == BusinessType.RESTAURANT for r in resp2.data["results"]))
 
     def test_owner_create_success_and_validations(self):
         self.client.force_authenticate(self.owner2)
@@ -255,3 +283,924 @@ class ProfilesAPITests(TestCase):
     def test_menu_crud(self):
         self.client.force_authenticate(self.owner2)
 
+
+
+# ---------------------------
+# 사진/메뉴 이미지 백그라운드 업로드
+# ---------------------------
+class ProfileImageUploadTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(username="uploader", email="up@example.com", password="pw1234")
+
+    def setUp(self):
+        media, staging = tempfile.mkdtemp(), tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media, ignore_errors=True)
+        self.addCleanup(shutil.rmtree, staging, ignore_errors=True)
+        # S3 대신 로컬 파일 시스템 스토리지
+        overrides = override_settings(
+            STORAGES={**dj_settings.STORAGES, "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"}},
+            MEDIA_ROOT=media,
+            PROFILE_UPLOADS={"BACKEND": "sync", "STAGING_DIR": staging},
+            STORAGE_DELETIONS={"BACKEND": "sync"},
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        self.media, self.staging = media, staging
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def staged_files(self):
+        return [f for _, _, files in os.walk(self.staging) for f in files]
+
+    def create_profile(self):
+        data = {
+            "business_type": BusinessType.CAFE,
+            "profile_name": "업로드카페",
+            "average_sales": 8000,
+            "margin_rate": "40.00",
+            "photos": [valid_image("a.png"), valid_image("b.png")],
+            "menus_data": json.dumps([{"name": "라떼", "price": 5000}]),
+            "menus_images": [valid_image("latte.png")],
+        }
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            resp = self.client.post(reverse("profiles:owner-list"), data, format="multipart")
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        return resp, callbacks
+
+    def test_create_returns_pending_then_uploads_after_commit(self):
+        resp, callbacks = self.create_profile()
+
+        # 응답 시점: 업로드 전 (image 없음, PENDING), 파일은 스테이징에만 있음
+        items = resp.data["photos"] + resp.data["menus"]
+        self.assertEqual([i["upload_status"] for i in items], [UploadStatus.PENDING] * 3)
+        self.assertTrue(all(i["image"] is None for i in items))
+        self.assertEqual(len(self.staged_files()), 3)
+
+        for callback in callbacks:
+            callback()
+
+        photos = list(OwnerPhoto.objects.filter(owner_profile_id=resp.data["id"]))
+        menu = Menu.objects.get(owner_profile_id=resp.data["id"])
+        for obj, prefix in [(photos[0], "owner_profile/photos/"), (photos[1], "owner_profile/photos/"),
+                            (menu, "owner_profile/menus/")]:
+            self.assertEqual(obj.upload_status, UploadStatus.READY)
+            self.assertTrue(obj.image.name.startswith(prefix))
+            self.assertEqual(obj.staged_path, "")
+            self.assertTrue(os.path.exists(os.path.join(self.media, obj.image.name)))
+        self.assertEqual(self.staged_files(), [])
+
+        resp = self.client.get(reverse("profiles:owner-detail", args=[resp.data["id"]]))
+        self.assertTrue(all(p["image"] for p in resp.data["photos"]))
+
+    def test_failed_upload_is_retried_by_command(self):
+        _, callbacks = self.create_profile()
+        with mock.patch("django.core.files.storage.FileSystemStorage.save", side_effect=OSError("S3 down")):
+            for callback in callbacks:
+                callback()
+        self.assertEqual(OwnerPhoto.objects.filter(upload_status=UploadStatus.FAILED).count(), 2)
+        self.assertEqual(len(self.staged_files()), 3)  # 재시도를 위해 스테이징 파일 유지
+
+        with mock.patch("profiles.management.commands.retry_profile_uploads.get_executor",
+                        return_value=InlineExecutor()):
+            call_command("retry_profile_uploads", stdout=StringIO())
+        self.assertFalse(OwnerPhoto.objects.exclude(upload_status=UploadStatus.READY).exists())
+        self.assertFalse(Menu.objects.exclude(upload_status=UploadStatus.READY).exists())
+        self.assertEqual(self.staged_files(), [])
+
+    def test_deleted_before_upload_discards_staged_file(self):
+        resp, callbacks = self.create_profile()
+        with self.captureOnCommitCallbacks(execute=True):
+            OwnerProfile.objects.filter(pk=resp.data["id"]).delete()
+        self.assertEqual(self.staged_files(), [])
+        for callback in callbacks:
+            callback()  # 행이 없으므로 업로드하지 않음
+        self.assertEqual([f for _, _, files in os.walk(self.media) for f in files], [])
+
+    def test_deleted_during_upload_queues_uploaded_files(self):
+        resp, callbacks = self.create_profile()
+
+        def delete_then_generate(instance, fileobj):
+            OwnerProfile.objects.filter(pk=resp.data["id"]).delete()
+            return generate_variants(instance, fileobj)
+
+        with mock.patch.object(uploads, "generate_variants", side_effect=delete_then_generate), \
+                self.captureOnCommitCallbacks(execute=False) as deletion_callbacks:
+            for callback in callbacks:
+                callback()
+        # 이미 올라간 원본/파생본은 스토리지를 바로 호출하지 않고 삭제 대기열(재시도 가능)에 기록
+        queued = set(StorageDeletion.objects.values_list("name", flat=True))
+        uploaded = {
+            os.path.relpath(os.path.join(root, f), self.media).replace(os.sep, "/")
+            for root, _, files in os.walk(self.media) for f in files
+        }
+        self.assertTrue(uploaded)
+        self.assertLessEqual(uploaded, queued)
+
+        for callback in deletion_callbacks:
+            callback()
+        self.assertEqual([f for _, _, files in os.walk(self.media) for f in files], [])
+        self.assertFalse(StorageDeletion.objects.exists())
+
+    def test_upload_generates_webp_variants_and_srcset(self):
+        data = {
+            "business_type": BusinessType.CAFE, "profile_name": "큰사진카페",
+            "average_sales": 8000, "margin_rate": "40.00",
+            "photos": [sized_image(1200, 800), valid_image("small.png")],
+        }
+        with self.captureOnCommitCallbacks(execute=True):
+            resp = self.client.post(reverse("profiles:owner-list"), data, format="multipart")
+        big, small = OwnerPhoto.objects.filter(owner_profile_id=resp.data["id"])
+
+        self.assertEqual((big.image_width, big.image_height), (1200, 800))
+        self.assertEqual(
+            {k: (v["width"], v["height"]) for k, v in big.image_variants.items()},
+            {"thumb": (320, 213), "medium": (960, 640)},
+        )
+        for variant in big.image_variants.values():
+            self.assertTrue(variant["name"].endswith(".webp"))
+            self.assertTrue(os.path.exists(os.path.join(self.media, variant["name"])))
+        # 원본보다 크게 만들지 않음
+        self.assertEqual((small.image_width, small.image_height, small.image_variants), (2, 2, {}))
+
+        resp = self.client.get(reverse("profiles:owner-detail", args=[resp.data["id"]]))
+        srcset = resp.data["photos"][0]["srcset"]
+        self.assertEqual(list(srcset), ["thumb", "medium", "original"])
+        self.assertEqual(srcset["original"]["width"], 1200)
+        self.assertEqual(list(resp.data["photos"][1]["srcset"]), ["original"])
+
+        # 삭제 시 파생본 파일도 삭제
+        with self.captureOnCommitCallbacks(execute=True):
+            big.delete()
+        for variant in big.image_variants.values():
+            self.assertFalse(os.path.exists(os.path.join(self.media, variant["name"])))
+
+    def test_student_profile_image_variants(self):
+        resp = self.client.post(
+            reverse("profiles:student-list"), {"name": "학생", "image": sized_image(600, 900)}, format="multipart",
+        )
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(resp.data["srcset"]["thumb"]["height"], 320)
+        self.assertEqual(list(resp.data["srcset"]), ["thumb", "original"])
+
+    def test_backfill_command_for_existing_images(self):
+        profile = OwnerProfile.objects.create(
+            user=self.owner, business_type=BusinessType.BAR, profile_name="기존", average_sales=1, margin_rate=1,
+        )
+        photo = OwnerPhoto.objects.create(owner_profile=profile, image=sized_image(800, 400))
+        self.assertIsNone(photo.image_width)
+
+        call_command("backfill_image_variants", stdout=StringIO())
+        photo.refresh_from_db()
+        self.assertEqual((photo.image_width, list(photo.image_variants)), (800, ["thumb"]))
+
+
+class ProfileAssetBulkTests(TestCase):
+    """사진/메뉴 일괄 등록: 파일 수와 무관한 고정 쿼리 수, 재조회 없는 응답"""
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(username="bulkowner", email="bulk@example.com", password="pw1234")
+
+    def setUp(self):
+        staging = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, staging, ignore_errors=True)
+        overrides = override_settings(PROFILE_UPLOADS={"BACKEND": "sync", "STAGING_DIR": staging})
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+        self.staging = staging
+
+    def post_owner(self, photo_count, menu_count):
+        data = {
+            "business_type": BusinessType.CAFE, "profile_name": "벌크카페",
+            "average_sales": 8000, "margin_rate": "40.00",
+            "photos": [valid_image(f"p{i}.png") for i in range(photo_count)],
+            "menus_data": json.dumps([{"name": f"메뉴{i}", "price": 1000 + i} for i in range(menu_count)]),
+            "menus_images": [valid_image(f"m{i}.png") for i in range(menu_count)],
+        }
+        # 업로드(커밋 후 콜백)는 제외하고 요청 자체의 쿼리만 측정
+        with self.captureOnCommitCallbacks(execute=False), CaptureQueriesContext(connection) as ctx:
+            resp = self.client.post(reverse("profiles:owner-list"), data, format="multipart")
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED, resp.data)
+        return resp, len(ctx.captured_queries)
+
+    def patch_owner(self, pk, data):
+        with self.captureOnCommitCallbacks(execute=False), CaptureQueriesContext(connection) as ctx:
+            resp = self.client.patch(reverse("profiles:owner-detail", args=[pk]), data, format="multipart")
+        return resp, len(ctx.captured_queries)
+
+    def test_owner_create_query_count_is_independent_of_file_count(self):
+        resp_small, small = self.post_owner(1, 1)
+        resp_large, large = self.post_owner(8, 6)
+        self.assertEqual(small, large)
+        self.assertEqual([p["order"] for p in resp_large.data["photos"]], list(range(8)))
+        self.assertEqual([m["name"] for m in resp_large.data["menus"]], [f"메뉴{i}" for i in range(6)])
+        # 응답은 재조회 없이 만들었지만 상세 조회와 같아야 함
+        detail = self.client.get(reverse("profiles:owner-detail", args=[resp_large.data["id"]]))
+        self.assertEqual(resp_large.data["photos"], detail.data["photos"])
+        self.assertEqual(resp_large.data["menus"], detail.data["menus"])
+
+    def test_owner_create_without_photos_adds_default_photo(self):
+        resp, _ = self.post_owner(0, 0)
+        self.assertEqual(len(resp.data["photos"]), 1)
+        self.assertEqual(resp.data["photos"][0]["upload_status"], UploadStatus.READY)
+        self.assertEqual(OwnerPhoto.objects.filter(owner_profile_id=resp.data["id"]).count(), 1)
+
+    def test_owner_patch_query_count_and_ordering(self):
+        resp, _ = self.post_owner(3, 2)
+        pk = resp.data["id"]
+        photo_ids = [p["id"] for p in resp.data["photos"]]
+        menu_ids = [m["id"] for m in resp.data["menus"]]
+
+        resp, one = self.patch_owner(pk, {
+            "photos_to_delete": [photo_ids[0]], "new_photos": [valid_image("n0.png")],
+            "menus_to_delete": [menu_ids[0]], "new_menus_data": json.dumps([{"name": "새메뉴0", "price": 100}]),
+        })
+        self.assertEqual(resp.status_code, status.HTTP_200_OK, resp.data)
+        resp, many = self.patch_owner(pk, {
+            "photos_to_delete": [photo_ids[1]], "new_photos": [valid_image(f"n{i}.png") for i in range(1, 5)],
+            "menus_to_delete": [menu_ids[1]],
+            "new_menus_data": json.dumps([{"name": f"새메뉴{i}", "price": 100} for i in range(1, 5)]),
+        })
+        self.assertEqual(resp.status_code, status.HTTP_200_OK, resp.data)
+        self.assertEqual(one, many)
+
+        self.assertEqual([p["order"] for p in resp.data["photos"]], [2, 3, 4, 5, 6, 7])
+        self.assertNotIn(photo_ids[1], [p["id"] for p in resp.data["photos"]])
+        self.assertEqual([m["name"] for m in resp.data["menus"]], [f"새메뉴{i}" for i in range(5)])
+        detail = self.client.get(reverse("profiles:owner-detail", args=[pk]))
+        self.assertEqual(resp.data["photos"], detail.data["photos"])
+        self.assertEqual(resp.data["menus"], detail.data["menus"])
+
+    def test_insert_without_bulk_returning_keeps_pks_per_row(self):
+        # MySQL처럼 bulk_create가 pk를 돌려주지 않는 DB: 같은 order의 다른 행이 있어도 각 행에 제 pk/파일
+        resp, _ = self.post_owner(1, 0)
+        profile = OwnerProfile.objects.prefetch_related("photos", "menus").get(pk=resp.data["id"])
+        concurrent = OwnerPhoto.objects.create(owner_profile=profile, order=1)  # 프리페치 이후 동시 요청이 넣은 행
+        with mock.patch.object(type(connection.features), "can_return_rows_from_bulk_insert",
+                               new_callable=mock.PropertyMock, return_value=False), \
+                mock.patch("profiles.services.uploads.generate_variants"), \
+                self.captureOnCommitCallbacks(execute=True):
+            apply_owner_assets(profile, new_photos=[valid_image("a.png"), valid_image("b.png")])
+
+        new = [p for p in profile.photos.all() if p.order > 0]
+        self.assertEqual([p.order for p in new], [1, 2])
+        self.assertNotIn(concurrent.pk, [p.pk for p in new])
+        for photo in new:
+            photo.refresh_from_db()
+            self.assertEqual(photo.upload_status, UploadStatus.READY)
+            self.assertTrue(photo.image.name.endswith(".png"), photo.image.name)
+        concurrent.refresh_from_db()
+        self.assertFalse(concurrent.image)
+
+    def test_owner_patch_limits_and_duplicates_roll_back(self):
+        resp, _ = self.post_owner(9, 1)
+        pk = resp.data["id"]
+        resp, _ = self.patch_owner(pk, {"profile_name": "바뀜", "new_photos": [valid_image("x.png"), valid_image("y.png")]})
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("message", resp.data)
+
+        resp, _ = self.patch_owner(pk, {
+            "profile_name": "바뀜", "new_menus_data": json.dumps([{"name": "메뉴0", "price": 1}]),
+        })
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        # 검증은 스테이징 전에 끝나고, 실패 시 프로필 수정도 롤백
+        staged = [f for _, _, files in os.walk(self.staging) for f in files]
+        self.assertEqual(len(staged), 10)
+        profile = OwnerProfile.objects.get(pk=pk)
+        self.assertEqual(profile.profile_name, "벌크카페")
+        self.assertEqual(profile.photos.count(), 9)
+        self.assertEqual(
+            OwnerPhoto.objects.filter(owner_profile=profile, upload_status=UploadStatus.PENDING).count(), 9,
+        )
+
+    def test_student_group_create_query_count_is_independent_of_file_count(self):
+        counts = []
+        for n in (1, 5):
+            data = {
+                "council_name": "총학생회", "department": "경영학과", "position": "회장", "student_size": 100,
+                "term_start": "2025-03-01", "term_end": "2025-12-31",
+                "partnership_start": "2025-04-01", "partnership_end": "2025-06-30",
+                "photos": [valid_image(f"s{i}.png") for i in range(n)],
+            }
+            with self.captureOnCommitCallbacks(execute=False), CaptureQueriesContext(connection) as ctx:
+                resp = self.client.post(reverse("profiles:student-group-list"), data, format="multipart")
+            self.assertEqual(resp.status_code, status.HTTP_201_CREATED, resp.data)
+            self.assertEqual([p["order"] for p in resp.data["photos"]], list(range(n)))
+            counts.append(len(ctx.captured_queries))
+        self.assertEqual(counts[0], counts[1])
+
+
+class FakeS3Storage:
+    """DeleteObjects 호출만 기록하는 S3 스토리지 대역 (실패시킬 키 지정 가능)"""
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.bucket = mock.Mock()
+        self.bucket.delete_objects.side_effect = self._delete_objects
+
+    def _normalize_name(self, name):
+        return f"media/{name}"
+
+    def _delete_objects(self, Delete):
+        return {"Errors": [
+            {"Key": o["Key"], "Code": "AccessDenied", "Message": "denied"}
+            for o in Delete["Objects"] if o["Key"] in self.failing
+        ]}
+
+
+class StorageDeletionTests(TestCase):
+    """삭제된 이미지 파일: 같은 트랜잭션의 대기열에 기록 → 커밋 후 일괄 삭제"""
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(username="deleter", email="del@example.com", password="pw1234")
+
+    def setUp(self):
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media, ignore_errors=True)
+        overrides = override_settings(
+            STORAGES={**dj_settings.STORAGES, "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"}},
+            MEDIA_ROOT=media,
+            STORAGE_DELETIONS={"BACKEND": "sync"},
+            DEFAULT_OWNER_PHOTO_PATH="defaults/owner_profile.png",
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        self.media = media
+
+    def media_files(self):
+        return sorted(
+            os.path.relpath(os.path.join(root, f), self.media).replace(os.sep, "/")
+            for root, _, files in os.walk(self.media) for f in files
+        )
+
+    def make_profile(self):
+        profile = OwnerProfile.objects.create(
+            user=self.owner, business_type=BusinessType.CAFE, profile_name="삭제카페", average_sales=1, margin_rate=1,
+        )
+        for i in range(3):
+            OwnerPhoto.objects.create(owner_profile=profile, image=valid_image(f"p{i}.png"), order=i)
+        OwnerPhoto.objects.create(owner_profile=profile, image="defaults/owner_profile.png", order=3)
+        for i in range(2):
+            Menu.objects.create(owner_profile=profile, name=f"메뉴{i}", price=1000, image=valid_image(f"m{i}.png"))
+        return profile
+
+    def test_profile_delete_queues_keys_and_flushes_after_commit(self):
+        profile = self.make_profile()
+        self.assertEqual(len(self.media_files()), 5)
+
+        with mock.patch("django.core.files.storage.FileSystemStorage.delete") as storage_delete:
+            with self.captureOnCommitCallbacks(execute=False) as callbacks:
+                profile.delete()
+            storage_delete.assert_not_called()  # 요청 안에서는 스토리지를 호출하지 않음
+        # 공용 기본 이미지는 대기열에 넣지 않음
+        self.assertEqual(StorageDeletion.objects.count(), 5)
+        self.assertFalse(StorageDeletion.objects.filter(name="defaults/owner_profile.png").exists())
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.media_files(), [])
+        self.assertFalse(StorageDeletion.objects.exists())
+
+    def test_rollback_keeps_files_and_queue_empty(self):
+        profile = self.make_profile()
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                profile.delete()
+                raise RuntimeError("rollback")
+        self.assertEqual(callbacks, [])
+        self.assertFalse(StorageDeletion.objects.exists())
+        self.assertEqual(len(self.media_files()), 5)
+
+    def test_s3_delete_objects_batches_and_retries_failures(self):
+        names = [f"owner_profile/photos/{i}.png" for i in range(2500)]
+        storage = FakeS3Storage(failing={"media/owner_profile/photos/7.png"})
+        errors = deletions.delete_files(storage, names)
+        self.assertEqual(
+            [len(c.kwargs["Delete"]["Objects"]) for c in storage.bucket.delete_objects.call_args_list],
+            [1000, 1000, 500],
+        )
+        self.assertEqual(list(errors), ["owner_profile/photos/7.png"])
+
+        # 한 배치(BATCH_SIZE)씩 선점 → 성공한 키만 제거, 실패한 키는 재시도 시각을 미룸
+        StorageDeletion.objects.bulk_create(
+            [StorageDeletion(name=n, available_at=dj_timezone.now()) for n in names[:1200]]
+        )
+        storage = FakeS3Storage(failing={"media/owner_profile/photos/7.png"})
+        with override_settings(STORAGE_DELETIONS={"BATCH_SIZE": 1000}):
+            self.assertEqual(deletions.flush_deletions(storage=storage), 1000)
+            self.assertEqual(storage.bucket.delete_objects.call_count, 1)
+            self.assertEqual(StorageDeletion.objects.count(), 201)
+            failed = StorageDeletion.objects.get(name="owner_profile/photos/7.png")
+            self.assertEqual(failed.attempts, 1)
+            self.assertIn("AccessDenied", failed.last_error)
+            self.assertGreater(failed.available_at, dj_timezone.now())
+
+            self.assertEqual(deletions.flush_deletions(storage=storage), 200)
+            self.assertEqual(list(StorageDeletion.objects.values_list("name", flat=True)), [failed.name])
+
+    def test_student_profile_delete_image(self):
+        student = StudentProfile.objects.create(user=self.owner, name="학생", image=sized_image(600, 400))
+        with student.image.open("rb") as f:
+            generate_variants(student, f)
+        student.save()
+        self.assertEqual(len(self.media_files()), 2)
+
+        client = APIClient()
+        client.force_authenticate(self.owner)
+        with self.captureOnCommitCallbacks(execute=True):
+            resp = client.patch(
+                reverse("profiles:student-detail", args=[student.pk]), {"delete_image": "true"}, format="multipart",
+            )
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertIsNone(resp.data["image"])
+        self.assertEqual(self.media_files(), [])
+
+    def test_reconcile_command_deletes_old_orphans_only(self):
+        profile = self.make_profile()
+        kept = OwnerPhoto.objects.filter(owner_profile=profile).first().image.name
+        old = time.time() - 2 * 24 * 60 * 60
+        for name, mtime in [("owner_profile/photos/orphan.png", old), ("owner_profile/menus/fresh.png", None)]:
+            path = os.path.join(self.media, name)
+            with open(path, "wb") as f:
+                f.write(b"x")
+            if mtime:
+                os.utime(path, (mtime, mtime))
+
+        out = StringIO()
+        call_command("reconcile_profile_files", "--dry-run", stdout=out)
+        self.assertIn("owner_profile/photos/orphan.png", out.getvalue())
+        self.assertIn("owner_profile/photos/orphan.png", self.media_files())
+
+        call_command("reconcile_profile_files", stdout=StringIO())
+        files = self.media_files()
+        self.assertNotIn("owner_profile/photos/orphan.png", files)
+        self.assertIn("owner_profile/menus/fresh.png", files)  # 최근 파일은 업로드 중일 수 있어 유지
+        self.assertIn(kept, files)
+        self.assertEqual(len(files), 6)
+
+
+class ProfileListCacheTests(TestCase):
+    """목록 응답 캐시: 시그널 무효화, ETag/304, 적중률"""
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(username="cacheowner", email="co@example.com", password="pw1234")
+        cls.admin = User.objects.create_user(
+            username="cacheadmin", email="ca@example.com", password="pw1234", is_staff=True,
+        )
+        cls.profile = OwnerProfile.objects.create(
+            user=cls.owner, business_type=BusinessType.CAFE, profile_name="캐시카페", average_sales=1, margin_rate=1,
+        )
+
+    def setUp(self):
+        overrides = override_settings(
+            PROFILE_LIST_CACHE={"ENABLED": True, "ALIAS": "default", "TTL": 60, "ALLOW_LOCAL": True},
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+        self.url = reverse("profiles:owner-list")
+
+    def test_hit_serves_without_queries_until_profile_changes(self):
+        first = self.client.get(self.url)
+        self.assertEqual(first["X-Cache"], "MISS")
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.data, first.data)
+
+        self.profile.profile_name = "바뀐카페"
+        self.profile.save()
+        third = self.client.get(self.url)
+        self.assertEqual(third["X-Cache"], "MISS")
+        self.assertEqual(third.data["results"][0]["profile_name"], "바뀐카페")
+
+    def test_child_rows_invalidate_only_their_listing(self):
+        self.client.get(self.url)
+        self.client.get(reverse("profiles:student-list"))
+
+        Menu.objects.create(owner_profile=self.profile, name="라떼", price=5000)
+        resp = self.client.get(self.url)
+        self.assertEqual(resp["X-Cache"], "MISS")
+        self.assertEqual([m["name"] for m in resp.data["results"][0]["menus"]], ["라떼"])
+        self.assertEqual(self.client.get(reverse("profiles:student-list"))["X-Cache"], "HIT")
+
+        # bulk_create 경로(사진 일괄 등록)도 무효화
+        self.client.get(self.url)
+        apply_owner_assets(OwnerProfile.objects.get(pk=self.profile.pk))  # 사진이 없으면 기본 사진 추가
+        resp = self.client.get(self.url)
+        self.assertEqual(resp["X-Cache"], "MISS")
+        self.assertEqual(len(resp.data["results"][0]["photos"]), 1)
+
+    def test_process_local_cache_is_not_used_by_default(self):
+        # 다른 워커가 버전 증가를 볼 수 없으므로 로컬 메모리 캐시로는 캐시하지 않음
+        with override_settings(PROFILE_LIST_CACHE={"ENABLED": True, "ALIAS": "default"}):
+            self.assertFalse(listing_cache.is_enabled())
+            self.client.get(self.url)
+            resp = self.client.get(self.url)
+        self.assertNotIn("X-Cache", resp)
+        self.assertEqual(listing_cache.listing_cache_stats()["owner"]["miss"], 0)
+
+    def test_filters_are_cached_separately(self):
+        cafe = self.client.get(self.url, {"business_type": BusinessType.CAFE})
+        bar = self.client.get(self.url, {"business_type": BusinessType.BAR})
+        self.assertEqual((cafe["X-Cache"], bar["X-Cache"]), ("MISS", "MISS"))
+        self.assertEqual(len(cafe.data["results"]), 1)
+        self.assertEqual(bar.data["results"], [])
+
+    def test_etag_returns_304_until_changed(self):
+        etag = self.client.get(self.url)["ETag"]
+        resp = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(resp.content, b"")
+        self.assertEqual(resp["ETag"], etag)
+
+        Menu.objects.create(owner_profile=self.profile, name="모카", price=5500)
+        resp = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(resp["ETag"], etag)
+
+    def test_hit_rate_stats(self):
+        for _ in range(3):
+            self.client.get(self.url)
+        etag = self.client.get(self.url)["ETag"]
+        self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(self.client.get(reverse("profiles:cache-stats")).status_code, status.HTTP_403_FORBIDDEN)
+        self.client.force_authenticate(self.admin)
+        stats = self.client.get(reverse("profiles:cache-stats")).data
+        self.assertEqual(stats["owner"], {"hit": 4, "miss": 1, "not_modified": 1, "hit_rate": 0.8})
+        self.assertIsNone(stats["student"]["hit_rate"])
+
+        listing_cache.reset_listing_cache_stats()
+        self.assertEqual(listing_cache.listing_cache_stats()["owner"]["hit"], 0)
+
+
+class ProfileConditionalGetTests(TestCase):
+    """상세 조회 ETag/Last-Modified: 검증값 쿼리만으로 304"""
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(username="etagowner", email="eo@example.com", password="pw1234")
+        cls.profile = OwnerProfile.objects.create(
+            user=cls.owner, business_type=BusinessType.CAFE, profile_name="이태그", average_sales=1, margin_rate=1,
+        )
+        cls.menu = Menu.objects.create(owner_profile=cls.profile, name="라떼", price=5000)
+        cls.group = StudentGroupProfile.objects.create(
+            user=cls.owner, council_name="학생회", position="회장", student_size=100,
+            term_start=date(2025, 3, 1), term_end=date(2025, 12, 31),
+            partnership_start=date(2025, 4, 1), partnership_end=date(2025, 6, 30),
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+        self.url = reverse("profiles:owner-detail", args=[self.profile.pk])
+
+    def assert_not_modified(self, url, etag):
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(resp.content, b"")
+        self.assertEqual(len(ctx), 1)  # 프로필/사진/메뉴를 읽지 않음
+
+    def test_owner_detail_validators_follow_child_rows(self):
+        resp = self.client.get(self.url)
+        etag = resp["ETag"]
+        self.assertIn("Last-Modified", resp)
+        self.assert_not_modified(self.url, etag)
+
+        # 메뉴 추가 / 수정 / 삭제, 업로드 완료(update)마다 검증값이 바뀜
+        seen = {etag}
+        menu = Menu.objects.create(owner_profile=self.profile, name="모카", price=5500)
+        for change in (
+            lambda: menu.save(),
+            lambda: Menu.objects.filter(pk=self.menu.pk).delete(),
+            lambda: OwnerPhoto.objects.create(owner_profile=self.profile, image="defaults/owner_profile.png"),
+            lambda: OwnerPhoto.objects.filter(owner_profile=self.profile).update(
+                upload_status=UploadStatus.FAILED, modified_at=dj_timezone.now() + timedelta(seconds=1),
+            ),
+        ):
+            change()
+            resp = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(resp.status_code, status.HTTP_200_OK)
+            self.assertNotIn(resp["ETag"], seen)
+            seen.add(resp["ETag"])
+            etag = resp["ETag"]
+        self.assert_not_modified(self.url, etag)
+
+    def test_if_modified_since_and_missing_profile(self):
+        last_modified = self.client.get(self.url)["Last-Modified"]
+        self.assertEqual(self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304)
+        missing = reverse("profiles:owner-detail", args=[self.profile.pk + 1000])
+        self.assertEqual(self.client.get(missing, HTTP_IF_NONE_MATCH="*").status_code, 404)
+
+    def test_student_group_detail(self):
+        url = reverse("profiles:student-group-detail", args=[self.group.pk])
+        etag = self.client.get(url)["ETag"]
+        self.assert_not_modified(url, etag)
+
+        self.group.position = "부회장"
+        self.group.save()
+        resp = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data["position"], "부회장")
+
+
+class OwnerSearchTests(TestCase):
+    """사장님 프로필 검색: 인덱스 컬럼 필터, 영업 중, 찜/추천 점수 순 커서 페이지"""
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = User.objects.create_user(username="searcher", password="pw1234", user_role=User.Role.STUDENT)
+        cls.fan = User.objects.create_user(username="fan", password="pw1234", user_role=User.Role.STUDENT)
+        cls.profiles = {}
+        for name, campus, business_type, sales, extra in [
+            ("카페A", "서울대", BusinessType.CAFE, 8000, {"goal_revisit": True, "service_drink": True}),
+            ("카페B", "서울대", BusinessType.CAFE, 15000, {"goal_revisit": True, "goal_sns_marketing": True}),
+            ("주점C", "서울대", BusinessType.BAR, 25000, {"goal_revisit": True, "service_drink": True}),
+            ("식당D", "연세대", BusinessType.RESTAURANT, 9000, {"goal_revisit": True}),
+        ]:
+            owner = User.objects.create_user(username=f"owner-{name}", password="pw1234")
+            cls.profiles[name] = OwnerProfile.objects.create(
+                user=owner, campus_name=campus, business_type=business_type, profile_name=name,
+                business_day={"평일": ["10:00-20:00"]} if name != "주점C" else {"금": ["18:00-02:00"]},
+                average_sales=sales, margin_rate=10, **extra,
+            )
+        # 점수: 주점C 2(추천) + 1(찜) = 3, 카페B 1, 카페A 0
+        Recommendation.objects.create(from_user=cls.student, to_user=cls.profiles["주점C"].user)
+        Like.objects.create(user=cls.fan, target=cls.profiles["주점C"].user)
+        Like.objects.create(user=cls.student, target=cls.profiles["카페B"].user)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.student)
+        self.url = reverse("profiles:owner-search")
+
+    def names(self, resp):
+        self.assertEqual(resp.status_code, status.HTTP_200_OK, resp.data)
+        return [row["profile_name"] for row in resp.data["results"]]
+
+    def test_week_intervals(self):
+        day = 24 * 60
+        self.assertEqual(week_intervals({"월": ["09:00-12:00", "11:00-15:00"]}), [(540, 900)])
+        # 일요일 밤 → 월요일 새벽은 주 경계에서 나뉨, 형식이 틀린 값은 무시
+        self.assertEqual(
+            week_intervals({"일요일": ["22:00-02:00"], "수": ["아무때나"]}),
+            [(0, 120), (6 * day + 22 * 60, 7 * day)],
+        )
+        self.assertEqual(len(week_intervals([{"평일": ["09:00-18:00"]}])), 5)
+        self.assertEqual(week_intervals(["10:00-11:00"])[6], (6 * day + 600, 6 * day + 660))
+        # 한 행은 한 요일 안: 자정을 넘는 구간은 다음 요일 행으로, 이어지는 요일끼리 합치지 않음
+        self.assertEqual(
+            week_intervals({"월": ["20:00-02:00"], "화": ["00:00-24:00"]}),
+            [(20 * 60, day), (day, 2 * day)],
+        )
+
+    def test_save_keeps_search_columns_in_sync(self):
+        profile = self.profiles["식당D"]
+        self.assertEqual(OwnerTimeRange.objects.filter(owner_profile=profile).count(), 5)
+        profile.service_side_menu = True
+        profile.business_day = {"토": ["11:00-13:00"]}
+        profile.save(update_fields=["service_side_menu", "business_day"])
+        profile.refresh_from_db()
+        self.assertEqual(profile.feature_mask, profile.compute_feature_mask())
+        self.assertEqual(
+            list(OwnerTimeRange.objects.filter(owner_profile=profile).values_list("weekday", "start", "end")),
+            [(5, 5 * 1440 + 660, 5 * 1440 + 780)],
+        )
+
+    def test_filters_and_score_ranking(self):
+        self.assertEqual(self.names(self.client.get(self.url, {"campus_name": "서울대"})), ["주점C", "카페B", "카페A"])
+        resp = self.client.get(self.url, {"campus_name": "서울대"})
+        self.assertEqual(
+            [(r["likes_count"], r["recommendations_count"], r["score"]) for r in resp.data["results"]],
+            [(1, 1, 3), (1, 0, 1), (0, 0, 0)],
+        )
+        self.assertEqual(
+            self.names(self.client.get(self.url, {"goals": "REVISIT", "services": "DRINK"})), ["주점C", "카페A"],
+        )
+        self.assertEqual(
+            self.names(self.client.get(f"{self.url}?goals=REVISIT&goals=SNS_MARKETING")), ["카페B"],
+        )
+        self.assertEqual(
+            self.names(self.client.get(self.url, {"business_type": "CAFE", "min_sales": 10000})), ["카페B"],
+        )
+        self.assertEqual(self.names(self.client.get(self.url, {"max_sales": 9000})), ["식당D", "카페A"])
+
+    def test_open_at(self):
+        # 2025-03-07 금요일, OWNER_SEARCH["TIME_ZONE"](Asia/Seoul) 기준
+        self.assertEqual(
+            self.names(self.client.get(self.url, {"open_at": "2025-03-07T12:00:00+09:00"})), ["카페B", "식당D", "카페A"],
+        )
+        self.assertEqual(self.names(self.client.get(self.url, {"open_at": "2025-03-07T23:30:00+09:00"})), ["주점C"])
+        # 금요일 밤 영업은 토요일 새벽 2시까지 (UTC로 보내도 같은 시각)
+        self.assertEqual(self.names(self.client.get(self.url, {"open_at": "2025-03-07T16:30:00Z"})), ["주점C"])
+        self.assertEqual(self.names(self.client.get(self.url, {"open_at": "2025-03-08T12:00:00+09:00"})), [])
+
+    def test_cursor_pagination_and_validation(self):
+        seen, url, params = [], self.url, {"page_size": 1}
+        while url:
+            resp = self.client.get(url, params)
+            seen += self.names(resp)
+            url, params = resp.data["next"], None
+        self.assertEqual(seen, ["주점C", "카페B", "식당D", "카페A"])
+
+        self.assertEqual(self.client.get(self.url, {"goals": "FLYING"}).status_code, status.HTTP_400_BAD_REQUEST)
+        resp = self.client.get(self.url, {"min_sales": 20000, "max_sales": 10000})
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("max_sales", resp.data)
+
+    def test_peak_tables_and_helpers(self):
+        day = 24 * 60
+        cafe, bar = self.profiles["카페A"], self.profiles["주점C"]
+        cafe.peak_time = {"평일": ["12:00-13:00"]}
+        cafe.off_peak_time = [{"주말": ["14:00-17:00"], "평일": ["15:00-17:00"]}]
+        cafe.save()
+        bar.off_peak_time = {"금": ["18:00-20:00"]}
+        bar.save(update_fields=["off_peak_time"])
+        self.assertEqual(
+            OwnerTimeRange.objects.filter(owner_profile=cafe, kind=TimeRangeKind.OFF_PEAK).count(), 7,
+        )
+        # update_fields에 없는 종류는 그대로
+        self.assertEqual(OwnerTimeRange.objects.filter(owner_profile=bar, kind=TimeRangeKind.BUSINESS).count(), 2)
+
+        def matching(condition):
+            return set(OwnerProfile.objects.filter(condition).values_list("profile_name", flat=True))
+
+        friday = 4 * day
+        self.assertEqual(matching(hours.overlaps_filter([(friday + 16 * 60, friday + 19 * 60)])), {"카페A", "주점C"})
+        self.assertEqual(matching(hours.overlaps_filter([(friday + 17 * 60, friday + 18 * 60)])), set())
+        self.assertEqual(matching(hours.overlaps_filter([])), set())
+        self.assertEqual(matching(hours.open_at_filter(friday + 12 * 60 + 30, kind=TimeRangeKind.PEAK)), {"카페A"})
+        self.assertEqual(matching(hours.weekday_filter(5)), {"주점C"})  # 금요일 밤 영업이 토요일 새벽으로 이어짐
+        self.assertEqual(
+            hours.overlap_minutes(week_intervals(cafe.business_day), week_intervals(cafe.off_peak_time)), 5 * 120,
+        )
+
+    def test_backfill_command_rebuilds_ranges(self):
+        profile = self.profiles["식당D"]
+        OwnerProfile.objects.filter(pk=profile.pk).update(off_peak_time={"월": ["15:00-16:00"]})  # 시그널 없음
+        OwnerTimeRange.objects.filter(owner_profile=profile, kind=TimeRangeKind.BUSINESS).delete()
+
+        out = StringIO()
+        call_command("backfill_owner_hours", "--batch-size", "2", stdout=out)
+        self.assertIn("프로필 4개", out.getvalue())
+        self.assertEqual(OwnerTimeRange.objects.filter(owner_profile=profile, kind=TimeRangeKind.BUSINESS).count(), 5)
+        self.assertEqual(
+            list(OwnerTimeRange.objects.filter(owner_profile=profile, kind=TimeRangeKind.OFF_PEAK)
+                 .values_list("weekday", "start", "end")),
+            [(0, 900, 960)],
+        )
+
+
+class PartnerMatchTests(TestCase):
+    """매칭 배치: 행렬 점수 → 유저별 상위 K 저장, /matches/는 저장된 행만 조회"""
+    @classmethod
+    def setUpTestData(cls):
+        def owner(username, profiles):
+            user = User.objects.create_user(username=username, password="pw1234", user_role=User.Role.OWNER)
+            for i, (campus, business_type, extra) in enumerate(profiles):
+                OwnerProfile.objects.create(
+                    user=user, campus_name=campus, business_type=business_type, profile_name=f"{username}-{i}",
+                    business_day={"매일": ["10:00-22:00"]}, average_sales=10000, margin_rate=10, **extra,
+                )
+            return user
+
+        def group(username, university, size, end=date(2099, 12, 31)):
+            user = User.objects.create_user(username=username, password="pw1234", user_role=User.Role.STUDENT_GROUP)
+            StudentGroupProfile.objects.create(
+                user=user, university_name=university, council_name=f"{username} 학생회", position="회장",
+                student_size=size, term_start=date(2025, 3, 1), term_end=date(2025, 12, 31),
+                partnership_start=date(2025, 4, 1), partnership_end=end,
+            )
+            return user
+
+        cls.snu_cafe = owner("snu-cafe", [("서울대학교 관악캠퍼스", BusinessType.CAFE, {
+            "goal_new_customers": True, "off_peak_time": {"평일": ["14:00-18:00"]},
+        })])
+        cls.yonsei_bar = owner("yonsei-bar", [("연세대학교", BusinessType.BAR, {})])
+        cls.chain = owner("chain", [
+            ("연세대학교", BusinessType.RESTAURANT, {}),
+            ("서울대학교", BusinessType.RESTAURANT, {"goal_revisit": True}),
+        ])
+        cls.snu_group = group("snu-group", "서울대학교", 800)
+        cls.yonsei_group = group("yonsei-group", "연세대학교", 60)
+        cls.expired_group = group("expired-group", "서울대학교", 900, end=date(2020, 1, 1))
+        Like.objects.create(user=cls.yonsei_group, target=cls.yonsei_bar)
+
+    def refresh(self, **kwargs):
+        return matching.refresh_partner_matches(**kwargs)
+
+    def ranked(self, user):
+        return list(PartnerMatch.objects.filter(user=user).order_by("rank"))
+
+    def test_refresh_ranks_candidates_per_user(self):
+        stats = self.refresh()
+        self.assertEqual((stats["owner_profiles"], stats["student_group_profiles"]), (4, 2))
+        self.assertEqual(stats["matches"], 3 * 2 + 2 * 4)  # 사장님 유저 × 학생단체 프로필 + 학생단체 유저 × 사장님 프로필
+
+        top = self.ranked(self.snu_cafe)[0]
+        self.assertEqual(top.student_group_profile.user, self.snu_group)
+        self.assertEqual(top.components["campus"], 1.0)
+        self.assertGreater(top.components["off_peak"], 0)
+
+        # 프로필이 여러 개인 유저: 후보마다 점수가 가장 높은 내 프로필 (같은 학교)
+        for match in self.ranked(self.chain):
+            self.assertEqual(
+                matching.campus_key(match.owner_profile.campus_name),
+                matching.campus_key(match.student_group_profile.university_name),
+            )
+
+        # 학생단체: 같은 학교 사장님이 먼저, 만료된 학생단체는 후보 계산에서 제외
+        snu = [m.owner_profile.user for m in self.ranked(self.snu_group)]
+        self.assertEqual(set(snu[:2]), {self.snu_cafe, self.chain})
+        self.assertFalse(PartnerMatch.objects.filter(user=self.expired_group).exists())
+        # 찜 이력이 있는 업종(BAR) 선호가 기본 가중치보다 높아짐
+        bar = next(m for m in self.ranked(self.yonsei_group) if m.owner_profile.user == self.yonsei_bar)
+        self.assertGreater(bar.components["business_type"], matching._config("BUSINESS_TYPE_WEIGHTS")[BusinessType.BAR])
+
+    def test_chunked_scores_match_single_pass(self):
+        self.refresh()
+        single = list(PartnerMatch.objects.order_by("user_id", "rank").values_list(
+            "user_id", "owner_profile_id", "student_group_profile_id", "score"))
+        self.refresh(chunk_size=1, top_k=20)
+        chunked = list(PartnerMatch.objects.order_by("user_id", "rank").values_list(
+            "user_id", "owner_profile_id", "student_group_profile_id", "score"))
+        self.assertEqual(single, chunked)
+
+        self.refresh(top_k=1)
+        self.assertEqual(set(PartnerMatch.objects.values_list("rank", flat=True)), {1})
+
+    def test_matches_endpoint_reads_precomputed_rows(self):
+        self.refresh()
+        client = APIClient()
+        client.force_authenticate(self.snu_group)
+        url = reverse("profiles:partner-matches")
+        with self.assertNumQueries(1):
+            resp = client.get(url, {"limit": 2})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data["count"], 2)
+        first = resp.data["results"][0]
+        self.assertEqual(first["rank"], 1)
+        self.assertIn("profile_name", first["candidate"])
+        self.assertEqual(first["my_profile_id"], self.snu_group.student_group_profile.get().pk)
+
+        client.force_authenticate(self.snu_cafe)
+        resp = client.get(url)
+        self.assertEqual(resp.data["results"][0]["candidate"]["council_name"], "snu-group 학생회")
+        self.assertEqual(client.get(url, {"limit": "0"}).status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@override_settings(PROFILE_LIST_CACHE={"ENABLED": False})
+class ProfileQueryBudgetTests(QueryBudgetMixin, TestCase):
+    """목록/상세/검색 쿼리 예산 — 사진/메뉴/프로필 수와 무관하게 일정해야 함 (N+1 방지)"""
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = User.objects.create_user(username="budget-student", password="pw1234", user_role=User.Role.STUDENT)
+        cls.owners = []
+        for i in range(5):
+            user = User.objects.create_user(username=f"budget-owner{i}", password="pw1234", user_role=User.Role.OWNER)
+            profile = OwnerProfile.objects.create(
+                user=user, campus_name="서울대", business_type=BusinessType.CAFE, profile_name=f"예산카페{i}",
+                business_day={"평일": ["10:00-20:00"]}, average_sales=5000, margin_rate=10,
+            )
+            for order in range(3):
+                OwnerPhoto.objects.create(owner_profile=profile, image="defaults/owner_profile.png", order=order)
+                Menu.objects.create(owner_profile=profile, name=f"메뉴{order}", price=4000 + order, order=order)
+            Like.objects.create(user=cls.student, target=user)
+            cls.owners.append(profile)
+        cls.groups = []
+        for i in range(4):
+            user = User.objects.create_user(username=f"budget-group{i}", password="pw1234", user_role=User.Role.STUDENT_GROUP)
+            group = StudentGroupProfile.objects.create(
+                user=user, university_name="서울대", council_name=f"학생회{i}", position="회장", student_size=100,
+                term_start=date(2025, 3, 1), term_end=date(2025, 12, 31),
+                partnership_start=date(2025, 4, 1), partnership_end=date(2025, 6, 30),
+            )
+            StudentPhoto.objects.create(student_group_profile=group, image="defaults/owner_profile.png")
+            cls.groups.append(group)
+        for i in range(3):
+            StudentProfile.objects.create(user=cls.student, name=f"학생{i}", university_name="서울대")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.student)
+
+    def test_endpoint_budgets(self):
+        # (URL 이름, args, 쿼리 파라미터, 예산)
+        budgets = [
+            ("profiles:owner-list", [], {}, 3),
+            ("profiles:owner-detail", [self.owners[0].pk], {}, 4),
+            ("profiles:owner-search", [], {"campus": "서울대"}, 3),
+            ("profiles:owner-search", [], {"open_now": "true"}, 3),  # 영업 중인 결과가 있으면 사진/메뉴 prefetch
+            ("profiles:student-group-list", [], {}, 2),
+            ("profiles:student-group-detail", [self.groups[0].pk], {}, 3),
+            ("profiles:student-list", [], {}, 1),
+            ("profiles:partner-matches", [], {}, 2),
+        ]
+        for name, args, params, budget in budgets:
+            with self.subTest(name, **params), self.assertQueryBudget(budget, max_duplicates=1):
+                resp = self.client.get(reverse(name, args=args), params)
+            self.assertEqual(resp.status_code, status.HTTP_200_OK, resp.data)
+
@@ -3,6 +3,7 @@ from .views import (
     # 사장님 프로필 관련
     OwnerProfileListCreateView,
     OwnerProfileDetailView,
+    OwnerSearchView,
     
     # 학생단체 프로필 관련
     StudentGroupProfileListCreateView,
@@ -11,6 +12,12 @@ from .views import (
     # 학생단체 프로필 관련
     StudentProfileListCreateView,
     StudentProfileDetailView,
+
+    # 매칭 후보
+    PartnerMatchListView,
+
+    # 목록 캐시 지표
+    ProfileListCacheStatsView,
 )
 
 app_name = 'profiles'
@@ -23,6 +30,9 @@ urlpatterns = [
     
     # 프로필 상세 (조회/수정/삭제)
     path('owners/<int:pk>/', OwnerProfileDetailView.as_view(), name='owner-detail'),
+
+    # 프로필 검색 (필터 + 찜/추천 점수 순)
+    path('owners/search/', OwnerSearchView.as_view(), name='owner-search'),
     
     # ------ 학생단체 프로필 관련 URLs ------
     
@@ -39,4 +49,10 @@ urlpatterns = [
     
     # 프로필 상세 (조회/수정/삭제)
     path('students/<int:pk>/', StudentProfileDetailView.as_view(), name='student-detail'),
-]
\ No newline at end of file
+
+    # ------ 매칭 후보 (배치로 미리 계산) ------
+    path('matches/', PartnerMatchListView.as_view(), name='partner-matches'),
+
+    # ------ 목록 캐시 지표 (관리자 전용) ------
+    path('cache-stats/', ProfileListCacheStatsView.as_view(), name='cache-stats'),
+]
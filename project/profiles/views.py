@@ -2,47 +2,96 @@ from django.shortcuts import render
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from django.shortcuts import get_object_or_404
 from django.db import transaction
+from django.db.models import Count, Max
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from rest_framework.settings import api_settings
 import json
+from config.conditional import conditional_get, make_etag
+from config.pagination import KeysetCursorPagination
 from .permissions import IsOwnerOrReadOnly
 from .models import (
-    OwnerProfile, OwnerPhoto, Menu, 
-    StudentGroupProfile, StudentPhoto,
+    OwnerProfile, StudentGroupProfile,
     StudentProfile
 )
 from .serializers import (
     OwnerProfileSerializer, OwnerProfileCreateSerializer,
     StudentGroupProfileSerializer, StudentGroupProfileCreateSerializer,
-    StudentProfileSerializer, StudentProfileCreateSerializer
+    StudentProfileSerializer, StudentProfileCreateSerializer,
+    OwnerSearchQuerySerializer, OwnerSearchResultSerializer,
+    PartnerMatchSerializer
 )
-from django.conf import settings
-
-MAX_OWNER_PHOTOS = 10
-MAX_OWNER_MENUS = 8
+from .services.assets import ProfileAssetError, apply_owner_assets, apply_student_group_assets
+from .services.deletions import image_keys, queue_deletions
+from .services.images import generate_variants
+from .services.listing_cache import cached_list_response, listing_cache_stats
+from .services.matching import get_matches
+from .services.search import local_now, search_owners
 
 class BaseProfileMixin:
     """프로필 관련 뷰의 공통 기능"""
     permission_classes = [IsAuthenticated]
     parser_classes = [MultiPartParser, FormParser, JSONParser]
+    pagination_class = api_settings.DEFAULT_PAGINATION_CLASS
+
+    @staticmethod
+    def load_json_list(request, key):
+        """멀티파트 폼의 JSON 배열 필드 (없으면 빈 리스트)"""
+        raw = request.data.get(key, '[]')
+        if isinstance(raw, list):
+            return raw
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError:
+            raise ProfileAssetError({"detail": f"잘못된 형식의 {key} 데이터입니다."})
+        return data if isinstance(data, list) else []
+
+    def paginated_response(self, request, queryset, serializer_class):
+        """(created_at, id) 커서 페이지 단위로 직렬화해서 반환"""
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = serializer_class(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
 class BaseDetailMixin(BaseProfileMixin):
     """상세 뷰의 공통 기능"""
     permission_classes = [IsAuthenticated, IsOwnerOrReadOnly]
 
+    @staticmethod
+    def detail_validators(queryset, *relations):
+        """
+        조건부 GET 검증값 (ETag, Last-Modified) — 본문/하위 행은 읽지 않고 한 쿼리로 계산
+        프로필 modified_at + 관계별 행 개수(삭제 감지)와 최대 modified_at(추가/수정/업로드 완료 감지)
+        """
+        annotations = {}
+        for name in relations:
+            annotations[f"{name}_count"] = Count(name, distinct=True)
+            annotations[f"{name}_modified"] = Max(f"{name}__modified_at")
+        row = queryset.annotate(**annotations).values("pk", "modified_at", *annotations).first()
+        if row is None:
+            return None, None
+        timestamps = [row["modified_at"], *(row[f"{name}_modified"] for name in relations)]
+        return make_etag(*row.values()), max(t for t in timestamps if t)
+
 # ------ 사장님 프로필 관련 Views ------
 class OwnerProfileListCreateView(BaseProfileMixin, APIView):
     """사장님 프로필 목록 조회, 생성"""
     @swagger_auto_schema(
         operation_summary="사장님 프로필 목록 조회",
-        operation_description="모든 사장님 프로필을 조회합니다.",
-        responses={200: OwnerProfileSerializer(many=True)}
+        operation_description=(
+            "모든 사장님 프로필을 커서 페이지 단위로 조회합니다. (?cursor=, ?page_size=)\n"
+            "응답은 캐시되며 ETag가 같으면(If-None-Match) 304를 반환합니다."
+        ),
+        responses={200: OwnerProfileSerializer(many=True), 304: "변경 없음"}
     )
     def get(self, request):
+        return cached_list_response(request, "owner", lambda: self.build_list(request))
+
+    def build_list(self, request):
         profiles = OwnerProfile.objects.select_related('user').prefetch_related('photos', 'menus')
         
         # 필터링
@@ -51,78 +100,79 @@ class OwnerProfileListCreateView(BaseProfileMixin, APIView):
         if business_type:
             profiles = profiles.filter(business_type=business_type)
               
-        serializer = OwnerProfileSerializer(profiles, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return self.paginated_response(request, profiles, OwnerProfileSerializer)
 
     @swagger_auto_schema(
         operation_summary="사장님 프로필 생성",
-        operation_description="새로운 사장님 프로필을 생성합니다.",
+        operation_description="새로운 사장님 프로필을 생성합니다. 사진/메뉴 이미지는 커밋 후 백그라운드로 업로드되며, 완료 전에는 upload_status=PENDING, image=null로 반환됩니다.",
         request_body=OwnerProfileCreateSerializer,
         responses={201: OwnerProfileCreateSerializer, 400: "잘못된 요청"}
     )
     def post(self, request):
         serializer = OwnerProfileCreateSerializer(data=request.data)
         if serializer.is_valid():
-            with transaction.atomic():
-                profile = serializer.save(user=request.user)
-                # 대표 사진 업로드 처리
-                photos = request.FILES.getlist('photos')
-                if photos:
-                    if len(photos) > MAX_OWNER_PHOTOS:
-                        return Response(
-                            {"message": f"대표 사진은 최대 {MAX_OWNER_PHOTOS}장까지 업로드할 수 있습니다."},
-                            status=status.HTTP_400_BAD_REQUEST,
-                        )
-                    for idx, photo in enumerate(photos):
-                        photo.seek(0)
-                        owner_photo = OwnerPhoto.objects.create(
-                            owner_profile=profile,
-                            image=photo,
-                            order=idx
-                        )
-                        owner_photo.save()
-
-                # 메뉴 이미지 처리
-                menu_images = request.FILES.getlist('menus_images')
-                menus_data_raw = request.data.get('menus_data', [])
-                try:
-                    menus_data = json.loads(menus_data_raw)
-                except json.JSONDecodeError:
-                    menus_data = []
-                
-                if menus_data:
-                    if len(menus_data) > MAX_OWNER_MENUS:
-                        return Response(
-                            {"detail": f"대표 메뉴는 최대 {MAX_OWNER_MENUS}개까지 등록할 수 있습니다."},
-                            status=status.HTTP_400_BAD_REQUEST,
-                        )
-                    for idx, menu_data in enumerate(menus_data):
-                        menu_image = menu_images[idx] if (idx) < len(menu_images) else None
-                        Menu.objects.create(
-                            owner_profile=profile,
-                            name=menu_data.get('name'),
-                            price=menu_data.get('price'),
-                            image=menu_image,
-                            order=idx
-                        )
-
-                # ---- 기본 대표 사진 자동 생성 ----
-                if profile.photos.count() == 0:
-                    OwnerPhoto.objects.create(
-                        owner_profile=profile,
-                        image=settings.DEFAULT_OWNER_PHOTO_PATH,
-                        order=0
+            # 사진/메뉴는 검증 후 관계별 bulk_create 한 번씩 (파일 수와 무관한 쿼리 수)
+            # 파일은 스테이징만 하고 S3 업로드는 커밋 후 워커가 처리 (응답에는 PENDING으로 표시)
+            try:
+                with transaction.atomic():
+                    profile = serializer.save(user=request.user)
+                    apply_owner_assets(
+                        profile, created=True,
+                        new_photos=request.FILES.getlist('photos'),
+                        new_menus=self.load_json_list(request, 'menus_data'),
+                        menu_images=request.FILES.getlist('menus_images'),
                     )
+            except ProfileAssetError as e:
+                return Response(e.body, status=status.HTTP_400_BAD_REQUEST)
 
-            # 생성된 프로필을 다시 조회하여 관련 데이터와 함께 반환
-            created_profile = OwnerProfile.objects.select_related('user').prefetch_related('photos', 'menus').get(id=profile.id)
+            # 프리페치 캐시가 채워져 있으므로 다시 조회하지 않고 직렬화
             return Response(
-                OwnerProfileSerializer(created_profile).data, 
+                OwnerProfileSerializer(profile).data, 
                 status=status.HTTP_201_CREATED
             )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class OwnerSearchPagination(KeysetCursorPagination):
+    """검색 결과: 점수 내림차순, 동점은 id 내림차순"""
+    ordering = ("-score", "-id")
+
+
+class OwnerSearchView(BaseProfileMixin, APIView):
+    """사장님 프로필 탐색 검색 (캠퍼스, 업종, 목표, 서비스, 객단가 범위, 영업 중)"""
+    pagination_class = OwnerSearchPagination
+
+    @swagger_auto_schema(
+        operation_summary="사장님 프로필 검색",
+        operation_description=(
+            "조건에 맞는 사장님 프로필을 받은 찜/추천 수 기반 점수(score) 순으로 커서 페이지 단위 조회합니다.\n"
+            "goals/services는 쉼표로 구분하며 모두 만족하는 프로필만 반환합니다. "
+            "open_now=true면 현재 영업 중(business_day 기준)인 프로필만, open_at을 주면 그 시각 기준으로 거릅니다."
+        ),
+        query_serializer=OwnerSearchQuerySerializer,
+        responses={200: OwnerSearchResultSerializer(many=True), 400: "잘못된 검색 조건"}
+    )
+    def get(self, request):
+        # 같은 키가 여러 번 오면 쉼표로 합침 (?goals=A&goals=B == ?goals=A,B)
+        params = {key: ",".join(values) for key, values in request.query_params.lists()}
+        query = OwnerSearchQuerySerializer(data=params)
+        if not query.is_valid():
+            return Response(query.errors, status=status.HTTP_400_BAD_REQUEST)
+        data = query.validated_data
+
+        open_at = data.get('open_at') or (local_now() if data['open_now'] else None)
+        profiles = search_owners(
+            campus_name=data.get('campus_name'),
+            business_type=data.get('business_type'),
+            goals=data.get('goals', ()),
+            services=data.get('services', ()),
+            min_sales=data.get('min_sales'),
+            max_sales=data.get('max_sales'),
+            open_at=open_at,
+        ).select_related('user').prefetch_related('photos', 'menus')
+        return self.paginated_response(request, profiles, OwnerSearchResultSerializer)
+
+
 class OwnerProfileDetailView(BaseDetailMixin, APIView):
     """사장님 프로필 상세 조회, 수정, 삭제"""
     def get_object(self, pk):
@@ -133,10 +183,14 @@ class OwnerProfileDetailView(BaseDetailMixin, APIView):
     
     @swagger_auto_schema(
         operation_summary="사장님 프로필 상세 조회",
-        operation_description="상세 사장님 프로필을 조회합니다.",
-        responses={200: OwnerProfileSerializer}
+        operation_description="상세 사장님 프로필을 조회합니다. ETag/Last-Modified가 같으면(If-None-Match/If-Modified-Since) 304를 반환합니다.",
+        responses={200: OwnerProfileSerializer, 304: "변경 없음"}
     )
     def get(self, request, pk):
+        etag, last_modified = self.detail_validators(OwnerProfile.objects.filter(pk=pk), 'photos', 'menus')
+        return conditional_get(request, etag, last_modified, lambda: self.build_detail(pk))
+
+    def build_detail(self, pk):
         profile = self.get_object(pk)
         serializer = OwnerProfileSerializer(profile)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -161,83 +215,24 @@ class OwnerProfileDetailView(BaseDetailMixin, APIView):
 
         serializer = OwnerProfileCreateSerializer(profile, data=request.data, partial=True)
         if serializer.is_valid():
-            with transaction.atomic():
-                profile = serializer.save()
-
-                # 1. 삭제할 사진 ID 목록 (photos_to_delete)
-                photos_to_delete_ids = request.data.getlist('photos_to_delete')
-                if photos_to_delete_ids:
-                    # request.data.getlist는 문자열 리스트를 반환하므로 정수형으로 변환
-                    photo_ids_to_delete = [int(id_str) for id_str in photos_to_delete_ids if id_str.isdigit()]
-                    if photo_ids_to_delete:
-                        OwnerPhoto.objects.filter(owner_profile=profile, id__in=photo_ids_to_delete).delete()
-
-                # 2. 새로 추가할 사진 파일 목록 (new_photos)
-                new_photos = request.FILES.getlist('new_photos')
-                if new_photos:
-                    # 기존 사진 개수 확인
-                    existing_photo_count = profile.photos.count()
-                    if existing_photo_count + len(new_photos) > MAX_OWNER_PHOTOS:
-                        return Response(
-                            {"message": f"대표 사진은 최대 {MAX_OWNER_PHOTOS}장까지 업로드할 수 있습니다."},
-                            status=status.HTTP_400_BAD_REQUEST,
-                        )
-                    
-                    # 가장 높은 order 값을 찾아 그 다음부터 순서 부여
-                    last_order = profile.photos.order_by('-order').first()
-                    start_order = (last_order.order + 1) if last_order else 0
-
-                    for i, photo in enumerate(new_photos):
-                        OwnerPhoto.objects.create(
-                            owner_profile=profile,
-                            image=photo,
-                            order=start_order + i
-                        )
-
-                # 1. 삭제할 메뉴 ID 처리 ('X' 버튼 누른 메뉴)
-                menus_to_delete_ids = request.data.getlist('menus_to_delete')
-                if menus_to_delete_ids:
-                    menu_ids_to_delete = [int(id_str) for id_str in menus_to_delete_ids if id_str.isdigit()]
-                    if menu_ids_to_delete:
-                        Menu.objects.filter(owner_profile=profile, id__in=menu_ids_to_delete).delete()
-
-                # 2. 새로 추가할 메뉴 데이터 및 이미지 파일 처리 ('+' 버튼으로 추가한 메뉴)
-                new_menus_raw = request.data.get('new_menus_data', '[]')
-                new_menu_images = request.FILES.getlist('new_menu_images')
-                try:
-                    new_menus_data = json.loads(new_menus_raw)
-                except json.JSONDecodeError:
-                     return Response({"detail": "잘못된 형식의 새 메뉴 데이터입니다."}, status=status.HTTP_400_BAD_REQUEST)
-
-                if new_menus_data:
-                    # 현재 메뉴 개수와 새로 추가할 메뉴 개수의 합이 최대치를 넘지 않는지 확인
-                    if profile.menus.count() + len(new_menus_data) > MAX_OWNER_MENUS:
-                        return Response({"detail": f"메뉴는 최대 {MAX_OWNER_MENUS}개까지 등록할 수 있습니다."}, status=status.HTTP_400_BAD_REQUEST)
-
-                    # 기존 메뉴 중 가장 높은 order 값을 찾아 그 다음부터 순서 부여
-                    last_order = profile.menus.order_by('-order').first()
-                    start_order = (last_order.order + 1) if last_order else 0
-
-                    for i, menu_data in enumerate(new_menus_data):
-                        Menu.objects.create(
-                            owner_profile=profile,
-                            name=menu_data.get('name'),
-                            price=menu_data.get('price'),
-                            image=new_menu_images[i] if i < len(new_menu_images) else None,
-                            order=start_order + i
-                        )
-
-            # ---- 기본 대표 사진 자동 생성 ----
-            if profile.photos.count() == 0:
-                OwnerPhoto.objects.create(
-                    owner_profile=profile,
-                    image=settings.DEFAULT_OWNER_PHOTO_PATH,
-                    order=0
-                )
+            try:
+                with transaction.atomic():
+                    profile = serializer.save()
+                    # 삭제할 사진/메뉴 ID (photos_to_delete, menus_to_delete), 새 사진/메뉴 ('+' 버튼으로 추가)
+                    # 기존 개수/순서는 get_object에서 프리페치한 목록으로 계산
+                    apply_owner_assets(
+                        profile,
+                        new_photos=request.FILES.getlist('new_photos'),
+                        delete_photo_ids=request.data.getlist('photos_to_delete'),
+                        new_menus=self.load_json_list(request, 'new_menus_data'),
+                        menu_images=request.FILES.getlist('new_menu_images'),
+                        delete_menu_ids=request.data.getlist('menus_to_delete'),
+                    )
+            except ProfileAssetError as e:
+                return Response(e.body, status=status.HTTP_400_BAD_REQUEST)
 
-            updated_profile = OwnerProfile.objects.select_related('user').prefetch_related('photos', 'menus').get(id=profile.id)
             return Response(
-                OwnerProfileSerializer(updated_profile).data, 
+                OwnerProfileSerializer(profile).data, 
                 status=status.HTTP_200_OK
             )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -266,10 +261,16 @@ class StudentGroupProfileListCreateView(BaseProfileMixin, APIView):
     """학생단체 프로필 목록 조회 및 생성"""
     @swagger_auto_schema(
         operation_summary="학생단체 프로필 목록 조회",
-        operation_description="모든 학생단체 프로필을 조회합니다.",
-        responses={200: StudentGroupProfileSerializer(many=True)}
+        operation_description=(
+            "모든 학생단체 프로필을 커서 페이지 단위로 조회합니다. (?cursor=, ?page_size=)\n"
+            "응답은 캐시되며 ETag가 같으면(If-None-Match) 304를 반환합니다."
+        ),
+        responses={200: StudentGroupProfileSerializer(many=True), 304: "변경 없음"}
     )
     def get(self, request):
+        return cached_list_response(request, "student_group", lambda: self.build_list(request))
+
+    def build_list(self, request):
         profiles = StudentGroupProfile.objects.select_related('user').prefetch_related('photos')
         
         # 필터링
@@ -278,8 +279,7 @@ class StudentGroupProfileListCreateView(BaseProfileMixin, APIView):
         if partnership_count:
             profiles = profiles.filter(partnership_count=partnership_count)
             
-        serializer = StudentGroupProfileSerializer(profiles, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return self.paginated_response(request, profiles, StudentGroupProfileSerializer)
     
     @swagger_auto_schema(
         operation_summary="학생단체 프로필 생성",
@@ -293,21 +293,11 @@ class StudentGroupProfileListCreateView(BaseProfileMixin, APIView):
             with transaction.atomic():
                 profile = serializer.save(user=request.user)
                 
-                # 프로필 사진 업로드 처리
-                photos = request.FILES.getlist('photos')
-                for idx, photo in enumerate(photos):
-                    photo.seek(0)
-                    student_group_photo = StudentPhoto.objects.create(
-                        student_group_profile=profile,
-                        image=photo,
-                        order=idx
-                    )
-                    student_group_photo.save()
+                # 프로필 사진 업로드 처리 (bulk_create 한 번)
+                apply_student_group_assets(profile, created=True, new_photos=request.FILES.getlist('photos'))
             
-            # 생성된 프로필을 다시 조회하여 관련 데이터와 함께 반환
-            created_profile = StudentGroupProfile.objects.select_related('user').prefetch_related('photos').get(id=profile.id)
             return Response(
-                StudentGroupProfileSerializer(created_profile).data, 
+                StudentGroupProfileSerializer(profile).data, 
                 status=status.HTTP_201_CREATED
             )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -323,10 +313,14 @@ class StudentGroupProfileDetailView(BaseDetailMixin, APIView):
     
     @swagger_auto_schema(
         operation_summary="학생단체 프로필 상세 조회",
-        operation_description="상세 학생단체 프로필을 조회합니다.",
-        responses={200: StudentGroupProfileSerializer}
+        operation_description="상세 학생단체 프로필을 조회합니다. ETag/Last-Modified가 같으면(If-None-Match/If-Modified-Since) 304를 반환합니다.",
+        responses={200: StudentGroupProfileSerializer, 304: "변경 없음"}
     )
     def get(self, request, pk):
+        etag, last_modified = self.detail_validators(StudentGroupProfile.objects.filter(pk=pk), 'photos')
+        return conditional_get(request, etag, last_modified, lambda: self.build_detail(pk))
+
+    def build_detail(self, pk):
         profile = self.get_object(pk)
         serializer = StudentGroupProfileSerializer(profile)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -352,32 +346,14 @@ class StudentGroupProfileDetailView(BaseDetailMixin, APIView):
         if serializer.is_valid():
             with transaction.atomic():
                 profile = serializer.save()
+                apply_student_group_assets(
+                    profile,
+                    new_photos=request.FILES.getlist('new_photos'),
+                    delete_photo_ids=request.data.getlist('photos_to_delete'),
+                )
 
-                # 1. 삭제할 사진 ID 목록 (photos_to_delete)
-                photos_to_delete_ids = request.data.getlist('photos_to_delete')
-                if photos_to_delete_ids:
-                    photo_ids_to_delete = [int(id_str) for id_str in photos_to_delete_ids if id_str.isdigit()]
-                    if photo_ids_to_delete:
-                        StudentPhoto.objects.filter(student_group_profile=profile, id__in=photo_ids_to_delete).delete()
-
-                # 2. 새로 추가할 사진 파일 목록 (new_photos)
-                new_photos = request.FILES.getlist('new_photos')
-                if new_photos:
-                    # 기존 사진 개수 확인 (필요 시 MAX_PHOTOS 같은 변수 정의)
-                    # last_order를 찾아 순서 부여
-                    last_order = profile.photos.order_by('-order').first()
-                    start_order = (last_order.order + 1) if last_order else 0
-                    
-                    for i, photo in enumerate(new_photos):
-                        StudentPhoto.objects.create(
-                            student_group_profile=profile,
-                            image=photo,
-                            order=start_order + i
-                        )
-
-            updated_profile = StudentGroupProfile.objects.select_related('user').prefetch_related('photos').get(id=profile.id)
             return Response(
-                StudentGroupProfileSerializer(updated_profile).data, 
+                StudentGroupProfileSerializer(profile).data, 
                 status=status.HTTP_200_OK
             )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -406,14 +382,19 @@ class StudentProfileListCreateView(BaseProfileMixin, APIView):
     """학생 프로필 목록 조회 및 생성""" 
     @swagger_auto_schema(
         operation_summary="학생 프로필 목록 조회",
-        operation_description="모든 학생 프로필을 조회합니다.",
-        responses={200: StudentProfileSerializer(many=True)}
+        operation_description=(
+            "모든 학생 프로필을 커서 페이지 단위로 조회합니다. (?cursor=, ?page_size=)\n"
+            "응답은 캐시되며 ETag가 같으면(If-None-Match) 304를 반환합니다."
+        ),
+        responses={200: StudentProfileSerializer(many=True), 304: "변경 없음"}
     )
     def get(self, request):
+        return cached_list_response(request, "student", lambda: self.build_list(request))
+
+    def build_list(self, request):
         profiles = StudentProfile.objects.select_related('user')
             
-        serializer = StudentProfileSerializer(profiles, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return self.paginated_response(request, profiles, StudentProfileSerializer)
     
     @swagger_auto_schema(
         operation_summary="학생 프로필 생성",
@@ -426,6 +407,13 @@ class StudentProfileListCreateView(BaseProfileMixin, APIView):
         if serializer.is_valid():
     
             profile = serializer.save(user=request.user)
+
+            # 업로드한 원본으로 크기 기록 + 썸네일/중간 크기 파생본 생성
+            image_file = request.FILES.get('image')
+            if image_file and profile.image:
+                fields = generate_variants(profile, image_file)
+                if fields:
+                    profile.save(update_fields=list(fields))
             
             # 생성된 프로필을 다시 조회하여 관련 데이터와 함께 반환
             created_profile = StudentProfile.objects.select_related('user').get(id=profile.id)
@@ -473,9 +461,14 @@ class StudentProfileDetailView(BaseDetailMixin, APIView):
         
         # 1. 기존 이미지 삭제 요청 처리
         #    프론트에서 'delete_image': 'true' 와 같은 신호를 보내면 기존 이미지 삭제
-        if request.data.get('delete_image') == 'true':
+        #    (파일은 저장 성공 후 삭제 대기열에 기록하고 워커가 지움)
+        old_keys = image_keys(profile)
+        delete_image = request.data.get('delete_image') == 'true'
+        if delete_image:
             if profile.image:
-                profile.image.delete(save=False) # 파일만 삭제, 모델 필드는 serializer가 처리
+                profile.image = None
+                profile.image_width = profile.image_height = None
+                profile.image_variants = {}
 
         # 2. 새 이미지 파일이 있는지 확인
         #    'image' 키로 새 파일이 오면 기존 파일을 덮어쓰게 됨
@@ -492,6 +485,15 @@ class StudentProfileDetailView(BaseDetailMixin, APIView):
             if new_image:
                  profile.image = new_image
                  profile.save()
+                 # 새 원본으로 파생본 다시 생성
+                 profile.image_width = profile.image_height = None
+                 profile.image_variants = {}
+                 generate_variants(profile, new_image)
+                 profile.save(update_fields=['image_width', 'image_height', 'image_variants'])
+
+            # 이전 원본/파생본 삭제 (같은 이름으로 덮어쓴 키는 제외)
+            if delete_image or new_image:
+                queue_deletions(set(old_keys) - set(image_keys(profile)))
 
             updated_profile = StudentProfile.objects.select_related('user').get(id=profile.id)
             return Response(
@@ -518,3 +520,44 @@ class StudentProfileDetailView(BaseDetailMixin, APIView):
         
         profile.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+# ------ 매칭 후보 ------
+class PartnerMatchListView(APIView):
+    """배치로 미리 계산된 내 매칭 후보 (사장님 → 학생단체, 학생단체 → 사장님)"""
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_summary="매칭 후보 조회",
+        operation_description=(
+            "주기 배치(refresh_partner_matches)가 계산해 둔 상위 후보를 점수 순으로 반환합니다. (?limit=, 최대 TOP_K)\n"
+            "components는 항목별 점수(campus, business_type, goals, off_peak, student_size)입니다."
+        ),
+        manual_parameters=[
+            openapi.Parameter('limit', openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description="반환할 후보 수"),
+        ],
+        responses={200: PartnerMatchSerializer(many=True), 400: "잘못된 limit"}
+    )
+    def get(self, request):
+        limit = request.query_params.get('limit')
+        if limit is not None and (not limit.isdigit() or int(limit) < 1):
+            return Response({"detail": "limit은 1 이상의 정수여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+        matches = get_matches(request.user, int(limit) if limit else None)
+        return Response(
+            {"count": len(matches), "results": PartnerMatchSerializer(matches, many=True).data},
+            status=status.HTTP_200_OK,
+        )
+
+
+# ------ 목록 캐시 지표 ------
+class ProfileListCacheStatsView(APIView):
+    """프로필 목록 응답 캐시 적중률 (관리자 전용)"""
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        operation_summary="프로필 목록 캐시 적중률",
+        operation_description="목록 종류별 hit/miss/304 횟수와 hit_rate(hit / (hit + miss))를 반환합니다.",
+        responses={200: "종류별 지표"}
+    )
+    def get(self, request):
+        return Response(listing_cache_stats(), status=status.HTTP_200_OK)
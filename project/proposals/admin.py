@@ -1,7 +1,6 @@
 from django.contrib import admin, messages
 from django.core.exceptions import ValidationError
-from django.db.models import OuterRef, Subquery
-from .models import Proposal, ProposalStatus
+from .models import Proposal, ProposalStatus, ProposalDraftJob
 
 # ---- inline: 상태 히스토리 ----
 class ProposalStatusInline(admin.TabularInline):
@@ -21,15 +20,10 @@ class LatestStatusFilter(admin.SimpleListFilter):
         return ProposalStatus.Status.choices
 
     def queryset(self, request, queryset):
-        latest_status_subq = (
-            ProposalStatus.objects.filter(proposal=OuterRef("pk"))
-            .order_by("-changed_at")
-            .values("status")[:1]
-        )
-        qs = queryset.annotate(_latest_status=Subquery(latest_status_subq))
+        # 비정규화된 current_status 컬럼으로 바로 필터링
         if self.value():
-            qs = qs.filter(_latest_status=self.value())
-        return qs
+            return queryset.filter(current_status=self.value())
+        return queryset
 
 
 @admin.register(Proposal)
@@ -46,7 +40,7 @@ class ProposalAdmin(admin.ModelAdmin):
 
     inlines = [ProposalStatusInline]
 
-    readonly_fields = ("created_at", "modified_at")
+    readonly_fields = ("current_status", "status_changed_at", "created_at", "modified_at")
 
     fieldsets = (
         ("기본 정보", {
@@ -62,13 +56,12 @@ class ProposalAdmin(admin.ModelAdmin):
                 "period_start", "period_end",
             )
         }),
-        ("메타", {"fields": ("created_at", "modified_at")}),
+        ("메타", {"fields": ("current_status", "status_changed_at", "created_at", "modified_at")}),
     )
 
-    # 현재 상태 표시 (annotate 없을 때도 안전)
+    # 현재 상태 표시 (비정규화 컬럼 사용, 행마다 추가 쿼리 없음)
     def current_status_admin(self, obj: Proposal):
-        cs = obj.current_status
-        return dict(ProposalStatus.Status.choices).get(cs, cs)
+        return obj.get_current_status_display()
     current_status_admin.short_description = "현재 상태"
 
     # 일괄 액션들 (모델의 clean() 규칙을 따름)
@@ -80,9 +73,8 @@ class ProposalAdmin(admin.ModelAdmin):
         for p in queryset:
             changer = getattr(p, who)
             try:
-                ProposalStatus.objects.create(
-                    proposal=p,
-                    status=to_status,
+                p.change_status(
+                    to_status,
                     changed_by=changer,
                     comment=f"[Admin] {to_status}로 변경",
                 )
@@ -123,3 +115,13 @@ class ProposalStatusAdmin(admin.ModelAdmin):
     )
     ordering = ("-changed_at",)
     date_hierarchy = "changed_at"
+
+
+@admin.register(ProposalDraftJob)
+class ProposalDraftJobAdmin(admin.ModelAdmin):
+    list_display = ("id", "author", "recipient", "direction", "status", "attempts", "created_at", "finished_at")
+    list_select_related = ("author", "recipient")
+    list_filter = ("status", "direction")
+    search_fields = ("author__username", "recipient__username")
+    readonly_fields = ("proposal", "error", "attempts", "created_at", "started_at", "finished_at")
+    ordering = ("-created_at",)
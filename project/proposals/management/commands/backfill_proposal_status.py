@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from proposals.models import Proposal, ProposalStatus
+
+
+class Command(BaseCommand):
+    """
+    Proposal.current_status / status_changed_at 백필
+    - 상태 이력(ProposalStatus)의 최신 값으로 비정규화 컬럼을 다시 채움
+    - id 구간 단위 UPDATE로 처리하여 큰 테이블에서도 락 범위를 작게 유지
+    사용 예)
+      python manage.py backfill_proposal_status
+      python manage.py backfill_proposal_status --batch-size 5000
+    """
+    help = "제안서의 현재 상태 컬럼(current_status, status_changed_at)을 상태 이력으로부터 백필합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="한 번에 갱신할 제안서 id 구간 크기")
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+
+        latest = ProposalStatus.objects.filter(proposal=OuterRef("pk")).order_by("-changed_at", "-id")
+        last_id = Proposal.objects.order_by("-id").values_list("id", flat=True).first() or 0
+
+        updated = 0
+        for start in range(0, last_id + 1, batch_size):
+            with transaction.atomic():
+                updated += Proposal.objects.filter(id__gte=start, id__lt=start + batch_size).update(
+                    current_status=Coalesce(
+                        Subquery(latest.values("status")[:1]),
+                        Value(ProposalStatus.Status.DRAFT),
+                    ),
+                    status_changed_at=Subquery(latest.values("changed_at")[:1]),
+                )
+
+        self.stdout.write(self.style.SUCCESS(f"{updated}건의 제안서 상태를 백필했습니다."))
@@ -0,0 +1,95 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from proposals.services import llm, make_prompt
+
+
+class Command(BaseCommand):
+    """
+    AI 초안 생성 경로(프롬프트 조립 → LLM 호출 → 후처리)의 처리량/꼬리 지연 측정
+    - 기본은 로컬 스텁 provider (API 키/네트워크 불필요), --provider openai 로 실제 호출도 가능
+    - 초안 캐시는 거치지 않음 (매 요청 LLM 호출)
+    사용 예)
+      python manage.py benchmark_ai_draft --requests 200 --concurrency 8 --latency 0.8 --jitter 0.4
+      python manage.py benchmark_ai_draft --timeout 1 --json
+    """
+    help = "AI 초안 생성 처리량과 지연 시간 분포(p50/p95/p99)를 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=100, help="총 요청 수")
+        parser.add_argument("--concurrency", type=int, default=4, help="동시 요청 수")
+        parser.add_argument("--provider", choices=("stub", "openai"), default="stub")
+        parser.add_argument("--latency", type=float, default=0.5, help="스텁 기본 지연(초)")
+        parser.add_argument("--jitter", type=float, default=0.0, help="스텁 추가 무작위 지연 상한(초)")
+        parser.add_argument("--timeout", type=float, default=None, help="호출 타임아웃(초), 기본은 settings.AI_LLM")
+        parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+
+    def handle(self, *args, **options):
+        config = {
+            **llm.DEFAULTS, **getattr(settings, "AI_LLM", {}),
+            "PROVIDER": options["provider"],
+            "STUB_LATENCY": options["latency"],
+            "STUB_JITTER": options["jitter"],
+        }
+        if options["timeout"] is not None:
+            config["TIMEOUT"] = options["timeout"]
+
+        inputs = {
+            "owner_profile": make_prompt.EXAMPLE_OWNER_INPUT,
+            "student_group_profile": make_prompt.EXAMPLE_STUDENT_GROUP_INPUT,
+            "author_name": "경영학부 학생회",
+        }
+        total = max(1, options["requests"])
+
+        def one(i):
+            start = time.perf_counter()
+            try:
+                make_prompt.request_proposal_draft(**inputs, author_contact=f"010-0000-{i:04d}")
+                error = None
+            except llm.LLMError as exc:
+                error = type(exc).__name__
+            return time.perf_counter() - start, error
+
+        with override_settings(AI_LLM=config):
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=max(1, options["concurrency"])) as pool:
+                samples = list(pool.map(one, range(total)))
+            elapsed = time.perf_counter() - started
+            breaker_state = llm.get_llm().breaker.state
+
+        latencies = sorted(s for s, _ in samples)
+        errors = {}
+        for _, error in samples:
+            if error:
+                errors[error] = errors.get(error, 0) + 1
+        results = {
+            "provider": config["PROVIDER"],
+            "requests": total,
+            "concurrency": options["concurrency"],
+            "throughput_rps": round(total / elapsed, 2),
+            "latency_ms": {
+                name: round(self._percentile(latencies, q) * 1000, 1)
+                for name, q in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99), ("max", 1.0))
+            },
+            "errors": errors,
+            "breaker_state": breaker_state,
+        }
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results, ensure_ascii=False, indent=2))
+            return
+
+        self.stdout.write(f"provider={results['provider']} 요청 {total}건 / 동시 {results['concurrency']}")
+        self.stdout.write(f"  처리량: {results['throughput_rps']} req/s")
+        self.stdout.write("  지연(ms): " + " ".join(f"{k}={v}" for k, v in results["latency_ms"].items()))
+        self.stdout.write(f"  실패: {errors or '없음'} / 서킷: {breaker_state}")
+
+    @staticmethod
+    def _percentile(sorted_values, q) -> float:
+        index = min(len(sorted_values) - 1, max(0, int(round(q * len(sorted_values))) - 1))
+        return sorted_values[index]
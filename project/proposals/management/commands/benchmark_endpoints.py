@@ -0,0 +1,116 @@
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import override_settings
+
+from config import benchmark
+from config.synthetic import SyntheticDataGenerator, scaled_counts
+
+
+class Command(BaseCommand):
+    """
+    accounts/profiles/proposals 전 엔드포인트 벤치마크 (config/benchmark.py)
+    - 기본은 --scale 규모의 합성 데이터를 만들어 측정한 뒤 모두 롤백 (--existing이면 현재 DB 데이터로 측정, 역시 롤백)
+    - 시나리오마다 --warmup번 버린 뒤 --repeat번 호출: 지연 p50/p95/p99/최대, 쿼리 수, DB/직렬화 시간, 할당 메모리
+    - AI 초안은 스텁 LLM(--llm-latency초, 초안 캐시/속도 제한 없음), 캐시는 벤치마크 전용 로컬 메모리 캐시 사용
+    - --output으로 JSON 저장, --baseline JSON과 비교해 나빠진 지표가 있으면 출력 후 종료 코드 1
+    사용 예)
+      python manage.py benchmark_endpoints --scale 5 --output bench/main.json
+      python manage.py benchmark_endpoints --scale 5 --baseline bench/main.json --output bench/branch.json
+      python manage.py benchmark_endpoints --existing --only proposal --repeat 100
+    """
+    help = "합성 데이터로 API 엔드포인트별 지연/쿼리/메모리를 측정하고 기준 결과와 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scale", type=float, default=1.0, help="합성 데이터 규모 (generate_synthetic_data와 같음)")
+        parser.add_argument("--existing", action="store_true", help="합성 데이터를 만들지 않고 현재 DB 데이터로 측정")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--repeat", type=int, default=30)
+        parser.add_argument("--warmup", type=int, default=3)
+        parser.add_argument("--only", action="append", default=[], help="이름에 이 문자열이 들어간 시나리오만 (여러 번 지정 가능)")
+        parser.add_argument("--llm-latency", type=float, default=0.0, help="스텁 LLM 응답 지연(초)")
+        parser.add_argument("--output", help="결과 JSON 파일 경로")
+        parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일 경로")
+        parser.add_argument("--threshold", type=float, default=0.2, help="지연/메모리 regression 판단 비율 (0.2 = 20%%)")
+
+    def handle(self, *args, **options):
+        baseline = None
+        if options["baseline"]:
+            try:
+                baseline = json.loads(Path(options["baseline"]).read_text())
+            except (OSError, ValueError) as exc:
+                raise CommandError(f"기준 결과를 읽을 수 없습니다: {exc}")
+
+        with self.isolated_settings(options), transaction.atomic():
+            if not options["existing"]:
+                counts = scaled_counts(options["scale"])
+                SyntheticDataGenerator(seed=options["seed"], stdout=self.stdout).generate(counts)
+            try:
+                fixtures = benchmark.load_fixtures()
+            except ValueError as exc:
+                raise CommandError(str(exc))
+            scenarios = benchmark.build_scenarios(fixtures)
+            uncovered = benchmark.uncovered_url_names(scenarios)
+            if options["only"]:
+                scenarios = [s for s in scenarios if any(part in s.name for part in options["only"])]
+            results = benchmark.run(
+                scenarios, repeat=options["repeat"], warmup=options["warmup"], on_result=self.print_result,
+            )
+            transaction.set_rollback(True)
+
+        report = {
+            "meta": {
+                "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "database": connection.vendor,
+                "scale": None if options["existing"] else options["scale"],
+                "repeat": options["repeat"],
+                "warmup": options["warmup"],
+            },
+            "results": results,
+            "uncovered": uncovered,
+        }
+        if uncovered:
+            self.stdout.write(self.style.WARNING(f"시나리오 없는 URL: {', '.join(uncovered)}"))
+
+        regressions = []
+        if baseline is not None:
+            regressions = benchmark.compare(results, baseline.get("results", {}), threshold=options["threshold"])
+            report["regressions"] = regressions
+
+        if options["output"]:
+            path = Path(options["output"])
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+            self.stdout.write(f"결과 저장: {path}")
+
+        if regressions:
+            for r in regressions:
+                self.stdout.write(self.style.ERROR(f"{r['scenario']}: {r['metric']} {r['baseline']} → {r['current']}"))
+            raise CommandError(f"기준 대비 나빠진 지표 {len(regressions)}개")
+        if baseline is not None:
+            self.stdout.write(self.style.SUCCESS("기준 대비 나빠진 지표 없음"))
+
+    def print_result(self, name, result):
+        latency = result["latency_ms"]
+        statuses = ",".join(result["status"])
+        self.stdout.write(
+            f"{name:<52} p50 {latency['p50']:8.2f}ms  p95 {latency['p95']:8.2f}ms  p99 {latency['p99']:8.2f}ms  "
+            f"queries {result['queries']:3d}  mem {result['peak_memory_kib']:8.1f}KiB  [{statuses}]"
+        )
+
+    @staticmethod
+    def isolated_settings(options):
+        """벤치마크 전용 로컬 메모리 캐시 + 스텁 LLM (롤백될 데이터가 공용 캐시에 남지 않도록)"""
+        return override_settings(
+            CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "benchmark"}},
+            AI_LLM={
+                **getattr(settings, "AI_LLM", {}),
+                "PROVIDER": "stub", "STUB_LATENCY": options["llm_latency"], "STUB_JITTER": 0,
+            },
+            AI_DRAFT_CACHE={"BACKEND": "none"},
+            AI_DRAFT_BATCH={**getattr(settings, "AI_DRAFT_BATCH", {}), "OWNER_RATE_LIMIT": 10 ** 9},
+        )
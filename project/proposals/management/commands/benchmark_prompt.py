@@ -0,0 +1,74 @@
+import json
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from proposals.services import make_prompt
+
+
+class Command(BaseCommand):
+    """
+    AI 제안서 프롬프트 조립 비용/토큰 수 벤치마크 (OpenAI 호출 없음)
+    - rebuild: 매 호출마다 정적 구간까지 새로 조립 (템플릿 컴파일 이전 방식)
+    - compiled: 미리 컴파일한 정적 구간 + 요청별 구간만 조립
+    사용 예)
+      python manage.py benchmark_prompt
+      python manage.py benchmark_prompt --iterations 5000 --json
+    """
+    help = "AI 제안서 프롬프트 조립 시간과 구간별 토큰 수를 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=2000, help="측정 반복 횟수")
+        parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+
+    def handle(self, *args, **options):
+        iterations = max(1, options["iterations"])
+        inputs = {
+            "owner_profile": make_prompt.EXAMPLE_OWNER_INPUT,
+            "student_group_profile": make_prompt.EXAMPLE_STUDENT_GROUP_INPUT,
+            "author_name": "경영학부 학생회",
+            "author_contact": "010-1234-5678",
+            "today": date(2025, 10, 1),
+        }
+
+        def rebuild():
+            template = make_prompt.compile_prompt_template(measure_tokens=False)
+            metrics = make_prompt.compute_proposal_metrics(inputs["owner_profile"], inputs["student_group_profile"])
+            dynamic = template.render_request(metrics=metrics, **inputs)
+            return template.static_prefix + "".join(text for _, text in dynamic)
+
+        def compiled():
+            return make_prompt.build_proposal_messages(**inputs)
+
+        make_prompt.get_prompt_template()  # 컴파일은 프로세스 시작 시 1회 (측정에서 제외)
+        results = {
+            "iterations": iterations,
+            "prompt_version": make_prompt.PROMPT_VERSION,
+            "rebuild_us_per_call": self._measure(rebuild, iterations),
+            "compiled_us_per_call": self._measure(compiled, iterations),
+        }
+        messages, _ = compiled()
+        results["tokens"] = make_prompt.prompt_token_report(messages)
+        results["cacheable_prefix_ratio"] = round(results["tokens"]["static_total"] / results["tokens"]["total"], 3)
+        results["tokenizer"] = "tiktoken" if make_prompt.tiktoken is not None else "approx"
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results, ensure_ascii=False, indent=2))
+            return
+
+        self.stdout.write(f"프롬프트 v{results['prompt_version']} / 반복 {iterations}회")
+        self.stdout.write(f"  조립 시간(rebuild):  {results['rebuild_us_per_call']:.1f} µs/호출")
+        self.stdout.write(f"  조립 시간(compiled): {results['compiled_us_per_call']:.1f} µs/호출")
+        self.stdout.write(f"  토큰 수({results['tokenizer']}):")
+        for name, count in results["tokens"].items():
+            self.stdout.write(f"    {name:<16} {count:>6}")
+        self.stdout.write(f"  캐시 가능한 정적 prefix 비율: {results['cacheable_prefix_ratio']:.1%}")
+
+    @staticmethod
+    def _measure(fn, iterations) -> float:
+        fn()  # 워밍업
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        return (time.perf_counter() - start) / iterations * 1_000_000
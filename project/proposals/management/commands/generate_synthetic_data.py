@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+
+from config.synthetic import BASE_COUNTS, SyntheticDataGenerator, scaled_counts
+
+
+class Command(BaseCommand):
+    """
+    accounts/profiles/proposals 전체에 걸친 합성 데이터 생성 (config/synthetic.py)
+    - 역할별 유저, 사장님 프로필(+시간 구간, 사진, 메뉴), 학생단체(+사진), 학생 프로필, 찜/추천, 제안서(+상태 이력)
+    - --scale배 규모 (1 = 사장님 200, 학생단체 50, 학생 500, 찜 5000, 추천 1000, 제안서 1000), 항목별 개수 지정 가능
+    - 데이터는 커밋됨 (벤치마크만 돌리고 버릴 거면 benchmark_endpoints가 생성 후 롤백)
+    사용 예)
+      python manage.py generate_synthetic_data --scale 10
+      python manage.py generate_synthetic_data --owners 5000 --proposals 50000 --seed 7 --matches
+    """
+    help = "벤치마크/부하 테스트용 합성 데이터를 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scale", type=float, default=1.0, help="기본 규모의 배수")
+        for name in BASE_COUNTS:
+            parser.add_argument(f"--{name.replace('_', '-')}", type=int, default=None, help="개수 직접 지정 (--scale보다 우선)")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--batch-size", type=int, default=2_000)
+        parser.add_argument("--matches", action="store_true", help="생성 후 매칭 후보 배치(refresh_partner_matches)도 실행")
+
+    def handle(self, *args, **options):
+        counts = scaled_counts(options["scale"], **{name: options[name] for name in BASE_COUNTS})
+        generator = SyntheticDataGenerator(seed=options["seed"], batch_size=max(1, options["batch_size"]), stdout=self.stdout)
+        stats = generator.generate(counts)
+        self.stdout.write(self.style.SUCCESS(
+            f"생성 ({generator.prefix}*): " + ", ".join(f"{name} {count}" for name, count in stats.items())
+        ))
+
+        if options["matches"]:
+            from profiles.services.matching import refresh_partner_matches  # NumPy 필요
+
+            matches = refresh_partner_matches()
+            self.stdout.write(f"매칭 후보 {matches['matches']}건")
@@ -0,0 +1,52 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from proposals.models import ProposalDraftJob
+from proposals.services.draft_jobs import get_executor, reclaim_stale_draft_jobs, run_draft_job_in_worker
+
+
+class Command(BaseCommand):
+    """
+    AI 제안서 초안 작업 워커 (AI_DRAFT_QUEUE_BACKEND="db"일 때 사용)
+    - PENDING 작업을 오래된 순으로 가져와 스레드 풀에서 병렬 처리
+    - 작업 선점은 조건부 UPDATE로 하므로 워커를 여러 개 띄워도 중복 처리되지 않음
+    - 매 배치 전에 AI_DRAFT_JOB_TIMEOUT이 지난 RUNNING 작업(죽은 워커/웹 프로세스가 남긴 것)을 회수
+      (thread 백엔드에서도 --once를 주기적으로 실행하면 방치된 작업을 다시 처리)
+    사용 예)
+      python manage.py run_draft_jobs
+      python manage.py run_draft_jobs --once --batch-size 20
+    """
+    help = "대기 중인 AI 제안서 초안 생성 작업을 처리합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="대기 작업을 한 번만 처리하고 종료")
+        parser.add_argument("--batch-size", type=int, default=10, help="한 번에 가져올 작업 수")
+        parser.add_argument("--interval", type=float, default=2.0, help="대기 작업이 없을 때 폴링 간격(초)")
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+        executor = get_executor()
+
+        processed = 0
+        while True:
+            reclaimed = reclaim_stale_draft_jobs()
+            if reclaimed["requeued"] or reclaimed["failed"]:
+                self.stdout.write(f"방치된 작업 회수: 재시도 {reclaimed['requeued']}건, 실패 처리 {reclaimed['failed']}건")
+            job_ids = list(
+                ProposalDraftJob.objects
+                .filter(status=ProposalDraftJob.Status.PENDING)
+                .order_by("created_at")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            # 배치 단위로 끝날 때까지 기다려 과도하게 선점하지 않음
+            for future in [executor.submit(run_draft_job_in_worker, job_id) for job_id in job_ids]:
+                future.result()
+            processed += len(job_ids)
+
+            if options["once"]:
+                break
+            if not job_ids:
+                time.sleep(options["interval"])
+
+        self.stdout.write(self.style.SUCCESS(f"{processed}건의 작업을 처리했습니다."))
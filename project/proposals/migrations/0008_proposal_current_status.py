@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals', '0007_alter_proposal_apply_target'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='proposal',
+            name='current_status',
+            field=models.CharField(choices=[('UNREAD', '미열람'), ('READ', '열람'), ('PARTNERSHIP', '제휴체결'), ('REJECTED', '거절'), ('DRAFT', '초안')], default='DRAFT', editable=False, max_length=20, verbose_name='현재 상태'),
+        ),
+        migrations.AddField(
+            model_name='proposal',
+            name='status_changed_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='상태 변경일시'),
+        ),
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['current_status'], name='proposals_p_current_a085d1_idx'),
+        ),
+    ]
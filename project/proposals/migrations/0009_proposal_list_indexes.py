@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals', '0008_proposal_current_status'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['created_at'], name='proposals_p_created_877293_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['author', 'created_at'], name='proposals_p_author__1649d4_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:15
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals', '0009_proposal_list_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProposalDraftJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('direction', models.CharField(choices=[('TO_OWNER', '학생단체 → 사장님'), ('TO_STUDENT_GROUP', '사장님 → 학생단체')], max_length=20, verbose_name='생성 방향')),
+                ('contact_info', models.CharField(blank=True, max_length=200, verbose_name='요청 연락처')),
+                ('status', models.CharField(choices=[('PENDING', '대기'), ('RUNNING', '생성 중'), ('DONE', '완료'), ('FAILED', '실패')], default='PENDING', max_length=10, verbose_name='작업 상태')),
+                ('error', models.TextField(blank=True, verbose_name='실패 사유')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='요청일시')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='시작일시')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='종료일시')),
+                ('author', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='proposal_draft_jobs', to=settings.AUTH_USER_MODEL, verbose_name='요청자(작성자)')),
+                ('proposal', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='proposals.proposal', verbose_name='생성된 제안서')),
+                ('recipient', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='수신자')),
+            ],
+            options={
+                'verbose_name': 'AI 초안 생성 작업',
+                'verbose_name_plural': 'AI 초안 생성 작업들',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='proposals_p_status_7e195d_idx')],
+            },
+        ),
+    ]
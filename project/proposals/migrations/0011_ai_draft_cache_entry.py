@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals', '0010_proposal_draft_job'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AIDraftCacheEntry',
+            fields=[
+                ('key', models.CharField(max_length=64, primary_key=True, serialize=False, verbose_name='캐시 키')),
+                ('owner_user_id', models.BigIntegerField(blank=True, db_index=True, null=True, verbose_name='사장님 유저 id')),
+                ('group_user_id', models.BigIntegerField(blank=True, db_index=True, null=True, verbose_name='학생단체 유저 id')),
+                ('payload', models.JSONField(verbose_name='AI 응답')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일시')),
+                ('last_used_at', models.DateTimeField(db_index=True, verbose_name='마지막 사용일시')),
+                ('expires_at', models.DateTimeField(db_index=True, verbose_name='만료일시')),
+            ],
+            options={
+                'verbose_name': 'AI 초안 캐시',
+                'verbose_name_plural': 'AI 초안 캐시들',
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 08:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals', '0011_ai_draft_cache_entry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='proposaldraftjob',
+            name='attempts',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수'),
+        ),
+    ]
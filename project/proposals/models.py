@@ -1,6 +1,9 @@
-from django.db import models, transaction
+import uuid
+
+from django.db import connections, models, router, transaction
 from django.core.exceptions import ValidationError
-from django.db.models import Q, F
+from django.db.models import Q, F, OuterRef, Subquery
+from django.utils import timezone
 from accounts.models import User
 
 # ----- 제휴 조건 보조 enum -----
@@ -18,6 +21,25 @@ class BenefitType(models.TextChoices):
     FREE_ITEM        = "FREE_ITEM",        "무료 제공"
     OTHER            = "OTHER",            "기타"
 
+# 제안서 진행 상태 (ProposalStatus.Status로도 접근 가능)
+class StatusChoices(models.TextChoices):
+    UNREAD      = 'UNREAD',      '미열람'
+    READ        = 'READ',        '열람'
+    PARTNERSHIP = 'PARTNERSHIP', '제휴체결'
+    REJECTED    = 'REJECTED',    '거절'
+    DRAFT       = 'DRAFT',       '초안'
+
+# 상태 전이 규칙: {현재 상태: {다음 상태: 전이 주체}}
+# - 전이 주체는 'author'(작성자) 또는 'recipient'(수신자)
+STATUS_TRANSITIONS = {
+    StatusChoices.DRAFT:       {StatusChoices.UNREAD: 'author'},       # 초안 제출
+    StatusChoices.UNREAD:      {StatusChoices.READ: 'recipient'},      # 열람
+    StatusChoices.READ:        {StatusChoices.PARTNERSHIP: 'recipient', # 수락
+                                StatusChoices.REJECTED: 'recipient'},   # 거절
+    StatusChoices.REJECTED:    {StatusChoices.UNREAD: 'author'},       # 재제출
+    StatusChoices.PARTNERSHIP: {},
+}
+
 
 # ----- 제안서 -----
 class Proposal(models.Model):
@@ -91,6 +113,20 @@ class Proposal(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일자')
     modified_at = models.DateTimeField(auto_now=True, verbose_name='수정일자')
 
+    # 현재 상태 (ProposalStatus 이력의 최신 값을 비정규화해서 보관)
+    # - ProposalStatus.save()에서 같은 트랜잭션으로 갱신되므로 직접 수정하지 말 것
+    #   (Proposal.save()는 기존 행을 저장할 때 이 두 컬럼을 쓰지 않음)
+    # - 기존 데이터는 `python manage.py backfill_proposal_status`로 채움
+    current_status = models.CharField(
+        max_length=20, choices=StatusChoices.choices,
+        default=StatusChoices.DRAFT, editable=False,
+        verbose_name='현재 상태'
+    )
+    status_changed_at = models.DateTimeField(
+        null=True, blank=True, editable=False,
+        verbose_name='상태 변경일시'
+    )
+
     class Meta:
         verbose_name = '제안서'
         verbose_name_plural = '제안서들'
@@ -102,6 +138,10 @@ class Proposal(models.Model):
         indexes = [
             models.Index(fields=['recipient']),
             models.Index(fields=['author', 'recipient']),
+            models.Index(fields=['current_status']),
+            # 목록 커서 페이지네이션 (created_at, id)
+            models.Index(fields=['created_at']),
+            models.Index(fields=['author', 'created_at']),
         ]
 
     # ---- 유효성 검증 ----
@@ -122,19 +162,67 @@ class Proposal(models.Model):
 
         # FREE_ITEM/OTHER 는 값 없어도 OK
 
+    # ProposalStatus.save()만 쓰는 비정규화 컬럼 (일반 save()에서는 제외)
+    STATUS_FIELDS = ('current_status', 'status_changed_at')
+
     def save(self, *args, **kwargs):
         is_new = self.pk is None
         self.full_clean()
-        super().save(*args, **kwargs)
-
-        # 최초 생성 시 상태를 DRAFT로 기록
-        if is_new:
-            ProposalStatus.objects.create(
-                proposal=self,
-                status=ProposalStatus.Status.DRAFT,
-                changed_by=self.author, # self.author로 수정해야할 수 있음. (2025/08/23)
-                comment='제안서 초기 생성'
+        # 기존 행의 전체 save()는 상태 컬럼을 빼고 UPDATE
+        # (메모리에 읽어 둔 옛 상태로 동시에 커밋된 change_status()를 되돌리지 않도록)
+        if not self._state.adding and kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            kwargs['update_fields'] = [
+                f.name for f in self._meta.concrete_fields
+                if not f.primary_key and f.name not in self.STATUS_FIELDS
+            ]
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+            # 최초 생성 시 상태를 DRAFT로 기록 (current_status도 함께 동기화됨)
+            if is_new:
+                ProposalStatus.objects.create(
+                    proposal=self,
+                    status=ProposalStatus.Status.DRAFT,
+                    changed_by=self.author, # self.author로 수정해야할 수 있음. (2025/08/23)
+                    comment='제안서 초기 생성'
+                )
+
+    @classmethod
+    def bulk_create_drafts(cls, proposals, comment='제안서 초기 생성'):
+        """
+        여러 제안서를 한 번에 저장 (save()를 건너뛰므로 DRAFT 상태 이력도 여기서 일괄 생성)
+        - 쿼리 수: 제안서 INSERT 1 + 상태 이력 INSERT 1 + status_changed_at UPDATE 1
+          (INSERT 후 pk를 돌려받지 못하는 DB(MySQL)는 제안서를 행마다 INSERT해 pk를 받음 — 배치 크기만큼)
+        - author/recipient는 이미 조회된 객체여야 함 (FK 존재 검증 쿼리를 생략)
+        """
+        proposals = list(proposals)
+        if not proposals:
+            return []
+        for p in proposals:
+            p.clean_fields(exclude=['author', 'recipient'])
+            p.clean()
+            p.current_status = StatusChoices.DRAFT
+
+        with transaction.atomic():
+            if connections[router.db_for_write(cls)].features.can_return_rows_from_bulk_insert:
+                cls.objects.bulk_create(proposals)
+            else:
+                # 다른 행과 구분할 방법 없이 pk를 재조회하면 같은 (작성자, 수신자) 제안서와 섞일 수 있으므로
+                # 기본 Model.save()로 한 행씩 INSERT (Proposal.save()의 검증/이력 생성은 건너뜀)
+                for p in proposals:
+                    models.Model.save(p, force_insert=True)
+
+            ProposalStatus.objects.bulk_create([
+                ProposalStatus(proposal=p, status=StatusChoices.DRAFT, changed_by_id=p.author_id, comment=comment)
+                for p in proposals
+            ])
+            # 비정규화 컬럼을 방금 만든 이력의 시각으로 맞춤
+            cls.objects.filter(pk__in=[p.pk for p in proposals]).update(
+                status_changed_at=Subquery(
+                    ProposalStatus.objects.filter(proposal=OuterRef('pk')).order_by('-changed_at', '-id').values('changed_at')[:1]
+                )
             )
+        return proposals
 
     # ---- 편의 ----
     def __str__(self):
@@ -142,15 +230,6 @@ class Proposal(models.Model):
         b = "사장님" if self.recipient.user_role == User.Role.OWNER else "학생단체"
         return f"제안서({a}: {self.author.username} → {b}: {self.recipient.username})"
 
-    @property
-    def current_status(self):
-        """현재 상태 코드 반환 (없으면 UNREAD)"""
-        try:
-            latest = self.status_history.latest('changed_at')
-            return latest.status
-        except ProposalStatus.DoesNotExist:
-            return ProposalStatus.Status.DRAFT
-
     @property
     def current_status_object(self):
         """현재 상태 객체 반환 (없으면 None)"""
@@ -175,8 +254,10 @@ class Proposal(models.Model):
     def change_status(self, new_status, changed_by, comment=''):
         """
         상태 변경 (권한 체크/전이 규칙은 ProposalStatus.clean()에서 검증)
+        - 제안서 행을 잠가 동시 전이가 같은 현재 상태를 기준으로 검증되지 않도록 함
         """
-        ProposalStatus.objects.create(
+        Proposal.objects.select_for_update().only('pk').get(pk=self.pk)
+        return ProposalStatus.objects.create(
             proposal=self,
             status=new_status,
             changed_by=changed_by,
@@ -193,12 +274,7 @@ class ProposalStatus(models.Model):
     """
 
     # Status에 DRAFT 상태 추가 하기 (2025/08/23)
-    class Status(models.TextChoices):
-        UNREAD      = 'UNREAD',      '미열람'
-        READ        = 'READ',        '열람'
-        PARTNERSHIP = 'PARTNERSHIP', '제휴체결'
-        REJECTED    = 'REJECTED',    '거절'
-        DRAFT       = 'DRAFT',       '초안'
+    Status = StatusChoices
 
     proposal   = models.ForeignKey(Proposal, on_delete=models.CASCADE, related_name='status_history')
     status     = models.CharField(max_length=20, choices=Status.choices)
@@ -240,41 +316,117 @@ class ProposalStatus(models.Model):
                 raise ValidationError('초안(DRAFT)은 작성자만 생성할 수 있습니다.')
             return
         
-        curr = self.proposal.current_status
+        # 현재 상태는 방금 조회한 최신 이력을 기준으로 판단 (비정규화 컬럼보다 우선)
+        curr = latest.status
         nxt  = self.status
-        author    = self.proposal.author
-        recipient = self.proposal.recipient
-
-        valid_transitions = {
-            self.Status.UNREAD:      [self.Status.READ],
-            self.Status.READ:        [self.Status.PARTNERSHIP, self.Status.REJECTED],
-            self.Status.PARTNERSHIP: [],
-            self.Status.REJECTED:    [self.Status.UNREAD],
-            self.Status.DRAFT:       [self.Status.UNREAD], # DRAFT 상태는 아직 제안서가 발송되지 않은 상태로 UNREAD로만 전이 가능
-        }
-        if nxt not in valid_transitions.get(curr, []):
+
+        allowed = STATUS_TRANSITIONS.get(curr, {})
+        if nxt not in allowed:
             raise ValidationError({'status': f'{curr} → {nxt} 전이는 허용되지 않습니다.'})
 
         # 전이의 주체 권한 (수정, 2025/08/23)
-        if curr == self.Status.DRAFT and nxt == self.Status.UNREAD:
-            if self.changed_by != author:
-                raise ValidationError('초안 제출(UNREAD 변경)은 작성자만 할 수 있습니다.')
-        elif curr == self.Status.UNREAD and nxt == self.Status.READ:
-            if self.changed_by != recipient:
-                raise ValidationError('열람(READ)은 수신자만 할 수 있습니다.')
-        elif curr == self.Status.READ and nxt in (self.Status.PARTNERSHIP, self.Status.REJECTED):
-            if self.changed_by != recipient:
-                raise ValidationError('수락/거절은 수신자만 할 수 있습니다.')
-        elif curr == self.Status.REJECTED and nxt == self.Status.UNREAD:
-            if self.changed_by != author:
-                raise ValidationError('재제출(UNREAD 복귀)은 작성자만 할 수 있습니다.')
+        actor = allowed[nxt]
+        actor_id = self.proposal.author_id if actor == 'author' else self.proposal.recipient_id
+        if self.changed_by_id != actor_id:
+            raise ValidationError(self.TRANSITION_ACTOR_ERRORS[(curr, nxt)])
+
+    # 전이별 권한 오류 메시지
+    TRANSITION_ACTOR_ERRORS = {
+        (StatusChoices.DRAFT, StatusChoices.UNREAD):      '초안 제출(UNREAD 변경)은 작성자만 할 수 있습니다.',
+        (StatusChoices.UNREAD, StatusChoices.READ):       '열람(READ)은 수신자만 할 수 있습니다.',
+        (StatusChoices.READ, StatusChoices.PARTNERSHIP):  '수락/거절은 수신자만 할 수 있습니다.',
+        (StatusChoices.READ, StatusChoices.REJECTED):     '수락/거절은 수신자만 할 수 있습니다.',
+        (StatusChoices.REJECTED, StatusChoices.UNREAD):   '재제출(UNREAD 복귀)은 작성자만 할 수 있습니다.',
+    }
 
     def save(self, *args, **kwargs):
+        is_new = self._state.adding
         self.full_clean()
-        return super().save(*args, **kwargs)
+        with transaction.atomic():
+            result = super().save(*args, **kwargs)
+            # 새 이력은 항상 최신이므로 제안서의 현재 상태 컬럼을 같은 트랜잭션에서 갱신
+            if is_new:
+                Proposal.objects.filter(pk=self.proposal_id).update(
+                    current_status=self.status,
+                    status_changed_at=self.changed_at,
+                )
+                self.proposal.current_status = self.status
+                self.proposal.status_changed_at = self.changed_at
+        return result
 
     # 추가 검증 속성 (2025/08/23)
     @property
     def is_visible_to_recipient(self):
         """수신자가 열람 가능한 상태인지 여부 (DRAFT은 비공개)"""
-        return self.status != self.Status.DRAFT
\ No newline at end of file
+        return self.status != self.Status.DRAFT
+
+
+# ----- AI 초안 생성 작업 -----
+class ProposalDraftJob(models.Model):
+    """
+    AI 제안서 초안 비동기 생성 작업
+    - POST ai-draft(?mode=async)에서 생성되고 워커 풀이 처리
+    - PENDING → RUNNING → DONE(proposal 연결) / FAILED(error 기록)
+    - 시간 초과로 방치된 RUNNING 작업은 run_draft_jobs가 PENDING으로 되돌리거나 FAILED 처리
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', '대기'
+        RUNNING = 'RUNNING', '생성 중'
+        DONE    = 'DONE',    '완료'
+        FAILED  = 'FAILED',  '실패'
+
+    # 생성 방향 (누구의 프로필을 기반으로 누구에게 보내는지)
+    class Direction(models.TextChoices):
+        TO_OWNER         = 'TO_OWNER',         '학생단체 → 사장님'
+        TO_STUDENT_GROUP = 'TO_STUDENT_GROUP', '사장님 → 학생단체'
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    author = models.ForeignKey(User, on_delete=models.CASCADE, related_name='proposal_draft_jobs', verbose_name='요청자(작성자)')
+    recipient = models.ForeignKey(User, on_delete=models.CASCADE, related_name='+', verbose_name='수신자')
+    direction = models.CharField(max_length=20, choices=Direction.choices, verbose_name='생성 방향')
+    contact_info = models.CharField(max_length=200, blank=True, verbose_name='요청 연락처')
+
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING, verbose_name='작업 상태')
+    proposal = models.ForeignKey(Proposal, on_delete=models.SET_NULL, null=True, blank=True, related_name='+', verbose_name='생성된 제안서')
+    error = models.TextField(blank=True, verbose_name='실패 사유')
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')  # 선점할 때마다 +1 (방치 작업 재시도 상한)
+
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='요청일시')
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name='시작일시')
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name='종료일시')
+
+    class Meta:
+        verbose_name = 'AI 초안 생성 작업'
+        verbose_name_plural = 'AI 초안 생성 작업들'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),  # 워커의 대기 작업 조회
+        ]
+
+    def __str__(self):
+        return f"{self.id} ({self.get_status_display()})"
+
+
+# ----- AI 초안 캐시 (DB 백엔드) -----
+class AIDraftCacheEntry(models.Model):
+    """
+    AI 제안서 초안 응답 캐시 (settings.AI_DRAFT_CACHE["BACKEND"] == "db"일 때 사용)
+    - key: 프롬프트 입력(프로필 스냅샷/연락처/프롬프트 버전 등)의 sha256
+    - owner_user_id / group_user_id: 프로필 수정 시 관련 항목을 지우기 위한 태그
+    """
+    key = models.CharField(max_length=64, primary_key=True, verbose_name='캐시 키')
+    owner_user_id = models.BigIntegerField(null=True, blank=True, db_index=True, verbose_name='사장님 유저 id')
+    group_user_id = models.BigIntegerField(null=True, blank=True, db_index=True, verbose_name='학생단체 유저 id')
+    payload = models.JSONField(verbose_name='AI 응답')
+
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일시')
+    last_used_at = models.DateTimeField(db_index=True, verbose_name='마지막 사용일시')  # LRU 기준
+    expires_at = models.DateTimeField(db_index=True, verbose_name='만료일시')
+
+    class Meta:
+        verbose_name = 'AI 초안 캐시'
+        verbose_name_plural = 'AI 초안 캐시들'
+
+    def __str__(self):
+        return self.key
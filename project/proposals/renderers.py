@@ -0,0 +1,26 @@
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.renderers import BaseRenderer
+
+
+def sse_event(event: str, data) -> str:
+    """Server-Sent Events 한 건 (data는 JSON 한 줄)"""
+    payload = json.dumps(data, ensure_ascii=False, cls=DjangoJSONEncoder)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    text/event-stream 응답용 렌더러
+    - 스트리밍 본문은 뷰에서 StreamingHttpResponse로 직접 내보내고,
+      스트림 시작 전의 일반 Response(검증 실패 등)는 error 이벤트 한 건으로 변환
+    """
+    media_type = "text/event-stream"
+    format = "sse"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return sse_event("error", data).encode(self.charset)
@@ -5,7 +5,7 @@ from rest_framework import serializers
 
 from accounts.models import User
 from .models import (
-    Proposal, ProposalStatus,
+    Proposal, ProposalStatus, ProposalDraftJob,
 )
 
 from profiles.models import StudentGroupProfile
@@ -33,7 +33,7 @@ class ProposalStatusReadSerializer(serializers.ModelSerializer):
 class ProposalReadSerializer(serializers.ModelSerializer):
     author = MiniUserSerializer(read_only=True)
     recipient = MiniUserSerializer(read_only=True)
-    current_status = serializers.SerializerMethodField()
+    current_status = serializers.CharField(read_only=True)
     status_history = ProposalStatusReadSerializer(many=True, read_only=True)
     is_editable = serializers.ReadOnlyField()
     is_partnership_made = serializers.ReadOnlyField()
@@ -54,20 +54,28 @@ class ProposalReadSerializer(serializers.ModelSerializer):
             "benefit_description",
             "period_start", "period_end",
             # 계산/메타
-            "current_status",  "status_history",
+            "current_status", "status_changed_at", "status_history",
             "is_editable", "is_partnership_made",
             "created_at", "modified_at",
         ]
         read_only_fields = [
             "id", "author", "recipient",
             "sender_name", "recipient_display_name",
-            "current_status", "status_history",
+            "current_status", "status_changed_at", "status_history",
             "is_editable", "is_partnership_made",
             "created_at", "modified_at",
         ]
 
-    def get_current_status(self, obj):
-        return obj.current_status
+
+# ---- 미리 조회한 유저를 재사용하는 PK 필드 (일괄 생성 시 건별 조회 방지) ----
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """context["prefetched_users"]({pk: User})에 있으면 쿼리 없이 사용"""
+    def to_internal_value(self, data):
+        prefetched = self.context.get("prefetched_users") or {}
+        try:
+            return prefetched[int(data)]
+        except (KeyError, TypeError, ValueError):
+            return super().to_internal_value(data)
 
 
 # ---- 제안서(Write: 생성/수정) ----
@@ -76,7 +84,7 @@ class ProposalWriteSerializer(serializers.ModelSerializer):
     - author는 request.user에서 자동 주입 (토큰 필요)
     - recipient만 PK로 입력
     """
-    recipient = serializers.PrimaryKeyRelatedField(queryset=User.objects.all())
+    recipient = PrefetchedPrimaryKeyRelatedField(queryset=User.objects.all())
 
     class Meta:
         model = Proposal
@@ -127,7 +135,8 @@ class ProposalWriteSerializer(serializers.ModelSerializer):
         return attrs
 
     # --- 생성 ---
-    def create(self, validated_data):
+    def build_instance(self, validated_data) -> Proposal:
+        """저장 전 Proposal 객체 (일괄 생성에서 bulk_create_drafts로 모아 저장)"""
         request = self.context.get("request")
         author = request.user
         recipient = validated_data["recipient"]
@@ -136,13 +145,16 @@ class ProposalWriteSerializer(serializers.ModelSerializer):
         sender_name = author.username or (author.email or "")
         recipient_display = recipient.username or (recipient.email or "")
 
-        instance = Proposal(
+        return Proposal(
             author=author,
             recipient=recipient,
             sender_name=sender_name,
             recipient_display_name=recipient_display,
             **{k: v for k, v in validated_data.items() if k != "recipient"},
         )
+
+    def create(self, validated_data):
+        instance = self.build_instance(validated_data)
         # 모델의 clean()과 제약은 save()에서 full_clean으로 재확인
         instance.save()
         return instance
@@ -187,12 +199,12 @@ class ProposalStatusChangeSerializer(serializers.ModelSerializer):
         request = self.context.get("request")
         proposal = self.context["proposal"]
 
-        obj = ProposalStatus(
-            proposal=proposal,
+        # clean() 내부에서 전이 규칙/권한을 검증, 제안서의 current_status도 함께 갱신
+        obj = proposal.change_status(
+            validated_data["status"],
             changed_by=request.user,
-            **validated_data,
+            comment=validated_data.get("comment", ""),
         )
-        obj.save()  # clean() 내부에서 전이 규칙/권한을 검증
 
         if validated_data["status"] == "PARTNERSHIP":
             # 학생단체가 author인 경우
@@ -220,15 +232,12 @@ class ProposalSentListSerializer(serializers.ModelSerializer):
     created_date = serializers.DateTimeField(source="created_at", read_only=True)
     modified_date = serializers.DateTimeField(source="modified_at", read_only=True)
 
-    status = serializers.SerializerMethodField(read_only=True)
+    status = serializers.CharField(source="current_status", read_only=True)
 
     class Meta:
         model = Proposal
         fields = ("id", "partnership_type", "created_date", "modified_date", "status")
         read_only_fields = fields
-
-    def get_status(self, obj):
-        return getattr(obj, "latest_status", None) or obj.current_status
     
 
 class ProposalReceivedListSerializer(serializers.ModelSerializer):
@@ -236,12 +245,37 @@ class ProposalReceivedListSerializer(serializers.ModelSerializer):
     created_date = serializers.DateTimeField(source="created_at", read_only=True)
     modified_date = serializers.DateTimeField(source="modified_at", read_only=True)
 
-    status = serializers.SerializerMethodField(read_only=True)
+    status = serializers.CharField(source="current_status", read_only=True)
 
     class Meta:
         model = Proposal
         fields = ("id", "partnership_type", "created_date", "modified_date", "status")
         read_only_fields = fields
 
-    def get_status(self, obj):
-        return getattr(obj, "latest_status", None) or obj.current_status
\ No newline at end of file
+# ---- AI 초안 생성 작업(Read) ----
+class ProposalDraftJobSerializer(serializers.ModelSerializer):
+    job_id = serializers.UUIDField(source="id", read_only=True)
+    # 완료(DONE)된 경우에만 생성된 제안서가 채워짐
+    proposal = ProposalReadSerializer(read_only=True)
+
+    class Meta:
+        model = ProposalDraftJob
+        fields = (
+            "job_id", "status", "direction", "recipient",
+            "proposal", "error",
+            "created_at", "started_at", "finished_at",
+        )
+        read_only_fields = fields
+
+
+# ---- AI 초안 일괄 생성 ----
+class ProposalAIDraftBatchRequestSerializer(serializers.Serializer):
+    recipients = serializers.ListField(child=serializers.IntegerField(min_value=1), allow_empty=False)
+    contact_info = serializers.CharField(required=False, allow_blank=True, default="")
+
+
+class ProposalAIDraftBatchResultSerializer(serializers.Serializer):
+    recipient = serializers.IntegerField()
+    status = serializers.ChoiceField(choices=("CREATED", "FAILED", "RATE_LIMITED"))
+    detail = serializers.JSONField(allow_null=True, help_text="실패 사유 (문자열 또는 필드별 검증 오류)")
+    proposal = ProposalReadSerializer(allow_null=True)
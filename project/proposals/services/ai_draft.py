@@ -0,0 +1,146 @@
+from types import SimpleNamespace
+
+from rest_framework import status
+
+from accounts.models import User
+from profiles.models import OwnerProfile, StudentGroupProfile
+from proposals.models import ProposalDraftJob
+from proposals.serializers import ProposalWriteSerializer
+from proposals.services.get_info import get_owner_profile_snapshot_by_user_id, get_student_group_profile_snapshot_by_user_id
+from proposals.services.draft_cache import get_draft_cache
+from proposals.services.json_stream import IncrementalJSONObjectParser
+from proposals.services.make_prompt import (
+    generate_proposal_from_owner_profile,
+    build_proposal_messages,
+    draft_cache_key,
+    finalize_proposal_draft,
+    stream_proposal_draft,
+)
+
+Direction = ProposalDraftJob.Direction
+
+
+class DraftRequestError(Exception):
+    """AI 초안 요청 검증 실패 (뷰에서 detail/status_code로 응답)"""
+    def __init__(self, detail, status_code=status.HTTP_400_BAD_REQUEST):
+        super().__init__(detail)
+        self.detail = detail
+        self.status_code = status_code
+
+
+def _author_contact(author, direction, contact_info=""):
+    """
+    작성자 연락처: body에 값이 있으면 그것을, 없으면 작성자 프로필의 contact를 사용
+    - TO_OWNER: 학생회 프로필 / TO_STUDENT_GROUP: 사장님 프로필
+    """
+    body_contact = (contact_info or "").strip()
+    if body_contact:
+        return body_contact
+    model = StudentGroupProfile if direction == Direction.TO_OWNER else OwnerProfile
+    return (
+        model.objects
+        .filter(user=author)
+        .values_list("contact", flat=True)
+        .first()
+    ) or ""
+
+
+def prepare_ai_draft(author, recipient_id, direction, contact_info="", request=None) -> dict:
+    """
+    AI 초안 생성에 필요한 입력을 검증/수집해서 generate_proposal_from_owner_profile 인자로 반환
+    - TO_OWNER: 작성자(학생단체) → 수신자(사장님), 수신자의 OwnerProfile 기반
+    - TO_STUDENT_GROUP: 작성자(사장님) → 수신자(학생단체), 작성자의 OwnerProfile 기반
+    검증 실패 시 DraftRequestError
+    """
+    if not recipient_id:
+        raise DraftRequestError("recipient는 필수입니다.")
+
+    # 수신자 존재/역할 체크
+    try:
+        recipient = User.objects.get(pk=recipient_id)
+    except (User.DoesNotExist, ValueError, TypeError):
+        raise DraftRequestError("수신자(유저)가 존재하지 않습니다.", status.HTTP_404_NOT_FOUND)
+
+    if direction == Direction.TO_OWNER:
+        if recipient.user_role != User.Role.OWNER:
+            raise DraftRequestError("수신자는 사장님(OWNER)이어야 합니다.")
+        owner_user_id, group_user_id = recipient.id, author.id
+        owner_missing = "수신자 사장님의 프로필이 없습니다."
+    else:
+        if recipient.user_role != User.Role.STUDENT_GROUP:
+            raise DraftRequestError("수신자는 학생단체(STUDENT_GROUP)이어야 합니다.")
+        owner_user_id, group_user_id = author.id, recipient.id
+        owner_missing = "작성자(사장님)의 프로필이 없습니다."
+
+    # 사장님/학생회 프로필 스냅샷
+    try:
+        owner_profile = get_owner_profile_snapshot_by_user_id(owner_user_id)
+    except OwnerProfile.DoesNotExist:
+        raise DraftRequestError(owner_missing)
+    try:
+        student_group_profile = get_student_group_profile_snapshot_by_user_id(group_user_id, request=request)
+    except StudentGroupProfile.DoesNotExist:
+        raise DraftRequestError("학생회의 프로필이 없습니다.")
+
+    return {
+        "owner_profile": owner_profile,
+        "author_name": author.username or (author.email or ""),
+        "author_contact": _author_contact(author, direction, contact_info),
+        "student_group_profile": student_group_profile,
+        # 프로필 수정 시 캐시 무효화용 태그
+        "owner_user_id": owner_user_id,
+        "group_user_id": group_user_id,
+    }
+
+
+def save_ai_draft(author, recipient_id, ai_dict: dict, request=None):
+    """AI 응답(JSON)에 recipient를 주입한 뒤 표준 WriteSerializer로 검증/저장"""
+    ai_dict = {**ai_dict, "recipient": recipient_id}
+    # 워커에서는 request가 없으므로 작성자만 담은 최소 객체로 대신함
+    context = {"request": request or SimpleNamespace(user=author)}
+    serializer = ProposalWriteSerializer(data=ai_dict, context=context)
+    serializer.is_valid(raise_exception=True)
+    return serializer.save()
+
+
+def generate_ai_draft(author, recipient_id, direction, contact_info="", request=None):
+    """검증 → GPT 호출 → 제안서 저장까지 한 번에 수행하고 생성된 Proposal 반환"""
+    inputs = prepare_ai_draft(author, recipient_id, direction, contact_info, request=request)
+    ai_dict = generate_proposal_from_owner_profile(**inputs)
+    return save_ai_draft(author, recipient_id, ai_dict, request=request)
+
+
+def stream_ai_draft(author, recipient_id, inputs: dict, request=None):
+    """
+    prepare_ai_draft 결과(inputs)로 GPT 스트리밍 호출 → 제안서 저장
+    (event, payload)를 순서대로 yield
+    - ("delta", {"key", "text"}): 작성 중인 문자열 필드의 추가 텍스트
+    - ("field", {"key", "value"}): 값이 완성된 필드
+    - ("done", Proposal): 검증/저장 완료 (마지막 이벤트)
+    캐시에 있으면 GPT 호출 없이 필드를 바로 내보냄
+    """
+    prompt_inputs = {
+        k: inputs[k] for k in ("owner_profile", "author_name", "author_contact", "student_group_profile")
+    }
+    cache = get_draft_cache()
+    key = draft_cache_key(**prompt_inputs)
+
+    ai_dict = cache.get(key)
+    if ai_dict is not None:
+        for field, value in ai_dict.items():
+            yield "field", {"key": field, "value": value}
+    else:
+        messages, metrics = build_proposal_messages(**prompt_inputs)
+        parser = IncrementalJSONObjectParser()
+        for chunk in stream_proposal_draft(messages):
+            for event, field, value in parser.feed(chunk):
+                if event == "delta":
+                    yield "delta", {"key": field, "text": value}
+                else:
+                    yield "field", {"key": field, "value": value}
+        ai_dict = finalize_proposal_draft(
+            parser.result(), author_contact=prompt_inputs["author_contact"], metrics=metrics,
+        )
+        cache.set(key, ai_dict, owner_user_id=inputs.get("owner_user_id"), group_user_id=inputs.get("group_user_id"))
+
+    yield "done", save_ai_draft(author, recipient_id, ai_dict, request=request)
@@ -0,0 +1,159 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from accounts.models import User
+from proposals.models import Proposal, ProposalDraftJob
+from proposals.serializers import ProposalWriteSerializer
+from proposals.services.ai_draft import DraftRequestError, _author_contact
+from proposals.services.get_info import (
+    get_owner_profile_snapshot_by_user_id,
+    get_student_group_profile_snapshot_by_user_id,
+    get_owner_profile_snapshots_by_user_ids,
+    get_student_group_profile_snapshots_by_user_ids,
+)
+from proposals.services.llm import LLMError
+from proposals.services.make_prompt import generate_proposal_from_owner_profile
+from proposals.services.rate_limit import FixedWindowRateLimiter
+from profiles.models import OwnerProfile, StudentGroupProfile
+
+logger = logging.getLogger(__name__)
+
+# AI 제안서 초안 일괄 생성 (한 작성자 → 여러 수신자)
+# - 수신자/프로필 스냅샷은 수신자 수와 무관한 고정 쿼리로 한 번에 조회
+# - GPT 호출은 크기가 제한된 스레드 풀에서 병렬 처리 (settings.AI_DRAFT_BATCH["WORKERS"])
+# - 사장님 단위 속도 제한: 같은 사장님 프로필로 만드는 초안 수를 윈도우당 OWNER_RATE_LIMIT건으로 제한
+# - 성공한 초안은 제안서/DRAFT 상태 이력을 각각 한 번의 INSERT로 저장
+
+Direction = ProposalDraftJob.Direction
+
+CREATED, FAILED, RATE_LIMITED = "CREATED", "FAILED", "RATE_LIMITED"
+
+DEFAULTS = {
+    "MAX_RECIPIENTS": 50,
+    "WORKERS": 4,
+    "OWNER_RATE_LIMIT": 20,
+    "OWNER_RATE_WINDOW": 60 * 60,
+}
+
+
+def _config(name):
+    return getattr(settings, "AI_DRAFT_BATCH", {}).get(name, DEFAULTS[name])
+
+
+def get_owner_rate_limiter() -> FixedWindowRateLimiter:
+    return FixedWindowRateLimiter("ai-draft-owner", _config("OWNER_RATE_LIMIT"), _config("OWNER_RATE_WINDOW"))
+
+
+def _generate_in_worker(inputs):
+    """워커 스레드: GPT 호출 (DB 캐시 백엔드를 쓰면 스레드별 커넥션을 정리)"""
+    try:
+        return generate_proposal_from_owner_profile(**inputs)
+    finally:
+        close_old_connections()
+
+
+def generate_ai_drafts_batch(author, recipient_ids, direction, contact_info="", request=None) -> list:
+    """
+    여러 수신자에게 보낼 AI 초안을 병렬 생성 후 일괄 저장
+    반환: 요청 순서대로 [{"recipient", "status", "detail", "proposal"}]
+    - status: CREATED(proposal 포함) / FAILED(detail) / RATE_LIMITED
+    작성자 쪽 프로필이 없거나 수신자 목록이 잘못되면 DraftRequestError
+    """
+    recipient_ids = list(dict.fromkeys(recipient_ids))  # 중복 제거(순서 유지)
+    if not recipient_ids:
+        raise DraftRequestError("recipients는 필수입니다.")
+    max_recipients = _config("MAX_RECIPIENTS")
+    if len(recipient_ids) > max_recipients:
+        raise DraftRequestError(f"한 번에 최대 {max_recipients}명까지 생성할 수 있습니다.")
+
+    to_owner = direction == Direction.TO_OWNER
+    expected_role = User.Role.OWNER if to_owner else User.Role.STUDENT_GROUP
+
+    # 작성자 쪽 스냅샷/연락처는 한 번만 조회
+    try:
+        if to_owner:
+            author_snapshot = get_student_group_profile_snapshot_by_user_id(author.id, request=request)
+        else:
+            author_snapshot = get_owner_profile_snapshot_by_user_id(author.id)
+    except (OwnerProfile.DoesNotExist, StudentGroupProfile.DoesNotExist):
+        raise DraftRequestError("학생회의 프로필이 없습니다." if to_owner else "작성자(사장님)의 프로필이 없습니다.")
+    author_contact = _author_contact(author, direction, contact_info)
+    author_name = author.username or (author.email or "")
+
+    results = {rid: {"recipient": rid, "status": FAILED, "detail": None, "proposal": None} for rid in recipient_ids}
+
+    # 수신자 1쿼리 + 수신자 스냅샷 (사장님: 프로필 1 + 메뉴 1 / 학생회: 1)
+    recipients = User.objects.in_bulk(recipient_ids)
+    valid_ids = []
+    for rid in recipient_ids:
+        user = recipients.get(rid)
+        if user is None:
+            results[rid]["detail"] = "수신자(유저)가 존재하지 않습니다."
+        elif user.user_role != expected_role:
+            results[rid]["detail"] = (
+                "수신자는 사장님(OWNER)이어야 합니다." if to_owner else "수신자는 학생단체(STUDENT_GROUP)이어야 합니다."
+            )
+        else:
+            valid_ids.append(rid)
+
+    if to_owner:
+        snapshots = get_owner_profile_snapshots_by_user_ids(valid_ids)
+        missing = "수신자 사장님의 프로필이 없습니다."
+    else:
+        snapshots = get_student_group_profile_snapshots_by_user_ids(valid_ids, request=request)
+        missing = "수신자 학생회의 프로필이 없습니다."
+
+    limiter = get_owner_rate_limiter()
+    tasks = {}
+    for rid in valid_ids:
+        if rid not in snapshots:
+            results[rid]["detail"] = missing
+            continue
+        owner_user_id, group_user_id = (rid, author.id) if to_owner else (author.id, rid)
+        if not limiter.allow(owner_user_id):
+            results[rid]["status"] = RATE_LIMITED
+            results[rid]["detail"] = "같은 사장님에 대한 초안 생성 한도를 초과했습니다. 잠시 후 다시 시도해 주세요."
+            continue
+        tasks[rid] = {
+            "owner_profile": snapshots[rid] if to_owner else author_snapshot,
+            "student_group_profile": author_snapshot if to_owner else snapshots[rid],
+            "author_name": author_name,
+            "author_contact": author_contact,
+            "owner_user_id": owner_user_id,
+            "group_user_id": group_user_id,
+        }
+
+    ai_results = {}
+    if tasks:
+        with ThreadPoolExecutor(max_workers=min(_config("WORKERS"), len(tasks)), thread_name_prefix="ai-draft-batch") as pool:
+            futures = {rid: pool.submit(_generate_in_worker, inputs) for rid, inputs in tasks.items()}
+        for rid, future in futures.items():
+            try:
+                ai_results[rid] = future.result()
+            except LLMError as exc:
+                # 타임아웃/서킷 차단 등은 재시도 후에도 실패한 경우 → 스택 없이 사유만 기록
+                logger.warning("AI 초안 일괄 생성 실패: recipient=%s (%s)", rid, exc.detail)
+                results[rid]["detail"] = exc.detail
+            except Exception as exc:
+                logger.exception("AI 초안 일괄 생성 실패: recipient=%s", rid)
+                results[rid]["detail"] = f"AI 초안 생성 실패: {type(exc).__name__}"
+
+    # 표준 WriteSerializer로 검증 (수신자는 이미 조회한 객체 재사용) → 일괄 저장
+    context = {"request": request or SimpleNamespace(user=author), "prefetched_users": recipients}
+    pending = []
+    for rid, ai_dict in ai_results.items():
+        serializer = ProposalWriteSerializer(data={**ai_dict, "recipient": rid}, context=context)
+        if not serializer.is_valid():
+            results[rid]["detail"] = serializer.errors
+            continue
+        pending.append(serializer.build_instance(serializer.validated_data))
+
+    for proposal in Proposal.bulk_create_drafts(pending):
+        results[proposal.recipient_id]["status"] = CREATED
+        results[proposal.recipient_id]["proposal"] = proposal
+
+    return [results[rid] for rid in recipient_ids]
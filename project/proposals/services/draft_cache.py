@@ -0,0 +1,167 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from proposals.models import AIDraftCacheEntry
+
+# AI 제안서 초안 캐시
+# - 같은 입력(프롬프트)이면 OpenAI를 다시 호출하지 않고 저장된 응답을 반환
+# - settings.AI_DRAFT_CACHE = {"BACKEND": "memory" | "db" | "none", "TTL": 초, "MAX_ENTRIES": 개수}
+#   - "memory": 프로세스 로컬 LRU (기본값, 워커 프로세스마다 따로 유지)
+#   - "db": AIDraftCacheEntry 테이블 (프로세스/서버 간 공유)
+#   - "none": 캐시 사용 안 함
+# - 프로필이 바뀌면 키(스냅샷 해시)가 달라지므로 이전 항목은 다시 쓰이지 않고,
+#   proposals.signals에서 해당 유저의 항목을 즉시 삭제함
+
+DEFAULT_TTL = 60 * 60 * 24
+DEFAULT_MAX_ENTRIES = 1000
+
+
+class BaseDraftCache:
+    def __init__(self, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    def get(self, key):
+        """캐시된 응답(dict) 또는 None"""
+        raise NotImplementedError
+
+    def set(self, key, value, owner_user_id=None, group_user_id=None):
+        raise NotImplementedError
+
+    def invalidate_user(self, user_id):
+        """해당 유저(사장님/학생단체)의 프로필로 만든 항목을 모두 삭제"""
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+
+class NullDraftCache(BaseDraftCache):
+    def get(self, key):
+        return None
+
+    def set(self, key, value, owner_user_id=None, group_user_id=None):
+        pass
+
+    def invalidate_user(self, user_id):
+        pass
+
+    def clear(self):
+        pass
+
+
+class LocMemDraftCache(BaseDraftCache):
+    """프로세스 로컬 LRU + TTL (OrderedDict 순서 = 최근 사용 순서)"""
+
+    def __init__(self, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES):
+        super().__init__(ttl, max_entries)
+        self._data = OrderedDict()  # key -> (expires_at, value, owner_user_id, group_user_id)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            # 호출 측에서 dict를 수정해도 캐시가 오염되지 않도록 복사본 반환
+            return copy.deepcopy(entry[1])
+
+    def set(self, key, value, owner_user_id=None, group_user_id=None):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, copy.deepcopy(value), owner_user_id, group_user_id)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def invalidate_user(self, user_id):
+        with self._lock:
+            stale = [k for k, (_, _, owner_id, group_id) in self._data.items() if user_id in (owner_id, group_id)]
+            for k in stale:
+                del self._data[k]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class DBDraftCache(BaseDraftCache):
+    """AIDraftCacheEntry 테이블 기반 (last_used_at으로 LRU, expires_at으로 TTL)"""
+
+    def get(self, key):
+        now = timezone.now()
+        # 만료되지 않은 항목만 사용 시각을 갱신 → 갱신된 행이 있으면 hit
+        if not AIDraftCacheEntry.objects.filter(key=key, expires_at__gt=now).update(last_used_at=now):
+            return None
+        return AIDraftCacheEntry.objects.filter(key=key).values_list("payload", flat=True).first()
+
+    def set(self, key, value, owner_user_id=None, group_user_id=None):
+        now = timezone.now()
+        AIDraftCacheEntry.objects.update_or_create(
+            key=key,
+            defaults={
+                "payload": value,
+                "owner_user_id": owner_user_id,
+                "group_user_id": group_user_id,
+                "last_used_at": now,
+                "expires_at": now + timedelta(seconds=self.ttl),
+            },
+        )
+        self._evict(now)
+
+    def _evict(self, now):
+        AIDraftCacheEntry.objects.filter(expires_at__lte=now).delete()
+        # 상한을 넘은 만큼 가장 오래 안 쓰인 항목부터 삭제
+        cutoff = (
+            AIDraftCacheEntry.objects
+            .order_by("-last_used_at")
+            .values_list("last_used_at", flat=True)[self.max_entries:self.max_entries + 1]
+        )
+        cutoff = list(cutoff)
+        if cutoff:
+            AIDraftCacheEntry.objects.filter(last_used_at__lte=cutoff[0]).delete()
+
+    def invalidate_user(self, user_id):
+        AIDraftCacheEntry.objects.filter(Q(owner_user_id=user_id) | Q(group_user_id=user_id)).delete()
+
+    def clear(self):
+        AIDraftCacheEntry.objects.all().delete()
+
+
+BACKENDS = {
+    "memory": LocMemDraftCache,
+    "db": DBDraftCache,
+    "none": NullDraftCache,
+}
+
+_cache = None
+_cache_config = None
+_cache_lock = threading.Lock()
+
+
+def get_draft_cache() -> BaseDraftCache:
+    """설정에 맞는 캐시 인스턴스 (설정이 바뀌면 새로 만듦 — override_settings 대응)"""
+    global _cache, _cache_config
+    config = getattr(settings, "AI_DRAFT_CACHE", {})
+    with _cache_lock:
+        if _cache is None or _cache_config != config:
+            backend = BACKENDS[config.get("BACKEND", "memory")]
+            _cache = backend(
+                ttl=config.get("TTL", DEFAULT_TTL),
+                max_entries=config.get("MAX_ENTRIES", DEFAULT_MAX_ENTRIES),
+            )
+            _cache_config = dict(config)
+    return _cache
@@ -0,0 +1,131 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError as DRFValidationError
+
+from proposals.models import ProposalDraftJob
+from proposals.services.ai_draft import DraftRequestError, generate_ai_draft
+from proposals.services.llm import LLMError
+
+logger = logging.getLogger(__name__)
+
+# AI 초안 생성 작업 큐
+# - 작업은 ProposalDraftJob 테이블에 저장됨 (외부 브로커 없이 DB가 큐 역할)
+# - settings.AI_DRAFT_QUEUE_BACKEND 에 따라 실행 주체가 달라짐
+#   - "thread"(기본): 웹 프로세스 안의 스레드 풀이 커밋 직후 바로 처리
+#   - "db": 별도 프로세스의 `python manage.py run_draft_jobs` 워커가 대기 작업을 가져가 처리
+#   - "sync": 커밋 직후 같은 스레드에서 처리 (테스트/로컬 디버깅용)
+# - 워커/프로세스가 죽어 RUNNING으로 남은 작업은 started_at 기준 AI_DRAFT_JOB_TIMEOUT초가 지나면
+#   run_draft_jobs가 회수 (AI_DRAFT_JOB_MAX_ATTEMPTS번까지 PENDING으로 되돌려 재시도, 넘으면 FAILED)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """프로세스 당 하나의 워커 스레드 풀 (처음 사용할 때 생성)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, "AI_DRAFT_WORKERS", 4),
+                thread_name_prefix="ai-draft",
+            )
+    return _executor
+
+
+def enqueue_draft_job(author, recipient_id, direction, contact_info="") -> ProposalDraftJob:
+    """작업을 저장하고 트랜잭션 커밋 후 실행되도록 등록"""
+    job = ProposalDraftJob.objects.create(
+        author=author,
+        recipient_id=recipient_id,
+        direction=direction,
+        contact_info=(contact_info or "").strip(),
+    )
+    backend = getattr(settings, "AI_DRAFT_QUEUE_BACKEND", "thread")
+    if backend == "thread":
+        transaction.on_commit(lambda: get_executor().submit(run_draft_job_in_worker, job.pk))
+    elif backend == "sync":
+        transaction.on_commit(lambda: run_draft_job(job.pk))
+    return job
+
+
+def claim_draft_job(job_id) -> bool:
+    """PENDING → RUNNING 조건부 갱신으로 작업 선점 (여러 워커가 같은 작업을 중복 처리하지 않도록)"""
+    return ProposalDraftJob.objects.filter(
+        pk=job_id, status=ProposalDraftJob.Status.PENDING,
+    ).update(
+        status=ProposalDraftJob.Status.RUNNING,
+        started_at=timezone.now(),
+        attempts=F("attempts") + 1,
+    ) == 1
+
+
+def run_draft_job(job_id):
+    """작업 하나를 선점해서 GPT 호출 → 제안서 저장까지 수행, 결과를 작업에 기록"""
+    if not claim_draft_job(job_id):
+        return
+
+    job = ProposalDraftJob.objects.select_related("author").get(pk=job_id)
+    # 결과는 이번 선점(started_at)이 유효할 때만 기록 (시간 초과로 회수된 뒤 다른 워커가 다시 잡았으면 무시)
+    lease = ProposalDraftJob.objects.filter(
+        pk=job_id, status=ProposalDraftJob.Status.RUNNING, started_at=job.started_at,
+    )
+    try:
+        proposal = generate_ai_draft(job.author, job.recipient_id, job.direction, job.contact_info)
+    except Exception as exc:
+        logger.exception("AI 초안 생성 작업 실패: %s", job_id)
+        lease.update(
+            status=ProposalDraftJob.Status.FAILED,
+            error=_error_text(exc),
+            finished_at=timezone.now(),
+        )
+    else:
+        lease.update(
+            status=ProposalDraftJob.Status.DONE,
+            proposal=proposal,
+            finished_at=timezone.now(),
+        )
+
+
+def reclaim_stale_draft_jobs() -> dict:
+    """
+    AI_DRAFT_JOB_TIMEOUT초 넘게 RUNNING인 작업 회수 (처리하던 워커/프로세스가 죽은 것으로 간주)
+    - 시도 횟수가 AI_DRAFT_JOB_MAX_ATTEMPTS 미만이면 PENDING으로 되돌리고, 아니면 FAILED로 종료
+    """
+    now = timezone.now()
+    timeout = getattr(settings, "AI_DRAFT_JOB_TIMEOUT", 600)
+    max_attempts = getattr(settings, "AI_DRAFT_JOB_MAX_ATTEMPTS", 3)
+    stale = ProposalDraftJob.objects.filter(
+        status=ProposalDraftJob.Status.RUNNING, started_at__lt=now - timedelta(seconds=timeout),
+    )
+    failed = stale.filter(attempts__gte=max_attempts).update(
+        status=ProposalDraftJob.Status.FAILED,
+        error=f"작업 시간 초과 ({timeout}초, {max_attempts}회 시도)",
+        finished_at=now,
+    )
+    requeued = stale.update(status=ProposalDraftJob.Status.PENDING, started_at=None)
+    if requeued or failed:
+        logger.warning("방치된 AI 초안 작업 회수: 재시도 %d건, 실패 처리 %d건", requeued, failed)
+    return {"requeued": requeued, "failed": failed}
+
+
+def run_draft_job_in_worker(job_id):
+    """워커 스레드용 래퍼: 스레드마다 열린 DB 커넥션을 정리"""
+    close_old_connections()
+    try:
+        run_draft_job(job_id)
+    finally:
+        close_old_connections()
+
+
+def _error_text(exc) -> str:
+    if isinstance(exc, (DraftRequestError, DRFValidationError, LLMError)):
+        return str(exc.detail)
+    return f"{type(exc).__name__}: {exc}"
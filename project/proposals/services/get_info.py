@@ -25,4 +25,30 @@ def get_student_group_profile_snapshot_by_user_id(student_user_id: int, request=
     if not profile:
         raise StudentGroupProfile.DoesNotExist("해당 유저의 학생회 프로필이 없습니다.")
     ctx = {"request": request} if request is not None else {}
-    return StudentGroupProfileForAISerializer(profile, context=ctx).data
\ No newline at end of file
+    return StudentGroupProfileForAISerializer(profile, context=ctx).data
+
+
+# ---- 여러 유저의 스냅샷을 한 번에 (일괄 생성용) ----
+def _first_profile_per_user(queryset, user_ids):
+    """유저당 프로필 하나 (단건 조회의 .first()와 같은 pk 최소값 기준)"""
+    profiles = {}
+    for profile in queryset.filter(user_id__in=set(user_ids)).order_by("pk"):
+        profiles.setdefault(profile.user_id, profile)
+    return profiles
+
+def get_owner_profile_snapshots_by_user_ids(owner_user_ids) -> dict:
+    """
+    {사장님 User.pk: AI용 dict} — 프로필 1쿼리 + 메뉴 prefetch 1쿼리 (유저 수와 무관)
+    프로필이 없는 유저는 결과에 포함되지 않음
+    """
+    profiles = _first_profile_per_user(
+        OwnerProfile.objects.select_related("user").prefetch_related("menus"), owner_user_ids,
+    )
+    return {user_id: OwnerProfileForAISerializer(p).data for user_id, p in profiles.items()}
+
+def get_student_group_profile_snapshots_by_user_ids(student_user_ids, request=None) -> dict:
+    """{학생회 User.pk: AI용 dict} — 1쿼리, 프로필이 없는 유저는 제외"""
+    profiles = _first_profile_per_user(StudentGroupProfile.objects.select_related("user"), student_user_ids)
+    ctx = {"request": request} if request is not None else {}
+    return {user_id: StudentGroupProfileForAISerializer(p, context=ctx).data for user_id, p in profiles.items()}
+
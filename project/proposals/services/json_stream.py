@@ -0,0 +1,183 @@
+import json
+
+# 스트리밍 중인 JSON 객체를 조각 단위로 파싱
+# - GPT가 {"key": value, ...} 형태의 JSON을 토큰 단위로 보내는 동안
+#   최상위 키의 값이 완성되는 즉시 꺼내고, 문자열 값은 완성 전에도 이어지는 텍스트를 꺼냄
+# - 중첩 객체/배열은 완성된 뒤 한 번에 반환
+
+WHITESPACE = " \t\r\n"
+
+
+class IncrementalJSONObjectParser:
+    """
+    사용 예)
+      parser = IncrementalJSONObjectParser()
+      for chunk in stream:
+          for event, key, value in parser.feed(chunk):
+              ...  # ("delta", key, "추가된 문자열") 또는 ("field", key, 완성된 값)
+      data = parser.result()
+    """
+
+    def __init__(self):
+        self.buf = ""
+        self.pos = 0
+        self.state = "start"      # start → key → colon → value → comma → ... → end
+        self.key = None
+        self.value_start = None
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.emitted = ""         # 현재 문자열 값 중 delta로 내보낸 부분
+        self.fields = {}
+
+    @property
+    def done(self) -> bool:
+        return self.state == "end"
+
+    def result(self) -> dict:
+        """전체 JSON이 끝났으면 파싱 결과, 아니면 ValueError"""
+        if not self.done:
+            raise ValueError("JSON 객체가 끝나지 않았습니다.")
+        return dict(self.fields)
+
+    def feed(self, chunk: str) -> list:
+        self.buf += chunk
+        events = []
+        while self.pos < len(self.buf) and not self.done:
+            if not self._step(events):
+                break
+        # 아직 닫히지 않은 최상위 문자열 값은 지금까지의 텍스트를 delta로 내보냄
+        if self.state == "value" and self.value_start is not None and self.buf[self.value_start] == '"':
+            self._emit_string_delta(events)
+        return events
+
+    # ---- 상태 머신 ----
+    def _step(self, events) -> bool:
+        """한 단계 진행. 입력이 더 필요하면 False"""
+        ch = self.buf[self.pos]
+
+        if self.state == "start":
+            self.pos += 1
+            if ch == "{":
+                self.state = "key"
+            elif ch not in WHITESPACE:
+                raise ValueError("JSON 객체가 아닙니다.")
+            return True
+
+        if self.state in ("key", "comma"):
+            if ch in WHITESPACE:
+                self.pos += 1
+                return True
+            if ch == "}":
+                self.pos += 1
+                self.state = "end"
+                return True
+            if self.state == "comma":
+                if ch != ",":
+                    raise ValueError(f"',' 가 필요합니다: {ch!r}")
+                self.pos += 1
+                self.state = "key"
+                return True
+            # 키 문자열 전체가 도착할 때까지 대기
+            end = self._string_end(self.pos)
+            if end is None:
+                return False
+            self.key = json.loads(self.buf[self.pos:end + 1])
+            self.pos = end + 1
+            self.state = "colon"
+            return True
+
+        if self.state == "colon":
+            self.pos += 1
+            if ch == ":":
+                self.state = "value"
+                self.value_start = None
+            elif ch not in WHITESPACE:
+                raise ValueError(f"':' 가 필요합니다: {ch!r}")
+            return True
+
+        # state == "value"
+        if self.value_start is None:
+            if ch in WHITESPACE:
+                self.pos += 1
+                return True
+            self.value_start = self.pos
+            self.depth = 0
+            self.in_string = False
+            self.escape = False
+            self.emitted = ""
+        end = self._scan_value()
+        if end is None:
+            return False
+        raw = self.buf[self.value_start:end]
+        value = json.loads(raw)
+        if isinstance(value, str):
+            self._emit_string_delta(events, final=value)
+        self.fields[self.key] = value
+        events.append(("field", self.key, value))
+        self.pos = end
+        self.value_start = None
+        self.state = "comma"
+        return True
+
+    def _scan_value(self):
+        """현재 값의 끝 인덱스(미포함)를 반환, 아직 끝나지 않았으면 None (스캔 위치는 유지)"""
+        first = self.buf[self.value_start]
+        i = self.pos
+        while i < len(self.buf):
+            ch = self.buf[i]
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif ch == "\\":
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+                    if self.depth == 0:
+                        return i + 1
+            elif ch == '"':
+                self.in_string = True
+            elif ch in "{[":
+                self.depth += 1
+            elif ch in "}]":
+                if self.depth == 0:
+                    # 숫자/리터럴 값 뒤에 바로 객체가 닫힘
+                    return i
+                self.depth -= 1
+                if self.depth == 0:
+                    return i + 1
+            elif first not in '"{[' and (ch == "," or ch in WHITESPACE):
+                return i
+            i += 1
+        self.pos = i
+        return None
+
+    def _string_end(self, start):
+        """start 위치의 '"'로 시작하는 문자열의 닫는 따옴표 인덱스"""
+        escape = False
+        for i in range(start + 1, len(self.buf)):
+            ch = self.buf[i]
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                return i
+        return None
+
+    def _emit_string_delta(self, events, final=None):
+        if final is None:
+            raw = self.buf[self.value_start + 1:]
+            # 끝에 걸친 미완성 이스케이프(\, \u12 등)는 다음 조각을 기다림
+            cut = raw.rfind("\\")
+            if cut != -1 and (len(raw) - cut) < (6 if raw[cut + 1:cut + 2] == "u" else 2):
+                raw = raw[:cut]
+            try:
+                text = json.loads('"' + raw + '"')
+            except ValueError:
+                return
+        else:
+            text = final
+        if len(text) > len(self.emitted):
+            events.append(("delta", self.key, text[len(self.emitted):]))
+            self.emitted = text
@@ -0,0 +1,383 @@
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# AI 초안용 LLM 호출 계층
+# - provider: 실제 모델 호출 (OpenAI / 로컬 스텁)
+# - ResilientLLM: provider 앞에서 타임아웃, 지터 백오프 재시도, 서킷 브레이커를 적용
+# - settings.AI_LLM 으로 선택/튜닝 (PROVIDER="stub"이면 API 키 없이 부하 테스트 가능)
+
+DEFAULTS = {
+    "PROVIDER": "openai",
+    "MODEL": "gpt-4o",
+    "TEMPERATURE": 0.3,
+    "TIMEOUT": 60,               # 초, 호출 1회(스트리밍은 조각 사이) 대기 한도
+    "MAX_RETRIES": 2,            # 일시적 오류 재시도 횟수
+    "BACKOFF_BASE": 0.5,         # 초, 재시도 대기 = U(0, min(BACKOFF_MAX, BASE * 2^n))
+    "BACKOFF_MAX": 8,
+    "BREAKER_THRESHOLD": 5,      # 연속 실패가 이만큼 쌓이면 차단
+    "BREAKER_RESET_TIMEOUT": 30, # 초, 차단 후 시험 호출까지 대기
+    "STUB_LATENCY": 0.5,         # 초, 스텁 응답 지연
+    "STUB_JITTER": 0.0,          # 초, 스텁 지연에 더해지는 최대 무작위 지연
+    "STUB_CHUNK_SIZE": 16,       # 스텁 스트리밍 조각 크기(문자)
+}
+
+
+class LLMError(Exception):
+    """LLM 호출 실패 (뷰에서 detail/status_code로 응답)"""
+    status_code = 502
+    retryable = False
+
+    def __init__(self, detail="AI 응답을 받지 못했습니다."):
+        super().__init__(detail)
+        self.detail = detail
+
+
+class LLMTransientError(LLMError):
+    """일시적 오류 (연결 실패, 429, 5xx) → 재시도 대상"""
+    retryable = True
+
+
+class LLMTimeout(LLMTransientError):
+    status_code = 504
+
+    def __init__(self, detail="AI 응답 시간이 초과되었습니다."):
+        super().__init__(detail)
+
+
+class LLMUnavailable(LLMError):
+    """서킷 브레이커가 열려 호출하지 않음"""
+    status_code = 503
+
+    def __init__(self, detail="AI 초안 서비스가 일시적으로 중단되었습니다. 잠시 후 다시 시도해 주세요.", retry_after=None):
+        super().__init__(detail)
+        self.retry_after = retry_after
+
+
+# ------ Provider ------
+class BaseLLMProvider:
+    """messages(OpenAI chat 형식) → 응답 JSON 텍스트"""
+    name = "base"
+
+    def __init__(self, model):
+        self.model = model
+
+    @property
+    def cache_tag(self) -> str:
+        """초안 캐시 키에 포함 (provider/모델이 바뀌면 이전 응답을 재사용하지 않음)"""
+        return f"{self.name}:{self.model}"
+
+    def complete(self, messages: list, *, timeout: float) -> str:
+        raise NotImplementedError
+
+    def stream(self, messages: list, *, timeout: float):
+        """응답 텍스트 조각을 순서대로 yield"""
+        raise NotImplementedError
+
+
+_client = None
+_client_key = None
+_client_lock = threading.Lock()
+
+
+def get_openai_client():
+    """
+    프로세스 당 하나의 OpenAI 클라이언트 (키가 바뀌면 새로 만듦 — override_settings 대응)
+    - openai 패키지 import(약 1초)는 첫 호출 시점에만 치름
+    - 재시도는 ResilientLLM이 담당하므로 SDK 자체 재시도는 끔
+    """
+    global _client, _client_key
+    api_key = getattr(settings, "OPENAI_API_KEY", None)
+    if not api_key:
+        raise ImproperlyConfigured("OPENAI_API_KEY(OPEN_API_SECRET_KEY)가 설정되지 않았습니다.")
+    with _client_lock:
+        if _client is None or _client_key != api_key:
+            from openai import OpenAI
+
+            _client = OpenAI(api_key=api_key, max_retries=0)
+            _client_key = api_key
+    return _client
+
+
+class OpenAIProvider(BaseLLMProvider):
+    name = "openai"
+
+    def __init__(self, model, temperature=0.3):
+        super().__init__(model)
+        self.temperature = temperature
+
+    def _create(self, messages, timeout, **kwargs):
+        import openai
+
+        try:
+            return get_openai_client().chat.completions.create(
+                model=self.model,
+                response_format={"type": "json_object"},
+                temperature=self.temperature,
+                messages=messages,
+                timeout=timeout,
+                **kwargs,
+            )
+        except openai.APITimeoutError as exc:
+            raise LLMTimeout() from exc
+        except (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError) as exc:
+            raise LLMTransientError(f"AI 호출 일시 오류: {type(exc).__name__}") from exc
+        except openai.APIError as exc:
+            raise LLMError(f"AI 호출 실패: {type(exc).__name__}") from exc
+
+    def complete(self, messages, *, timeout):
+        resp = self._create(messages, timeout)
+        _log_usage(resp, self.model)
+        return resp.choices[0].message.content
+
+    def stream(self, messages, *, timeout):
+        import openai
+
+        stream = self._create(messages, timeout, stream=True)
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+        except openai.APITimeoutError as exc:
+            raise LLMTimeout() from exc
+        except openai.APIError as exc:
+            raise LLMTransientError(f"AI 스트리밍 중단: {type(exc).__name__}") from exc
+
+
+def _log_usage(resp, model):
+    """실제 전송 토큰 수와 프롬프트 캐시 적중 토큰 수 기록"""
+    usage = getattr(resp, "usage", None)
+    if usage is None:
+        return
+    details = getattr(usage, "prompt_tokens_details", None)
+    logger.info(
+        "AI 초안 토큰: prompt=%s cached=%s completion=%s (%s)",
+        usage.prompt_tokens, getattr(details, "cached_tokens", None), usage.completion_tokens, model,
+    )
+
+
+class StubLLMProvider(BaseLLMProvider):
+    """
+    부하 테스트/오프라인 벤치마크용 로컬 스텁
+    - 같은 messages면 같은 응답 (프롬프트 해시 기반, 네트워크/키 불필요)
+    - latency(+ 0~jitter초) 만큼 지연, 스트리밍은 지연을 조각에 나눠서 보냄
+    - 지연이 timeout보다 길면 timeout만큼 기다린 뒤 LLMTimeout
+    """
+    name = "stub"
+
+    def __init__(self, model="stub", latency=0.5, jitter=0.0, chunk_size=16):
+        super().__init__(model)
+        self.latency = latency
+        self.jitter = jitter
+        self.chunk_size = max(1, chunk_size)
+
+    def render(self, messages) -> str:
+        digest = hashlib.sha256(
+            json.dumps(messages, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        start = timezone.localdate() + timedelta(days=2)
+        # partnership_type/contact_info는 비워 두면 finalize_proposal_draft가 사전 계산 지표/작성자 연락처로 채움
+        return json.dumps({
+            "expected_effects": f"스텁 응답 {digest[:8]}. 한산 시간대 유입 증가.",
+            "partnership_type": [],
+            "apply_target": "학생회 소속 재학생",
+            "time_windows": [{"days": ["월", "화", "수", "목", "금"], "start": "15:00", "end": "17:00"}],
+            "benefit_description": f"전 메뉴 10% 할인. (stub-{digest[8:16]})",
+            "period_start": start.isoformat(),
+            "period_end": (start + timedelta(days=30)).isoformat(),
+        }, ensure_ascii=False)
+
+    def _delay(self) -> float:
+        return self.latency + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def complete(self, messages, *, timeout):
+        delay = self._delay()
+        if delay > timeout:
+            time.sleep(timeout)
+            raise LLMTimeout()
+        time.sleep(delay)
+        return self.render(messages)
+
+    def stream(self, messages, *, timeout):
+        text = self.render(messages)
+        chunks = [text[i:i + self.chunk_size] for i in range(0, len(text), self.chunk_size)]
+        per_chunk = self._delay() / len(chunks)
+        if per_chunk > timeout:
+            time.sleep(timeout)
+            raise LLMTimeout()
+        for chunk in chunks:
+            time.sleep(per_chunk)
+            yield chunk
+
+
+# ------ 서킷 브레이커 ------
+class CircuitBreaker:
+    """
+    연속 실패가 threshold번 쌓이면 OPEN → reset_timeout 동안 호출 차단
+    이후 HALF_OPEN에서 한 번만 시험 호출: 성공하면 CLOSED, 실패하면 다시 OPEN
+    """
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, threshold=5, reset_timeout=30, clock=time.monotonic):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self):
+        if self.opened_at is None:
+            return self.CLOSED
+        if self.clock() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def before_call(self):
+        """호출 가능 여부 확인, 차단 중이면 LLMUnavailable"""
+        with self._lock:
+            state = self._state()
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self.trial_in_flight:
+                self.trial_in_flight = True
+                return
+            retry_after = max(0, self.reset_timeout - (self.clock() - self.opened_at))
+        raise LLMUnavailable(retry_after=int(retry_after) + 1)
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_in_flight = False
+
+    def release_trial(self):
+        """LLMError가 아닌 예외로 끝난 호출: 성공/실패로 치지 않고 시험 호출 자리만 돌려줌"""
+        with self._lock:
+            self.trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.trial_in_flight or self.failures >= self.threshold:
+                if self.opened_at is None:
+                    logger.warning("AI 호출 서킷 브레이커 OPEN (연속 실패 %s회)", self.failures)
+                self.opened_at = self.clock()
+            self.trial_in_flight = False
+
+
+# ------ 타임아웃/재시도/차단을 적용한 호출 ------
+class ResilientLLM:
+    def __init__(self, provider, *, timeout, max_retries, backoff_base, backoff_max, breaker, sleep=time.sleep):
+        self.provider = provider
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker
+        self.sleep = sleep
+
+    @property
+    def cache_tag(self) -> str:
+        return self.provider.cache_tag
+
+    def backoff(self, attempt) -> float:
+        """full jitter: 0 ~ min(max, base * 2^attempt) 사이 무작위 (동시 재시도 분산)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _call(self, fn):
+        attempt = 0
+        while True:
+            self.breaker.before_call()
+            try:
+                result = fn()
+            except LLMError as exc:
+                self.breaker.record_failure()
+                if not exc.retryable or attempt >= self.max_retries:
+                    raise
+                delay = self.backoff(attempt)
+                logger.warning("AI 호출 재시도 %s/%s (%.2fs 후): %s", attempt + 1, self.max_retries, delay, exc.detail)
+                self.sleep(delay)
+                attempt += 1
+            except BaseException:
+                # 프로바이더 버그/중단 등 LLMError 외 예외도 HALF_OPEN 시험 호출을 풀어줘야 다시 닫힐 수 있음
+                self.breaker.release_trial()
+                raise
+            else:
+                self.breaker.record_success()
+                return result
+
+    def complete(self, messages: list) -> str:
+        return self._call(lambda: self.provider.complete(messages, timeout=self.timeout))
+
+    def stream(self, messages: list):
+        """첫 조각을 받기 전까지만 재시도 (이미 보낸 조각은 되돌릴 수 없음)"""
+        def first_chunk():
+            chunks = self.provider.stream(messages, timeout=self.timeout)
+            try:
+                return chunks, next(chunks)
+            except StopIteration:
+                return chunks, None
+
+        chunks, first = self._call(first_chunk)
+        if first is None:
+            return
+        yield first
+        try:
+            yield from chunks
+        except LLMError:
+            self.breaker.record_failure()
+            raise
+
+
+def _build_provider(config):
+    name = config["PROVIDER"]
+    if name == "openai":
+        return OpenAIProvider(config["MODEL"], temperature=config["TEMPERATURE"])
+    if name == "stub":
+        return StubLLMProvider(
+            latency=config["STUB_LATENCY"], jitter=config["STUB_JITTER"], chunk_size=config["STUB_CHUNK_SIZE"],
+        )
+    raise ImproperlyConfigured(f"알 수 없는 AI_LLM PROVIDER: {name}")
+
+
+_llm = None
+_llm_config = None
+_llm_lock = threading.Lock()
+
+
+def get_llm() -> ResilientLLM:
+    """설정에 맞는 LLM 호출 객체 (설정이 바뀌면 새로 만듦 — 서킷 브레이커 상태도 초기화)"""
+    global _llm, _llm_config
+    config = {**DEFAULTS, **getattr(settings, "AI_LLM", {})}
+    with _llm_lock:
+        if _llm is None or _llm_config != config:
+            _llm = ResilientLLM(
+                _build_provider(config),
+                timeout=config["TIMEOUT"],
+                max_retries=config["MAX_RETRIES"],
+                backoff_base=config["BACKOFF_BASE"],
+                backoff_max=config["BACKOFF_MAX"],
+                breaker=CircuitBreaker(config["BREAKER_THRESHOLD"], config["BREAKER_RESET_TIMEOUT"]),
+            )
+            _llm_config = config
+    return _llm
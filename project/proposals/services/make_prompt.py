@@ -1,95 +1,95 @@
+import hashlib
 import json
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from functools import lru_cache
 from textwrap import dedent
-from openai import OpenAI
 
-from config.settings import get_secret
-from datetime import date, timedelta
+from django.utils import timezone
+
+from proposals.services.llm import get_llm
+from proposals.services.metrics import compute_proposal_metrics
 
-OPENAI_API_KEY = get_secret("OPEN_API_SECRET_KEY")
-client = OpenAI(api_key=OPENAI_API_KEY)
+try:  # 선택 의존성: 없으면 토큰 수를 근사치로 계산
+    import tiktoken
+except ImportError:  # pragma: no cover
+    tiktoken = None
 
-today = date.today()
-today_str = today.strftime("%Y-%m-%d")
-start_hint = (today + timedelta(days=2)).strftime("%Y-%m-%d")
-end_hint = (today + timedelta(days=30)).strftime("%Y-%m-%d")
+# 프롬프트(지시문/예시/모델 파라미터)를 바꾸면 올려서 이전 캐시를 무효화
+PROMPT_VERSION = "3"
 
 def _j(obj):  # JSON pretty string (한글 보존)
     return json.dumps(obj, ensure_ascii=False, indent=2)
 
-def generate_proposal_from_owner_profile(
-    *,
-    owner_profile: dict,
-    author_name: str,
-    author_contact: str = "",
-    student_group_profile: dict | None = None,
-) -> dict:
-    """
-    owner_profile: OwnerProfileForAISerializer(data).data 결과(dict)
-    응답(JSON)은 ProposalWriteSerializer의 입력 스키마와 1:1 매칭되도록 요청
-    """
-    # 프롬프트: 시스템+유저
-    system = dedent(f"""
+def _compact(obj):  # 요청마다 바뀌는 입력은 공백 없는 JSON (토큰 절약)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+# ------ 프롬프트 템플릿 (정적 구간) ------
+# 요청마다 바뀌지 않는 지시문/필드 설명/규칙/예시는 프로세스 시작 시 한 번만 만들어 system 메시지 앞쪽에 둠
+# → 모든 요청의 프롬프트 앞부분이 완전히 같아 OpenAI 프롬프트 캐시(동일 prefix 재사용)가 적용됨
+# 날짜, 프로필, 사전 계산 지표 등 요청마다 바뀌는 값은 user 메시지에만 넣음
+
+SYSTEM_INTRO = dedent("""
     너는 제휴 제안서를 작성하는 어시스턴트야. 제휴 제안서를 작성할 때에는 입력으로 주어진 '업체 프로필'과 '학생회 프로필'을 바탕으로 작성해야 해.
     아래 '업체 프로필'을 바탕으로 제휴 제안서 초안을 JSON으로 만들어.
     출력은 반드시 JSON 객체 하나여야 하고, 지정된 키만 포함해야 한다.
-    """)
-
-    # 규칙/스키마 설명(중괄호 직접 쓰지 말고 문자열로만 설명하거나, 예시는 dumps로 주입)
-    
-    example_input = {
-        "campus_name": "중앙대학교",
-        "profile_name": "Middle Door",
-        "business_type": "카페",
-        "business_type_other": "",
-        "business_day": [{"월": ["09:00-21:00"], "화": ["09:00-21:00"], "수": ["09:00-21:00"], "목": ["09:00-21:00"], "금": ["09:00-21:00"], "토": ["10:00-17:00"]}],
-        "goal_new_customers": True,
-        "goal_revisit": False,
-        "goal_clear_stock": False,
-        "goal_spread_peak": True,
-        "goal_sns_marketing": False,
-        "goal_collect_reviews": False,
-        "goal_other": False,
-        "goal_other_detail": "",
-        "margin_rate": 45,
-        "average_sales": 4500,
-        "peak_time": [{"주말": ["13:00-15:00"], "평일": ["09:00-11:00"]}],
-        "off_peak_time": [
-            {"주말": ["09:00-11:00"], "평일": ["15:00-17:00"]}
-        ],
-        "service_drink": False,
-        "service_side_menu": False,
-        "service_other": True,
-        "service_other_detail": "사이즈 업 이벤트",
-        "comment": "오래 협업하고 싶습니다.",
-        "menus": [
+""")
+
+EXAMPLE_OWNER_INPUT = {
+    "campus_name": "중앙대학교",
+    "profile_name": "Middle Door",
+    "business_type": "카페",
+    "business_type_other": "",
+    "business_day": [{"월": ["09:00-21:00"], "화": ["09:00-21:00"], "수": ["09:00-21:00"], "목": ["09:00-21:00"], "금": ["09:00-21:00"], "토": ["10:00-17:00"]}],
+    "goal_new_customers": True,
+    "goal_revisit": False,
+    "goal_clear_stock": False,
+    "goal_spread_peak": True,
+    "goal_sns_marketing": False,
+    "goal_collect_reviews": False,
+    "goal_other": False,
+    "goal_other_detail": "",
+    "margin_rate": 45,
+    "average_sales": 4500,
+    "peak_time": [{"주말": ["13:00-15:00"], "평일": ["09:00-11:00"]}],
+    "off_peak_time": [
+        {"주말": ["09:00-11:00"], "평일": ["15:00-17:00"]}
+    ],
+    "service_drink": False,
+    "service_side_menu": False,
+    "service_other": True,
+    "service_other_detail": "사이즈 업 이벤트",
+    "comment": "오래 협업하고 싶습니다.",
+    "menus": [
         {"name": "아메리카노", "price": 4000},
         {"name": "카페라떼", "price": 5000}
-        ],
-    }
+    ],
+}
 
-    example_student_group_profile_input = {
-        "council_name": "경영학부 학생회",
-        "department": "경영학부",
-        "student_size": 1000,
-        "term_start": "2025-03-01",
-        "term_end": "2026-02-28",
-        "partnership_count": 3,
-        "university_name": "중앙대학교"
-    }
+EXAMPLE_STUDENT_GROUP_INPUT = {
+    "council_name": "경영학부 학생회",
+    "department": "경영학부",
+    "student_size": 1000,
+    "term_start": "2025-03-01",
+    "term_end": "2026-02-28",
+    "partnership_count": 3,
+    "university_name": "중앙대학교"
+}
 
-    example_output = {
-        "expected_effects": " 3개월 기준 약 300명 방문 (30% 방문 가정) -> 예상 추가 매출 약 150만 원 (인당 매출 4,500원 가정 시). 경영학부 재학생 약 1,000명 대상 홍보. 방문 학생 약 30% 예상. 한산 시간대 유입 증가.",
-        "partnership_type": ["타임형", "할인형"],
-        "contact_info": author_contact,
-        "apply_target": "중앙대학교 경영학부에 소속된 재학생들",
-        "time_windows": [{"days": ["월", "화", "수", "목", "금"], "start": "15:00", "end": "17:00"}],
-        "benefit_description": "커피음료 10% 할인 (에이드, 아인슈페너는 제외)",
-        "period_start": "2025-10-01",
-        "period_end": "2025-12-31",
-    }
+EXAMPLE_OUTPUT = {
+    "expected_effects": "잠재 제휴 이용자 수 약 109명. 예상 추가 매출 약 490,500원. 경영학부 재학생 약 1,000명 대상 홍보. 한산 시간대 유입 증가, 신규 고객 유치.",
+    "partnership_type": ["타임형", "할인형"],
+    "contact_info": "010-1234-5678",
+    "apply_target": "중앙대학교 경영학부에 소속된 재학생들",
+    "time_windows": [{"days": ["월", "화", "수", "목", "금"], "start": "15:00", "end": "17:00"}],
+    "benefit_description": "커피음료 20% 할인 (에이드, 아인슈페너는 제외)",
+    "period_start": "2025-10-01",
+    "period_end": "2025-12-31",
+}
 
-    # 입력으로 들어오는 필드 설명 (사장님 프로필, 학생회 (= 학생 단체) 프로필)
-    explain_fields = dedent(f"""
+# 입력으로 들어오는 필드 설명 (사장님 프로필, 학생회 (= 학생 단체) 프로필)
+FIELD_GUIDE = dedent("""
     [업체 프로필 필드 설명]
     - campus_name: 업장 주변에 있는 대학교를 의미함 (예: 중앙대학교)
     - profile_name: 업체의 명칭을 말함
@@ -123,15 +123,15 @@ def generate_proposal_from_owner_profile(
     - term_end: 임기 종료일 (학생회의 임기 종료)
     - partnership_count: 제휴 경험 수를 나타내며 int형태로 저장되어 있음
     - university_name: 학생회가 속한 대학교
-    """)
+""")
 
-    rules = dedent(f"""
+RULES = dedent("""
     반환 JSON 스키마(키만 허용):
     - expected_effects: string (100자 이내, margin_rate/average_sales 참고)
-    - partnership_type: string[] (["할인형","리뷰형","서비스제공형","타임형"] 중 하나 이상), 마진율이 30% 이상이면 할인형을 고려하는 것처럼 입력 요소를 기준으로 합리적인 추론 부탁
-    - contact_info: string (기본값은 위에 준 작성자 연락처)
+    - partnership_type: string[] (["할인형","리뷰형","서비스제공형","타임형"] 중 하나 이상, [사전 계산 지표]의 recommended_partnership_type 사용)
+    - contact_info: string (기본값은 [작성자 연락처 기본값])
     - apply_target: string (제안서를 작성하는 대상이 사장님이라면, 대학생들 혹은 학생회에 속한 대상을 위주로 작성, 만약 작성자가 학생회라면 마찬가지로 학생회를 위주로 작성하면 좋을 것 같음)
-    - time_windows: object[]  // 형식: {{"days":["월요일","화요일"], "start":"HH:MM", "end":"HH:MM"}}
+    - time_windows: object[]  // 형식: {"days":["월요일","화요일"], "start":"HH:MM", "end":"HH:MM"}
     - benefit_description: string (100자 이내로 어떠한 혜택을 제공하는지 작성하면 됨, 단 메뉴명을 활용하는 것이 바람직함)
     - period_start: "YYYY-MM-DD" 또는 null (제안서가 시작되는 날짜, period_start는 최대한 null을 피하고 제안서를 생성한 이후 1~2일 이후로 시작 날짜를 설정하는 것이 좋을 것으로 생각 됨.)
     - period_end:   "YYYY-MM-DD" 또는 null (제안서가 종료되는 날짜, null이면 기간 없음)
@@ -139,41 +139,35 @@ def generate_proposal_from_owner_profile(
     [출력 값 도출을 위한 중요한 규칙 (expected_effects, partnership_type, benefit_description 필드에 대한 중요한 내용)]:
     - expected_effects, partnership_type, benefit_description 필드는 아래의 로직과 조건에 따라서 작성해주어야 함.
 
-    1) partnership_type(= 제휴 유형)의 값을 산출할때, 다음과 같은 사항을 참고할 것
-    a. 만약 업종이 '음식점', '카페' 중 하나라면 "할인형", "타임형"에 가중치를 줌. 만약 업종이 '주점'이라면 "서비스제공형", "리뷰형"에 가중치를 줌.
-    b. 마진율 가중치: 마진율이 20% 이상이라면 "할인형"에 가중치를 줌. 마진율이 15% 이하라면 "서비스제공형", "리뷰형"에 가중치를 줌.
-    c. 한산 시간대 입력 여부: 한산 시간대 존재한다면 "타임형"에 가중치를 줌.
+    - 숫자는 직접 계산하지 말고 [사전 계산 지표(JSON)]의 값을 그대로 사용할 것.
+
+    1) partnership_type(= 제휴 유형)은 [사전 계산 지표]의 recommended_partnership_type을 그대로 사용할 것. (partnership_type_scores는 업종/마진율/한산 시간대 가중치 점수)
 
     2) benefit_description(= 혜택) 필드는 다음과 같은 사항을 참고할 것.
-    a. partnership_type(= 제휴 유형)이 할인형 이라면, 혜택에 할인율을 포함하되, 마진율x0.7% 와 20% 사이의 값이어야 함.
-    b. partnership_type(= 제휴 유형)이 서비스제공형 이라면, 서비스 제공을 포함하되, 제공 품목은 추가 제공 가능 서비스 중에서 하나를 골라서 제공.
+    a. partnership_type(= 제휴 유형)이 할인형 이라면, 혜택에 할인율을 포함하되, discount_rate_min% 와 discount_rate_max% 사이의 값이어야 함.
+    b. partnership_type(= 제휴 유형)이 서비스제공형 이라면, 서비스 제공을 포함하되, 제공 품목은 service_items 중에서 하나를 골라서 제공.
     c. partnership_type(= 제휴 유형)이 타임형 이라면, 혜택에 한산 시간대에 서비스 제공을 포함함.
     d. partnership_type(= 제휴 유형)이 리뷰형 이라면, 혜택에 후기 업로드 시 서비스 제공을 포함함.
     e. partnership_type의 내용을 기반으로 작성해야 한다. 예를 들어 partnership_type이 ["할인형", "서비스제공형"]이라면, 혜택에 할인율과 서비스 제공 관련 내용을 포함해야 한다, 이 경우 타임형, 리뷰형의 내용은 삼가하면 좋을 것 같음.
-    f. 출력 방식은 다음의 예시를 참고하면 좋을 것 같다. 특히 혜택의 내용이 바뀔때는 마침표를 찍어야 함: ex) 의과대학 학생회 약 84명 대상 홍보. 방문 학생 약 30% 증가 예상 3개월 기준 약 84명 방문. 예상 추가 매출 약 134만 원.
+    f. 출력 방식은 다음의 예시를 참고하면 좋을 것 같다. 특히 혜택의 내용이 바뀔때는 마침표를 찍어야 함: ex) 의과대학 학생회 대상 전 메뉴 N% 할인. 후기 업로드 시 음료 1잔 제공. (N 같은 숫자는 [사전 계산 지표]의 범위 안에서 사용)
 
-    3) 모든 partnership_type(= 제휴 유형)에서 expected_effects(= 기대효과)에 잠재 제휴 이용자 수, 예상 추가 매출을 반드시 포함할 것. 
-    잠재 제휴 이용자 수는 0.52 * 업종별 선호도 * student_size(= 소속 단위 학생 수)로 산출함. 이때, 업종별 선호도는 업종이 음식점일때 0.23, 카페일때 0.21, 술집일때 0.07로 계산함.
-    기대 매출은 잠재 제휴 이용자 수 * average_sales(= 평균 인당 매출)로 산출함.
-    노출 건수는 잠재 제휴 이용자 수와 같음.
+    3) 모든 partnership_type(= 제휴 유형)에서 expected_effects(= 기대효과)에 [사전 계산 지표]의 expected_effects_phrases 두 문구를 그대로 포함할 것.
+    노출 건수는 exposure_count를 사용함.
     menus 배열이 주어졌다면, benefit_description에 해당 메뉴명을 활용하는 것이 바람직함.
     만약 partnership_type(= 제휴 유형)이 "리뷰형"이라면, expected_effects(= 기대 효과)에 기대 매출과 노출 건수를 반드시 포함할 것.               
     input으로 들어온 boolean field 내용 중에서 "goal_*" 형태의 필드 값이 True인 항목의 내용을 포함하여 문장형식으로 expected_effects(= 기대효과)에 추가해주면 좋을 것 같아.
     문장이 끝나면 마침표를 찍어줄 것(.).
                    
     [expected_effects 필수 문장 형식]:
-    - 아래 두 문구를 반드시 포함하고 마침표로 끝낼 것:
-      1) "잠재 제휴 이용자 수 약 {int}명" 
-      2) "예상 추가 매출 약 {int}원"
+    - expected_effects_phrases의 두 문구를 숫자 그대로 포함하고 각각 마침표로 끝낼 것.
     - 필요 시 목표(goal_*)를 한 문장으로 요약하여 맨 뒤에 붙일 것. 예: "한산 시간대 유입 증대, 신규 고객 유치."
-    - 단 int형을 표현할때 1000 단위로 끊어서 표현 할 것. ex) 1,000,000
 
     [출력 값 도출을 위한 중요한 규칙 (apply_target, time_windows, period_start, period_end 필드에 대한 중요한 내용)]:
     - apply_target는 학생회의 프로필 필드에 있는 department와 council_name을 활용하라. 예를 들면, department가 경영학부이고 council_name이 '중앙사랑'이라면 "중앙사랑 학생회에 속한 학생회 인원 및 경영학부 학생"으로 작성할 수 있다. 이것 외에 추가적인 미사여구와 같은 내용은 GPT 너의 재량을 어느정도 맡김.
     - off_peak_time를 우선 고려해 time_windows를 제안하자. 즉 off_peak_time의 시간대에 맞춰 제안하자는 의미이다. peak_time도 고려하여 이 시간대는 피하는 것으로 진행하자.
     - business_day 필드를 보면 주어진 날짜와 시간 안에 포함되는 시간만을 time_windows에 고려해야 한다. 그외의 시간은 영업 시간이 아니므로 포함하지 말자.
     - partnership_type에 "타임형"이 포함되어 있지 않다면, input으로 들어온 business_day를 기반으로 time_windows를 설정하자. (형식이 동일한 것으로 판명되니, 이 경우 해당 값을 그대로 출력해도 됨.)
-    - 오늘 날짜는 {today_str}이다.
+    - 오늘 날짜는 [기준 날짜]의 today 값이다.
     - period_start는 오늘 날짜 이후로 해야하고 학생회 프로필의 필드의 term_start이후로 설정해라.
     - period_end는 period_start 이후, 보통 14일~3개월 범위로 설정하라. 단, 학생회 프로필 필드의 term_end 이전으로 설정해라.
     - period_end는 period_start보다 빠를 수는 없다는 것을 명심해라.
@@ -184,39 +178,202 @@ def generate_proposal_from_owner_profile(
     - [업체 프로필 필드 설명]과 [학생회 프로필 필드 설명]을 반드시 숙지하라.
     - 출력 필드는 [출력 값 도출을 위한 중요한 규칙]에 의거하여 최대한으로 반영해야 함.
     - "recipient" 키는 절대 포함하지 마(서버에서 채움)
-    """)
-
-    user = (
-        f"[작성자 이름]: {author_name}\n"
-        f"[작성자 연락처 기본값]: {author_contact}\n\n"
-        "[업체 프로필(JSON)]\n" + _j(owner_profile) + "\n\n"
-        "[학생회 프로필(JSON)]\n" + (_j(student_group_profile) if student_group_profile else "없음") + "\n\n"
-        "[사장님 프로필 및 학생회 프로필 필드 설명]\n" + explain_fields + "\n\n"
-        "[출력 형식 규칙 및 주의사항]\n" + rules + "\n"
-        "[입력 예시(사장님 프로필)]\n" + _j(example_input) + "\n\n"
-        "[입력 예시(학생회 프로필)]\n" + _j(example_student_group_profile_input) + "\n\n"
-        "[출력 예시]\n" + _j(example_output) + "\n\n"
-        "위 자료를 바탕으로 제휴 제안서 초안을 만들어.\n"
-        "출력은 오직 위에서 정의한 JSON 하나만 반환해. 추가 설명, 코드블록 금지."
+""")
+
+
+def count_tokens(text: str) -> int:
+    """
+    OpenAI 토크나이저 기준 토큰 수 (tiktoken이 없으면 근사치)
+    근사: ASCII 4글자당 1토큰, 그 외(한글 등) 1글자당 1토큰
+    """
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+@lru_cache(maxsize=1)
+def _encoding():
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(get_llm().provider.model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+@dataclass(frozen=True)
+class CompiledPromptTemplate:
+    """
+    미리 만들어 둔 프롬프트 템플릿
+    - sections: 정적 구간 (이름, 텍스트) — 순서대로 이어 붙여 system 메시지(static_prefix)가 됨
+    - section_tokens: 정적 구간별 토큰 수 (컴파일 시 한 번 계산)
+    """
+    version: str
+    sections: tuple
+    static_prefix: str
+    section_tokens: dict = field(default_factory=dict)
+
+    def render_request(self, *, today: date, owner_profile, student_group_profile, author_name,
+                       author_contact, metrics) -> list:
+        """요청마다 바뀌는 구간 (이름, 텍스트) 목록"""
+        return [
+            ("request_context", (
+                f"[기준 날짜]\n- today: {today.isoformat()}\n"
+                f"- period_start 권장: {(today + timedelta(days=1)).isoformat()} ~ {(today + timedelta(days=2)).isoformat()}\n\n"
+                f"[작성자 이름]: {author_name}\n"
+                f"[작성자 연락처 기본값]: {author_contact}\n\n"
+            )),
+            ("owner_profile", "[업체 프로필(JSON)]\n" + _compact(owner_profile) + "\n\n"),
+            ("student_group_profile", "[학생회 프로필(JSON)]\n" + (_compact(student_group_profile) if student_group_profile else "없음") + "\n\n"),
+            ("metrics", "[사전 계산 지표(JSON)]\n" + _compact(metrics) + "\n\n"),
+            ("instruction", (
+                "위 자료를 바탕으로 제휴 제안서 초안을 만들어.\n"
+                "출력은 오직 system에서 정의한 JSON 하나만 반환해. 추가 설명, 코드블록 금지."
+            )),
+        ]
+
+
+def compile_prompt_template(measure_tokens: bool = True) -> CompiledPromptTemplate:
+    """정적 구간을 조립하고 구간별 토큰 수를 계산"""
+    sections = (
+        ("system_intro", SYSTEM_INTRO + "\n"),
+        ("field_guide", "[사장님 프로필 및 학생회 프로필 필드 설명]\n" + FIELD_GUIDE + "\n"),
+        ("rules", "[출력 형식 규칙 및 주의사항]\n" + RULES + "\n"),
+        ("examples", (
+            "[입력 예시(사장님 프로필)]\n" + _j(EXAMPLE_OWNER_INPUT) + "\n\n"
+            "[입력 예시(학생회 프로필)]\n" + _j(EXAMPLE_STUDENT_GROUP_INPUT) + "\n\n"
+            "[출력 예시]\n" + _j(EXAMPLE_OUTPUT) + "\n"
+        )),
     )
+    return CompiledPromptTemplate(
+        version=PROMPT_VERSION,
+        sections=sections,
+        static_prefix="".join(text for _, text in sections),
+        section_tokens={name: count_tokens(text) for name, text in sections} if measure_tokens else {},
+    )
+
+@lru_cache(maxsize=1)
+def get_prompt_template() -> CompiledPromptTemplate:
+    """프로세스당 한 번만 컴파일"""
+    return compile_prompt_template()
 
-    resp = client.chat.completions.create(
-        model="gpt-4o",
-        response_format={"type": "json_object"},
-        temperature=0.3,
-        messages=[
-            {"role": "system", "content": system},
-            {"role": "user", "content": user},
-        ],
+
+def draft_cache_key(
+    *,
+    owner_profile: dict,
+    author_name: str,
+    author_contact: str = "",
+    student_group_profile: dict | None = None,
+    today: date | None = None,
+) -> str:
+    """
+    프롬프트에 들어가는 입력 전체의 안정적인 해시 (키 순서와 무관)
+    - 프로필 스냅샷, 작성자 이름/연락처, 프롬프트 버전, 모델, 기준 날짜(프롬프트의 오늘 날짜)
+    """
+    material = {
+        "v": PROMPT_VERSION,
+        "model": get_llm().cache_tag,
+        "today": (today or timezone.localdate()).isoformat(),
+        "owner": owner_profile,
+        "group": student_group_profile,
+        "author_name": author_name,
+        "author_contact": author_contact,
+    }
+    raw = json.dumps(material, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def generate_proposal_from_owner_profile(
+    *,
+    owner_profile: dict,
+    author_name: str,
+    author_contact: str = "",
+    student_group_profile: dict | None = None,
+    owner_user_id: int | None = None,
+    group_user_id: int | None = None,
+    use_cache: bool = True,
+) -> dict:
+    """
+    캐시를 거쳐 AI 초안 생성
+    - 같은 입력이면 OpenAI 호출 없이 캐시된 응답 반환
+    - owner_user_id / group_user_id: 프로필 수정 시 캐시 삭제용 태그
+    """
+    from proposals.services.draft_cache import get_draft_cache
+
+    inputs = {
+        "owner_profile": owner_profile,
+        "author_name": author_name,
+        "author_contact": author_contact,
+        "student_group_profile": student_group_profile,
+    }
+    cache = get_draft_cache()
+    key = draft_cache_key(**inputs)
+    if use_cache:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    data = request_proposal_draft(**inputs)
+    cache.set(key, data, owner_user_id=owner_user_id, group_user_id=group_user_id)
+    return data
+
+def build_proposal_messages(
+    *,
+    owner_profile: dict,
+    author_name: str,
+    author_contact: str = "",
+    student_group_profile: dict | None = None,
+    today: date | None = None,
+) -> tuple[list, dict]:
+    """
+    OpenAI chat messages와 사전 계산 지표를 함께 반환
+    owner_profile: OwnerProfileForAISerializer(data).data 결과(dict)
+    응답(JSON)은 ProposalWriteSerializer의 입력 스키마와 1:1 매칭되도록 요청
+    """
+    # 숫자(이용자 수/매출/할인율/제휴 유형)는 서버에서 계산하고 GPT는 문장만 작성
+    metrics = compute_proposal_metrics(owner_profile, student_group_profile)
+
+    template = get_prompt_template()
+    dynamic = template.render_request(
+        today=today or timezone.localdate(),
+        owner_profile=owner_profile,
+        student_group_profile=student_group_profile,
+        author_name=author_name,
+        author_contact=author_contact,
+        metrics=metrics,
     )
+    messages = [
+        {"role": "system", "content": template.static_prefix},
+        {"role": "user", "content": "".join(text for _, text in dynamic)},
+    ]
+    return messages, metrics
 
-    content = resp.choices[0].message.content
-    data = json.loads(content)
+def prompt_token_report(messages: list) -> dict:
+    """구간별 토큰 수 — 정적 구간은 컴파일 시 계산한 값을 재사용"""
+    template = get_prompt_template()
+    report = dict(template.section_tokens)
+    report["static_total"] = sum(template.section_tokens.values())
+    report["dynamic_total"] = count_tokens(messages[1]["content"])
+    report["total"] = report["static_total"] + report["dynamic_total"]
+    return report
 
+def finalize_proposal_draft(data: dict, *, author_contact: str, metrics: dict) -> dict:
+    """GPT 응답(dict) 후처리"""
     # 사전 방어: 누락 키를 기본값으로 보정
     data.setdefault("contact_info", author_contact or "")
     data.setdefault("time_windows", [])
     data.setdefault("apply_target_other", "")
-    data.setdefault("partnership_type", [])
+    if not data.get("partnership_type"):
+        data["partnership_type"] = list(metrics["recommended_partnership_type"])
+
+    return data
+
+def request_proposal_draft(**inputs) -> dict:
+    """LLM을 호출해 제안서 초안 생성 (캐시 없이 항상 호출, 타임아웃/재시도/차단은 get_llm()이 적용)"""
+    messages, metrics = build_proposal_messages(**inputs)
+    data = json.loads(get_llm().complete(messages))
+    return finalize_proposal_draft(data, author_contact=inputs.get("author_contact", ""), metrics=metrics)
 
-    return data
\ No newline at end of file
+def stream_proposal_draft(messages: list):
+    """LLM 스트리밍 호출: 응답 JSON 텍스트 조각(delta)을 순서대로 yield"""
+    yield from get_llm().stream(messages)
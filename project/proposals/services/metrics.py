@@ -0,0 +1,147 @@
+from decimal import Decimal
+
+# 제안서 지표 사전 계산 (순수 파이썬, DB/외부 호출 없음)
+# - 프롬프트 규칙에 있던 계산식을 서버에서 결정적으로 계산해 GPT에는 결과만 전달
+# - 입력은 OwnerProfileForAISerializer / StudentGroupProfileForAISerializer 스냅샷(dict)
+
+# 잠재 제휴 이용자 수 = 0.52 * 업종별 선호도 * student_size
+VISIT_RATE = 0.52
+PREFERENCE_BY_BUSINESS_TYPE = {
+    "RESTAURANT": 0.23,
+    "CAFE": 0.21,
+    "BAR": 0.07,
+}
+# 기타 업종은 세 업종 선호도의 평균을 사용
+DEFAULT_PREFERENCE = round(sum(PREFERENCE_BY_BUSINESS_TYPE.values()) / len(PREFERENCE_BY_BUSINESS_TYPE), 2)
+
+# 스냅샷에 코드 대신 표시명이 들어와도 처리
+BUSINESS_TYPE_ALIASES = {"식당": "RESTAURANT", "음식점": "RESTAURANT", "카페": "CAFE", "주점": "BAR", "술집": "BAR", "기타": "OTHER"}
+
+# 할인율 범위 (%): 상한은 마진율 * 0.7과 20 중 작은 값, 하한은 5 (상한이 5보다 작으면 상한과 같음)
+DISCOUNT_MARGIN_FACTOR = 0.7
+DISCOUNT_CAP = 20
+DISCOUNT_FLOOR = 5
+
+# 제휴 유형 (출력 순서 고정)
+DISCOUNT, REVIEW, SERVICE, TIME = "할인형", "리뷰형", "서비스제공형", "타임형"
+PARTNERSHIP_TYPES = (DISCOUNT, REVIEW, SERVICE, TIME)
+
+
+def _business_type(owner_profile: dict) -> str:
+    value = (owner_profile.get("business_type") or "").strip()
+    return BUSINESS_TYPE_ALIASES.get(value, value.upper())
+
+
+def _number(value, default=0.0) -> float:
+    if value in (None, ""):
+        return default
+    try:
+        return float(Decimal(str(value)))
+    except (ArithmeticError, ValueError):
+        return default
+
+
+def has_time_ranges(value) -> bool:
+    """peak_time/off_peak_time 처럼 dict/list로 중첩된 시간대 JSON에 실제 시간대가 하나라도 있는지"""
+    if isinstance(value, str):
+        return bool(value.strip())
+    if isinstance(value, dict):
+        return any(has_time_ranges(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(has_time_ranges(v) for v in value)
+    return False
+
+
+def potential_users(business_type: str, student_size) -> int:
+    preference = PREFERENCE_BY_BUSINESS_TYPE.get(business_type, DEFAULT_PREFERENCE)
+    return int(round(VISIT_RATE * preference * int(student_size or 0)))
+
+
+def discount_range(margin_rate) -> tuple[float, float]:
+    """(하한, 상한) %, 상한은 마진율 * 0.7 (마진을 30% 이상 남김)이되 DISCOUNT_CAP을 넘지 않음"""
+    high = min(round(_number(margin_rate) * DISCOUNT_MARGIN_FACTOR, 1), DISCOUNT_CAP)
+    return (min(DISCOUNT_FLOOR, high), high)
+
+
+def score_partnership_types(business_type: str, margin_rate, has_off_peak: bool) -> dict:
+    """
+    제휴 유형별 가중치 점수
+    - 업종: 식당/카페 → 할인형·타임형, 주점 → 서비스제공형·리뷰형
+    - 마진율: 20% 이상 → 할인형, 15% 이하 → 서비스제공형·리뷰형
+    - 한산 시간대가 있으면 → 타임형
+    """
+    scores = dict.fromkeys(PARTNERSHIP_TYPES, 0)
+    if business_type in ("RESTAURANT", "CAFE"):
+        scores[DISCOUNT] += 1
+        scores[TIME] += 1
+    elif business_type == "BAR":
+        scores[SERVICE] += 1
+        scores[REVIEW] += 1
+
+    margin = _number(margin_rate)
+    if margin >= 20:
+        scores[DISCOUNT] += 1
+    elif margin <= 15:
+        scores[SERVICE] += 1
+        scores[REVIEW] += 1
+
+    if has_off_peak:
+        scores[TIME] += 1
+    return scores
+
+
+def recommend_partnership_types(scores: dict) -> list:
+    """최고 점수 유형들 (모두 0점이면 할인형)"""
+    top = max(scores.values())
+    if top <= 0:
+        return [DISCOUNT]
+    return [t for t in PARTNERSHIP_TYPES if scores[t] == top]
+
+
+def service_items(owner_profile: dict) -> list:
+    """서비스제공형에서 고를 수 있는 추가 제공 품목"""
+    items = []
+    if owner_profile.get("service_drink"):
+        items.append("음료")
+    if owner_profile.get("service_side_menu"):
+        items.append("사이드 메뉴")
+    if owner_profile.get("service_other") and owner_profile.get("service_other_detail"):
+        items.append(owner_profile["service_other_detail"])
+    return items
+
+
+def compute_proposal_metrics(owner_profile: dict, student_group_profile: dict | None = None) -> dict:
+    """
+    프롬프트에 넣을 사전 계산 지표
+    - potential_users: 잠재 제휴 이용자 수 (= 노출 건수)
+    - expected_revenue: 예상 추가 매출 (잠재 이용자 수 * 인당 평균 매출)
+    - discount_rate_min/max: 할인형일 때 허용 할인율 범위(%)
+    - partnership_type_scores / recommended_partnership_type
+    - expected_effects_phrases: expected_effects에 그대로 넣을 문구
+    """
+    owner_profile = owner_profile or {}
+    business_type = _business_type(owner_profile)
+    student_size = (student_group_profile or {}).get("student_size") or 0
+    margin_rate = owner_profile.get("margin_rate")
+
+    users = potential_users(business_type, student_size)
+    revenue = users * int(_number(owner_profile.get("average_sales")))
+    low, high = discount_range(margin_rate)
+    has_off_peak = has_time_ranges(owner_profile.get("off_peak_time"))
+    scores = score_partnership_types(business_type, margin_rate, has_off_peak)
+
+    return {
+        "potential_users": users,
+        "exposure_count": users,
+        "expected_revenue": revenue,
+        "discount_rate_min": low,
+        "discount_rate_max": high,
+        "partnership_type_scores": scores,
+        "recommended_partnership_type": recommend_partnership_types(scores),
+        "service_items": service_items(owner_profile),
+        "has_off_peak_time": has_off_peak,
+        "expected_effects_phrases": [
+            f"잠재 제휴 이용자 수 약 {users:,}명",
+            f"예상 추가 매출 약 {revenue:,}원",
+        ],
+    }
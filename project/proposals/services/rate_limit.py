@@ -0,0 +1,37 @@
+import time
+
+from django.core.cache import cache
+
+# 고정 윈도우 카운터 방식의 간단한 속도 제한
+# - Django 캐시(settings.CACHES["default"])에 카운터를 저장하므로
+#   Redis/Memcached 등 공유 캐시를 쓰면 프로세스/서버 간에도 제한이 공유됨
+
+
+class FixedWindowRateLimiter:
+    def __init__(self, prefix: str, limit: int, window: int):
+        self.prefix = prefix
+        self.limit = limit
+        self.window = window
+
+    def _key(self, ident) -> str:
+        bucket = int(time.time() // self.window)
+        return f"ratelimit:{self.prefix}:{ident}:{bucket}"
+
+    def allow(self, ident) -> bool:
+        """이번 윈도우에서 한 번 더 허용되면 True (허용 시 카운트 증가)"""
+        if self.limit <= 0:
+            return True
+        key = self._key(ident)
+        # add는 키가 없을 때만 성공 → 윈도우의 첫 요청
+        if cache.add(key, 1, timeout=self.window):
+            return True
+        try:
+            count = cache.incr(key)
+        except ValueError:
+            # 윈도우가 방금 만료된 경우
+            cache.add(key, 1, timeout=self.window)
+            return True
+        return count <= self.limit
+
+    def reset(self, ident):
+        cache.delete(self._key(ident))
@@ -0,0 +1,28 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from profiles.models import OwnerProfile, StudentGroupProfile, Menu
+from proposals.services.draft_cache import get_draft_cache
+
+
+# ---- 프로필 수정/삭제 시 해당 유저의 AI 초안 캐시 삭제 ----
+@receiver(post_save, sender=OwnerProfile)
+@receiver(post_delete, sender=OwnerProfile)
+@receiver(post_save, sender=StudentGroupProfile)
+@receiver(post_delete, sender=StudentGroupProfile)
+def invalidate_draft_cache_for_profile(sender, instance, **kwargs):
+    get_draft_cache().invalidate_user(instance.user_id)
+
+
+# 메뉴는 사장님 스냅샷(menus)에 포함됨
+@receiver(post_save, sender=Menu)
+@receiver(post_delete, sender=Menu)
+def invalidate_draft_cache_for_menu(sender, instance, **kwargs):
+    owner_user_id = (
+        OwnerProfile.objects
+        .filter(pk=instance.owner_profile_id)
+        .values_list("user_id", flat=True)
+        .first()
+    )
+    if owner_user_id is not None:
+        get_draft_cache().invalidate_user(owner_user_id)
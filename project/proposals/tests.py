@@ -1,3 +1,956 @@
-from django.test import TestCase
+import os
+import subprocess
+import sys
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.urls import reverse
+from django.test import TestCase, override_settings
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from accounts.models import User
+from accounts.services.counters import repair_counters
+from config import benchmark
+from config.testing import InlineExecutor, QueryBudgetMixin
+from .models import Proposal, ProposalStatus, ProposalDraftJob, AIDraftCacheEntry
+from .services.draft_jobs import reclaim_stale_draft_jobs, run_draft_job
+from .services.draft_cache import LocMemDraftCache, get_draft_cache
+from .services import llm, make_prompt
+from .services.metrics import compute_proposal_metrics, discount_range
+import json
+from profiles.models import OwnerProfile, StudentGroupProfile, Menu
+from datetime import date, timedelta
+from django.utils import timezone
+from django.core.cache import cache
+
+
+def make_proposal(author, recipient, **kwargs):
+    data = {"contact_info": "010-0000-0000", **kwargs}
+    return Proposal.objects.create(author=author, recipient=recipient, **data)
+
+
+class ProposalStatusTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = User.objects.create_user(
+            username="group", password="pass1234", email="group@example.com", user_role=User.Role.STUDENT_GROUP
+        )
+        cls.owner = User.objects.create_user(
+            username="owner", password="pass1234", email="owner@example.com", user_role=User.Role.OWNER
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+
+    # ---------- 생성 시 DRAFT 동기화 ----------
+    def test_create_sets_current_status_draft(self):
+        p = make_proposal(self.group, self.owner)
+        p.refresh_from_db()
+        self.assertEqual(p.current_status, ProposalStatus.Status.DRAFT)
+        self.assertIsNotNone(p.status_changed_at)
+        self.assertTrue(p.is_editable)
+
+    # ---------- 상태 변경 시 비정규화 컬럼 갱신 ----------
+    def test_change_status_updates_current_status(self):
+        p = make_proposal(self.group, self.owner)
+        p.change_status(ProposalStatus.Status.UNREAD, changed_by=self.group)
+        p.change_status(ProposalStatus.Status.READ, changed_by=self.owner)
+        self.assertEqual(p.current_status, ProposalStatus.Status.READ)
+
+        p.refresh_from_db()
+        self.assertEqual(p.current_status, ProposalStatus.Status.READ)
+        self.assertEqual(p.status_changed_at, p.status_history.latest("changed_at").changed_at)
+        self.assertFalse(p.is_editable)
+
+    # ---------- 일반 save()는 동시에 바뀐 상태를 되돌리지 않음 ----------
+    def test_stale_save_keeps_current_status(self):
+        p = make_proposal(self.group, self.owner)
+        stale = Proposal.objects.get(pk=p.pk)
+        p.change_status(ProposalStatus.Status.UNREAD, changed_by=self.group)
+
+        stale.benefit_description = "음료 1잔 무료"
+        stale.save()
+
+        stale.refresh_from_db()
+        self.assertEqual(stale.benefit_description, "음료 1잔 무료")
+        self.assertEqual(stale.current_status, ProposalStatus.Status.UNREAD)
+        self.assertEqual(stale.status_changed_at, p.status_changed_at)
+
+    # ---------- 일괄 생성: INSERT 후 pk를 못 받는 DB에서도 이력이 제 제안서에 붙음 ----------
+    def test_bulk_create_drafts_without_returning_rows(self):
+        existing = make_proposal(self.group, self.owner)
+        new = [Proposal(author=self.group, recipient=self.owner, contact_info="010-0000-0000") for _ in range(2)]
+        with mock.patch.object(type(connection.features), "can_return_rows_from_bulk_insert",
+                               new_callable=mock.PropertyMock, return_value=False):
+            Proposal.bulk_create_drafts(new)
+
+        self.assertEqual(len({existing.pk, *(p.pk for p in new)}), 3)
+        for p in [existing, *new]:
+            self.assertEqual(p.status_history.count(), 1)
+            p.refresh_from_db()
+            self.assertEqual(p.current_status, ProposalStatus.Status.DRAFT)
+            self.assertIsNotNone(p.status_changed_at)
+
+    # ---------- 잘못된 전이/주체는 거절되고 상태 유지 ----------
+    def test_invalid_transition_keeps_status(self):
+        p = make_proposal(self.group, self.owner)
+        with self.assertRaises(ValidationError):
+            p.change_status(ProposalStatus.Status.PARTNERSHIP, changed_by=self.owner)
+        with self.assertRaises(ValidationError):
+            # 초안 제출은 작성자만 가능
+            p.change_status(ProposalStatus.Status.UNREAD, changed_by=self.owner)
+
+        p.refresh_from_db()
+        self.assertEqual(p.current_status, ProposalStatus.Status.DRAFT)
+
+    # ---------- 상태 변경 API ----------
+    def test_status_action_returns_fresh_status(self):
+        p = make_proposal(self.group, self.owner)
+        self.client.force_authenticate(user=self.group)
+        url = reverse("proposal-change-status", args=[p.id])
+        resp = self.client.post(url, {"status": "UNREAD"}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data["current_status"], "UNREAD")
+        self.assertEqual(len(resp.data["status_history"]), 2)
+
+    # ---------- 목록 조회: 행 수와 무관한 쿼리 수 ----------
+    def test_list_query_count_is_constant(self):
+        self.client.force_authenticate(user=self.group)
+        url = reverse("proposal-list")
+
+        make_proposal(self.group, self.owner)
+        with CaptureQueriesContext(connection) as one:
+            self.client.get(url)
+
+        for _ in range(5):
+            make_proposal(self.group, self.owner)
+        with CaptureQueriesContext(connection) as many:
+            resp = self.client.get(url, {"status": "DRAFT"})
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(one), len(many))
+
+    # ---------- 백필 커맨드 ----------
+    def test_backfill_command_repairs_drift(self):
+        p = make_proposal(self.group, self.owner)
+        p.change_status(ProposalStatus.Status.UNREAD, changed_by=self.group)
+        Proposal.objects.filter(pk=p.pk).update(current_status=ProposalStatus.Status.DRAFT, status_changed_at=None)
+
+        call_command("backfill_proposal_status", batch_size=1, stdout=StringIO())
+
+        p.refresh_from_db()
+        self.assertEqual(p.current_status, ProposalStatus.Status.UNREAD)
+        self.assertIsNotNone(p.status_changed_at)
+
+    # ---------- 상세 조회: 조건부 GET ----------
+    def test_retrieve_conditional_get(self):
+        p = make_proposal(self.group, self.owner)
+        self.client.force_authenticate(user=self.group)
+        url = reverse("proposal-detail", args=[p.id])
+
+        resp = self.client.get(url)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        etag, last_modified = resp["ETag"], resp["Last-Modified"]
+
+        # 변경이 없으면 검증값 쿼리 한 번으로 본문 없이 304
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(resp.content, b"")
+        self.assertEqual(len(ctx), 1)
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304)
+
+        # 상태 이력이 늘면 검증값이 바뀜
+        p.change_status(ProposalStatus.Status.UNREAD, changed_by=self.group)
+        resp = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data["current_status"], "UNREAD")
+        self.assertNotEqual(resp["ETag"], etag)
+
+        # 수신자에게 보이지 않는 초안은 304가 아니라 404
+        draft = make_proposal(self.group, self.owner)
+        self.client.force_authenticate(user=self.owner)
+        resp = self.client.get(reverse("proposal-detail", args=[draft.id]), HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(resp.status_code, status.HTTP_404_NOT_FOUND)
+
+        # 숫자가 아닌 id도 500이 아니라 404
+        resp = self.client.get(reverse("proposal-detail", args=["abc"]))
+        self.assertEqual(resp.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ProposalQueryBudgetTests(QueryBudgetMixin, TestCase):
+    """제안서 목록/상세 쿼리 예산 — 제안서·상태 이력 수와 무관하게 일정해야 함 (N+1 방지)"""
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = User.objects.create_user(username="budget-group", password="pass1234", user_role=User.Role.STUDENT_GROUP)
+        cls.owner = User.objects.create_user(username="budget-owner", password="pass1234", user_role=User.Role.OWNER)
+        cls.proposals = []
+        for _ in range(6):
+            p = make_proposal(cls.group, cls.owner)
+            p.change_status(ProposalStatus.Status.UNREAD, changed_by=cls.group)
+            cls.proposals.append(p)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.group)
+
+    def test_endpoint_budgets(self):
+        group, owner = self.group.id, self.owner.id
+        # (URL 이름, args, 쿼리 파라미터, 예산)
+        budgets = [
+            ("proposal-list", [], {}, 2),
+            ("proposal-list", [], {"box": "sent", "status": "UNREAD"}, 2),
+            ("proposal-detail", [self.proposals[0].id], {}, 3),
+            ("proposal-sent-by-user", [group], {}, 2),
+            ("proposal-received-by-user", [owner], {}, 2),
+        ]
+        for name, args, params, budget in budgets:
+            with self.subTest(name, **params), self.assertQueryBudget(budget, max_duplicates=1):
+                resp = self.client.get(reverse(name, args=args), params)
+            self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
+
+# AI 호출/프로필 스냅샷은 테스트에서 고정값으로 대체
+AI_PATCH = "proposals.services.ai_draft."
+AI_RESULT = {
+    "expected_effects": "신규 고객 유입",
+    "partnership_type": ["할인형"],
+    "contact_info": "010-1111-2222",
+    "benefit_description": "전 메뉴 10% 할인",
+}
+
+
+@override_settings(AI_DRAFT_QUEUE_BACKEND="sync")
+@mock.patch(AI_PATCH + "get_student_group_profile_snapshot_by_user_id", return_value={})
+@mock.patch(AI_PATCH + "get_owner_profile_snapshot_by_user_id", return_value={})
+class ProposalDraftJobTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = User.objects.create_user(
+            username="group", password="pass1234", email="group@example.com", user_role=User.Role.STUDENT_GROUP
+        )
+        cls.owner = User.objects.create_user(
+            username="owner", password="pass1234", email="owner@example.com", user_role=User.Role.OWNER
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.group)
+        self.url = reverse("proposal-ai-draft") + "?mode=async"
+
+    # ---------- 비동기 등록 → 커밋 후 처리 → 상태 조회 ----------
+    def test_async_draft_job_done(self, *_):
+        with mock.patch(AI_PATCH + "generate_proposal_from_owner_profile", return_value=AI_RESULT) as gpt:
+            with self.captureOnCommitCallbacks(execute=True):
+                resp = self.client.post(self.url, {"recipient": self.owner.id}, format="json")
+                # 응답 시점에는 아직 GPT를 호출하지 않음
+                self.assertEqual(resp.status_code, status.HTTP_202_ACCEPTED)
+                self.assertEqual(resp.data["status"], ProposalDraftJob.Status.PENDING)
+                gpt.assert_not_called()
+        gpt.assert_called_once()
+
+        job_url = reverse("proposal-ai-draft-job", kwargs={"job_id": resp.data["job_id"]})
+        resp = self.client.get(job_url)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data["status"], ProposalDraftJob.Status.DONE)
+        self.assertEqual(resp.data["proposal"]["benefit_description"], "전 메뉴 10% 할인")
+        self.assertEqual(resp.data["proposal"]["author"]["id"], self.group.id)
+
+        # 다른 유저는 작업을 볼 수 없음
+        self.client.force_authenticate(user=self.owner)
+        self.assertEqual(self.client.get(job_url).status_code, status.HTTP_404_NOT_FOUND)
+
+        # UUID가 아닌 id는 404
+        for bad_id in ("abc", "abc-def"):
+            resp = self.client.get(f"{reverse('proposal-list')}ai-draft-jobs/{bad_id}/")
+            self.assertEqual(resp.status_code, status.HTTP_404_NOT_FOUND)
+
+    # ---------- GPT 실패 시 FAILED + 에러 기록 ----------
+    def test_async_draft_job_failed(self, *_):
+        with mock.patch(AI_PATCH + "generate_proposal_from_owner_profile", side_effect=RuntimeError("timeout")):
+            with self.captureOnCommitCallbacks(execute=True):
+                resp = self.client.post(self.url, {"recipient": self.owner.id}, format="json")
+
+        job = ProposalDraftJob.objects.get(pk=resp.data["job_id"])
+        self.assertEqual(job.status, ProposalDraftJob.Status.FAILED)
+        self.assertIn("timeout", job.error)
+        self.assertIsNone(job.proposal)
+        self.assertIsNotNone(job.finished_at)
+
+    # ---------- 잘못된 요청은 작업을 만들지 않음 ----------
+    def test_async_draft_invalid_recipient(self, *_):
+        resp = self.client.post(self.url, {"recipient": self.group.id}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ProposalDraftJob.objects.exists())
+
+    # ---------- 동기 모드는 기존처럼 201 + 제안서 ----------
+    def test_sync_draft_still_supported(self, *_):
+        with mock.patch(AI_PATCH + "generate_proposal_from_owner_profile", return_value=AI_RESULT):
+            resp = self.client.post(reverse("proposal-ai-draft"), {"recipient": self.owner.id}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(resp.data["current_status"], ProposalStatus.Status.DRAFT)
+
+    # ---------- db 백엔드: 워커 커맨드가 대기 작업 처리 ----------
+    @override_settings(AI_DRAFT_QUEUE_BACKEND="db")
+    def test_worker_command_processes_pending(self, *_):
+        with self.captureOnCommitCallbacks(execute=True):
+            resp = self.client.post(self.url, {"recipient": self.owner.id}, format="json")
+        self.assertEqual(ProposalDraftJob.objects.get(pk=resp.data["job_id"]).status, ProposalDraftJob.Status.PENDING)
+
+        # 테스트 트랜잭션 안에서 보이도록 스레드 풀 대신 현재 스레드에서 실행
+        cmd = "proposals.management.commands.run_draft_jobs."
+        with mock.patch(AI_PATCH + "generate_proposal_from_owner_profile", return_value=AI_RESULT), \
+                mock.patch(cmd + "get_executor", return_value=InlineExecutor()), \
+                mock.patch(cmd + "run_draft_job_in_worker", side_effect=run_draft_job):
+            call_command("run_draft_jobs", once=True, stdout=StringIO())
+
+        self.assertEqual(ProposalDraftJob.objects.get(pk=resp.data["job_id"]).status, ProposalDraftJob.Status.DONE)
+
+    # ---------- 죽은 워커가 남긴 RUNNING 작업 회수 ----------
+    @override_settings(AI_DRAFT_JOB_TIMEOUT=60, AI_DRAFT_JOB_MAX_ATTEMPTS=2)
+    def test_reclaim_stale_running_jobs(self, *_):
+        old = timezone.now() - timedelta(minutes=5)
+        running = dict(author=self.group, recipient=self.owner, direction=ProposalDraftJob.Direction.TO_OWNER,
+                       status=ProposalDraftJob.Status.RUNNING)
+        retry = ProposalDraftJob.objects.create(**running, started_at=old, attempts=1)
+        exhausted = ProposalDraftJob.objects.create(**running, started_at=old, attempts=2)
+        fresh = ProposalDraftJob.objects.create(**running, started_at=timezone.now(), attempts=1)
+
+        self.assertEqual(reclaim_stale_draft_jobs(), {"requeued": 1, "failed": 1})
+        retry.refresh_from_db()
+        exhausted.refresh_from_db()
+        fresh.refresh_from_db()
+        self.assertEqual((retry.status, retry.started_at), (ProposalDraftJob.Status.PENDING, None))
+        self.assertEqual(exhausted.status, ProposalDraftJob.Status.FAILED)
+        self.assertIn("시간 초과", exhausted.error)
+        self.assertEqual(fresh.status, ProposalDraftJob.Status.RUNNING)
+
+        # 되돌린 작업은 워커가 다시 처리 (시도 횟수 증가)
+        with mock.patch(AI_PATCH + "generate_proposal_from_owner_profile", return_value=AI_RESULT):
+            run_draft_job(retry.pk)
+        retry.refresh_from_db()
+        self.assertEqual((retry.status, retry.attempts), (ProposalDraftJob.Status.DONE, 2))
+
+    # ---------- 회수된 뒤 끝난 옛 선점은 결과를 덮어쓰지 않음 ----------
+    def test_expired_lease_does_not_overwrite(self, *_):
+        job = ProposalDraftJob.objects.create(
+            author=self.group, recipient=self.owner, direction=ProposalDraftJob.Direction.TO_OWNER,
+        )
+
+        def reclaimed_meanwhile(*args, **kwargs):
+            ProposalDraftJob.objects.filter(pk=job.pk).update(status=ProposalDraftJob.Status.PENDING, started_at=None)
+            return AI_RESULT
+
+        with mock.patch(AI_PATCH + "generate_proposal_from_owner_profile", side_effect=reclaimed_meanwhile):
+            run_draft_job(job.pk)
+        job.refresh_from_db()
+        self.assertEqual(job.status, ProposalDraftJob.Status.PENDING)
+
+
+# ---------- AI 초안 캐시 ----------
+DRAFT_INPUTS = {
+    "owner_profile": {"user": 1, "profile_name": "카페", "menus": [{"name": "아메리카노", "price": 4000}]},
+    "author_name": "group",
+    "author_contact": "010-0000-0000",
+    "student_group_profile": {"council_name": "학생회", "student_size": 1000},
+}
+
+
+class AIDraftCacheTests(TestCase):
+    def setUp(self):
+        get_draft_cache().clear()
+        patcher = mock.patch.object(make_prompt, "request_proposal_draft", side_effect=lambda **kw: dict(AI_RESULT))
+        self.gpt = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cache_key_is_stable_and_content_addressed(self):
+        reordered = {**DRAFT_INPUTS, "owner_profile": dict(reversed(list(DRAFT_INPUTS["owner_profile"].items())))}
+        self.assertEqual(make_prompt.draft_cache_key(**DRAFT_INPUTS), make_prompt.draft_cache_key(**reordered))
+
+        key = make_prompt.draft_cache_key(**DRAFT_INPUTS)
+        changed = {**DRAFT_INPUTS, "author_contact": "010-9999-9999"}
+        self.assertNotEqual(key, make_prompt.draft_cache_key(**changed))
+        # 프롬프트 버전이 바뀌면 같은 입력이라도 다른 키
+        with mock.patch.object(make_prompt, "PROMPT_VERSION", "test"):
+            self.assertNotEqual(key, make_prompt.draft_cache_key(**DRAFT_INPUTS))
+
+    def test_repeat_draft_hits_cache(self):
+        first = make_prompt.generate_proposal_from_owner_profile(**DRAFT_INPUTS)
+        first["benefit_description"] = "호출 측 수정"
+        second = make_prompt.generate_proposal_from_owner_profile(**DRAFT_INPUTS)
+
+        self.assertEqual(self.gpt.call_count, 1)
+        self.assertEqual(second["benefit_description"], AI_RESULT["benefit_description"])
+
+        # 스냅샷이 바뀌면 새로 호출
+        edited = {**DRAFT_INPUTS, "owner_profile": {**DRAFT_INPUTS["owner_profile"], "profile_name": "새 이름"}}
+        make_prompt.generate_proposal_from_owner_profile(**edited)
+        self.assertEqual(self.gpt.call_count, 2)
+
+    def test_memory_backend_lru_and_ttl(self):
+        cache = LocMemDraftCache(ttl=60, max_entries=2)
+        cache.set("a", {"v": 1})
+        cache.set("b", {"v": 2})
+        cache.get("a")            # a를 최근 사용으로
+        cache.set("c", {"v": 3})  # 가장 오래 안 쓰인 b 제거
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), {"v": 1})
+
+        with mock.patch("proposals.services.draft_cache.time.monotonic", return_value=10 ** 9):
+            self.assertIsNone(cache.get("a"))
+
+    @override_settings(AI_DRAFT_CACHE={"BACKEND": "db", "TTL": 60, "MAX_ENTRIES": 2})
+    def test_db_backend_hit_and_eviction(self):
+        for contact in ("1", "2", "3"):
+            make_prompt.generate_proposal_from_owner_profile(**{**DRAFT_INPUTS, "author_contact": contact})
+        self.assertEqual(AIDraftCacheEntry.objects.count(), 2)
+
+        make_prompt.generate_proposal_from_owner_profile(**{**DRAFT_INPUTS, "author_contact": "3"})
+        self.assertEqual(self.gpt.call_count, 3)
+
+    @override_settings(AI_DRAFT_CACHE={"BACKEND": "db", "TTL": 60, "MAX_ENTRIES": 10})
+    def test_profile_edit_invalidates_entries(self):
+        owner = User.objects.create_user(
+            username="owner", password="pass1234", email="owner@example.com", user_role=User.Role.OWNER
+        )
+        profile = OwnerProfile.objects.create(
+            user=owner, business_type="CAFE", profile_name="카페", average_sales=5000, margin_rate="30.00",
+        )
+        make_prompt.generate_proposal_from_owner_profile(**DRAFT_INPUTS, owner_user_id=owner.id, group_user_id=None)
+        self.assertTrue(AIDraftCacheEntry.objects.filter(owner_user_id=owner.id).exists())
+
+        profile.comment = "수정"
+        profile.save()
+        self.assertFalse(AIDraftCacheEntry.objects.filter(owner_user_id=owner.id).exists())
+
+
+# ---------- 제안서 지표 사전 계산 ----------
+class ProposalMetricsTests(TestCase):
+    def test_cafe_metrics_match_prompt_example(self):
+        owner = {
+            "business_type": "CAFE", "average_sales": 4500, "margin_rate": "45.00",
+            "off_peak_time": [{"주말": ["09:00-11:00"], "평일": ["15:00-17:00"]}],
+            "service_other": True, "service_other_detail": "사이즈 업 이벤트",
+        }
+        m = compute_proposal_metrics(owner, {"student_size": 1000})
+
+        self.assertEqual(m["potential_users"], 109)  # 0.52 * 0.21 * 1000
+        self.assertEqual(m["expected_revenue"], 109 * 4500)
+        # 마진율 * 0.7 = 31.5%지만 상한 20%를 넘지 않음
+        self.assertEqual((m["discount_rate_min"], m["discount_rate_max"]), (5, 20))
+        self.assertEqual(m["recommended_partnership_type"], ["할인형", "타임형"])
+        self.assertEqual(m["service_items"], ["사이즈 업 이벤트"])
+        self.assertEqual(m["expected_effects_phrases"], ["잠재 제휴 이용자 수 약 109명", "예상 추가 매출 약 490,500원"])
+
+    def test_low_margin_bar_prefers_service_and_review(self):
+        owner = {"business_type": "주점", "average_sales": 20000, "margin_rate": 10, "off_peak_time": {}}
+        m = compute_proposal_metrics(owner, {"student_size": 3000})
+
+        self.assertEqual(m["potential_users"], 109)  # 0.52 * 0.07 * 3000
+        self.assertEqual((m["discount_rate_min"], m["discount_rate_max"]), (5, 7))
+        self.assertEqual(m["recommended_partnership_type"], ["리뷰형", "서비스제공형"])
+        self.assertFalse(m["has_off_peak_time"])
+
+    def test_missing_student_group(self):
+        m = compute_proposal_metrics({"business_type": "OTHER", "average_sales": 5000, "margin_rate": 18})
+        self.assertEqual(m["potential_users"], 0)
+        self.assertEqual(m["expected_revenue"], 0)
+        self.assertEqual(m["recommended_partnership_type"], ["할인형"])
+
+    def test_discount_range_never_exceeds_cap_or_margin(self):
+        for margin, expected in [(None, (0, 0)), (4, (2.8, 2.8)), (10, (5, 7)), (28, (5, 19.6)), (90, (5, 20))]:
+            self.assertEqual(discount_range(margin), expected, margin)
+
+
+# ---------- SSE 스트리밍 초안 ----------
+def parse_sse(resp):
+    body = b"".join(resp.streaming_content).decode()
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def chunked(text, size=7):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+@mock.patch(AI_PATCH + "get_student_group_profile_snapshot_by_user_id", return_value={})
+@mock.patch(AI_PATCH + "get_owner_profile_snapshot_by_user_id", return_value={})
+class ProposalDraftStreamTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = User.objects.create_user(
+            username="group", password="pass1234", email="group@example.com", user_role=User.Role.STUDENT_GROUP
+        )
+        cls.owner = User.objects.create_user(
+            username="owner", password="pass1234", email="owner@example.com", user_role=User.Role.OWNER
+        )
+
+    def setUp(self):
+        get_draft_cache().clear()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.group)
+        self.url = reverse("proposal-ai-draft-stream")
+
+    def stream(self, ai_result):
+        chunks = chunked(json.dumps(ai_result, ensure_ascii=False))
+        with mock.patch(AI_PATCH + "stream_proposal_draft", return_value=iter(chunks)) as gpt:
+            resp = self.client.post(self.url, {"recipient": self.owner.id}, format="json")
+            self.assertEqual(resp["Content-Type"], "text/event-stream; charset=utf-8")
+            events = parse_sse(resp)
+        return events, gpt
+
+    def test_stream_pushes_fields_then_saves(self, *_):
+        events, gpt = self.stream(AI_RESULT)
+        kinds = [e for e, _ in events]
+
+        # 문자열 필드는 완성 전에 delta로 먼저 전달됨
+        self.assertLess(kinds.index("delta"), kinds.index("field"))
+        effects = "".join(d["text"] for e, d in events if e == "delta" and d["key"] == "expected_effects")
+        self.assertEqual(effects, AI_RESULT["expected_effects"])
+        fields = {d["key"]: d["value"] for e, d in events if e == "field"}
+        self.assertEqual(fields["partnership_type"], ["할인형"])
+
+        self.assertEqual(kinds[-1], "done")
+        proposal = Proposal.objects.get(pk=events[-1][1]["id"])
+        self.assertEqual(proposal.benefit_description, AI_RESULT["benefit_description"])
+
+        # 같은 입력을 다시 요청하면 캐시에서 바로 내보냄
+        events, gpt = self.stream(AI_RESULT)
+        gpt.assert_not_called()
+        self.assertEqual(events[-1][0], "done")
+
+    def test_stream_invalid_draft_is_not_saved(self, *_):
+        events, _ = self.stream({**AI_RESULT, "period_start": "2025-12-31", "period_end": "2025-01-01"})
+        self.assertEqual(events[-1][0], "error")
+        self.assertIn("period_end", events[-1][1]["errors"])
+        self.assertFalse(Proposal.objects.exists())
+
+    def test_stream_request_validation_before_stream(self, *_):
+        resp = self.client.post(self.url, {"recipient": self.group.id}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+        resp = self.client.post(self.url, {}, format="json", HTTP_ACCEPT="text/event-stream")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue(resp.content.startswith(b"event: error"))
+
+
+# ---------- AI 초안 일괄 생성 ----------
+BATCH_PATCH = "proposals.services.ai_draft_batch.generate_proposal_from_owner_profile"
+
+
+class ProposalDraftBatchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = User.objects.create_user(
+            username="group", password="pass1234", email="group@example.com", user_role=User.Role.STUDENT_GROUP
+        )
+        StudentGroupProfile.objects.create(
+            user=cls.group, position="회장", student_size=1000, contact="010-1234-5678",
+            term_start=date(2025, 3, 1), term_end=date(2026, 2, 28),
+            partnership_start=date(2025, 3, 1), partnership_end=date(2026, 2, 28),
+        )
+        cls.owners = []
+        for i in range(5):
+            owner = User.objects.create_user(
+                username=f"owner{i}", password="pass1234", email=f"owner{i}@example.com", user_role=User.Role.OWNER
+            )
+            profile = OwnerProfile.objects.create(
+                user=owner, business_type="CAFE", profile_name=f"카페{i}", average_sales=5000, margin_rate="30.00",
+            )
+            Menu.objects.create(owner_profile=profile, name="아메리카노", price=4000)
+            cls.owners.append(owner)
+        cls.no_profile_owner = User.objects.create_user(
+            username="owner-x", password="pass1234", email="ownerx@example.com", user_role=User.Role.OWNER
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.group)
+        self.url = reverse("proposal-ai-draft-batch")
+
+    def post(self, recipients, ai_result=AI_RESULT):
+        with mock.patch(BATCH_PATCH, side_effect=lambda **kw: dict(ai_result)) as gpt:
+            resp = self.client.post(self.url, {"recipients": recipients}, format="json")
+        return resp, gpt
+
+    def test_batch_creates_drafts_with_per_recipient_results(self):
+        ids = [o.id for o in self.owners[:2]] + [self.no_profile_owner.id, self.group.id, 999999]
+        resp, gpt = self.post(ids)
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual([r["recipient"] for r in resp.data], ids)
+        self.assertEqual([r["status"] for r in resp.data], ["CREATED", "CREATED", "FAILED", "FAILED", "FAILED"])
+        self.assertEqual(gpt.call_count, 2)
+
+        created = resp.data[0]["proposal"]
+        self.assertEqual(created["current_status"], ProposalStatus.Status.DRAFT)
+        self.assertEqual(len(created["status_history"]), 1)
+        self.assertEqual(created["contact_info"], AI_RESULT["contact_info"])
+
+        p = Proposal.objects.get(pk=created["id"])
+        self.assertEqual(p.status_changed_at, p.status_history.get().changed_at)
+        self.assertEqual(p.author, self.group)
+
+    def test_batch_query_count_independent_of_recipients(self):
+        with CaptureQueriesContext(connection) as two:
+            self.post([o.id for o in self.owners[:2]])
+        Proposal.objects.all().delete()
+        with CaptureQueriesContext(connection) as five:
+            resp, _ = self.post([o.id for o in self.owners])
+
+        self.assertEqual([r["status"] for r in resp.data], ["CREATED"] * 5)
+        self.assertEqual(len(two), len(five))
+
+    def test_invalid_drafts_are_reported_not_saved(self):
+        resp, _ = self.post([self.owners[0].id], {**AI_RESULT, "period_start": "2025-12-31", "period_end": "2025-01-01"})
+        self.assertEqual(resp.data[0]["status"], "FAILED")
+        self.assertIn("period_end", resp.data[0]["detail"])
+        self.assertFalse(Proposal.objects.exists())
+
+    @override_settings(AI_DRAFT_BATCH={"OWNER_RATE_LIMIT": 1, "OWNER_RATE_WINDOW": 60})
+    def test_per_owner_rate_limit(self):
+        owner = self.owners[0].id
+        self.post([owner])
+        resp, gpt = self.post([owner, self.owners[1].id])
+
+        self.assertEqual([r["status"] for r in resp.data], ["RATE_LIMITED", "CREATED"])
+        self.assertEqual(gpt.call_count, 1)
+
+    @override_settings(AI_DRAFT_BATCH={"MAX_RECIPIENTS": 2})
+    def test_request_validation(self):
+        resp, _ = self.post([o.id for o in self.owners[:3]])
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        resp, _ = self.post([])
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_owner_to_student_groups(self):
+        url = reverse("proposal-ai-draft-to-student-batch")
+        self.client.force_authenticate(user=self.owners[0])
+        with mock.patch(BATCH_PATCH, side_effect=lambda **kw: dict(AI_RESULT)):
+            resp = self.client.post(url, {"recipients": [self.group.id]}, format="json")
+        self.assertEqual(resp.data[0]["status"], "CREATED")
+
+        # 작성자 프로필이 없으면 전체 거절
+        self.client.force_authenticate(user=self.no_profile_owner)
+        resp = self.client.post(url, {"recipients": [self.group.id]}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+# ---------- 프롬프트 템플릿 ----------
+class PromptTemplateTests(TestCase):
+    inputs = {
+        "owner_profile": make_prompt.EXAMPLE_OWNER_INPUT,
+        "student_group_profile": make_prompt.EXAMPLE_STUDENT_GROUP_INPUT,
+        "author_name": "group",
+        "author_contact": "010-0000-0000",
+    }
+
+    def test_static_prefix_is_shared_and_dates_are_per_request(self):
+        first, _ = make_prompt.build_proposal_messages(**self.inputs, today=date(2025, 11, 3))
+        second, _ = make_prompt.build_proposal_messages(
+            **{**self.inputs, "author_contact": "010-9999-9999"}, today=date(2025, 11, 4),
+        )
+
+        # 정적 구간(system)은 요청과 무관하게 동일한 객체 → 프롬프트 캐시 적용
+        self.assertIs(first[0]["content"], second[0]["content"])
+        self.assertNotIn("2025-11-03", first[0]["content"])
+        self.assertIn("today: 2025-11-03", first[1]["content"])
+        self.assertIn("today: 2025-11-04", second[1]["content"])
+        self.assertIn("010-9999-9999", second[1]["content"])
+
+        # 같은 입력이라도 날짜가 바뀌면 캐시 키가 달라짐
+        self.assertNotEqual(
+            make_prompt.draft_cache_key(**self.inputs, today=date(2025, 11, 3)),
+            make_prompt.draft_cache_key(**self.inputs, today=date(2025, 11, 4)),
+        )
+
+    def test_token_report_per_section(self):
+        messages, _ = make_prompt.build_proposal_messages(**self.inputs)
+        report = make_prompt.prompt_token_report(messages)
+
+        for name in ("system_intro", "field_guide", "rules", "examples"):
+            self.assertGreater(report[name], 0)
+        self.assertEqual(report["total"], report["static_total"] + report["dynamic_total"])
+        # OpenAI 프롬프트 캐시는 1024 토큰 이상의 동일 prefix에만 적용됨
+        self.assertGreaterEqual(report["static_total"], 1024)
+
+    def test_benchmark_command(self):
+        out = StringIO()
+        call_command("benchmark_prompt", iterations=5, json=True, stdout=out)
+        result = json.loads(out.getvalue())
+        self.assertEqual(result["prompt_version"], make_prompt.PROMPT_VERSION)
+        self.assertIn("compiled_us_per_call", result)
+        self.assertGreater(result["tokens"]["total"], 0)
+
+
+# ---------- 지연 초기화 / import 시간 ----------
+# 프로세스 시작(django.setup + URLconf) 시 무거운 클라이언트 라이브러리를 불러오지 않아야 함
+IMPORT_TIME_BUDGET_US = 1_000_000
+LAZY_MODULES = ("openai", "boto3", "botocore", "storages.backends.s3boto3")
+
+
+class LazyInitTests(TestCase):
+    def test_startup_does_not_import_cloud_clients(self):
+        code = "import django; django.setup(); import config.urls"
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=settings.BASE_DIR, capture_output=True, text=True,
+            env={**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE},
+        )
+        self.assertEqual(proc.returncode, 0, proc.stderr[-2000:])
+
+        # "import time: self | cumulative | module" 형식
+        cumulative = {}
+        for line in proc.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[1].strip().isdigit():
+                cumulative[parts[2].strip()] = int(parts[1])
+        for name in LAZY_MODULES:
+            self.assertNotIn(name, cumulative)
+        self.assertLess(cumulative["config.urls"], IMPORT_TIME_BUDGET_US)
+
+    @override_settings(OPENAI_API_KEY=None)
+    def test_openai_client_requires_key_only_when_called(self):
+        messages, _ = make_prompt.build_proposal_messages(**PromptTemplateTests.inputs)
+        self.assertTrue(messages)
+        with self.assertRaises(ImproperlyConfigured):
+            llm.get_openai_client()
+
+    def test_openai_client_is_reused_per_key(self):
+        with override_settings(OPENAI_API_KEY="sk-test-1"):
+            first = llm.get_openai_client()
+            self.assertIs(first, llm.get_openai_client())
+        with override_settings(OPENAI_API_KEY="sk-test-2"):
+            self.assertIsNot(first, llm.get_openai_client())
+
+
+# ---------- LLM provider / 타임아웃 / 재시도 / 서킷 브레이커 ----------
+STUB_LLM = {"PROVIDER": "stub", "STUB_LATENCY": 0, "MAX_RETRIES": 0}
+
+
+class FlakyProvider(llm.BaseLLMProvider):
+    """앞의 failures번은 errors 순서대로 실패, 이후 성공"""
+    name = "flaky"
+
+    def __init__(self, *errors):
+        super().__init__("test")
+        self.errors = list(errors)
+        self.calls = 0
+
+    def complete(self, messages, *, timeout):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return json.dumps(AI_RESULT)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def resilient(provider, max_retries=2, breaker=None):
+    sleeps = []
+    client = llm.ResilientLLM(
+        provider, timeout=1, max_retries=max_retries, backoff_base=0.5, backoff_max=2,
+        breaker=breaker or llm.CircuitBreaker(threshold=10, reset_timeout=30), sleep=sleeps.append,
+    )
+    return client, sleeps
+
+
+class LLMProviderTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = User.objects.create_user(
+            username="group", password="pass1234", email="group@example.com", user_role=User.Role.STUDENT_GROUP
+        )
+        cls.owner = User.objects.create_user(
+            username="owner", password="pass1234", email="owner@example.com", user_role=User.Role.OWNER
+        )
+
+    def setUp(self):
+        get_draft_cache().clear()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.group)
+
+    @override_settings(AI_LLM=STUB_LLM, OPENAI_API_KEY=None)
+    def test_stub_provider_is_deterministic_and_drives_endpoints(self):
+        messages, _ = make_prompt.build_proposal_messages(**PromptTemplateTests.inputs)
+        provider = llm.get_llm().provider
+        self.assertEqual(provider.complete(messages, timeout=1), provider.complete(messages, timeout=1))
+        self.assertEqual("".join(provider.stream(messages, timeout=1)), provider.complete(messages, timeout=1))
+
+        # API 키 없이 동기/스트리밍 엔드포인트 전체 경로 실행
+        body = {"recipient": self.owner.id, "contact_info": "010-0000-0000"}
+        with mock.patch(AI_PATCH + "get_owner_profile_snapshot_by_user_id", return_value={}), \
+                mock.patch(AI_PATCH + "get_student_group_profile_snapshot_by_user_id", return_value={}):
+            resp = self.client.post(reverse("proposal-ai-draft"), body, format="json")
+            self.assertEqual(resp.status_code, status.HTTP_201_CREATED, resp.data)
+            self.assertIn("stub-", resp.data["benefit_description"])
+
+            get_draft_cache().clear()
+            resp = self.client.post(reverse("proposal-ai-draft-stream"), body, format="json")
+            self.assertEqual(parse_sse(resp)[-1][0], "done")
+        self.assertEqual(Proposal.objects.count(), 2)
+
+    def test_stub_latency_over_timeout_raises(self):
+        provider = llm.StubLLMProvider(latency=0.05)
+        with self.assertRaises(llm.LLMTimeout):
+            provider.complete([], timeout=0.01)
+
+    def test_retries_transient_errors_with_jittered_backoff(self):
+        provider = FlakyProvider(llm.LLMTimeout(), llm.LLMTransientError())
+        client, sleeps = resilient(provider)
+        self.assertEqual(json.loads(client.complete([])), AI_RESULT)
+        self.assertEqual(provider.calls, 3)
+        # full jitter: 0 ~ min(BACKOFF_MAX, BASE * 2^n)
+        self.assertEqual(len(sleeps), 2)
+        self.assertTrue(0 <= sleeps[0] <= 0.5 and 0 <= sleeps[1] <= 1.0)
+
+        # 재시도 한도를 넘기거나 재시도 대상이 아니면 그대로 실패
+        client, _ = resilient(FlakyProvider(*[llm.LLMTimeout()] * 3))
+        with self.assertRaises(llm.LLMTimeout):
+            client.complete([])
+        provider = FlakyProvider(llm.LLMError("bad request"))
+        client, sleeps = resilient(provider)
+        with self.assertRaises(llm.LLMError):
+            client.complete([])
+        self.assertEqual((provider.calls, sleeps), (1, []))
+
+    def test_circuit_breaker_opens_and_recovers(self):
+        clock = FakeClock()
+        breaker = llm.CircuitBreaker(threshold=2, reset_timeout=30, clock=clock)
+        provider = FlakyProvider(llm.LLMTimeout(), llm.LLMTimeout(), llm.LLMTimeout())
+        client, _ = resilient(provider, max_retries=0, breaker=breaker)
+
+        for _ in range(2):
+            with self.assertRaises(llm.LLMTimeout):
+                client.complete([])
+        self.assertEqual(breaker.state, breaker.OPEN)
+        # 차단 중에는 provider를 호출하지 않음
+        with self.assertRaises(llm.LLMUnavailable) as ctx:
+            client.complete([])
+        self.assertEqual(provider.calls, 2)
+        self.assertEqual(ctx.exception.retry_after, 31)
+
+        # reset_timeout 후 시험 호출 실패 → 다시 OPEN, 다음 시험 호출 성공 → CLOSED
+        clock.now = 30
+        with self.assertRaises(llm.LLMTimeout):
+            client.complete([])
+        self.assertEqual(breaker.state, breaker.OPEN)
+        clock.now = 60
+        client.complete([])
+        self.assertEqual(breaker.state, breaker.CLOSED)
+
+    def test_circuit_breaker_trial_released_on_unexpected_error(self):
+        clock = FakeClock()
+        breaker = llm.CircuitBreaker(threshold=1, reset_timeout=30, clock=clock)
+        provider = FlakyProvider(llm.LLMTimeout(), RuntimeError("bug"))
+        client, _ = resilient(provider, max_retries=0, breaker=breaker)
+
+        with self.assertRaises(llm.LLMTimeout):
+            client.complete([])
+        # HALF_OPEN 시험 호출이 LLMError가 아닌 예외로 끝나도 다음 시험 호출은 허용
+        clock.now = 30
+        with self.assertRaises(RuntimeError):
+            client.complete([])
+        self.assertEqual(breaker.state, breaker.HALF_OPEN)
+        client.complete([])
+        self.assertEqual(breaker.state, breaker.CLOSED)
+
+    @override_settings(AI_LLM={**STUB_LLM, "BREAKER_THRESHOLD": 1})
+    @mock.patch(AI_PATCH + "get_student_group_profile_snapshot_by_user_id", return_value={})
+    @mock.patch(AI_PATCH + "get_owner_profile_snapshot_by_user_id", return_value={})
+    def test_endpoint_maps_llm_errors(self, *_):
+        url = reverse("proposal-ai-draft")
+        provider = llm.get_llm().provider
+        with mock.patch.object(provider, "complete", side_effect=llm.LLMTimeout()):
+            resp = self.client.post(url, {"recipient": self.owner.id}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_504_GATEWAY_TIMEOUT)
+
+        # 서킷이 열린 뒤에는 즉시 503 + Retry-After
+        resp = self.client.post(url, {"recipient": self.owner.id}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertIn("Retry-After", resp)
+        self.assertFalse(Proposal.objects.exists())
+
+    def test_benchmark_command_with_stub(self):
+        out = StringIO()
+        call_command("benchmark_ai_draft", requests=6, concurrency=3, latency=0, json=True, stdout=out)
+        result = json.loads(out.getvalue())
+        self.assertEqual((result["provider"], result["requests"], result["errors"]), ("stub", 6, {}))
+        self.assertGreater(result["throughput_rps"], 0)
+
+
+# ---------- 합성 데이터 / 엔드포인트 벤치마크 ----------
+class SyntheticBenchmarkTests(TestCase):
+    def test_generate_synthetic_data(self):
+        out = StringIO()
+        call_command(
+            "generate_synthetic_data", owners=6, student_groups=3, students=8,
+            likes=40, recommendations=10, proposals=15, stdout=out,
+        )
+        self.assertIn("owner_profiles 6", out.getvalue())
+        self.assertEqual(OwnerProfile.objects.count(), 6)
+        self.assertEqual(StudentGroupProfile.objects.count(), 3)
+        self.assertEqual(User.objects.filter(user_role=User.Role.STUDENT).count(), 8)
+        # bulk_create 뒤에도 카운터/비정규화 상태가 실제 행과 맞음
+        self.assertEqual(repair_counters(dry_run=True)["fixed"], 0)
+        self.assertGreater(Proposal.objects.count(), 0)
+        for p in Proposal.objects.prefetch_related("status_history"):
+            history = sorted(p.status_history.all(), key=lambda h: h.id)
+            self.assertEqual(history[0].status, ProposalStatus.Status.DRAFT)
+            self.assertEqual(p.current_status, history[-1].status)
+            self.assertIsNotNone(p.status_changed_at)
+
+    def test_benchmark_covers_every_endpoint(self):
+        out = StringIO()
+        path = os.path.join(self.enterContext(tempfile.TemporaryDirectory()), "bench.json")
+        call_command("benchmark_endpoints", scale=0.05, repeat=2, warmup=0, output=path, stdout=out)
+
+        with open(path) as f:
+            report = json.load(f)
+        self.assertEqual(report["uncovered"], [])
+        for name, result in report["results"].items():
+            self.assertTrue(all(code.startswith("2") for code in result["status"]), (name, result["status"]))
+            self.assertGreater(result["latency_ms"]["p50"], 0)
+        self.assertEqual(report["results"]["GET user-relation-states"]["queries"], 1)
+        # 측정 데이터는 롤백됨
+        self.assertFalse(User.objects.exists())
+
+        # 쿼리 수가 늘었으면 regression → 종료 코드 1
+        name = "GET proposal-list"
+        report["results"][name]["queries"] -= 1
+        with open(path, "w") as f:
+            json.dump(report, f)
+        with self.assertRaises(CommandError):
+            call_command(
+                "benchmark_endpoints", scale=0.05, repeat=1, warmup=0, only=[name], baseline=path, stdout=out,
+            )
+        self.assertIn(f"{name}: queries", out.getvalue())
+
+    def test_compare_ignores_small_latency_noise(self):
+        def result(p50, queries=3, memory=100.0):
+            return {"latency_ms": {"p50": p50, "p95": p50}, "queries": queries, "peak_memory_kib": memory}
+
+        baseline = {"a": result(1.0), "b": result(10.0), "c": result(10.0), "gone": result(1.0)}
+        current = {"a": result(2.5), "b": result(20.0), "c": result(10.0, queries=4, memory=400.0), "new": result(99)}
+        regressions = {(r["scenario"], r["metric"]) for r in benchmark.compare(current, baseline, threshold=0.2)}
+        self.assertEqual(regressions, {
+            ("b", "latency_ms.p50"), ("b", "latency_ms.p95"), ("c", "queries"), ("c", "peak_memory_kib"),
+        })
 
-# Create your tests here.
@@ -1,27 +1,41 @@
+import logging
+
 from django.shortcuts import render
-from django.db.models import Q, OuterRef, Subquery, Value
+from django.http import StreamingHttpResponse
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Count, Max, Q, Prefetch
 from rest_framework import viewsets, permissions, filters, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.renderers import JSONRenderer
+from rest_framework.exceptions import ValidationError as DRFValidationError
 
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
-from .models import Proposal, ProposalStatus
+from rest_framework.reverse import reverse
+
+from config.conditional import conditional_get, make_etag
+
+from .models import Proposal, ProposalStatus, ProposalDraftJob
+from .renderers import EventStreamRenderer, sse_event
 from .serializers import (
     ProposalReadSerializer,
     ProposalWriteSerializer,
     ProposalStatusChangeSerializer,
     ProposalSentListSerializer,
-    ProposalReceivedListSerializer
+    ProposalReceivedListSerializer,
+    ProposalDraftJobSerializer,
+    ProposalAIDraftBatchRequestSerializer,
+    ProposalAIDraftBatchResultSerializer,
 )
 
 # GPT를 이용한 제안서 생성 서비스
-from profiles.serializers import OwnerProfileForAISerializer
-from proposals.services.get_info import get_owner_profile_snapshot_by_user_id, get_student_group_profile_snapshot_by_user_id
-from proposals.services.make_prompt import generate_proposal_from_owner_profile
+from proposals.services.ai_draft import DraftRequestError, prepare_ai_draft, generate_ai_draft, stream_ai_draft
+from proposals.services.ai_draft_batch import generate_ai_drafts_batch
+from proposals.services.draft_jobs import enqueue_draft_job
+from proposals.services.llm import LLMError, LLMUnavailable
 from accounts.models import User
-from profiles.models import OwnerProfile, StudentGroupProfile
 
 # 필요한 view 목록
 '''
@@ -34,6 +48,8 @@ from profiles.models import OwnerProfile, StudentGroupProfile
 7. 제안서 검색 (제안서 제목, 작성자, 작성일 등을 기준으로 검색할 수 있는 기능)
 '''
 
+logger = logging.getLogger(__name__)
+
 
 # --- 객체 단위 권한: 작성자 또는 수신자만 접근 ---
 class IsAuthorOrRecipient(permissions.BasePermission):
@@ -42,6 +58,52 @@ class IsAuthorOrRecipient(permissions.BasePermission):
         return u.is_authenticated and (u == obj.author or u == obj.recipient)
 
 
+# --- AI 초안 비동기 모드 문서화 ---
+AI_DRAFT_MODE_PARAM = openapi.Parameter(
+    "mode", openapi.IN_QUERY, type=openapi.TYPE_STRING, enum=["async"], required=False,
+    description="async 지정 시 작업만 등록하고 즉시 202 반환 (GPT 호출은 백그라운드에서 처리)",
+)
+AI_DRAFT_ACCEPTED_RESPONSE = openapi.Response(
+    "비동기 작업 등록됨 (?mode=async)",
+    examples={"application/json": {
+        "job_id": "6f1c2d3e-0000-0000-0000-000000000000",
+        "status": "PENDING",
+        "status_url": "/proposals/ai-draft-jobs/6f1c2d3e-0000-0000-0000-000000000000/",
+    }},
+)
+
+AI_DRAFT_REQUEST_BODY = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    required=["recipient"],
+    properties={
+        "recipient": openapi.Schema(type=openapi.TYPE_INTEGER, description="수신자(User.id)"),
+        "contact_info": openapi.Schema(type=openapi.TYPE_STRING, description="작성자 연락처(선택; 미지정 시 작성자 프로필의 연락처를 사용)"),
+    }
+)
+AI_DRAFT_STREAM_DESCRIPTION = (
+    "응답은 text/event-stream 입니다. 이벤트 종류:\n"
+    "- delta: {key, text} — 작성 중인 문자열 필드에 이어 붙일 텍스트\n"
+    "- field: {key, value} — 값이 완성된 필드\n"
+    "- done: 저장된 제안서(ProposalRead 형식) — 마지막 이벤트\n"
+    "- error: {detail, errors?} — 생성/검증 실패 (제안서는 저장되지 않음)\n"
+    "요청 검증 실패(수신자 없음/역할 불일치 등)는 스트림 시작 전 4xx로 반환됩니다."
+)
+AI_DRAFT_BATCH_DESCRIPTION = (
+    "recipients의 각 수신자에게 보낼 AI 초안을 병렬로 생성해 한 번에 저장합니다.\n"
+    "- 결과는 요청 순서대로 수신자별 status(CREATED / FAILED / RATE_LIMITED)와 제안서 또는 실패 사유를 담습니다.\n"
+    "- 같은 사장님 프로필로 만드는 초안 수는 시간당 제한됩니다.\n"
+    "- 작성자 프로필이 없거나 recipients가 비었거나 너무 많으면 400을 반환합니다."
+)
+AI_DRAFT_STREAM_RESPONSE = openapi.Response(
+    "SSE 스트림",
+    examples={"text/event-stream": (
+        'event: delta\ndata: {"key": "expected_effects", "text": "잠재 제휴 이용자 수"}\n\n'
+        'event: field\ndata: {"key": "partnership_type", "value": ["할인형"]}\n\n'
+        'event: done\ndata: {"id": 123, ...}\n\n'
+    )},
+)
+
+
 class ProposalViewSet(viewsets.ModelViewSet):
     """
     목록/상세/생성/수정/삭제 + 상태변경 액션 제공
@@ -65,18 +127,15 @@ class ProposalViewSet(viewsets.ModelViewSet):
         user = self.request.user
 
         # 내가 보낸/받은 것만 기본 표시 (관리자는 전체 허용)
+        # 상태 이력은 변경자까지 한 번에 prefetch (행마다 추가 쿼리 방지)
         qs = Proposal.objects.select_related("author", "recipient") \
-                             .prefetch_related("status_history")
+                             .prefetch_related(Prefetch(
+                                 "status_history",
+                                 queryset=ProposalStatus.objects.select_related("changed_by"),
+                             ))
         # if not user.is_staff:
         #     qs = qs.filter(Q(author=user) | Q(recipient=user))
 
-        # 최신 상태를 annotation (status 필터에 사용)
-        latest_status_subq = ProposalStatus.objects.filter(
-            proposal=OuterRef("pk")
-        ).order_by("-changed_at").values("status")[:1]
-        # 이력이 없으면 DRAFT로 간주 (2025/08/23)
-        qs = qs.annotate(latest_status=Subquery(latest_status_subq))
-
         # box 필터: inbox/sent/all (기본 all=양쪽)
         box = self.request.query_params.get("box", "all")
         if box == "inbox":
@@ -84,10 +143,10 @@ class ProposalViewSet(viewsets.ModelViewSet):
         elif box == "sent":
             qs = qs.filter(author=user)
 
-        # 상태 필터 (현재 상태 기준)
+        # 상태 필터 (비정규화된 현재 상태 컬럼 기준)
         status_param = self.request.query_params.get("status")
         if status_param:
-            qs = qs.filter(latest_status=status_param)
+            qs = qs.filter(current_status=status_param)
 
         # 생성일 범위 필터 (YYYY-MM-DD)
         date_from = self.request.query_params.get("date_from")
@@ -99,7 +158,7 @@ class ProposalViewSet(viewsets.ModelViewSet):
 
         # 수신자는 상대방의 DRAFT를 볼 수 없어야 함 (2025/08/23)
         if not user.is_staff:
-            qs = qs.exclude(Q(recipient=user) & Q(latest_status=ProposalStatus.Status.DRAFT))
+            qs = qs.exclude(Q(recipient=user) & Q(current_status=ProposalStatus.Status.DRAFT))
 
         return qs
 
@@ -153,13 +212,14 @@ class ProposalViewSet(viewsets.ModelViewSet):
         )
         ser.is_valid(raise_exception=True)
         ser.save()
-        # 변경 후 최신 상태를 포함한 상세 반환
+        # 변경 후 최신 상태/이력을 포함한 상세 반환 (prefetch된 이력 캐시를 새로 읽음)
+        proposal = self.get_object()
         return Response(ProposalReadSerializer(proposal, context={"request": request}).data)
 
     # ---- Swagger 문서화(목록/상세/생성/수정) ----
     @swagger_auto_schema(
         operation_summary="제안서 목록 조회",
-        operation_description="내가 보낸/받은 제안서를 최신 생성순으로 반환합니다.",
+        operation_description="내가 보낸/받은 제안서를 최신 생성순 커서 페이지로 반환합니다.",
         manual_parameters=[
             openapi.Parameter("box", openapi.IN_QUERY, type=openapi.TYPE_STRING,
                               enum=["all", "inbox", "sent"],
@@ -182,11 +242,30 @@ class ProposalViewSet(viewsets.ModelViewSet):
 
     @swagger_auto_schema(
         operation_summary="제안서 상세 조회",
-        responses={200: ProposalReadSerializer},
+        operation_description="ETag/Last-Modified가 같으면(If-None-Match/If-Modified-Since) 본문 없이 304를 반환합니다.",
+        responses={200: ProposalReadSerializer, 304: "변경 없음"},
         tags=["Proposals"],
     )
     def retrieve(self, request, *args, **kwargs):
-        return super().retrieve(request, *args, **kwargs)
+        # 검증값: 제안서 modified_at + 비정규화된 현재 상태/변경 시각 + 상태 이력 꼬리(개수, 마지막 id)
+        # (같은 조회 범위 조건으로 한 쿼리, 작성자/수신자/이력 행은 읽지 않음)
+        try:
+            row = (
+                self.get_queryset().prefetch_related(None)
+                .filter(pk=kwargs[self.lookup_field])
+                .annotate(history_count=Count("status_history"), history_last=Max("status_history__id"))
+                .values_list("pk", "modified_at", "current_status", "status_changed_at", "history_count", "history_last")
+                .first()
+            )
+        except (TypeError, ValueError, DjangoValidationError):
+            row = None  # 숫자가 아닌 id 등 (get_object_or_404와 같은 처리)
+        if row is None:
+            return super().retrieve(request, *args, **kwargs)  # 404
+        last_modified = max(t for t in (row[1], row[3]) if t)
+        return conditional_get(
+            request, make_etag(*row), last_modified,
+            lambda: super(ProposalViewSet, self).retrieve(request, *args, **kwargs),
+        )
 
     @swagger_auto_schema(
         operation_summary="제안서 생성",
@@ -243,7 +322,8 @@ class ProposalViewSet(viewsets.ModelViewSet):
                 "contact_info": openapi.Schema(type=openapi.TYPE_STRING, description="작성자 연락처(선택; 미지정 시 학생 프로필의 연락처를 사용)"),
             }
         ),
-        responses={201: ProposalReadSerializer()},
+        manual_parameters=[AI_DRAFT_MODE_PARAM],
+        responses={201: ProposalReadSerializer(), 202: AI_DRAFT_ACCEPTED_RESPONSE},
         security=[{"Bearer": []}],
     )
     @action(detail=False, methods=['post'], url_path='ai-draft')
@@ -251,69 +331,9 @@ class ProposalViewSet(viewsets.ModelViewSet):
         """
         - request.user: 작성자(학생단체)
         - recipient: 사장님(User.id) — 이 사장님의 OwnerProfile을 읽어 제안서 초안 생성
+        - ?mode=async: 작업만 등록하고 202 + job_id 반환 (결과는 ai-draft-jobs/{job_id}/ 로 조회)
         """
-        recipient_id = request.data.get("recipient")
-        if not recipient_id:
-            return Response({"detail": "recipient는 필수입니다."}, status=400)
-
-        # 수신자 존재/역할 체크
-        try:
-            recipient = User.objects.get(pk=recipient_id)
-        except User.DoesNotExist:
-            return Response({"detail": "수신자(유저)가 존재하지 않습니다."}, status=404)
-
-        # 여기선 '사장님 프로필 기반'이므로 수신자가 OWNER인지 확인
-        if recipient.user_role != User.Role.OWNER:
-            return Response({"detail": "수신자는 사장님(OWNER)이어야 합니다."}, status=400)
-
-        # 사장님 프로필 스냅샷 추출
-        try:
-            profile_dict = get_owner_profile_snapshot_by_user_id(recipient_id)
-        except OwnerProfile.DoesNotExist:
-            return Response({"detail": "수신자 사장님의 프로필이 없습니다."}, status=400)
-
-        # 작성자(학생단체) 프로필 스냅샷 (필요 시 GPT에 보조정보로 제공)
-        student_profile_dict = None
-        try:
-            student_profile_dict = get_student_group_profile_snapshot_by_user_id(request.user.id, request=request)  # ✅ 작성자(학생회)
-        except StudentGroupProfile.DoesNotExist:
-            return Response({"detail": "학생회의 프로필이 없습니다."}, status=400)
-        
-        # 작성자의 정보에서 author_contact를 profiles에서 id랑 매칭 후 가져와야함.
-        # 작성자 정보 (작성자는 여기선 학생단체임)
-        author = request.user
-        author_name = author.username or (author.email or "")
-
-        # 2025/08/22 코드 추가 내용 (학생회 프로필에서 값을 가져와 author_contact에 할당)
-        body_contact = (request.data.get("contact_info") or "").strip()
-        if body_contact: # 프론트에서 body에 값이 있다면 그것을 사용
-            author_contact = body_contact
-        else: # 프론트에서 body 값이 없다면 학생 프로필 모델의 contact 필드의 값을 가져옴
-            author_contact = (
-                StudentGroupProfile.objects
-                .filter(user=author)
-                .values_list("contact", flat=True)
-                .first()
-            ) or ""
-                
-        # GPT 호출 → 초안(JSON)
-        ai_dict = generate_proposal_from_owner_profile(
-            owner_profile=profile_dict,
-            author_name=author_name,
-            author_contact=author_contact,
-            student_group_profile=student_profile_dict
-        )
-
-        # 서버에서 recipient 주입 후, 표준 WriteSerializer로 검증/생성
-        ai_dict["recipient"] = recipient_id
-        serializer = ProposalWriteSerializer(data=ai_dict, context={"request": request})
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
-
-        return Response(
-            ProposalReadSerializer(serializer.instance, context={"request": request}).data,
-            status=status.HTTP_201_CREATED
-        )
+        return self._ai_draft_response(request, ProposalDraftJob.Direction.TO_OWNER)
         
     @swagger_auto_schema(
     method='post',
@@ -342,6 +362,7 @@ class ProposalViewSet(viewsets.ModelViewSet):
             "contact_info": "010-xxxx-xxxx 혹은 비어있는 string"
         }
     ),
+    manual_parameters=[AI_DRAFT_MODE_PARAM],
     responses={
         201: openapi.Response(
             "AI가 생성한 제안서 예시",
@@ -357,6 +378,7 @@ class ProposalViewSet(viewsets.ModelViewSet):
                 }
             }
         ),
+        202: AI_DRAFT_ACCEPTED_RESPONSE,
         400: openapi.Response(
             description="필수 파라미터 누락, 역할 불일치, 프로필 없음 등",
             examples={"application/json": {"detail": "recipient는 필수입니다."}}
@@ -379,70 +401,166 @@ class ProposalViewSet(viewsets.ModelViewSet):
         - request.user: 작성자(사장님) - 작성자가 사장님이지만 제안서의 input으로 들어가는 데이터는 사장님의 프로필이다.
         - recipient: 학생단체(User.id)
         - AI 입력은 '작성자(사장님)의 OwnerProfile' 스냅샷을 사용
+        - ?mode=async: 작업만 등록하고 202 + job_id 반환 (결과는 ai-draft-jobs/{job_id}/ 로 조회)
         """
-        recipient_id = request.data.get("recipient")
-        if not recipient_id:
-            return Response({"detail": "recipient는 필수입니다."}, status=400)
+        return self._ai_draft_response(request, ProposalDraftJob.Direction.TO_STUDENT_GROUP)
 
-        # 수신자 존재/역할 체크
+    def _ai_draft_response(self, request, direction):
+        """AI 초안 공통 처리: 동기(201 + 제안서) 또는 비동기(202 + 작업) 응답"""
+        recipient_id = request.data.get("recipient")
+        contact_info = request.data.get("contact_info") or ""
         try:
-            recipient = User.objects.get(pk=recipient_id)
-        except User.DoesNotExist:
-            return Response({"detail": "수신자(유저)가 존재하지 않습니다."}, status=404)
+            # 요청 검증은 동기 모드와 동일하게 즉시 수행 (잘못된 요청은 작업으로 만들지 않음)
+            if request.query_params.get("mode") == "async":
+                prepare_ai_draft(request.user, recipient_id, direction, contact_info, request=request)
+                job = enqueue_draft_job(request.user, recipient_id, direction, contact_info)
+                return Response(
+                    {
+                        "job_id": str(job.id),
+                        "status": job.status,
+                        "status_url": reverse("proposal-ai-draft-job", kwargs={"job_id": job.id}, request=request),
+                    },
+                    status=status.HTTP_202_ACCEPTED,
+                )
+            proposal = generate_ai_draft(request.user, recipient_id, direction, contact_info, request=request)
+        except DraftRequestError as e:
+            return Response({"detail": e.detail}, status=e.status_code)
+        except LLMError as e:
+            return self._llm_error_response(e)
 
-        # 학생단체 역할 확인 (❗ STUDENT_GROUP 이 맞습니다)
-        if recipient.user_role != User.Role.STUDENT_GROUP:
-            return Response({"detail": "수신자는 학생단체(STUDENT_GROUP)이어야 합니다."}, status=400)
+        return Response(
+            ProposalReadSerializer(proposal, context={"request": request}).data,
+            status=status.HTTP_201_CREATED
+        )
 
-        # 작성자(사장님)의 OwnerProfile 스냅샷 추출 (수신자 아님!)
-        author = request.user
-        try:
-            profile_dict = get_owner_profile_snapshot_by_user_id(author.id)
-        except OwnerProfile.DoesNotExist:
-            return Response({"detail": "작성자(사장님)의 프로필이 없습니다."}, status=400)
+    @staticmethod
+    def _llm_error_response(e):
+        """LLM 호출 실패: 타임아웃 504 / 차단(서킷 OPEN) 503 + Retry-After / 그 외 502"""
+        response = Response({"detail": e.detail}, status=e.status_code)
+        if isinstance(e, LLMUnavailable) and e.retry_after:
+            response["Retry-After"] = str(e.retry_after)
+        return response
+
+    @swagger_auto_schema(
+        method='get',
+        operation_summary="(AI) 제안서 초안 생성 작업 상태 조회",
+        operation_description="ai-draft(?mode=async)로 등록한 작업의 상태를 반환합니다. 완료(DONE)되면 생성된 제안서가 함께 반환됩니다.",
+        responses={200: ProposalDraftJobSerializer, 404: "작업 없음"},
+        tags=["Proposals"],
+        security=[{"Bearer": []}],
+    )
+    @action(detail=False, methods=["get"], url_path=r"ai-draft-jobs/(?P<job_id>[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})",
+            url_name="ai-draft-job", permission_classes=[permissions.IsAuthenticated])
+    def ai_draft_job(self, request, job_id=None):
+        # 작업을 요청한 본인만 조회 가능
+        job = ProposalDraftJob.objects.select_related("proposal").filter(pk=job_id, author=request.user).first()
+        if job is None:
+            return Response({"detail": "작업이 존재하지 않습니다."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(ProposalDraftJobSerializer(job, context={"request": request}).data)
+
+    # --- 일괄 생성: 여러 수신자에게 보낼 초안을 병렬 생성 ---
+    @swagger_auto_schema(
+        method='post',
+        operation_summary="(AI) 학생 단체 -> 여러 사장님 제안서 일괄 생성",
+        operation_description=AI_DRAFT_BATCH_DESCRIPTION,
+        request_body=ProposalAIDraftBatchRequestSerializer,
+        responses={200: ProposalAIDraftBatchResultSerializer(many=True)},
+        tags=["Proposals"],
+        security=[{"Bearer": []}],
+    )
+    @action(detail=False, methods=['post'], url_path='ai-draft/batch', url_name='ai-draft-batch')
+    def ai_draft_batch(self, request):
+        return self._ai_draft_batch_response(request, ProposalDraftJob.Direction.TO_OWNER)
 
-        # 학생회의 StudentGroupProfile 스냅샷 (필요 시 GPT에 보조정보로 제공)
-        student_profile_dict = None
+    @swagger_auto_schema(
+        method='post',
+        operation_summary="(AI) 사장님 → 여러 학생단체 제안서 일괄 생성",
+        operation_description=AI_DRAFT_BATCH_DESCRIPTION,
+        request_body=ProposalAIDraftBatchRequestSerializer,
+        responses={200: ProposalAIDraftBatchResultSerializer(many=True)},
+        tags=["Proposals"],
+        security=[{"Bearer": []}],
+    )
+    @action(detail=False, methods=['post'], url_path='ai-draft-to-student/batch', url_name='ai-draft-to-student-batch')
+    def ai_draft_to_student_batch(self, request):
+        return self._ai_draft_batch_response(request, ProposalDraftJob.Direction.TO_STUDENT_GROUP)
+
+    def _ai_draft_batch_response(self, request, direction):
+        body = ProposalAIDraftBatchRequestSerializer(data=request.data)
+        body.is_valid(raise_exception=True)
         try:
-            student_profile_dict = get_student_group_profile_snapshot_by_user_id(recipient_id, request=request)  # ✅ 수신자(학생회)
-        except StudentGroupProfile.DoesNotExist:
-            return Response({"detail": "학생회의 프로필이 없습니다."}, status=400)
-
-
-        # 작성자 정보
-        # 사장 프로필의 contact을 사용하는 것이 나음 -> 수정을 해야 함 (2025/08/22)
-        author = request.user
-        author_name = author.username or (author.email or "")
-
-        body_contact = (request.data.get("contact_info") or "").strip()
-        if body_contact: # 프론트에서 body에 값이 있다면 그것을 사용
-            author_contact = body_contact
-        else: # 프론트에서 body 값이 없다면 사장님 프로필 모델의 contact 필드의 값을 가져옴
-            author_contact = (
-                OwnerProfile.objects
-                .filter(user=author)
-                .values_list("contact", flat=True)
-                .first()
-            ) or ""
-
-        # GPT 호출 → 초안(JSON)
-        ai_dict = generate_proposal_from_owner_profile(
-            owner_profile=profile_dict,
-            author_name=author_name,
-            author_contact=author_contact,
-            student_group_profile=student_profile_dict,
-        )
+            results = generate_ai_drafts_batch(
+                request.user, body.validated_data["recipients"], direction,
+                body.validated_data["contact_info"], request=request,
+            )
+        except DraftRequestError as e:
+            return Response({"detail": e.detail}, status=e.status_code)
+
+        # 생성된 제안서는 목록 조회와 같은 고정 쿼리로 다시 읽어 직렬화
+        created_ids = [r["proposal"].pk for r in results if r["proposal"] is not None]
+        proposals = self.get_queryset().in_bulk(created_ids)
+        for r in results:
+            if r["proposal"] is not None:
+                r["proposal"] = proposals[r["proposal"].pk]
+        return Response(ProposalAIDraftBatchResultSerializer(results, many=True, context={"request": request}).data)
+
+    # --- 스트리밍(SSE) 변형: GPT 응답을 필드 단위로 바로 전달 ---
+    @swagger_auto_schema(
+        method='post',
+        operation_summary="(AI) 학생 단체 -> 사장님 제안서 자동 생성 (SSE 스트리밍)",
+        operation_description=AI_DRAFT_STREAM_DESCRIPTION,
+        request_body=AI_DRAFT_REQUEST_BODY,
+        responses={200: AI_DRAFT_STREAM_RESPONSE},
+        tags=["Proposals"],
+        security=[{"Bearer": []}],
+    )
+    @action(detail=False, methods=['post'], url_path='ai-draft/stream', url_name='ai-draft-stream',
+            renderer_classes=[JSONRenderer, EventStreamRenderer])
+    def ai_draft_stream(self, request):
+        return self._ai_draft_stream_response(request, ProposalDraftJob.Direction.TO_OWNER)
 
-        # 서버에서 recipient 주입 후, 표준 WriteSerializer로 검증/생성
-        ai_dict["recipient"] = recipient_id
-        serializer = ProposalWriteSerializer(data=ai_dict, context={"request": request})
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
+    @swagger_auto_schema(
+        method='post',
+        operation_summary="(AI) 사장님 → 학생단체 제안서 자동 생성 (SSE 스트리밍)",
+        operation_description=AI_DRAFT_STREAM_DESCRIPTION,
+        request_body=AI_DRAFT_REQUEST_BODY,
+        responses={200: AI_DRAFT_STREAM_RESPONSE},
+        tags=["Proposals"],
+        security=[{"Bearer": []}],
+    )
+    @action(detail=False, methods=['post'], url_path='ai-draft-to-student/stream', url_name='ai-draft-to-student-stream',
+            renderer_classes=[JSONRenderer, EventStreamRenderer])
+    def ai_draft_to_student_stream(self, request):
+        return self._ai_draft_stream_response(request, ProposalDraftJob.Direction.TO_STUDENT_GROUP)
 
-        return Response(
-            ProposalReadSerializer(serializer.instance, context={"request": request}).data,
-            status=status.HTTP_201_CREATED
-        )            
+    def _ai_draft_stream_response(self, request, direction):
+        recipient_id = request.data.get("recipient")
+        contact_info = request.data.get("contact_info") or ""
+        # 요청 검증은 스트림 시작 전에 끝내서 일반 에러 응답(4xx)으로 반환
+        try:
+            inputs = prepare_ai_draft(request.user, recipient_id, direction, contact_info, request=request)
+        except DraftRequestError as e:
+            return Response({"detail": e.detail}, status=e.status_code)
+
+        def events():
+            try:
+                for event, payload in stream_ai_draft(request.user, recipient_id, inputs, request=request):
+                    if event == "done":
+                        payload = ProposalReadSerializer(payload, context={"request": request}).data
+                    yield sse_event(event, payload)
+            except DRFValidationError as e:
+                # 완성된 초안이 ProposalWriteSerializer 검증을 통과하지 못함
+                yield sse_event("error", {"detail": "생성된 초안이 유효하지 않습니다.", "errors": e.detail})
+            except LLMError as e:
+                yield sse_event("error", {"detail": e.detail})
+            except Exception:
+                logger.exception("AI 초안 스트리밍 실패")
+                yield sse_event("error", {"detail": "AI 초안 생성 중 오류가 발생했습니다."})
+
+        response = StreamingHttpResponse(events(), content_type="text/event-stream; charset=utf-8")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"  # nginx 버퍼링 끄기
+        return response
     
     @swagger_auto_schema(
         method='get',
@@ -474,12 +592,13 @@ class ProposalViewSet(viewsets.ModelViewSet):
         qs = (
             Proposal.objects
             .filter(author=user)
-            .only("id", "partnership_type", "created_at", "modified_at")
+            .only("id", "partnership_type", "created_at", "modified_at", "current_status")
             .order_by("-created_at")
         )
 
-        data = ProposalSentListSerializer(qs, many=True).data
-        return Response(data, status=status.HTTP_200_OK)
+        page = self.paginate_queryset(qs)
+        data = ProposalSentListSerializer(page, many=True).data
+        return self.get_paginated_response(data)
     
     @swagger_auto_schema(
         method='get',
@@ -511,9 +630,10 @@ class ProposalViewSet(viewsets.ModelViewSet):
         qs = (
             Proposal.objects
             .filter(recipient=user)
-            .only("id", "partnership_type", "created_at", "modified_at")
+            .only("id", "partnership_type", "created_at", "modified_at", "current_status")
             .order_by("-created_at")
         )
 
-        data = ProposalReceivedListSerializer(qs, many=True).data
-        return Response(data, status=status.HTTP_200_OK)
\ No newline at end of file
+        page = self.paginate_queryset(qs)
+        data = ProposalReceivedListSerializer(page, many=True).data
+        return self.get_paginated_response(data)
\ No newline at end of file